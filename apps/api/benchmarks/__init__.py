@@ -0,0 +1,14 @@
+"""性能改善の効果を計測するベンチマーク
+
+ベンチマークはアプリケーションのモジュールを直接読み込むため、
+.env が無い環境でも実行できるように最低限の環境変数を既定値として設定する。
+"""
+
+import os
+
+os.environ.setdefault("APP_ENV", "local")
+os.environ.setdefault("LOG_CONFIG_FILE", "log_config/log_config_null.json")
+os.environ.setdefault("LOGGER_NAME", "null_logger")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("USE_MOCK_AWS_COMPREHEND_API", "true")
+os.environ.setdefault("TYPETALK_API_BASE_URL", "http://127.0.0.1")
@@ -0,0 +1,91 @@
+"""非同期化したリクエスト処理のスループットを計測するベンチマーク
+
+スタンドインサーバーで上流のレイテンシを模擬し、同時実行数ごとに
+以下の2つの方式で組織一覧取得のスループットを比較する。
+
+- sync: async def のルートから同期版ユースケースを呼び出す従来の方式。
+  上流の応答を待つ間イベントループがブロックされるため、同時実行数を増やしても
+  スループットは向上しない。
+- async: 非同期版ユースケースを await する方式。
+  上流の応答待ちの間に他のリクエストを処理できるため、スループットが向上する。
+
+実行方法:
+    python -m benchmarks.bench_async_concurrency
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from benchmarks.stand_in_server import run_stand_in_server
+from src.infrastructure.typetalk.async_typetalk_api import AsyncTypetalkApi
+from src.infrastructure.typetalk.http_client import TypetalkTimeouts
+from src.infrastructure.typetalk.typetalk_api import TypetalkApi
+from src.use_cases.get_spaces import get_spaces_async_use_case, get_spaces_use_case
+
+TIMEOUTS = TypetalkTimeouts(
+    spaces=httpx.Timeout(30.0),
+    topics=httpx.Timeout(30.0),
+    messages=httpx.Timeout(30.0),
+)
+LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=200)
+
+
+async def _throughput(
+    handler: Callable[[], Awaitable[object]],
+    concurrency: int,
+    total_requests: int,
+) -> float:
+    """指定の同時実行数でリクエストを処理し、1秒あたりの処理件数を返す"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one() -> None:
+        async with semaphore:
+            await handler()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run_one() for _ in range(total_requests)))
+    return total_requests / (time.perf_counter() - start)
+
+
+async def _run(base_url: str, concurrency_levels: list[int], latency: float) -> None:
+    """同時実行数ごとに各方式のスループットを計測して出力する"""
+    with httpx.Client(limits=LIMITS) as client:
+        async with httpx.AsyncClient(limits=LIMITS) as async_client:
+            sync_api = TypetalkApi(base_url, client, TIMEOUTS)
+            async_api = AsyncTypetalkApi(base_url, async_client, TIMEOUTS)
+
+            async def sync_handler() -> object:
+                # 従来のルートと同様にイベントループ上で同期処理を呼び出す
+                return get_spaces_use_case(sync_api, "token")
+
+            async def async_handler() -> object:
+                return await get_spaces_async_use_case(async_api, "token")
+
+            print(f"upstream latency: {latency * 1000:.0f}ms")
+            print(f"{'concurrency':>11} {'sync req/s':>12} {'async req/s':>12}")
+            for concurrency in concurrency_levels:
+                total_requests = max(concurrency * 4, 20)
+                sync_rps = await _throughput(sync_handler, concurrency, total_requests)
+                async_rps = await _throughput(
+                    async_handler, concurrency, total_requests
+                )
+                print(f"{concurrency:>11} {sync_rps:>12.1f} {async_rps:>12.1f}")
+
+
+def main() -> None:
+    """ベンチマークを実行する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 5, 10, 20])
+    args = parser.parse_args()
+
+    with run_stand_in_server(latency=args.latency) as base_url:
+        asyncio.run(_run(base_url, args.concurrency, args.latency))
+
+
+if __name__ == "__main__":
+    main()
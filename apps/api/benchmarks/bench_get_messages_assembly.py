@@ -0,0 +1,206 @@
+"""メッセージ一覧取得での感情分析結果の付与にかかる時間とメモリを計測するベンチマーク
+
+Typetalk API と AWS Comprehend API を事前に作成したレスポンスを返すスタブに置き換え、
+1ページ(既定は200件)のポストに感情分析結果を付与する処理を以下の2つの方式で比較する。
+
+- legacy: ポストを deepcopy し、感情分析結果を持つ新しいポストを作成してから
+  辞書でマージし、逆順に並べ替える従来の方式
+- current: ポストの位置ごとの感情を1つのリストに設定し、逆順に並べ替えながら
+  感情があるポストだけを浅いコピーにする get_messages_use_case の方式
+
+実行方法:
+    python -m benchmarks.bench_get_messages_assembly
+    python -m benchmarks.bench_get_messages_assembly --posts 200 --iterations 2000
+"""
+
+import argparse
+import copy
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from itertools import chain
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentEnum,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+from src.infrastructure.typetalk.i_typetalk_api import ITypetalkApi
+from src.schemas.account import Account
+from src.schemas.message import GetMessagesResponse, Post, TypetalkGetMessagesResponse
+from src.schemas.space import TypetalkGetSpacesResponse
+from src.schemas.topic import Topic, TypetalkGetTopicsResponse
+from src.use_cases.get_messages import get_messages_use_case
+
+TOKEN = "typetalk_token"
+TOPIC_ID = 1
+
+
+class _StubTypetalkApi(ITypetalkApi):
+    """事前に作成したメッセージ一覧を返すスタブ"""
+
+    def __init__(self, response: TypetalkGetMessagesResponse):
+        self.response = response
+
+    def get_spaces(self, typetalk_token: str) -> TypetalkGetSpacesResponse:
+        raise NotImplementedError
+
+    def get_topics(
+        self, typetalk_token: str, space_key: str
+    ) -> TypetalkGetTopicsResponse:
+        raise NotImplementedError
+
+    def get_messages(
+        self,
+        typetalk_token: str,
+        topic_id: int,
+        from_id: int | None = None,
+        count: int | None = None,
+    ) -> TypetalkGetMessagesResponse:
+        return self.response
+
+
+class _StubComprehendApi(IAwsComprehendApi):
+    """事前に作成した感情分析結果を返すスタブ"""
+
+    def __init__(self, response: BatchDetectSentimentResponse):
+        self.response = response
+
+    def batch_detect_sentiment(
+        self, text_list: list[str]
+    ) -> BatchDetectSentimentResponse:
+        return self.response
+
+
+def _build_stubs(post_count: int) -> tuple[_StubTypetalkApi, _StubComprehendApi]:
+    """1割のポストを本文なしとしたメッセージ一覧と感情分析結果のスタブを作成する"""
+    account = Account(id=1, name="test-user", image_url="https://placehold.jp/1.png")
+    posts = [
+        Post(
+            id=i,
+            message="" if i % 10 == 0 else f"今日のリリースは順調です。 #{i}",
+            updated_at="2024-01-23T00:00:00Z",
+            account=account,
+        )
+        for i in range(post_count)
+    ]
+    typetalk_response = TypetalkGetMessagesResponse(
+        topic=Topic(id=TOPIC_ID, name="トピック", description=""),
+        has_next=True,
+        posts=posts,
+    )
+    target_count = sum(1 for post in posts if post.message)
+    comprehend_response = BatchDetectSentimentResponse(
+        result_list=[
+            SentimentResult(
+                index=index,
+                sentiment=SentimentEnum.POSITIVE,
+                sentiment_score={"Positive": 0.9},
+            )
+            for index in range(target_count)
+        ],
+        error_list=[],
+    )
+    return _StubTypetalkApi(typetalk_response), _StubComprehendApi(comprehend_response)
+
+
+def _legacy_use_case(
+    i_typetalk_api: ITypetalkApi,
+    i_aws_comprehend_api: IAwsComprehendApi,
+) -> GetMessagesResponse:
+    """従来の get_messages_use_case の処理を再現する"""
+    typetalk_response = i_typetalk_api.get_messages(TOKEN, TOPIC_ID)
+    typetalk_posts = copy.deepcopy(typetalk_response.posts)
+    targets = [x for x in typetalk_posts if x.message]
+    result = i_aws_comprehend_api.batch_detect_sentiment([x.message for x in targets])
+    sentiment_posts = [
+        Post(
+            id=post.id,
+            message=post.message,
+            updated_at=post.updated_at,
+            account=post.account,
+            sentiment=sentiment_result.sentiment.value,
+        )
+        for post, sentiment_result in zip(targets, result.result_list, strict=False)
+    ]
+    merged = list(
+        {post.id: post for post in chain(typetalk_posts, sentiment_posts)}.values()
+    )
+    return GetMessagesResponse(
+        topic=typetalk_response.topic,
+        has_next=typetalk_response.has_next,
+        posts=list(reversed(merged)),
+    )
+
+
+def _current_use_case(
+    i_typetalk_api: ITypetalkApi,
+    i_aws_comprehend_api: IAwsComprehendApi,
+) -> GetMessagesResponse:
+    """現在の get_messages_use_case を呼び出す"""
+    return get_messages_use_case(i_typetalk_api, i_aws_comprehend_api, TOKEN, TOPIC_ID)
+
+
+def _latencies_us(
+    use_case: Callable[[ITypetalkApi, IAwsComprehendApi], GetMessagesResponse],
+    stubs: tuple[_StubTypetalkApi, _StubComprehendApi],
+    iterations: int,
+) -> list[float]:
+    """1回ごとの処理時間(マイクロ秒)を返す"""
+    for _ in range(10):
+        use_case(*stubs)
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        use_case(*stubs)
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    return latencies
+
+
+def _allocations(
+    use_case: Callable[[ITypetalkApi, IAwsComprehendApi], GetMessagesResponse],
+    stubs: tuple[_StubTypetalkApi, _StubComprehendApi],
+) -> tuple[float, int]:
+    """1回の処理で確保されるメモリのピーク(KiB)と、応答が保持するメモリブロック数を返す"""
+    tracemalloc.start()
+    use_case(*stubs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    response = use_case(*stubs)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del response
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return peak / 1024, blocks
+
+
+def main() -> None:
+    """ベンチマークを実行する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    stubs = _build_stubs(args.posts)
+    use_cases = {"legacy": _legacy_use_case, "current": _current_use_case}
+    assert _legacy_use_case(*stubs) == _current_use_case(*stubs)
+
+    print(f"{'method':>8} {'p50':>10} {'p95':>10} {'peak mem':>11} {'blocks':>7}")
+    for name, use_case in use_cases.items():
+        quantiles = statistics.quantiles(
+            _latencies_us(use_case, stubs, args.iterations), n=100
+        )
+        peak_kib, blocks = _allocations(use_case, stubs)
+        print(
+            f"{name:>8} {quantiles[49]:>8.1f}us {quantiles[94]:>8.1f}us "
+            f"{peak_kib:>8.1f}KiB {blocks:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
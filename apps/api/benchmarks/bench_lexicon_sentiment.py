@@ -0,0 +1,71 @@
+"""極性辞書によるプロセス内の感情分析の処理時間を計測するベンチマーク
+
+チャットのメッセージを模したテキストのバッチに対して LexiconSentimentApi を呼び出し、
+バッチサイズごとに以下を比較する。
+
+- per batch: 1回の batch_detect_sentiment の処理時間 (p50 / p95)
+- per text: テキスト1件あたりの処理時間
+
+実行方法:
+    python -m benchmarks.bench_lexicon_sentiment
+    python -m benchmarks.bench_lexicon_sentiment --batch-sizes 1 25 100 --repeat 500
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from src.infrastructure.local_sentiment.lexicon_sentiment_api import (
+    LexiconSentimentApi,
+)
+
+# メッセージを組み立てる文の断片
+_FRAGMENTS = (
+    "明日の会議は10時からです。",
+    "資料を共有しました、確認お願いします。",
+    "ありがとうございます！助かりました。",
+    "本番環境でエラーが出ていて困っています。",
+    "このバグはまだ直っていないようです。",
+    "レビューの指摘は問題ないです。",
+    "新しい画面はとても使いやすいですね👍",
+    "デプロイが遅くて大変でした。",
+    "https://example.com/issues/123 を参照してください。",
+    "了解です。",
+)
+
+
+def _messages(count: int) -> list[str]:
+    """断片を組み合わせてメッセージのリストを作成する"""
+    return [
+        "".join(random.choices(_FRAGMENTS, k=random.randint(1, 4)))
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    """ベンチマークを実行する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 25, 200])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    api = LexiconSentimentApi()
+    print(f"{'batch':>6} {'p50':>9} {'p95':>9} {'per text':>10}")
+    for batch_size in args.batch_sizes:
+        text_list = _messages(batch_size)
+        api.batch_detect_sentiment(text_list)
+        latencies = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            api.batch_detect_sentiment(text_list)
+            latencies.append((time.perf_counter() - start) * 1000)
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"{batch_size:>6} {quantiles[49]:>7.3f}ms {quantiles[94]:>7.3f}ms "
+            f"{statistics.median(latencies) * 1000 / batch_size:>8.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""リクエストをまたいだテキストの集約による呼び出し回数とレイテンシを計測するベンチマーク
+
+AWS Comprehend の応答時間を模擬した非同期APIに対して、1リクエストあたり数件の
+テキストを持つリクエストを同時に実行し、集約の待ち時間ごとに以下を比較する。
+
+- calls/request: 1リクエストあたりの上流への呼び出し回数
+- p50 / p95: 1リクエストの感情分析にかかったレイテンシ
+
+待ち時間 0 は集約を行わない場合(AsyncAwsComprehendApi を直接呼び出す場合)を表す。
+
+実行方法:
+    python -m benchmarks.bench_micro_batcher
+    python -m benchmarks.bench_micro_batcher --latency-ms 80 --texts-per-request 3
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentEnum,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.micro_batching_aws_comprehend_api import (
+    MicroBatchingAwsComprehendApi,
+)
+
+
+class _SlowComprehendApi(IAsyncAwsComprehendApi):
+    """一定のレイテンシで全てのテキストを肯定的と判定する非同期API"""
+
+    def __init__(self, latency_seconds: float):
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+
+    async def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        self.calls += 1
+        await asyncio.sleep(self.latency_seconds)
+        return BatchDetectSentimentResponse(
+            result_list=[
+                SentimentResult(
+                    index=index,
+                    sentiment=SentimentEnum.POSITIVE,
+                    sentiment_score={"Positive": 1.0},
+                )
+                for index in range(len(text_list))
+            ],
+            error_list=[],
+        )
+
+
+async def _run(
+    window_ms: float,
+    concurrency: int,
+    total_requests: int,
+    texts_per_request: int,
+    latency_seconds: float,
+) -> tuple[float, list[float]]:
+    """同時実行数を保ってリクエストを処理し、呼び出し回数とレイテンシを返す"""
+    inner = _SlowComprehendApi(latency_seconds)
+    api: IAsyncAwsComprehendApi = inner
+    if window_ms > 0:
+        api = MicroBatchingAwsComprehendApi(inner, window_seconds=window_ms / 1000)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def run_one(request_id: int) -> None:
+        text_list = [f"message {request_id}-{i}" for i in range(texts_per_request)]
+        async with semaphore:
+            # リクエストの到着時刻をばらつかせる
+            await asyncio.sleep(random.random() * 0.005)
+            start = time.perf_counter()
+            await api.batch_detect_sentiment(text_list)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(run_one(i) for i in range(total_requests)))
+    return inner.calls / total_requests, latencies
+
+
+def main() -> None:
+    """ベンチマークを実行する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--windows-ms", type=float, nargs="+", default=[0, 5, 10, 20])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--texts-per-request", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    print(f"{'window':>8} {'conc':>5} {'calls/req':>10} {'p50':>9} {'p95':>9}")
+    for concurrency in args.concurrency:
+        for window_ms in args.windows_ms:
+            calls_per_request, latencies = asyncio.run(
+                _run(
+                    window_ms,
+                    concurrency,
+                    args.requests,
+                    args.texts_per_request,
+                    args.latency_ms / 1000,
+                )
+            )
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"{window_ms:>6.0f}ms {concurrency:>5} {calls_per_request:>10.3f} "
+                f"{quantiles[49]:>7.1f}ms {quantiles[94]:>7.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""感情分析結果の永続ストアの検索レイテンシを計測するベンチマーク
+
+指定件数(既定は100万件)のポストを保存したSQLiteのストアに対して、
+1ページ分のキーをまとめて検索する get_many のレイテンシを計測する。
+検索するキーは、ポストIDと更新日時で見つかるもの、テキストのハッシュ値で
+見つかるもの、見つからないものを混在させる。
+
+実行方法:
+    python -m benchmarks.bench_sentiment_store
+    python -m benchmarks.bench_sentiment_store --entries 100000 --page-size 200
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from src.core.text_hash import hash_text
+from src.infrastructure.sentiment_store.i_sentiment_store import SentimentStoreKey
+from src.infrastructure.sentiment_store.sqlite_sentiment_store import (
+    SqliteSentimentStore,
+)
+
+UPDATED_AT = "2024-01-23T00:00:00Z"
+SENTIMENTS = ["POSITIVE", "NEGATIVE", "NEUTRAL", "MIXED"]
+
+
+def _key(post_id: int, updated_at: str = UPDATED_AT) -> SentimentStoreKey:
+    """ポストIDに対応するキーを作成する"""
+    return SentimentStoreKey(
+        post_id=post_id,
+        updated_at=updated_at,
+        text_hash=hash_text(f"テストメッセージ {post_id}"),
+    )
+
+
+def _populate(store: SqliteSentimentStore, entries: int, batch_size: int) -> None:
+    """指定件数の結果をストアに保存する"""
+    start = time.perf_counter()
+    for offset in range(0, entries, batch_size):
+        store.put_many(
+            {
+                _key(post_id): SENTIMENTS[post_id % len(SENTIMENTS)]
+                for post_id in range(offset, min(offset + batch_size, entries))
+            }
+        )
+    elapsed = time.perf_counter() - start
+    print(f"populated {entries:,} entries in {elapsed:.1f}s")
+
+
+def _page_keys(entries: int, page_size: int) -> list[SentimentStoreKey]:
+    """1ページ分の検索キーを作成する
+
+    8割はポストIDで見つかるキー、1割は更新日時が異なりテキストのハッシュ値で
+    見つかるキー、1割は見つからないキーとする。
+    """
+    keys = []
+    for _ in range(page_size):
+        post_id = random.randrange(entries)
+        roll = random.random()
+        if roll < 0.8:
+            keys.append(_key(post_id))
+        elif roll < 0.9:
+            keys.append(_key(post_id, updated_at="2024-12-31T00:00:00Z"))
+        else:
+            keys.append(
+                SentimentStoreKey(
+                    post_id=entries + post_id,
+                    updated_at=UPDATED_AT,
+                    text_hash=hash_text(f"未保存のメッセージ {post_id}"),
+                )
+            )
+    return keys
+
+
+def main() -> None:
+    """ベンチマークを実行する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sentiments.db")
+        store = SqliteSentimentStore(
+            path, max_entries=args.entries, compact_interval=args.entries * 2
+        )
+        _populate(store, args.entries, batch_size=10_000)
+        print(f"database size: {os.path.getsize(path) / 1024 / 1024:.1f}MiB")
+
+        pages = [
+            _page_keys(args.entries, args.page_size) for _ in range(args.iterations)
+        ]
+        # ウォームアップ
+        for keys in pages[:10]:
+            store.get_many(keys)
+
+        latencies = []
+        found = 0
+        for keys in pages:
+            start = time.perf_counter()
+            found += len(store.get_many(keys))
+            latencies.append((time.perf_counter() - start) * 1000)
+        store.close()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"get_many({args.page_size} keys) "
+        f"p50={quantiles[49]:.3f}ms p95={quantiles[94]:.3f}ms "
+        f"p99={quantiles[98]:.3f}ms mean={statistics.mean(latencies):.3f}ms "
+        f"hit_rate={found / (args.page_size * args.iterations):.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
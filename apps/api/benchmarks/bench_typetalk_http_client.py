@@ -0,0 +1,78 @@
+"""TypetalkApiのHTTPクライアント共有による効果を計測するベンチマーク
+
+接続ごとにクライアントを作成する従来の方式と、コネクションプールを持つ
+共有クライアントを使用する方式で組織一覧取得のレイテンシを比較する。
+
+ローカルのスタンドインサーバーはTLSを使用しないため、計測される差分はTCP接続の
+確立コストのみである。本番環境ではTLSハンドシェイクが加わり、差はより大きくなる。
+
+実行方法:
+    python -m benchmarks.bench_typetalk_http_client
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+import httpx
+
+from benchmarks.stand_in_server import run_stand_in_server
+from src.infrastructure.typetalk.http_client import TypetalkTimeouts
+from src.infrastructure.typetalk.typetalk_api import TypetalkApi
+
+TIMEOUTS = TypetalkTimeouts(
+    spaces=httpx.Timeout(5.0),
+    topics=httpx.Timeout(5.0),
+    messages=httpx.Timeout(5.0),
+)
+
+
+def _measure(call: Callable[[], object], iterations: int) -> list[float]:
+    """指定の処理を繰り返し実行し、1回ごとの所要時間(ミリ秒)を返す"""
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    """レイテンシの統計値を出力する"""
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<24} p50={quantiles[49]:.3f}ms "
+        f"p95={quantiles[94]:.3f}ms mean={statistics.mean(latencies):.3f}ms"
+    )
+
+
+def main() -> None:
+    """ベンチマークを実行する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    with run_stand_in_server() as base_url:
+
+        def per_call() -> object:
+            # 従来の httpx.get と同様に、リクエストごとに接続を確立する
+            with httpx.Client() as client:
+                return TypetalkApi(base_url, client, TIMEOUTS).get_spaces("token")
+
+        with httpx.Client() as shared_client:
+            shared_api = TypetalkApi(base_url, shared_client, TIMEOUTS)
+
+            def shared() -> object:
+                return shared_api.get_spaces("token")
+
+            # ウォームアップ
+            _measure(per_call, 10)
+            _measure(shared, 10)
+
+            _report("per-call connection", _measure(per_call, args.iterations))
+            _report("shared pooled client", _measure(shared, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Typetalk APIのレスポンスのデコード方式ごとのCPU時間とメモリを計測するベンチマーク
+
+mockoon/typetalk-api.json のメッセージ一覧のレスポンスを元に、添付ファイル、
+リンク、いいね等を含むポストを指定件数に増やしたレスポンスを作成し、
+以下の2つの方式でメッセージ一覧のスキーマに変換する処理を比較する。
+
+- json: r.json() で全体を辞書に変換してから model_validate で検証する従来の方式
+- bytes: バイト列から model_validate_json でスキーマのフィールドだけを取り出す方式
+
+実行方法:
+    python -m benchmarks.bench_typetalk_response_parsing
+    python -m benchmarks.bench_typetalk_response_parsing --posts 20 100 200
+"""
+
+import argparse
+import copy
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from src.schemas.message import TypetalkGetMessagesResponse
+
+MOCKOON_FILE = Path(__file__).parents[3] / "mockoon" / "typetalk-api.json"
+MESSAGES_ENDPOINT = "api/v1/topics/390668"
+
+
+def _load_template() -> dict:
+    """Mockoon の定義からメッセージ一覧のレスポンスを読み込む"""
+    routes = json.loads(MOCKOON_FILE.read_text(encoding="utf-8"))["routes"]
+    route = next(x for x in routes if x["endpoint"] == MESSAGES_ENDPOINT)
+    return json.loads(route["responses"][0]["body"])
+
+
+def _build_payload(template: dict, post_count: int) -> bytes:
+    """指定件数のポストを持つレスポンスのバイト列を作成する"""
+    base_post = template["posts"][0]
+    posts = []
+    for i in range(post_count):
+        post = copy.deepcopy(base_post)
+        post["id"] = base_post["id"] + i
+        post["message"] = f"今日のリリースは順調に進んでいます。確認ありがとう! #{i}"
+        post["likes"] = [
+            {
+                "id": j,
+                "postId": post["id"],
+                "topicId": post["topicId"],
+                "comment": "",
+                "account": base_post["account"],
+                "createdAt": base_post["createdAt"],
+            }
+            for j in range(3)
+        ]
+        post["links"] = [
+            {
+                "id": i,
+                "url": "https://example.com/articles/release-notes",
+                "contentType": "text/html",
+                "title": "リリースノート",
+                "description": "リリースノートの説明文。" * 40,
+                "imageUrl": "https://placehold.jp/150x150.png",
+                "createdAt": base_post["createdAt"],
+                "updatedAt": base_post["updatedAt"],
+            }
+        ]
+        posts.append(post)
+    payload = {**template, "posts": posts}
+    return json.dumps(payload, ensure_ascii=False).encode()
+
+
+def _parse_json(content: bytes) -> TypetalkGetMessagesResponse:
+    """辞書に変換してから検証する従来の方式"""
+    return TypetalkGetMessagesResponse.model_validate(json.loads(content))
+
+
+def _parse_bytes(content: bytes) -> TypetalkGetMessagesResponse:
+    """バイト列から直接検証する方式"""
+    return TypetalkGetMessagesResponse.model_validate_json(content)
+
+
+def _cpu_time_ms(
+    parse: Callable[[bytes], TypetalkGetMessagesResponse],
+    content: bytes,
+    iterations: int,
+) -> float:
+    """1回あたりのCPU時間(ミリ秒)を返す"""
+    parse(content)
+    start = time.process_time()
+    for _ in range(iterations):
+        parse(content)
+    return (time.process_time() - start) / iterations * 1000
+
+
+def _peak_memory_kib(
+    parse: Callable[[bytes], TypetalkGetMessagesResponse],
+    content: bytes,
+) -> float:
+    """1回の変換で確保されるメモリのピーク(KiB)を返す"""
+    tracemalloc.start()
+    parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main() -> None:
+    """ベンチマークを実行する"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--posts", type=int, nargs="+", default=[20, 100, 200])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    template = _load_template()
+    methods = {"json": _parse_json, "bytes": _parse_bytes}
+    print(f"{'posts':>5} {'size':>9} {'method':>6} {'cpu':>10} {'peak mem':>11}")
+    for post_count in args.posts:
+        content = _build_payload(template, post_count)
+        assert _parse_json(content) == _parse_bytes(content)
+        for name, parse in methods.items():
+            cpu_ms = _cpu_time_ms(parse, content, args.iterations)
+            peak_kib = _peak_memory_kib(parse, content)
+            print(
+                f"{post_count:>5} {len(content) / 1024:>7.1f}KiB {name:>6} "
+                f"{cpu_ms:>8.3f}ms {peak_kib:>8.1f}KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""ベンチマーク用にTypetalk APIを模したローカルHTTPサーバーを提供する"""
+
+import json
+import multiprocessing
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.connection import Connection
+
+SPACES_BODY = {
+    "mySpaces": [
+        {
+            "space": {
+                "key": f"space{i:04d}",
+                "name": f"ベンチマーク組織{i}",
+                "imageUrl": "https://placehold.jp/150x150.png",
+            },
+        }
+        for i in range(5)
+    ],
+}
+
+
+def _serve(
+    body_factory: Callable[[str], bytes] | None,
+    latency: float,
+    conn: Connection,
+) -> None:
+    """子プロセスでHTTPサーバーを起動し、待ち受けポートを親プロセスに通知する"""
+    default_body = json.dumps(SPACES_BODY).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:  # noqa: N802
+            body = body_factory(self.path) if body_factory else default_body
+            if latency:
+                time.sleep(latency)
+            self.send_response(200)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            return
+
+    class Server(ThreadingHTTPServer):
+        # 同時接続を計測するベンチマークで接続が待たされないように拡張する
+        request_queue_size = 256
+        daemon_threads = True
+
+    server = Server(("127.0.0.1", 0), Handler)
+    conn.send(server.server_address[1])
+    server.serve_forever()
+
+
+@contextmanager
+def run_stand_in_server(
+    body_factory: Callable[[str], bytes] | None = None,
+    latency: float = 0.0,
+) -> Iterator[str]:
+    """Typetalk APIの代わりに固定のJSONを返すHTTPサーバーを起動する
+
+    サーバーはHTTP/1.1のキープアライブに対応する。計測対象とGILを奪い合わないように、
+    サーバーは別プロセスで動作させる。
+
+    Args:
+        body_factory (Callable[[str], bytes] | None, optional):
+            リクエストパスからレスポンスボディを生成する関数。
+            省略した場合は組織一覧のレスポンスを返す。
+        latency (float, optional): レスポンスを返す前に待機する秒数
+
+    Yields:
+        str: サーバーのベースURL
+    """
+    context = multiprocessing.get_context("fork")
+    parent_conn, child_conn = context.Pipe()
+    process = context.Process(
+        target=_serve,
+        args=(body_factory, latency, child_conn),
+        daemon=True,
+    )
+    process.start()
+    try:
+        port = parent_conn.recv()
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.join()
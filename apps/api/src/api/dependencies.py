@@ -1,37 +1,383 @@
 """アプリケーションの依存関係を管理する"""
 
+from collections.abc import AsyncIterator
+from dataclasses import asdict
+from functools import lru_cache
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from src.core.circuit_breaker import CircuitBreaker
 from src.core.config import get_settings
+from src.core.metrics import metrics_registry
+from src.infrastructure.aws.comprehend.async_aws_comprehend_api import (
+    AsyncAwsComprehendApi,
+)
 from src.infrastructure.aws.comprehend.aws_comprehend_api import AwsComprehendApi
 from src.infrastructure.aws.comprehend.aws_comprehend_api_mock import (
     AwsComprehendApiMock,
 )
+from src.infrastructure.aws.comprehend.cached_aws_comprehend_api import (
+    CachedAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.chunked_aws_comprehend_api import (
+    ChunkedAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.circuit_breaking_aws_comprehend_api import (
+    CircuitBreakingAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.governed_aws_comprehend_api import (
+    GovernedAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.hedged_aws_comprehend_api import (
+    HedgedAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
 from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+from src.infrastructure.aws.comprehend.sample_recording_aws_comprehend_api import (
+    SampleRecordingAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.tiered_aws_comprehend_api import (
+    TieredAwsComprehendApi,
+)
+from src.infrastructure.local_sentiment.distilled_sentiment_api import (
+    DistilledSentimentApi,
+)
+from src.infrastructure.local_sentiment.lexicon_sentiment_api import (
+    LexiconSentimentApi,
+)
+from src.infrastructure.sentiment_store.i_sentiment_store import ISentimentStore
+from src.infrastructure.sentiment_store.sqlite_sentiment_store import (
+    SqliteSentimentStore,
+)
+from src.infrastructure.typetalk.async_typetalk_api import AsyncTypetalkApi
+from src.infrastructure.typetalk.cached_typetalk_api import CachedTypetalkApi
+from src.infrastructure.typetalk.circuit_breaking_typetalk_api import (
+    CircuitBreakingTypetalkApi,
+)
+from src.infrastructure.typetalk.coalescing_typetalk_api import (
+    CoalescingTypetalkApi,
+)
+from src.infrastructure.typetalk.hedged_typetalk_api import HedgedTypetalkApi
+from src.infrastructure.typetalk.http_client import (
+    TypetalkTimeouts,
+    create_typetalk_async_http_client,
+    get_typetalk_http_client,
+)
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
 from src.infrastructure.typetalk.i_typetalk_api import ITypetalkApi
+from src.infrastructure.typetalk.listing_cache import TypetalkListingCache
+from src.infrastructure.typetalk.negative_caching_typetalk_api import (
+    NegativeCachingTypetalkApi,
+)
 from src.infrastructure.typetalk.typetalk_api import TypetalkApi
+from src.use_cases.messages_prefetcher import MessagesPrefetcher
+from src.use_cases.topic_feed import TopicFeedHub
 
 
 def get_i_typetalk_api() -> ITypetalkApi:
     """ITypetalkApiを実装したクラスのインスタンスを返す
 
+    HTTPクライアントはアプリケーション全体で共有し、キープアライブ接続を再利用する。
+
     Returns:
         ITypetalkApi: ITypetalkApiを実装したクラスのインスタンス
     """
-    base_url = get_settings().typetalk_api_base_url
-    return TypetalkApi(base_url)
+    settings = get_settings()
+    return TypetalkApi(
+        settings.typetalk_api_base_url,
+        client=get_typetalk_http_client(),
+        timeouts=TypetalkTimeouts.from_settings(settings),
+    )
+
+
+async def get_i_async_typetalk_api(
+    request: Request,
+) -> AsyncIterator[IAsyncTypetalkApi]:
+    """IAsyncTypetalkApiを実装したクラスのインスタンスを返す
+
+    lifespan で作成した共有の非同期HTTPクライアントを使用する。
+    lifespan でレート制限の調整の仕組みが作成されている場合は、
+    アクセストークンごとのレート制限に合わせて送信を調整する。
+    lifespan でヘッジの仕組みが作成されている場合は、遅いリクエストをヘッジする。
+    lifespan でサーキットブレーカーが作成されている場合は、障害が続く間は
+    Typetalk API へリクエストせずにエラーとする。
+    lifespan で同じリクエストを集約する仕組みが作成されている場合は、
+    同時に行われる同じリクエストを1回にまとめる。
+    lifespan で一覧のキャッシュが作成されている場合は、組織一覧とトピック一覧を
+    キャッシュから返す。
+    lifespan でエラーレスポンスのキャッシュが作成されている場合は、
+    認証エラーや存在しないリソースへのエラーを Typetalk API へリクエストせずに返す。
+    lifespan が実行されていない場合 (with 文を使用しない TestClient など) は、
+    リクエスト単位でクライアントを作成し、レスポンス後にクローズする。
+
+    Args:
+        request (Request): FastAPIのリクエストオブジェクト
+
+    Yields:
+        IAsyncTypetalkApi: IAsyncTypetalkApiを実装したクラスのインスタンス
+    """
+    settings = get_settings()
+    timeouts = TypetalkTimeouts.from_settings(settings)
+    base_url = settings.typetalk_api_base_url
+
+    shared_client = getattr(request.app.state, "typetalk_async_http_client", None)
+    if shared_client is not None:
+        typetalk_api: IAsyncTypetalkApi = AsyncTypetalkApi(
+            base_url,
+            client=shared_client,
+            timeouts=timeouts,
+            rate_limiter=getattr(request.app.state, "typetalk_rate_limiter", None),
+        )
+        hedgers = getattr(request.app.state, "typetalk_hedgers", None)
+        if hedgers is not None:
+            typetalk_api = HedgedTypetalkApi(typetalk_api, hedgers)
+        circuit_breaker = getattr(request.app.state, "typetalk_circuit_breaker", None)
+        if circuit_breaker is not None:
+            typetalk_api = CircuitBreakingTypetalkApi(typetalk_api, circuit_breaker)
+        single_flight = getattr(request.app.state, "typetalk_single_flight", None)
+        if single_flight is not None:
+            typetalk_api = CoalescingTypetalkApi(typetalk_api, single_flight)
+        listing_cache = get_typetalk_listing_cache(request)
+        if listing_cache is not None:
+            typetalk_api = CachedTypetalkApi(
+                typetalk_api,
+                listing_cache,
+                spaces_ttl_seconds=settings.typetalk_spaces_cache_ttl_seconds,
+                topics_ttl_seconds=settings.typetalk_topics_cache_ttl_seconds,
+            )
+        negative_cache = getattr(request.app.state, "typetalk_negative_cache", None)
+        if negative_cache is not None:
+            typetalk_api = NegativeCachingTypetalkApi(typetalk_api, negative_cache)
+        yield typetalk_api
+        return
+
+    async with create_typetalk_async_http_client(settings) as client:
+        yield AsyncTypetalkApi(base_url, client=client, timeouts=timeouts)
+
+
+def get_typetalk_listing_cache(request: Request) -> TypetalkListingCache | None:
+    """Typetalkの組織一覧とトピック一覧のキャッシュを返す
+
+    Args:
+        request (Request): FastAPIのリクエストオブジェクト
+
+    Returns:
+        TypetalkListingCache | None: lifespan で作成されていない場合は None
+    """
+    return getattr(request.app.state, "typetalk_listing_cache", None)
+
+
+@lru_cache
+def get_comprehend_circuit_breaker() -> CircuitBreaker | None:
+    """AWS Comprehend APIへの呼び出しで共有するサーキットブレーカーを返す
+
+    AWS Comprehend APIはワーカースレッドから呼び出すため、イベントループに依存しない
+    プロセス全体で共有のインスタンスとする。
+
+    Returns:
+        CircuitBreaker | None: 環境設定で無効にされている場合は None
+    """
+    settings = get_settings()
+    if not settings.comprehend_circuit_breaker_enabled:
+        return None
+    circuit_breaker = CircuitBreaker(
+        failure_threshold=settings.comprehend_circuit_breaker_failure_threshold,
+        probe_interval_seconds=(
+            settings.comprehend_circuit_breaker_probe_interval_seconds
+        ),
+    )
+    metrics_registry.register(
+        "comprehend_circuit_breaker", lambda: asdict(circuit_breaker.stats)
+    )
+    return circuit_breaker
+
+
+def get_circuit_breakers(request: Request) -> dict[str, CircuitBreaker]:
+    """外部サービスごとのサーキットブレーカーを返す
 
+    Args:
+        request (Request): FastAPIのリクエストオブジェクト
 
+    Returns:
+        dict[str, CircuitBreaker]: 外部サービス名とサーキットブレーカーの対応。
+            作成されていないサーキットブレーカーは含まない
+    """
+    circuit_breakers = {
+        "typetalk": getattr(request.app.state, "typetalk_circuit_breaker", None),
+        "comprehend": get_comprehend_circuit_breaker(),
+    }
+    return {name: x for name, x in circuit_breakers.items() if x is not None}
+
+
+@lru_cache
 def get_i_aws_comprehend_api() -> IAwsComprehendApi:
     """IAwsComprehendApiを実装したクラスのインスタンスを返す
 
-    環境設定により、モックAPIを使用するかどうかを切り替える
+    環境設定により、モックAPIや極性辞書、学習したモデルによる推定を使用するかどうかを
+    切り替える。サンプルの記録が有効な場合は、AWS Comprehend APIの結果を記録する。
+    AWS Comprehend APIを使用する場合は、アカウントの秒間リクエスト数に合わせて
+    送信を制御し、スロットリングを再試行する。
+    サーキットブレーカーが有効な場合は、障害が続く間は呼び出しを遮断する。
+    段階的な感情分析を使用する場合は、ローカルの推定で確信度の低いテキストのみを
+    AWS Comprehend API (モックAPIを使用する場合はモックAPI) で分析する。
+    感情分析の結果はテキストの内容をキーにメモリ上にキャッシュし、
+    キャッシュに無いテキストのうちバッチサイズの上限を超える分は分割して並列に送信する。
+    インスタンスはプロセス全体で共有し、リクエストごとに作成しない。
 
     Returns:
         IAwsComprehendApi: IAwsComprehendApiを実装したクラスのインスタンス
     """
-    api_mapping = {
-        True: AwsComprehendApiMock,
-        False: AwsComprehendApi,
-    }
     settings = get_settings()
-    api_class = api_mapping[settings.use_mock_aws_comprehend_api]
-    return api_class()
+    api: IAwsComprehendApi
+    if settings.use_mock_aws_comprehend_api:
+        api = AwsComprehendApiMock()
+    elif settings.sentiment_engine == "lexicon":
+        api = LexiconSentimentApi()
+    elif settings.sentiment_engine == "distilled":
+        api = DistilledSentimentApi.from_path(settings.distilled_model_path)
+    else:
+        api = AwsComprehendApi()
+    if settings.comprehend_governor_enabled and settings.use_aws_comprehend_api:
+        governed_api = GovernedAwsComprehendApi(
+            api,
+            transactions_per_second=settings.comprehend_transactions_per_second,
+            burst=settings.comprehend_burst,
+            max_retries=settings.comprehend_throttle_max_retries,
+            backoff_base_seconds=settings.comprehend_backoff_base_seconds,
+            backoff_max_seconds=settings.comprehend_backoff_max_seconds,
+            max_total_retry_seconds=settings.comprehend_retry_max_total_seconds,
+        )
+        metrics_registry.register(
+            "comprehend_governor", lambda: asdict(governed_api.stats)
+        )
+        api = governed_api
+    if settings.sentiment_training_samples_path and settings.use_aws_comprehend_api:
+        recording_api = SampleRecordingAwsComprehendApi(
+            api, settings.sentiment_training_samples_path
+        )
+        metrics_registry.register(
+            "sentiment_training_samples", lambda: asdict(recording_api.stats)
+        )
+        api = recording_api
+    circuit_breaker = get_comprehend_circuit_breaker()
+    if circuit_breaker is not None:
+        api = CircuitBreakingAwsComprehendApi(api, circuit_breaker)
+    api = ChunkedAwsComprehendApi(
+        api,
+        chunk_size=AwsComprehendApi.MAX_BATCH_SIZE,
+        max_workers=settings.comprehend_chunk_max_workers,
+    )
+    if settings.sentiment_engine == "tiered":
+        local_api: IAwsComprehendApi = (
+            DistilledSentimentApi.from_path(settings.distilled_model_path)
+            if settings.distilled_model_path
+            else LexiconSentimentApi()
+        )
+        tiered_api = TieredAwsComprehendApi(
+            local_api,
+            api,
+            confidence_threshold=settings.tiered_sentiment_confidence_threshold,
+        )
+        metrics_registry.register("tiered_sentiment", lambda: asdict(tiered_api.stats))
+        api = tiered_api
+    cached_api = CachedAwsComprehendApi(
+        api,
+        max_size=settings.comprehend_cache_max_size,
+        ttl_seconds=settings.comprehend_cache_ttl_seconds,
+    )
+    metrics_registry.register("sentiment_cache", lambda: asdict(cached_api.stats))
+    return cached_api
+
+
+def get_i_async_aws_comprehend_api(
+    request: Request,
+    i_aws_comprehend_api: Annotated[
+        IAwsComprehendApi, Depends(get_i_aws_comprehend_api)
+    ],
+) -> IAsyncAwsComprehendApi:
+    """IAsyncAwsComprehendApiを実装したクラスのインスタンスを返す
+
+    lifespan でリクエストをまたいでテキストを集約する仕組みが作成されている場合は、
+    それを返す。作成されていない場合は、get_i_aws_comprehend_api が返す同期版の実装を
+    非同期アダプターで包み、ヘッジの仕組みが作成されている場合は遅いリクエストをヘッジする。
+
+    Args:
+        request (Request): FastAPIのリクエストオブジェクト
+        i_aws_comprehend_api (IAwsComprehendApi): 同期版のAWS Comprehend API
+
+    Returns:
+        IAsyncAwsComprehendApi: IAsyncAwsComprehendApiを実装したクラスのインスタンス
+    """
+    micro_batcher = getattr(request.app.state, "comprehend_micro_batcher", None)
+    if micro_batcher is not None:
+        return micro_batcher
+    async_api = AsyncAwsComprehendApi(i_aws_comprehend_api)
+    hedger = getattr(request.app.state, "comprehend_hedger", None)
+    if hedger is not None:
+        return HedgedAwsComprehendApi(async_api, hedger)
+    return async_api
+
+
+@lru_cache
+def get_i_sentiment_store() -> ISentimentStore | None:
+    """ISentimentStoreを実装したクラスのインスタンスを返す
+
+    環境設定でデータベースファイルのパスが指定されていない場合は None を返し、
+    感情分析結果を永続化しない。
+
+    Returns:
+        ISentimentStore | None: ISentimentStoreを実装したクラスのインスタンス
+    """
+    settings = get_settings()
+    if not settings.sentiment_store_path:
+        return None
+    return SqliteSentimentStore(
+        settings.sentiment_store_path,
+        max_entries=settings.sentiment_store_max_entries,
+        compact_interval=settings.sentiment_store_compact_interval,
+    )
+
+
+def close_i_sentiment_store() -> None:
+    """感情分析結果の永続ストアをクローズし、キャッシュを破棄する
+
+    ストアが作成されていない場合は何もしない。
+    """
+    if get_i_sentiment_store.cache_info().currsize:
+        i_sentiment_store = get_i_sentiment_store()
+        if i_sentiment_store is not None:
+            i_sentiment_store.close()
+    get_i_sentiment_store.cache_clear()
+
+
+def get_messages_prefetcher(request: Request) -> MessagesPrefetcher | None:
+    """メッセージ一覧を先読みする仕組みのインスタンスを返す
+
+    先読みは lifespan で作成した共有のクライアントを使用するため、
+    lifespan で作成されている場合のみ返す。
+
+    Args:
+        request (Request): FastAPIのリクエストオブジェクト
+
+    Returns:
+        MessagesPrefetcher | None: 先読みを行わない場合は None
+    """
+    return getattr(request.app.state, "messages_prefetcher", None)
+
+
+def get_topic_feed_hub(request: Request) -> TopicFeedHub | None:
+    """トピックの新しいポストを配信する仕組みのインスタンスを返す
+
+    ポーリングは lifespan で作成した共有のクライアントを使用するため、
+    lifespan で作成されている場合のみ返す。
+
+    Args:
+        request (Request): FastAPIのリクエストオブジェクト
+
+    Returns:
+        TopicFeedHub | None: 配信を行わない場合は None
+    """
+    return getattr(request.app.state, "topic_feed_hub", None)
@@ -1,24 +1,80 @@
 """FastAPIを使用したAPIルーティングを定義する。各ルートは、特定のエンドポイントに対するHTTPリクエストを処理する"""
 
+from collections.abc import AsyncIterator
+from dataclasses import asdict
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Header, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
-from src.api.dependencies import get_i_aws_comprehend_api, get_i_typetalk_api
-from src.infrastructure.aws.comprehend.aws_comprehend_api import IAwsComprehendApi
-from src.infrastructure.typetalk.i_typetalk_api import ITypetalkApi
-from src.schemas.message import GetMessagesResponse
+from src.api.dependencies import (
+    get_circuit_breakers,
+    get_i_async_aws_comprehend_api,
+    get_i_async_typetalk_api,
+    get_i_sentiment_store,
+    get_messages_prefetcher,
+    get_topic_feed_hub,
+    get_typetalk_listing_cache,
+)
+from src.core.circuit_breaker import CircuitBreaker, CircuitState
+from src.core.config import Settings, get_settings
+from src.core.metrics import metrics_registry
+from src.core.text_hash import hash_token
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
+from src.infrastructure.sentiment_store.i_sentiment_store import ISentimentStore
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.infrastructure.typetalk.listing_cache import TypetalkListingCache
+from src.schemas.message import (
+    GetMessagesBatchRequest,
+    GetMessagesBatchResponse,
+    GetMessagesResponse,
+    MessagesStreamLine,
+    TopicFeedPosts,
+)
 from src.schemas.space import GetSpacesResponse
 from src.schemas.topic import GetTopicsResponse
-from src.use_cases.get_messages import get_messages_use_case
-from src.use_cases.get_spaces import get_spaces_use_case
-from src.use_cases.get_topics import get_topics_use_case
+from src.use_cases.get_messages import (
+    get_messages_async_use_case,
+    get_messages_since_async_use_case,
+    stream_messages_async_use_case,
+)
+from src.use_cases.get_messages_batch import get_messages_batch_async_use_case
+from src.use_cases.get_spaces import get_spaces_async_use_case
+from src.use_cases.get_topics import get_topics_async_use_case
+from src.use_cases.messages_prefetcher import MessagesPrefetcher
+from src.use_cases.topic_feed import (
+    TopicFeedCapacityError,
+    TopicFeedEventType,
+    TopicFeedHub,
+    TopicSubscription,
+)
 
 router = APIRouter()
 
+# Typetalk API で一度に取得できるメッセージの最大件数
+MAX_MESSAGES_COUNT = 200
+# メッセージ一覧をストリーミングで返す場合のメディアタイプ
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# トピックの新しいポストを配信する場合のメディアタイプ
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
 
-TypetalkApiDep = Annotated[ITypetalkApi, Depends(get_i_typetalk_api)]
-AwsComprehendDep = Annotated[IAwsComprehendApi, Depends(get_i_aws_comprehend_api)]
+
+TypetalkApiDep = Annotated[IAsyncTypetalkApi, Depends(get_i_async_typetalk_api)]
+AwsComprehendDep = Annotated[
+    IAsyncAwsComprehendApi, Depends(get_i_async_aws_comprehend_api)
+]
+SentimentStoreDep = Annotated[ISentimentStore | None, Depends(get_i_sentiment_store)]
+MessagesPrefetcherDep = Annotated[
+    MessagesPrefetcher | None, Depends(get_messages_prefetcher)
+]
+ListingCacheDep = Annotated[
+    TypetalkListingCache | None, Depends(get_typetalk_listing_cache)
+]
+TopicFeedHubDep = Annotated[TopicFeedHub | None, Depends(get_topic_feed_hub)]
+CircuitBreakersDep = Annotated[dict[str, CircuitBreaker], Depends(get_circuit_breakers)]
+SettingsDep = Annotated[Settings, Depends(get_settings)]
 
 
 @router.get("/healthcheck")
@@ -27,6 +83,59 @@ async def health_check() -> dict:
     return {"message": "success"}
 
 
+@router.get("/healthcheck/details")
+async def health_check_details(circuit_breakers: CircuitBreakersDep) -> dict:
+    """詳細ヘルスチェックAPI
+
+    外部サービスごとのサーキットブレーカーの状態を返す。
+    いずれかの外部サービスへの呼び出しを遮断している場合は degraded を返す。
+
+    Args:
+        circuit_breakers (dict[str, CircuitBreaker]):
+            外部サービスごとのサーキットブレーカー
+
+    Returns:
+        dict: 全体の状態と、外部サービスごとのサーキットブレーカーの統計情報
+    """
+    upstreams = {name: asdict(x.stats) for name, x in circuit_breakers.items()}
+    degraded = any(x["state"] != CircuitState.CLOSED for x in upstreams.values())
+    return {"message": "degraded" if degraded else "success", "upstreams": upstreams}
+
+
+@router.get("/metrics")
+async def get_metrics() -> dict:
+    """メトリクス取得API
+
+    キャッシュやリクエストの集約など、性能改善の仕組みの統計情報を返す。
+
+    Returns:
+        dict: メトリクスの名前と値の対応
+    """
+    return metrics_registry.collect()
+
+
+@router.delete("/cache")
+async def invalidate_cache(
+    listing_cache: ListingCacheDep,
+    x_typetalk_token: Annotated[str, Header(min_length=1)],
+) -> dict:
+    """キャッシュ無効化API
+
+    リクエストのアクセストークンに対応する組織一覧とトピック一覧のキャッシュを破棄する。
+    他のアクセストークンのキャッシュには影響しない。
+
+    Args:
+        listing_cache (TypetalkListingCache | None): 組織一覧とトピック一覧のキャッシュ
+        x_typetalk_token (Annotated[str, Header, optional): Typetalkのアクセストークン
+
+    Returns:
+        dict: 破棄したエントリ数
+    """
+    if listing_cache is None:
+        return {"invalidated": 0}
+    return {"invalidated": listing_cache.invalidate(hash_token(x_typetalk_token))}
+
+
 @router.get("/spaces")
 async def get_spaces(
     i_typetalk_api: TypetalkApiDep,
@@ -35,13 +144,15 @@ async def get_spaces(
     """組織一覧取得API
 
     Args:
-        i_typetalk_api (ITypetalkApi): Typetalk APIのインターフェース
+        i_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
         x_typetalk_token (Annotated[str, Header, optional): Typetalkのアクセストークン
 
     Returns:
         GetSpacesResponse: 組織一覧取得APIレスポンス
     """
-    return get_spaces_use_case(i_typetalk_api, typetalk_token=x_typetalk_token)
+    return await get_spaces_async_use_case(
+        i_typetalk_api, typetalk_token=x_typetalk_token
+    )
 
 
 @router.get("/topics")
@@ -53,44 +164,268 @@ async def get_topics(
     """トピック一覧取得API
 
     Args:
-        i_typetalk_api (ITypetalkApi): Typetalk APIのインターフェース
+        i_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
         x_typetalk_token (Annotated[str, Header, optional): Typetalkのアクセストークン
         space_key (Annotated[str, Query, optional): 対象の組織キー
 
     Returns:
         GetTopicsResponse: トピック一覧取得APIレスポンス
     """
-    return get_topics_use_case(
+    return await get_topics_async_use_case(
         i_typetalk_api,
         typetalk_token=x_typetalk_token,
         space_key=space_key,
     )
 
 
-@router.get("/topics/{topic_id}/messages")
+@router.post("/topics/messages:batch")
+async def get_messages_batch(
+    i_typetalk_api: TypetalkApiDep,
+    i_aws_comprehend_api: AwsComprehendDep,
+    i_sentiment_store: SentimentStoreDep,
+    settings: SettingsDep,
+    x_typetalk_token: Annotated[str, Header(min_length=1)],
+    request: GetMessagesBatchRequest,
+) -> GetMessagesBatchResponse:
+    """複数トピックのメッセージ一覧一括取得API
+
+    トピックごとのメッセージ一覧を並行して取得し、全てのトピックのポストをまとめて
+    感情分析する。トピックごとのエラーはレスポンス全体を失敗させず、
+    そのトピックの結果の error として返す。
+
+    Args:
+        i_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
+        i_aws_comprehend_api (IAsyncAwsComprehendApi):
+            AWS Comprehend APIの非同期インターフェース
+        i_sentiment_store (ISentimentStore | None): 感情分析結果の永続ストア
+        settings (Settings): アプリケーションの設定
+        x_typetalk_token (Annotated[str, Header, optional): Typetalkのアクセストークン
+        request (GetMessagesBatchRequest): 対象のトピックIDと取得する件数
+
+    Returns:
+        GetMessagesBatchResponse: トピックごとのメッセージ一覧一括取得APIレスポンス
+    """
+    return await get_messages_batch_async_use_case(
+        i_typetalk_api,
+        i_aws_comprehend_api,
+        typetalk_token=x_typetalk_token,
+        topic_ids=request.topic_ids,
+        count=request.count,
+        max_concurrency=settings.messages_batch_max_concurrency,
+        i_sentiment_store=i_sentiment_store,
+    )
+
+
+@router.get(
+    "/topics/{topic_id}/messages",
+    response_model=GetMessagesResponse,
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
 async def get_messages(
     i_typetalk_api: TypetalkApiDep,
     i_aws_comprehend_api: AwsComprehendDep,
+    i_sentiment_store: SentimentStoreDep,
+    messages_prefetcher: MessagesPrefetcherDep,
     x_typetalk_token: Annotated[str, Header(min_length=1)],
     topic_id: int,
     from_id: int | None = None,
-) -> GetMessagesResponse:
+    count: Annotated[int | None, Query(ge=1, le=MAX_MESSAGES_COUNT)] = None,
+    since_id: Annotated[int | None, Query(ge=0)] = None,
+    stream: bool = False,
+    accept: Annotated[str | None, Header()] = None,
+) -> GetMessagesResponse | StreamingResponse:
     """メッセージ一覧取得API
 
+    先読みが有効な場合は、先読みした結果があればそれを返し、
+    続きのページがあれば次のページを先読みする。
+
+    stream=true または Accept: application/x-ndjson の場合は、感情分析の完了を待たずに
+    NDJSON で返す。最初にトピックと続きのページの有無の行を、次に感情の無いポストの行を
+    返し、その後に感情分析のチャンクが完了するごとにポストの感情の行を返す。
+
+    since_id を指定した場合は、そのIDより新しいポストのみを取得して感情分析し、
+    JSON で返す。ページ数の上限に達してさらに新しいポストがある場合は hasNext が
+    true となるため、返したポストの最新のIDを since_id として続けて取得する。
+
     Args:
-        i_typetalk_api (ITypetalkApi): Typetalk APIのインターフェース
-        i_aws_comprehend_api (IAwsComprehendApi): AWS Comprehend APIのインターフェース
+        i_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
+        i_aws_comprehend_api (IAsyncAwsComprehendApi):
+            AWS Comprehend APIの非同期インターフェース
+        i_sentiment_store (ISentimentStore | None): 感情分析結果の永続ストア
+        messages_prefetcher (MessagesPrefetcher | None): メッセージ一覧の先読み
         topic_id (int): 対象のトピックID
         x_typetalk_token (Annotated[str, Header, optional): Typetalkのアクセストークン
         from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+        count (Annotated[int | None, Query, optional):
+            取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+        since_id (Annotated[int | None, Query, optional):
+            取得済みの最新のポストID。from_id とは同時に指定できない
+        stream (bool, optional): NDJSON のストリーミングで返すかどうか
+        accept (Annotated[str | None, Header, optional): Acceptヘッダー
 
     Returns:
-        GetMessagesResponse: メッセージ一覧取得APIレスポンス
+        GetMessagesResponse | StreamingResponse:
+            メッセージ一覧取得APIレスポンス、またはストリーミングのレスポンス
     """
-    return get_messages_use_case(
-        i_typetalk_api,
-        i_aws_comprehend_api,
-        typetalk_token=x_typetalk_token,
-        topic_id=topic_id,
-        from_id=from_id,
+    if since_id is not None:
+        if from_id is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="from_id and since_id cannot be used together.",
+            )
+        return await get_messages_since_async_use_case(
+            i_typetalk_api,
+            i_aws_comprehend_api,
+            typetalk_token=x_typetalk_token,
+            topic_id=topic_id,
+            since_id=since_id,
+            count=count,
+            i_sentiment_store=i_sentiment_store,
+        )
+
+    if stream or NDJSON_MEDIA_TYPE in (accept or ""):
+        lines = stream_messages_async_use_case(
+            i_typetalk_api,
+            i_aws_comprehend_api,
+            typetalk_token=x_typetalk_token,
+            topic_id=topic_id,
+            from_id=from_id,
+            count=count,
+            i_sentiment_store=i_sentiment_store,
+        )
+        # Typetalk のエラーを通常のエラーレスポンスで返すため、最初の行は先に取得する
+        header = await anext(lines)
+        return StreamingResponse(
+            _to_ndjson(header, lines), media_type=NDJSON_MEDIA_TYPE
+        )
+
+    async def fetch(page_from_id: int | None) -> GetMessagesResponse:
+        """指定の開始IDからメッセージ一覧を取得し、感情分析を行う"""
+        return await get_messages_async_use_case(
+            i_typetalk_api,
+            i_aws_comprehend_api,
+            typetalk_token=x_typetalk_token,
+            topic_id=topic_id,
+            from_id=page_from_id,
+            count=count,
+            i_sentiment_store=i_sentiment_store,
+        )
+
+    if messages_prefetcher is None:
+        return await fetch(from_id)
+    return await messages_prefetcher.get_messages(
+        x_typetalk_token, topic_id, from_id, count, fetch
+    )
+
+
+@router.get(
+    "/topics/{topic_id}/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {EVENT_STREAM_MEDIA_TYPE: {}}}},
+)
+async def stream_topic(
+    i_typetalk_api: TypetalkApiDep,
+    i_aws_comprehend_api: AwsComprehendDep,
+    i_sentiment_store: SentimentStoreDep,
+    topic_feed_hub: TopicFeedHubDep,
+    x_typetalk_token: Annotated[str, Header(min_length=1)],
+    topic_id: int,
+    last_event_id: Annotated[int | None, Header()] = None,
+) -> StreamingResponse:
+    """トピックの新しいポスト配信API
+
+    Server-Sent Events で、購読を開始した後のトピックの新しいポストを感情分析して
+    配信する。トピックごとに1つのポーリングを購読者で共有する。
+    最初に ready イベントを、その後は新しいポストごとに posts イベントを送信する。
+    配信が追いつかない場合は reset イベントを、トピックにアクセスできなくなった場合は
+    closed イベントを送信して終了する。
+
+    Args:
+        i_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
+        i_aws_comprehend_api (IAsyncAwsComprehendApi):
+            AWS Comprehend APIの非同期インターフェース
+        i_sentiment_store (ISentimentStore | None): 感情分析結果の永続ストア
+        topic_feed_hub (TopicFeedHub | None): トピックの新しいポストの配信
+        x_typetalk_token (Annotated[str, Header, optional): Typetalkのアクセストークン
+        topic_id (int): 対象のトピックID
+        last_event_id (Annotated[int | None, Header, optional):
+            再接続の場合の受信済みの最新のポストID
+
+    Returns:
+        StreamingResponse: Server-Sent Events のレスポンス
+    """
+    if topic_feed_hub is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Topic stream is disabled.",
+        )
+    try:
+        subscription = await topic_feed_hub.subscribe(
+            i_typetalk_api,
+            i_aws_comprehend_api,
+            typetalk_token=x_typetalk_token,
+            topic_id=topic_id,
+            last_event_id=last_event_id,
+            i_sentiment_store=i_sentiment_store,
+        )
+    except TopicFeedCapacityError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many topics are being streamed.",
+        ) from e
+
+    return StreamingResponse(
+        _to_server_sent_events(topic_feed_hub, subscription),
+        media_type=EVENT_STREAM_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
+
+
+async def _to_server_sent_events(
+    topic_feed_hub: TopicFeedHub, subscription: TopicSubscription
+) -> AsyncIterator[bytes]:
+    """購読したイベントを Server-Sent Events のイベントに変換する
+
+    イベントが無い間は接続を維持するためのコメントを送信し、
+    購読が終了した場合や切断された場合は購読を解除する。
+
+    Args:
+        topic_feed_hub (TopicFeedHub): トピックの新しいポストの配信
+        subscription (TopicSubscription): トピックの新しいポストの購読
+
+    Yields:
+        bytes: Server-Sent Events のイベント
+    """
+    try:
+        yield f"id: {subscription.last_id}\nevent: ready\ndata: {{}}\n\n".encode()
+        while True:
+            event = await subscription.get()
+            if event is None:
+                yield b": keepalive\n\n"
+                continue
+            if event.type != TopicFeedEventType.POSTS:
+                yield f"event: {event.type}\ndata: {{}}\n\n".encode()
+                return
+            data = TopicFeedPosts(
+                topic_id=subscription.topic_id, posts=list(event.posts)
+            ).model_dump_json(by_alias=True)
+            yield f"id: {event.last_id}\nevent: posts\ndata: {data}\n\n".encode()
+    finally:
+        topic_feed_hub.unsubscribe(subscription)
+
+
+async def _to_ndjson(
+    first_line: MessagesStreamLine, lines: AsyncIterator[MessagesStreamLine]
+) -> AsyncIterator[bytes]:
+    """ストリーミングで送信する行を NDJSON の行に変換する
+
+    Args:
+        first_line (MessagesStreamLine): 先に取得した最初の行
+        lines (AsyncIterator[MessagesStreamLine]): 残りの行
+
+    Yields:
+        bytes: 改行で終わる JSON の行
+    """
+    yield first_line.model_dump_json(by_alias=True).encode() + b"\n"
+    async for line in lines:
+        yield line.model_dump_json(by_alias=True).encode() + b"\n"
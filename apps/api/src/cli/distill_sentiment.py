@@ -0,0 +1,144 @@
+"""AWS Comprehend の結果からローカルで推定するモデルを学習・評価するコマンドを提供する
+
+SENTIMENT_TRAINING_SAMPLES_PATH に記録したサンプルを使用して、
+ハッシュ化した文字 n-gram の線形モデルを学習し、AWS Comprehend の判定との一致率と
+確信度の閾値ごとの一致率を出力する。
+
+- train: サンプルの一部を評価用に分けて学習し、評価結果を出力してモデルを保存する
+- evaluate: 保存したモデルをサンプル全体で評価する
+
+実行方法:
+    python -m src.cli.distill_sentiment train --samples samples.jsonl --model model.npz
+    python -m src.cli.distill_sentiment evaluate --samples samples.jsonl \
+        --model model.npz
+"""
+
+import argparse
+import random
+import time
+
+from src.infrastructure.local_sentiment.hashed_char_ngrams import (
+    HashedCharNgramVectorizer,
+)
+from src.infrastructure.local_sentiment.lexicon_sentiment_api import (
+    LexiconSentimentApi,
+)
+from src.infrastructure.local_sentiment.linear_sentiment_model import (
+    LinearSentimentModel,
+    TrainingAlgorithm,
+)
+from src.infrastructure.local_sentiment.training_samples import (
+    TrainingSample,
+    read_training_samples,
+    to_target_matrix,
+)
+
+# 評価結果に出力する確信度の閾値
+CONFIDENCE_THRESHOLDS = (0.5, 0.6, 0.7, 0.8, 0.9)
+
+
+def evaluate(model: LinearSentimentModel, samples: list[TrainingSample]) -> None:
+    """モデルの推定と AWS Comprehend の判定を比較した結果を出力する
+
+    確信度の閾値ごとに、ローカルの推定結果を採用する割合 (coverage) と、
+    採用したテキストでの一致率を出力する。段階的な感情分析の閾値を決める目安となる。
+
+    Args:
+        model (LinearSentimentModel): 評価するモデル
+        samples (list[TrainingSample]): 評価に使用するサンプルのリスト
+    """
+    texts = [x.text for x in samples]
+    start = time.perf_counter()
+    scores = model.predict_proba(texts)
+    elapsed = time.perf_counter() - start
+
+    expected = to_target_matrix(samples).argmax(axis=1)
+    predicted = scores.argmax(axis=1)
+    matched = predicted == expected
+    confidence = scores.max(axis=1)
+    print(f"samples: {len(samples)}")
+    print(f"accuracy: {matched.mean():.3f}")
+    print(f"per text: {elapsed * 1_000_000 / len(samples):.1f}us")
+    for label, sentiment in enumerate(LexiconSentimentApi.SENTIMENTS):
+        support = int((expected == label).sum())
+        recall = matched[expected == label].mean() if support else 0.0
+        print(f"  {sentiment.value:<9} support {support:>6} recall {recall:.3f}")
+    print(f"{'threshold':>9} {'coverage':>9} {'accuracy':>9}")
+    for threshold in CONFIDENCE_THRESHOLDS:
+        accepted = confidence >= threshold
+        accuracy = matched[accepted].mean() if accepted.any() else 0.0
+        print(f"{threshold:>9.2f} {accepted.mean():>9.3f} {accuracy:>9.3f}")
+
+
+def _train(args: argparse.Namespace) -> None:
+    """サンプルの一部を評価用に分けてモデルを学習し、保存する"""
+    samples = read_training_samples(args.samples)
+    random.Random(args.seed).shuffle(samples)
+    eval_count = int(len(samples) * args.eval_fraction)
+    eval_samples, train_samples = samples[:eval_count], samples[eval_count:]
+    if not train_samples:
+        raise SystemExit(f"No training samples in {args.samples}")
+
+    model = LinearSentimentModel.fit(
+        [x.text for x in train_samples],
+        to_target_matrix(train_samples),
+        HashedCharNgramVectorizer(
+            n_features=args.n_features, ngram_range=(1, args.ngram_max)
+        ),
+        algorithm=args.algorithm,
+        epochs=args.epochs,
+        learning_rate=args.learning_rate,
+    )
+    model.save(args.model)
+    print(f"trained on {len(train_samples)} samples, saved to {args.model}")
+    if eval_samples:
+        evaluate(model, eval_samples)
+
+
+def _evaluate(args: argparse.Namespace) -> None:
+    """保存したモデルをサンプル全体で評価する"""
+    samples = read_training_samples(args.samples)
+    if not samples:
+        raise SystemExit(f"No samples in {args.samples}")
+    evaluate(LinearSentimentModel.load(args.model), samples)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """コマンドを実行する
+
+    Args:
+        argv (list[str] | None, optional): コマンドライン引数 (省略時は sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(required=True)
+
+    train_parser = subparsers.add_parser("train", help="モデルを学習して保存する")
+    train_parser.set_defaults(handler=_train)
+    train_parser.add_argument("--samples", required=True)
+    train_parser.add_argument("--model", required=True)
+    train_parser.add_argument(
+        "--algorithm",
+        type=TrainingAlgorithm,
+        choices=list(TrainingAlgorithm),
+        default=TrainingAlgorithm.LOGISTIC_REGRESSION,
+    )
+    train_parser.add_argument("--n-features", type=int, default=2**17)
+    train_parser.add_argument("--ngram-max", type=int, default=3)
+    train_parser.add_argument("--epochs", type=int, default=200)
+    train_parser.add_argument("--learning-rate", type=float, default=0.05)
+    train_parser.add_argument("--eval-fraction", type=float, default=0.2)
+    train_parser.add_argument("--seed", type=int, default=0)
+
+    evaluate_parser = subparsers.add_parser("evaluate", help="モデルを評価する")
+    evaluate_parser.set_defaults(handler=_evaluate)
+    evaluate_parser.add_argument("--samples", required=True)
+    evaluate_parser.add_argument("--model", required=True)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
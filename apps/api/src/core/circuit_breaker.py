@@ -0,0 +1,172 @@
+"""障害が続く外部サービスへの呼び出しを遮断するサーキットブレーカーを定義する"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class CircuitState(StrEnum):
+    """サーキットブレーカーの状態を定義する列挙型"""
+
+    # 呼び出しを許可し、連続した失敗を数える
+    CLOSED = "closed"
+    # 呼び出しを遮断し、すぐにエラーとする
+    OPEN = "open"
+    # 復旧を確認するため、限られた数の呼び出しのみを許可する
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStats:
+    """サーキットブレーカーに関する統計情報
+
+    Attributes:
+        state (str): 現在の状態 (closed / open / half_open)
+        consecutive_failures (int): 連続した失敗の回数
+        failures (int): 失敗として数えた呼び出しの回数
+        rejected (int): 遮断によりすぐにエラーとした呼び出しの回数
+        opened (int): 遮断を開始した回数
+        probes (int): 復旧の確認のために許可した呼び出しの回数
+    """
+
+    state: str
+    consecutive_failures: int
+    failures: int
+    rejected: int
+    opened: int
+    probes: int
+
+
+class CircuitBreaker:
+    """外部サービスごとに呼び出しの成否を記録し、障害が続く場合に呼び出しを遮断する
+
+    連続した失敗が failure_threshold に達すると遮断 (open) し、外部サービスの
+    タイムアウトを待たずにすぐにエラーとする。probe_interval_seconds が経過すると
+    半開 (half_open) となり、half_open_max_calls 件の呼び出しで復旧を確認する。
+    確認の呼び出しが成功すると閉じ (closed)、失敗すると再び遮断する。
+
+    呼び出し側は allow で許可を得た後、結果に応じて record_success または
+    record_failure を呼び出す。結果を記録せずに中断した場合は release を呼び出す。
+    ワーカースレッドからも呼び出されるため、スレッドセーフに実装する。
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        probe_interval_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """CircuitBreaker クラスのインスタンスを初期化する
+
+        Args:
+            failure_threshold (int, optional): 遮断を開始する連続した失敗の回数
+            probe_interval_seconds (float, optional):
+                遮断してから復旧の確認を始めるまでの時間(秒)
+            half_open_max_calls (int, optional):
+                復旧の確認のために同時に許可する呼び出し数
+            clock (Callable[[], float], optional): 現在時刻(秒)を返す関数
+        """
+        self.failure_threshold = failure_threshold
+        self.probe_interval_seconds = probe_interval_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._consecutive_failures = 0
+        self._failures = 0
+        self._rejected = 0
+        self._opened = 0
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """現在の状態を返す"""
+        with self._lock:
+            return self._current_state()
+
+    @property
+    def stats(self) -> CircuitBreakerStats:
+        """サーキットブレーカーに関する統計情報を返す"""
+        with self._lock:
+            return CircuitBreakerStats(
+                state=self._current_state().value,
+                consecutive_failures=self._consecutive_failures,
+                failures=self._failures,
+                rejected=self._rejected,
+                opened=self._opened,
+                probes=self._probes,
+            )
+
+    def allow(self) -> bool:
+        """呼び出しを許可するかどうかを返す
+
+        Returns:
+            bool: 許可する場合は True。遮断中の場合は False
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if (
+                state == CircuitState.HALF_OPEN
+                and self._probes_in_flight < self.half_open_max_calls
+            ):
+                self._probes_in_flight += 1
+                self._probes += 1
+                return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """呼び出しの成功を記録し、復旧の確認中の場合は閉じる"""
+        with self._lock:
+            if self._current_state() == CircuitState.HALF_OPEN:
+                self._release_probe()
+                self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """呼び出しの失敗を記録し、必要に応じて遮断を開始する"""
+        with self._lock:
+            state = self._current_state()
+            self._failures += 1
+            self._consecutive_failures += 1
+            if state == CircuitState.HALF_OPEN:
+                self._release_probe()
+                self._open()
+            elif (
+                state == CircuitState.CLOSED
+                and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._open()
+
+    def release(self) -> None:
+        """結果を記録せずに中断した呼び出しの許可を返却する"""
+        with self._lock:
+            if self._current_state() == CircuitState.HALF_OPEN:
+                self._release_probe()
+
+    def _current_state(self) -> CircuitState:
+        """確認までの時間が経過している場合は半開に移行し、現在の状態を返す"""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.probe_interval_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probes_in_flight = 0
+        return self._state
+
+    def _open(self) -> None:
+        """遮断を開始する"""
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._opened += 1
+
+    def _release_probe(self) -> None:
+        """復旧の確認のために許可した呼び出しの枠を返却する"""
+        self._probes_in_flight = max(0, self._probes_in_flight - 1)
@@ -2,6 +2,7 @@
 
 import os
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -29,10 +30,160 @@ class Settings(BaseSettings):
 
     # AWS Comprehend API設定
     use_mock_aws_comprehend_api: bool
+    # 感情分析エンジン (comprehend / lexicon / distilled / tiered)
+    # lexicon は日本語の極性辞書によりプロセス内で推定する。モックAPIの設定が優先される
+    # distilled は AWS Comprehend の結果から学習したモデルによりプロセス内で推定する
+    # tiered はローカルで推定し、確信度の低いテキストのみを AWS Comprehend で分析する
+    # (ローカルの推定には、モデルのパスがあればモデルを、無ければ極性辞書を使う)
+    sentiment_engine: Literal["comprehend", "lexicon", "distilled", "tiered"] = (
+        "comprehend"
+    )
+    # tiered の場合に、ローカルの推定結果を採用する確信度(最も高いスコア)の下限
+    tiered_sentiment_confidence_threshold: float = 0.6
+    # distilled と tiered で使用する、学習したモデル(npz 形式)のパス
+    distilled_model_path: str = ""
+    # AWS Comprehend の結果をモデルの学習用に追記する JSON Lines ファイルのパス
+    # (空の場合は記録しない。メッセージの本文がそのまま記録される点に注意する)
+    sentiment_training_samples_path: str = ""
+
+    # AWS Comprehend クライアント設定
+    # コネクションプールの最大接続数
+    comprehend_max_pool_connections: int = 10
+    # 接続確立と読み込みのタイムアウト(秒)
+    comprehend_connect_timeout: float = 3.0
+    comprehend_read_timeout: float = 10.0
+    # リトライモード (legacy / standard / adaptive) と最大試行回数
+    # 送信の制御が有効な場合は再試行を送信の制御で行うため、最大試行回数は1回となる
+    comprehend_retry_mode: Literal["legacy", "standard", "adaptive"] = "standard"
+    comprehend_max_attempts: int = 3
+    # TCPキープアライブを有効にするかどうか
+    comprehend_tcp_keepalive: bool = True
+    # 25件を超えるテキストを分割して並列に送信する際のワーカー数
+    comprehend_chunk_max_workers: int = 8
+    # 感情分析結果のキャッシュのエントリ数の上限と有効期限(秒)
+    comprehend_cache_max_size: int = 10000
+    comprehend_cache_ttl_seconds: float = 3600.0
+    # リクエストをまたいでテキストを集約して送信するかどうかと、
+    # テキストを集約する最大の待ち時間(ミリ秒)
+    comprehend_micro_batch_enabled: bool = True
+    comprehend_micro_batch_window_ms: float = 10.0
+    # アカウントの秒間リクエスト数(TPS)に合わせて送信を制御するかどうかと、
+    # 1秒あたりに送信する回数の上限、待機せずに連続で送信できる回数の上限
+    comprehend_governor_enabled: bool = True
+    comprehend_transactions_per_second: float = 10.0
+    comprehend_burst: int = 10
+    # スロットリングやテキストごとの一時的なエラーを再試行する回数の上限
+    comprehend_throttle_max_retries: int = 3
+    # 再試行時の指数バックオフの基準となる待機時間と上限(秒)
+    comprehend_backoff_base_seconds: float = 0.1
+    comprehend_backoff_max_seconds: float = 2.0
+    # 1回の呼び出しで再試行を続ける時間の上限(秒)
+    comprehend_retry_max_total_seconds: float = 5.0
+    # 障害が続く場合に呼び出しを遮断するかどうかと、遮断を開始する連続した失敗の回数、
+    # 遮断してから復旧の確認を始めるまでの時間(秒)
+    comprehend_circuit_breaker_enabled: bool = True
+    comprehend_circuit_breaker_failure_threshold: int = 5
+    comprehend_circuit_breaker_probe_interval_seconds: float = 30.0
+
+    # 感情分析結果の永続ストア設定
+    # SQLiteデータベースファイルのパス (空の場合は永続ストアを使用しない)
+    sentiment_store_path: str = ""
+    # 保存する件数の上限
+    sentiment_store_max_entries: int = 1_000_000
+    # コンパクションを行う書き込み件数の間隔
+    sentiment_store_compact_interval: int = 10_000
+
+    # メッセージ一覧の先読み設定
+    # 次のページのメッセージ一覧を先読みするかどうか
+    messages_prefetch_enabled: bool = False
+    # 先読みした結果の有効期間(秒)、キャッシュするページ数、同時に実行する先読みの上限
+    messages_prefetch_ttl_seconds: float = 30.0
+    messages_prefetch_max_entries: int = 256
+    messages_prefetch_max_concurrency: int = 4
+
+    # 複数トピックのメッセージ一覧の一括取得設定
+    # 同時にメッセージ一覧を取得するトピック数の上限
+    messages_batch_max_concurrency: int = 8
+
+    # トピックの新しいポストの配信(Server-Sent Events)設定
+    # トピックごとに共有のポーリングで新しいポストを配信するかどうか
+    topic_stream_enabled: bool = True
+    # ポーリングの間隔(秒)と、ポーリングで1ページに取得するメッセージの件数
+    topic_stream_poll_interval_seconds: float = 5.0
+    topic_stream_poll_count: int = 50
+    # 購読者がいない場合にポーリングを終了するまでの時間(秒)
+    topic_stream_idle_timeout_seconds: float = 30.0
+    # 購読者ごとの読み出されていないイベントの上限。超えた購読者の配信は終了する
+    topic_stream_queue_size: int = 100
+    # イベントが無い場合に接続を維持するための送信を行う間隔(秒)
+    topic_stream_keepalive_seconds: float = 15.0
+    # 同時にポーリングするトピック数の上限
+    topic_stream_max_topics: int = 100
+
+    # リクエストのヘッジ設定
+    # 一定時間内に結果が返らない場合に、同じリクエストを追加で送信するかどうか
+    typetalk_hedging_enabled: bool = False
+    comprehend_hedging_enabled: bool = False
+    # ヘッジまでの待ち時間とするレイテンシの分位点と、その下限と上限(ミリ秒)
+    hedging_quantile: float = 0.95
+    hedging_min_delay_ms: float = 10.0
+    hedging_max_delay_ms: float = 2000.0
+    # 呼び出し回数に対するヘッジの割合の上限
+    hedging_budget_ratio: float = 0.05
+    # ヘッジを始めるのに必要なレイテンシの計測数と、分位点の計算に使う計測数
+    hedging_min_samples: int = 20
+    hedging_window_size: int = 200
 
     # Typetalk API URL
     typetalk_api_base_url: str
 
+    # Typetalk API HTTPクライアント設定
+    # コネクションプールの最大接続数
+    typetalk_http_max_connections: int = 100
+    # キープアライブで保持する最大接続数
+    typetalk_http_max_keepalive_connections: int = 20
+    # キープアライブ接続を保持する秒数
+    typetalk_http_keepalive_expiry: float = 30.0
+    # HTTP/2を使用するかどうか (使用する場合は h2 パッケージが必要)
+    typetalk_http2: bool = False
+    # 接続確立のタイムアウト(秒)
+    typetalk_connect_timeout: float = 3.0
+    # エンドポイントごとのタイムアウト(秒)
+    typetalk_spaces_timeout: float = 5.0
+    typetalk_topics_timeout: float = 5.0
+    typetalk_messages_timeout: float = 10.0
+    # 同時に行われる同じリクエストを1回にまとめるかどうか
+    typetalk_coalesce_requests: bool = True
+    # 組織一覧とトピック一覧をアクセストークンごとにキャッシュするかどうか
+    # 有効にすると、有効期間内の一覧の変更は再取得されるまで反映されない
+    typetalk_listing_cache_enabled: bool = False
+    # 組織一覧とトピック一覧の有効期間(秒)
+    typetalk_spaces_cache_ttl_seconds: float = 300.0
+    typetalk_topics_cache_ttl_seconds: float = 60.0
+    # 有効期間を過ぎた一覧を、再取得の間に返してよい期間(秒)
+    typetalk_listing_cache_stale_seconds: float = 600.0
+    # キャッシュするエントリ数の上限
+    typetalk_listing_cache_max_size: int = 10000
+    # 401/403/404 のエラーレスポンスをキャッシュするかどうかと、その有効期間(秒)
+    typetalk_negative_cache_enabled: bool = True
+    typetalk_negative_cache_ttl_seconds: float = 10.0
+    # エラーレスポンスをキャッシュするエントリ数の上限
+    typetalk_negative_cache_max_size: int = 10000
+    # レート制限に合わせてアクセストークンごとに送信を調整するかどうか
+    typetalk_rate_limit_enabled: bool = True
+    # 送信を分散させ始める、上限に対する残りリクエスト数の割合
+    typetalk_rate_limit_smoothing_threshold: float = 0.2
+    # 送信を待機させる時間の上限(秒)。超える場合は送信せずに429エラーとする
+    typetalk_rate_limit_max_wait_seconds: float = 10.0
+    # レート制限が不明な場合の、アクセストークンごとの同時実行数の初期値と最大値
+    typetalk_rate_limit_initial_concurrency: int = 4
+    typetalk_rate_limit_max_concurrency: int = 32
+    # 障害が続く場合にリクエストを遮断するかどうかと、遮断を開始する連続した失敗の回数、
+    # 遮断してから復旧の確認を始めるまでの時間(秒)
+    typetalk_circuit_breaker_enabled: bool = True
+    typetalk_circuit_breaker_failure_threshold: int = 5
+    typetalk_circuit_breaker_probe_interval_seconds: float = 30.0
+
     # 環境設定の読み込み方法を定義
     # 本番環境(APP_ENV=production)では.envファイルを読み込まない
     model_config = SettingsConfigDict(
@@ -40,6 +191,14 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @property
+    def use_aws_comprehend_api(self) -> bool:
+        """AWS Comprehend APIを呼び出すかどうかを返す"""
+        return not self.use_mock_aws_comprehend_api and self.sentiment_engine not in (
+            "lexicon",
+            "distilled",
+        )
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,199 @@
+"""遅いリクエストと同じリクエストを追加で送信し、先に返った結果を使う仕組みを定義する"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from src.core.config import Settings
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    """リクエストのヘッジに関する統計情報
+
+    Attributes:
+        calls (int): 呼び出し回数
+        hedged (int): ヘッジのリクエストを送信した回数
+        wins (int): ヘッジのリクエストが先に結果を返した回数
+        budget_exhausted (int): 予算が足りないためヘッジしなかった回数
+        hedge_rate (float): 呼び出し回数に対するヘッジのリクエストの割合
+        delay_ms (float | None): 現在のヘッジまでの待ち時間(ミリ秒)。
+            計測したレイテンシが少なくヘッジしない場合は None
+    """
+
+    calls: int
+    hedged: int
+    wins: int
+    budget_exhausted: int
+    hedge_rate: float
+    delay_ms: float | None
+
+
+class RequestHedger:
+    """一定時間内に結果が返らない処理を、もう1つ同時に実行して先に返った結果を使う
+
+    ヘッジまでの待ち時間は、直近の呼び出しのレイテンシの分位点(既定は p95)とする。
+    追加の負荷は予算で制限し、1回の呼び出しごとに budget_ratio 分の予算を積み立て、
+    ヘッジのリクエストごとに1を消費する。予算が足りない場合はヘッジしない。
+
+    ヘッジするのは冪等な読み取りの処理に限ること。先に結果が返った場合、
+    もう一方のタスクはキャンセルする(スレッドで実行中の処理は完了まで継続する)。
+    """
+
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        budget_ratio: float = 0.05,
+        min_delay_seconds: float = 0.01,
+        max_delay_seconds: float = 2.0,
+        min_samples: int = 20,
+        window_size: int = 200,
+        max_budget: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """RequestHedger クラスのインスタンスを初期化する
+
+        Args:
+            quantile (float, optional): ヘッジまでの待ち時間とするレイテンシの分位点
+            budget_ratio (float, optional): 呼び出し回数に対するヘッジの割合の上限
+            min_delay_seconds (float, optional): ヘッジまでの待ち時間の下限(秒)
+            max_delay_seconds (float, optional): ヘッジまでの待ち時間の上限(秒)
+            min_samples (int, optional): ヘッジを始めるのに必要なレイテンシの計測数
+            window_size (int, optional): 分位点の計算に使う直近のレイテンシの数
+            max_budget (float, optional): 積み立てる予算の上限
+            clock (Callable[[], float], optional): 現在時刻(秒)を返す関数
+        """
+        self.quantile = quantile
+        self.budget_ratio = budget_ratio
+        self.min_delay_seconds = min_delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.min_samples = min_samples
+        self.max_budget = max_budget
+        self._clock = clock
+        self._latencies: deque[float] = deque(maxlen=window_size)
+        self._budget = 0.0
+        self._calls = 0
+        self._hedged = 0
+        self._wins = 0
+        self._budget_exhausted = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RequestHedger":
+        """環境設定からヘッジの仕組みを作成する
+
+        Args:
+            settings (Settings): 環境設定
+
+        Returns:
+            RequestHedger: ヘッジの仕組み
+        """
+        return cls(
+            quantile=settings.hedging_quantile,
+            budget_ratio=settings.hedging_budget_ratio,
+            min_delay_seconds=settings.hedging_min_delay_ms / 1000,
+            max_delay_seconds=settings.hedging_max_delay_ms / 1000,
+            min_samples=settings.hedging_min_samples,
+            window_size=settings.hedging_window_size,
+        )
+
+    @property
+    def stats(self) -> HedgingStats:
+        """リクエストのヘッジに関する統計情報を返す"""
+        delay = self.delay_seconds()
+        return HedgingStats(
+            calls=self._calls,
+            hedged=self._hedged,
+            wins=self._wins,
+            budget_exhausted=self._budget_exhausted,
+            hedge_rate=self._hedged / self._calls if self._calls else 0.0,
+            delay_ms=None if delay is None else delay * 1000,
+        )
+
+    def delay_seconds(self) -> float | None:
+        """直近のレイテンシの分位点から、ヘッジまでの待ち時間(秒)を返す
+
+        Returns:
+            float | None: ヘッジまでの待ち時間。計測数が足りない場合は None
+        """
+        if len(self._latencies) < self.min_samples:
+            return None
+        latencies = sorted(self._latencies)
+        rank = min(len(latencies) - 1, math.ceil(self.quantile * len(latencies)) - 1)
+        return min(self.max_delay_seconds, max(self.min_delay_seconds, latencies[rank]))
+
+    async def run(self, func: Callable[[], Awaitable[T]]) -> T:
+        """処理を実行し、待ち時間を過ぎても結果が返らない場合はもう1つ同時に実行する
+
+        Args:
+            func (Callable[[], Awaitable[T]]): 実行する冪等な処理
+
+        Returns:
+            T: 先に正常に完了した処理の結果
+        """
+        self._calls += 1
+        self._budget = min(self.max_budget, self._budget + self.budget_ratio)
+        started_at = self._clock()
+        delay = self.delay_seconds()
+        if delay is None:
+            result = await func()
+            self._latencies.append(self._clock() - started_at)
+            return result
+
+        primary = asyncio.ensure_future(func())
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                result = primary.result()
+                self._latencies.append(self._clock() - started_at)
+                return result
+        except BaseException:
+            primary.cancel()
+            raise
+
+        if self._budget < 1:
+            self._budget_exhausted += 1
+            result = await primary
+            self._latencies.append(self._clock() - started_at)
+            return result
+
+        self._budget -= 1
+        self._hedged += 1
+        hedge = asyncio.ensure_future(func())
+        result, winner = await self._first_success(primary, hedge)
+        if winner is hedge:
+            self._wins += 1
+        self._latencies.append(self._clock() - started_at)
+        return result
+
+    @staticmethod
+    async def _first_success(
+        primary: asyncio.Future[T], hedge: asyncio.Future[T]
+    ) -> tuple[T, asyncio.Future[T]]:
+        """先に正常に完了したタスクの結果を返し、もう一方をキャンセルする
+
+        両方とも失敗した場合は、最初に実行したタスクの例外を送出する。
+        """
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                # 同時に完了した場合は最初に実行したタスクを優先する
+                for task in sorted(done, key=lambda x: x is not primary):
+                    if not task.cancelled() and task.exception() is None:
+                        return task.result(), task
+            return primary.result(), primary
+        finally:
+            for task in pending:
+                task.cancel()
+            # 両方とも失敗した場合に、取得されない例外の警告を出さないようにする
+            for task in (primary, hedge):
+                if task.done() and not task.cancelled():
+                    task.exception()
@@ -0,0 +1,54 @@
+"""アプリケーションの内部状態をメトリクスとして収集する仕組みを定義する"""
+
+import threading
+from collections.abc import Callable, Mapping
+from typing import Any
+
+MetricsCollector = Callable[[], Mapping[str, Any]]
+
+
+class MetricsRegistry:
+    """メトリクスの収集関数を名前ごとに登録し、まとめて収集するクラス
+
+    キャッシュやクライアントなどのコンポーネントは、作成時に自身の統計情報を返す
+    関数を登録する。登録された関数はメトリクスAPIの呼び出し時に実行される。
+    """
+
+    def __init__(self) -> None:
+        """MetricsRegistry クラスのインスタンスを初期化する"""
+        self._collectors: dict[str, MetricsCollector] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, collector: MetricsCollector) -> None:
+        """メトリクスの収集関数を登録する
+
+        同じ名前で登録済みの場合は上書きする。
+
+        Args:
+            name (str): メトリクスの名前
+            collector (MetricsCollector): メトリクスを返す関数
+        """
+        with self._lock:
+            self._collectors[name] = collector
+
+    def unregister(self, name: str) -> None:
+        """メトリクスの収集関数の登録を解除する
+
+        Args:
+            name (str): メトリクスの名前
+        """
+        with self._lock:
+            self._collectors.pop(name, None)
+
+    def collect(self) -> dict[str, dict[str, Any]]:
+        """登録された全てのメトリクスを収集する
+
+        Returns:
+            dict[str, dict[str, Any]]: メトリクスの名前と値の対応
+        """
+        with self._lock:
+            collectors = dict(self._collectors)
+        return {name: dict(collector()) for name, collector in collectors.items()}
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,36 @@
+"""テキストやアクセストークンを内容で識別するハッシュ関数を定義する"""
+
+import hashlib
+import unicodedata
+
+
+def hash_text(text: str, language_code: str = "ja") -> str:
+    """正規化したテキストと言語コードからハッシュ値を作成する
+
+    Unicode正規化(NFKC)と前後の空白の除去を行い、
+    表記揺れのみが異なるテキストが同じハッシュ値になるようにする。
+
+    Args:
+        text (str): 対象のテキスト
+        language_code (str, optional): テキストの言語コード
+
+    Returns:
+        str: SHA-256 のハッシュ値(16進数文字列)
+    """
+    normalized = unicodedata.normalize("NFKC", text).strip()
+    return hashlib.sha256(f"{language_code}\0{normalized}".encode()).hexdigest()
+
+
+def hash_token(typetalk_token: str) -> str:
+    """アクセストークンからハッシュ値を作成する
+
+    キャッシュのキーやメトリクスなど、アクセストークンを識別する必要があるが
+    トークン自体を保持してはならない箇所で使用する。
+
+    Args:
+        typetalk_token (str): Typetalkのアクセストークン
+
+    Returns:
+        str: SHA-256 のハッシュ値(16進数文字列)
+    """
+    return hashlib.sha256(typetalk_token.encode()).hexdigest()
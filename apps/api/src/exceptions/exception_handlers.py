@@ -5,8 +5,15 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
 from src.core.logger.logger import logger
-from src.infrastructure.aws.comprehend.exceptions import ComprehendError
-from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.typetalk.exceptions import (
+    CachedTypetalkAPIError,
+    TypetalkAPIError,
+    TypetalkCircuitOpenError,
+)
 
 
 async def typetalk_error_handler(
@@ -15,6 +22,9 @@ async def typetalk_error_handler(
 ) -> Response:
     """Typetalk API で発生したエラーをキャッチするハンドラー
 
+    キャッシュしたエラーレスポンスの場合や、サーキットブレーカーが遮断した場合は、
+    スタックトレースを出力せずに警告を記録する。
+
     Args:
         request (Request): FastAPIのリクエストオブジェクト
         exc (TypetalkAPIError): キャッチされた例外
@@ -22,7 +32,12 @@ async def typetalk_error_handler(
     Returns:
         JSONResponse: エラーレスポンス
     """
-    logger.exception("Typetalk API request failed.: %s", exc)
+    if isinstance(exc, CachedTypetalkAPIError):
+        logger.warning("Typetalk API request failed (cached).: %s", exc)
+    elif isinstance(exc, TypetalkCircuitOpenError):
+        logger.warning("Typetalk API request failed (circuit open).: %s", exc)
+    else:
+        logger.exception("Typetalk API request failed.: %s", exc)
 
     content = {"title": "Typetalk API request failed."}
     if exc.content and exc.content["error"]:
@@ -40,6 +55,8 @@ async def comprehend_error_handler(
 ) -> Response:
     """AWS Comprehend APIで発生したエラーをキャッチするハンドラー
 
+    サーキットブレーカーが遮断した場合は、スタックトレースを出力せずに警告を記録する。
+
     Args:
         request (Request): FastAPIのリクエストオブジェクト
         exc (ComprehendError): キャッチされた例外
@@ -47,7 +64,10 @@ async def comprehend_error_handler(
     Returns:
         JSONResponse: エラーレスポンス
     """
-    logger.exception("AWS Comprehend API error occurred.: %s", exc)
+    if exc.error_type == ComprehendErrorType.CIRCUIT_OPEN:
+        logger.warning("AWS Comprehend API error occurred (circuit open).: %s", exc)
+    else:
+        logger.exception("AWS Comprehend API error occurred.: %s", exc)
 
     return JSONResponse(
         status_code=exc.status_code,
@@ -0,0 +1,47 @@
+"""同期版のAWS Comprehend APIを非同期に呼び出すクラスを定義する"""
+
+import asyncio
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+)
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+
+
+class AsyncAwsComprehendApi(IAsyncAwsComprehendApi):
+    """IAwsComprehendApi の実装をワーカースレッドで実行する非同期アダプター
+
+    boto3 はブロッキングI/Oを行うため、イベントループをブロックしないように
+    asyncio.to_thread を使用してスレッドプール上で呼び出す。
+    """
+
+    def __init__(self, aws_comprehend_api: IAwsComprehendApi):
+        """AsyncAwsComprehendApi クラスのインスタンスを初期化する
+
+        Args:
+            aws_comprehend_api (IAwsComprehendApi): 呼び出し対象の同期版API
+        """
+        self.aws_comprehend_api = aws_comprehend_api
+
+    async def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出する
+
+        Args:
+            text_list (list[str]): 感情を検出するテキストのリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+
+        Raises:
+            ComprehendError: Comprehend APIに関連するエラーが発生した場合
+        """
+        return await asyncio.to_thread(
+            self.aws_comprehend_api.batch_detect_sentiment,
+            text_list,
+        )
@@ -1,17 +1,22 @@
 """AWSのComprehendサービスを使用して、テキストの感情分析を行うクラスを定義する"""
 
-import boto3
+from typing import TYPE_CHECKING
+
 from botocore.exceptions import BotoCoreError, ClientError
 
 from src.infrastructure.aws.comprehend.aws_comprehend_models import (
     BatchDetectSentimentResponse,
 )
+from src.infrastructure.aws.comprehend.comprehend_client import get_comprehend_client
 from src.infrastructure.aws.comprehend.exceptions import (
     ComprehendError,
     ComprehendErrorType,
 )
 from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
 
+if TYPE_CHECKING:
+    from mypy_boto3_comprehend.client import ComprehendClient
+
 
 class AwsComprehendApi(IAwsComprehendApi):
     """AWS Comprehend APIを使用してテキストの感情分析を行うクラス"""
@@ -19,6 +24,16 @@ class AwsComprehendApi(IAwsComprehendApi):
     MAX_BATCH_SIZE = 25
     MAX_TEXT_SIZE = 5000
 
+    def __init__(self, comprehend_client: "ComprehendClient | None" = None):
+        """AwsComprehendApi クラスのインスタンスを初期化する
+
+        Args:
+            comprehend_client (ComprehendClient | None, optional):
+                使用するAWS Comprehendクライアント。
+                省略した場合はプロセス全体で共有するクライアントを使用する。
+        """
+        self._comprehend_client = comprehend_client
+
     def _validate_input(self, text_list: list[str]) -> None:
         if not text_list:
             raise ComprehendError(
@@ -66,7 +81,7 @@ class AwsComprehendApi(IAwsComprehendApi):
         self._validate_input(text_list)
 
         try:
-            comprehend_client = boto3.client("comprehend")
+            comprehend_client = self._comprehend_client or get_comprehend_client()
             comprehend_response = comprehend_client.batch_detect_sentiment(
                 TextList=text_list,
                 LanguageCode="ja",
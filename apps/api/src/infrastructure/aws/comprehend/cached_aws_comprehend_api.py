@@ -0,0 +1,175 @@
+"""感情分析の結果をテキストの内容で再利用するキャッシュ付きのクラスを定義する"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.core.text_hash import hash_text
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentError,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+
+
+@dataclass(frozen=True)
+class SentimentCacheStats:
+    """感情分析キャッシュの統計情報
+
+    Attributes:
+        hits (int): キャッシュから結果を返したテキスト数
+        misses (int): キャッシュに結果が無く、感情分析を行ったテキスト数
+        evictions (int): 容量超過または有効期限切れで破棄したエントリ数
+        size (int): 現在のエントリ数
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class CachedAwsComprehendApi(IAwsComprehendApi):
+    """感情分析の結果をメモリ上にキャッシュするデコレーター
+
+    正規化したテキストと言語コードのハッシュをキーとして結果を保持し、
+    キャッシュに無いテキストだけを呼び出し対象のAPIに送信する。
+    エントリ数の上限を超えた場合は最も長く使われていないエントリから破棄し、
+    有効期限を過ぎたエントリは参照時に破棄する。
+    エラーとなったテキストの結果はキャッシュしない。
+    """
+
+    def __init__(
+        self,
+        aws_comprehend_api: IAwsComprehendApi,
+        max_size: int = 10000,
+        ttl_seconds: float = 3600.0,
+        language_code: str = "ja",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """CachedAwsComprehendApi クラスのインスタンスを初期化する
+
+        Args:
+            aws_comprehend_api (IAwsComprehendApi): 呼び出し対象のAPI
+            max_size (int, optional): キャッシュするエントリ数の上限
+            ttl_seconds (float, optional): エントリの有効期限(秒)
+            language_code (str, optional): キーに含める言語コード
+            clock (Callable[[], float], optional): 現在時刻(秒)を返す関数
+        """
+        self.aws_comprehend_api = aws_comprehend_api
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.language_code = language_code
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, SentimentResult]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> SentimentCacheStats:
+        """キャッシュの統計情報を返す"""
+        with self._lock:
+            return SentimentCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def _get(self, key: str, now: float) -> SentimentResult | None:
+        """有効なエントリを取得する
+
+        ロックを取得した状態で呼び出すこと。
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if expires_at <= now:
+            del self._entries[key]
+            self._evictions += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return result
+
+    def _put(self, key: str, result: SentimentResult, now: float) -> None:
+        """エントリを追加し、上限を超えた分を破棄する
+
+        ロックを取得した状態で呼び出すこと。
+        """
+        self._entries[key] = (now + self.ttl_seconds, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出する
+
+        キャッシュに無いテキストのみを重複を除いて送信し、
+        キャッシュの結果と合わせて元のテキストリストの順序で返す。
+
+        Args:
+            text_list (list[str]): 感情を検出するテキストのリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+        """
+        if not text_list:
+            # 入力の検証は呼び出し対象のAPIに任せる
+            return self.aws_comprehend_api.batch_detect_sentiment(text_list)
+
+        keys = [hash_text(text, self.language_code) for text in text_list]
+        results: dict[int, SentimentResult] = {}
+        errors: dict[int, SentimentError] = {}
+        # キャッシュに無いテキストのキーと、そのテキストの元の位置
+        miss_positions: dict[str, list[int]] = {}
+        miss_texts: list[str] = []
+
+        with self._lock:
+            now = self._clock()
+            for position, key in enumerate(keys):
+                result = self._get(key, now)
+                if result is not None:
+                    results[position] = result
+                    self._hits += 1
+                    continue
+
+                self._misses += 1
+                if key not in miss_positions:
+                    miss_positions[key] = []
+                    miss_texts.append(text_list[position])
+                miss_positions[key].append(position)
+
+        if miss_texts:
+            miss_response = self.aws_comprehend_api.batch_detect_sentiment(miss_texts)
+            miss_keys = list(miss_positions)
+
+            with self._lock:
+                now = self._clock()
+                for result in miss_response.result_list:
+                    key = miss_keys[result.index]
+                    self._put(key, result, now)
+                    for position in miss_positions[key]:
+                        results[position] = result
+            for error in miss_response.error_list:
+                for position in miss_positions[miss_keys[error.index]]:
+                    errors[position] = error.model_copy(update={"index": position})
+
+        return BatchDetectSentimentResponse(
+            result_list=[
+                results[position].model_copy(update={"index": position})
+                for position in sorted(results)
+            ],
+            error_list=[errors[position] for position in sorted(errors)],
+        )
@@ -0,0 +1,79 @@
+"""バッチサイズの上限を超えるテキストリストを分割して感情分析を行うクラスを定義する"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentError,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+
+
+class ChunkedAwsComprehendApi(IAwsComprehendApi):
+    """テキストリストをチャンクに分割して並列に感情分析を行うデコレーター
+
+    BatchDetectSentiment は1回の呼び出しで扱えるテキスト数に上限があるため、
+    上限を超えるテキストリストをチャンクに分割し、ワーカースレッドで並列に呼び出す。
+    各チャンクの結果は、インデックスを元のテキストリストの位置に付け替えて結合する。
+    """
+
+    def __init__(
+        self,
+        aws_comprehend_api: IAwsComprehendApi,
+        chunk_size: int = 25,
+        max_workers: int = 8,
+    ):
+        """ChunkedAwsComprehendApi クラスのインスタンスを初期化する
+
+        Args:
+            aws_comprehend_api (IAwsComprehendApi): 呼び出し対象のAPI
+            chunk_size (int, optional): 1回の呼び出しで送信するテキスト数の上限
+            max_workers (int, optional): チャンクを並列に送信するワーカー数の上限
+        """
+        self.aws_comprehend_api = aws_comprehend_api
+        self.chunk_size = chunk_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="comprehend-chunk",
+        )
+
+    def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出する
+
+        いずれかのチャンクでエラーが発生した場合は、そのエラーをそのまま送出する。
+
+        Args:
+            text_list (list[str]): 感情を検出するテキストのリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+        """
+        if len(text_list) <= self.chunk_size:
+            return self.aws_comprehend_api.batch_detect_sentiment(text_list)
+
+        offsets = range(0, len(text_list), self.chunk_size)
+        chunk_responses = self._executor.map(
+            self.aws_comprehend_api.batch_detect_sentiment,
+            [text_list[offset : offset + self.chunk_size] for offset in offsets],
+        )
+
+        result_list: list[SentimentResult] = []
+        error_list: list[SentimentError] = []
+        for offset, chunk_response in zip(offsets, chunk_responses, strict=True):
+            result_list.extend(
+                result.model_copy(update={"index": result.index + offset})
+                for result in chunk_response.result_list
+            )
+            error_list.extend(
+                error.model_copy(update={"index": error.index + offset})
+                for error in chunk_response.error_list
+            )
+
+        return BatchDetectSentimentResponse(
+            result_list=result_list,
+            error_list=error_list,
+        )
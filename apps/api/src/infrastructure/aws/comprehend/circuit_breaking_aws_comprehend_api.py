@@ -0,0 +1,84 @@
+"""障害が続くAWS Comprehend APIへの呼び出しを遮断するクラスを定義する"""
+
+from src.core.circuit_breaker import CircuitBreaker
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+)
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+
+
+class CircuitBreakingAwsComprehendApi(IAwsComprehendApi):
+    """遮断している間、AWS Comprehend APIを呼び出さずにエラーとするデコレーター
+
+    サーバー側のエラーや通信エラー、再試行しても解消しないスロットリングを
+    失敗として数える。テキストサイズの超過などのリクエストの誤りは失敗として数えない。
+    遮断中は CIRCUIT_OPEN の ComprehendError を送出するため、呼び出し側は
+    感情分析の結果なしとして処理を続けることができる。
+    """
+
+    def __init__(
+        self,
+        aws_comprehend_api: IAwsComprehendApi,
+        circuit_breaker: CircuitBreaker,
+    ):
+        """CircuitBreakingAwsComprehendApi クラスのインスタンスを初期化する
+
+        Args:
+            aws_comprehend_api (IAwsComprehendApi): 呼び出し対象のAPI
+            circuit_breaker (CircuitBreaker): 呼び出し間で共有するサーキットブレーカー
+        """
+        self.aws_comprehend_api = aws_comprehend_api
+        self.circuit_breaker = circuit_breaker
+
+    def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出する
+
+        Args:
+            text_list (list[str]): 感情を検出するテキストのリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+
+        Raises:
+            ComprehendError: サーキットブレーカーが遮断している場合は CIRCUIT_OPEN
+        """
+        if not self.circuit_breaker.allow():
+            raise ComprehendError(
+                ComprehendErrorType.CIRCUIT_OPEN,
+                "AWS Comprehend API circuit breaker is open.",
+            )
+        try:
+            response = self.aws_comprehend_api.batch_detect_sentiment(text_list)
+        except ComprehendError as error:
+            if self.is_failure(error):
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            raise
+        except BaseException:
+            self.circuit_breaker.release()
+            raise
+        self.circuit_breaker.record_success()
+        return response
+
+    @staticmethod
+    def is_failure(error: ComprehendError) -> bool:
+        """AWS Comprehend APIの障害として数えるエラーかどうかを返す
+
+        Args:
+            error (ComprehendError): 呼び出しで発生したエラー
+
+        Returns:
+            bool: サーバー側のエラーやスロットリングの場合は True
+        """
+        return (
+            error.status_code >= 500
+            or error.error_type == ComprehendErrorType.THROTTLING
+        )
@@ -0,0 +1,81 @@
+"""プロセス全体で共有するAWS Comprehendクライアントを管理する"""
+
+import threading
+from typing import TYPE_CHECKING
+
+import boto3
+from botocore.config import Config
+
+from src.core.config import Settings, get_settings
+
+if TYPE_CHECKING:
+    from mypy_boto3_comprehend.client import ComprehendClient
+
+_client: "ComprehendClient | None" = None
+_client_lock = threading.Lock()
+
+
+def create_comprehend_client_config(settings: Settings) -> Config:
+    """環境設定からbotocoreのクライアント設定を作成する
+
+    送信の制御が有効な場合は、スロットリングの再試行が botocore のリトライと
+    重ならないように、botocore の最大試行回数を1回とする。
+
+    Args:
+        settings (Settings): 環境設定
+
+    Returns:
+        Config: コネクションプール、タイムアウト、リトライ、TCPキープアライブの設定
+    """
+    return Config(
+        max_pool_connections=settings.comprehend_max_pool_connections,
+        connect_timeout=settings.comprehend_connect_timeout,
+        read_timeout=settings.comprehend_read_timeout,
+        retries={
+            "mode": settings.comprehend_retry_mode,
+            "max_attempts": 1
+            if settings.comprehend_governor_enabled
+            else settings.comprehend_max_attempts,
+        },
+        tcp_keepalive=settings.comprehend_tcp_keepalive,
+    )
+
+
+def get_comprehend_client() -> "ComprehendClient":
+    """プロセス全体で共有するAWS Comprehendクライアントを取得する
+
+    初回呼び出し時にクライアントを作成し、以降は同じインスタンスを返す。
+    boto3 のクライアント作成はスレッドセーフではないため、ロックを取得して作成する。
+    作成済みのクライアントはスレッド間で共有して使用できる。
+
+    Returns:
+        ComprehendClient: AWS Comprehendクライアント
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = boto3.client(
+                    "comprehend",
+                    config=create_comprehend_client_config(get_settings()),
+                )
+    return _client
+
+
+def warm_up_comprehend_client() -> None:
+    """AWS Comprehendクライアントを事前に作成する
+
+    認証情報の解決やサービスモデルの読み込みをアプリケーションの起動時に済ませ、
+    最初のリクエストのレイテンシを抑える。
+    """
+    get_comprehend_client()
+
+
+def reset_comprehend_client() -> None:
+    """共有しているAWS Comprehendクライアントを破棄する
+
+    次回の get_comprehend_client の呼び出しで新しいクライアントが作成される。
+    """
+    global _client
+    with _client_lock:
+        _client = None
@@ -23,6 +23,8 @@ class ComprehendErrorType(Enum):
     THROTTLING = ("ThrottlingException", 429)
     API_ERROR = ("APIError", 500)
     UNKNOWN = ("UnknownException", 500)
+    # サーキットブレーカーが呼び出しを遮断した場合 (AWS SDKのエラーコードではない)
+    CIRCUIT_OPEN = ("CircuitOpenException", 503)
 
     @classmethod
     def from_aws_error_code(cls, error_code: str) -> "ComprehendErrorType":
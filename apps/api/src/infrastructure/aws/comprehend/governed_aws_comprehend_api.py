@@ -0,0 +1,266 @@
+"""AWS Comprehend APIへの送信を制御し、スロットリングを再試行するクラスを定義する"""
+
+import random
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+)
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+
+
+@dataclass(frozen=True)
+class ComprehendGovernorStats:
+    """AWS Comprehend APIへの送信の制御に関する統計情報
+
+    Attributes:
+        requests (int): AWS Comprehend APIへ送信した回数(再試行を含む)
+        throttled (int): スロットリングのエラーを返された回数
+        throttle_rate (float): 送信した回数に対するスロットリングの割合
+        retries (int): スロットリングにより呼び出し全体を再試行した回数
+        item_retries (int): error_list で返されたテキストを再試行した件数
+        failures (int): 再試行の上限に達してエラーを送出した回数
+        queue_depth (int): 現在送信を待機している呼び出しの数
+        max_queue_depth (int): 送信を待機した呼び出しの数の最大値
+        wait_seconds (float): 送信の待機とバックオフで待機した時間の合計(秒)
+    """
+
+    requests: int
+    throttled: int
+    throttle_rate: float
+    retries: int
+    item_retries: int
+    failures: int
+    queue_depth: int
+    max_queue_depth: int
+    wait_seconds: float
+
+
+class GovernedAwsComprehendApi(IAwsComprehendApi):
+    """トークンバケットで送信レートを制御し、スロットリングを再試行するデコレーター
+
+    アカウントの秒間リクエスト数(TPS)に合わせたトークンバケットで送信を待機させ、
+    ピーク時のバーストをエラーではなく待ち時間として吸収する。
+    スロットリングのエラーを返された場合は、ジッター付きの指数バックオフで待機した後に
+    呼び出し全体を再試行する。レスポンスの error_list で一時的なエラーとして返された
+    テキストは、そのテキストだけを再試行して結果を元のインデックスに戻す。
+    再試行は botocore のリトライと重ならないように、このクラスでのみ行う前提とし、
+    1回の呼び出しで再試行に費やす時間は上限までに抑える。
+
+    チャンクを並列に送信するワーカースレッドから呼び出されるため、スレッドセーフに実装する。
+    """
+
+    # 再試行の対象とする error_list のエラーコード
+    RETRYABLE_ITEM_ERROR_CODES = frozenset(
+        {
+            "INTERNAL_SERVER_ERROR",
+            "InternalServerException",
+            "THROTTLING",
+            "ThrottlingException",
+        }
+    )
+
+    def __init__(
+        self,
+        aws_comprehend_api: IAwsComprehendApi,
+        transactions_per_second: float = 10.0,
+        burst: int = 10,
+        max_retries: int = 3,
+        backoff_base_seconds: float = 0.1,
+        backoff_max_seconds: float = 2.0,
+        max_total_retry_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[float, float], float] = random.uniform,
+    ):
+        """GovernedAwsComprehendApi クラスのインスタンスを初期化する
+
+        Args:
+            aws_comprehend_api (IAwsComprehendApi): 呼び出し対象のAPI
+            transactions_per_second (float, optional): 1秒あたりに送信する回数の上限
+            burst (int, optional): 待機せずに連続で送信できる回数の上限
+            max_retries (int, optional):
+                スロットリングやテキストごとのエラーを再試行する回数の上限
+            backoff_base_seconds (float, optional): バックオフの基準となる待機時間(秒)
+            backoff_max_seconds (float, optional): バックオフの待機時間の上限(秒)
+            max_total_retry_seconds (float, optional):
+                1回の呼び出しで再試行を続ける時間の上限(秒)。
+                次のバックオフでこの時間を超える場合は再試行しない
+            clock (Callable[[], float], optional): 現在時刻(秒)を返す関数
+            sleep (Callable[[float], None], optional): 待機する関数
+            jitter (Callable[[float, float], float], optional):
+                範囲を受け取り、その範囲の乱数を返す関数
+        """
+        self.aws_comprehend_api = aws_comprehend_api
+        self.transactions_per_second = transactions_per_second
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.max_total_retry_seconds = max_total_retry_seconds
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._requests = 0
+        self._throttled = 0
+        self._retries = 0
+        self._item_retries = 0
+        self._failures = 0
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+        self._wait_seconds = 0.0
+
+    @property
+    def stats(self) -> ComprehendGovernorStats:
+        """AWS Comprehend APIへの送信の制御に関する統計情報を返す"""
+        with self._lock:
+            return ComprehendGovernorStats(
+                requests=self._requests,
+                throttled=self._throttled,
+                throttle_rate=self._throttled / self._requests
+                if self._requests
+                else 0.0,
+                retries=self._retries,
+                item_retries=self._item_retries,
+                failures=self._failures,
+                queue_depth=self._queue_depth,
+                max_queue_depth=self._max_queue_depth,
+                wait_seconds=self._wait_seconds,
+            )
+
+    def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出する
+
+        Args:
+            text_list (list[str]): 感情を検出するテキストのリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+
+        Raises:
+            ComprehendError: 再試行の上限に達した場合や、再試行の対象外のエラーの場合
+        """
+        deadline = self._clock() + self.max_total_retry_seconds
+        response = self._detect_with_backoff(text_list, deadline)
+        if not any(
+            x.error_code in self.RETRYABLE_ITEM_ERROR_CODES for x in response.error_list
+        ):
+            return response
+
+        result_list = list(response.result_list)
+        error_list = response.error_list
+        for attempt in range(self.max_retries):
+            retry_errors = [
+                x for x in error_list if x.error_code in self.RETRYABLE_ITEM_ERROR_CODES
+            ]
+            if not retry_errors:
+                break
+            backoff_seconds = self._backoff_seconds(attempt)
+            if self._clock() + backoff_seconds > deadline:
+                break
+            self._wait(backoff_seconds)
+            with self._lock:
+                self._item_retries += len(retry_errors)
+
+            # 再試行したテキストの結果とエラーのインデックスを元の位置に戻す
+            original_indexes = [x.index for x in retry_errors]
+            retry_response = self._detect_with_backoff(
+                [text_list[index] for index in original_indexes], deadline
+            )
+            result_list.extend(
+                x.model_copy(update={"index": original_indexes[x.index]})
+                for x in retry_response.result_list
+            )
+            error_list = [
+                x
+                for x in error_list
+                if x.error_code not in self.RETRYABLE_ITEM_ERROR_CODES
+            ] + [
+                x.model_copy(update={"index": original_indexes[x.index]})
+                for x in retry_response.error_list
+            ]
+
+        result_list.sort(key=lambda x: x.index)
+        error_list.sort(key=lambda x: x.index)
+        return BatchDetectSentimentResponse(
+            result_list=result_list, error_list=error_list
+        )
+
+    def _detect_with_backoff(
+        self, text_list: list[str], deadline: float
+    ) -> BatchDetectSentimentResponse:
+        """送信できるまで待機して呼び出し、スロットリングの場合はバックオフして再試行する
+
+        再試行の回数の上限に達した場合や、バックオフの後の時刻が再試行の期限を
+        超える場合は、スロットリングのエラーを送出する。
+        """
+        attempt = 0
+        while True:
+            self._acquire()
+            try:
+                return self.aws_comprehend_api.batch_detect_sentiment(text_list)
+            except ComprehendError as error:
+                if error.error_type != ComprehendErrorType.THROTTLING:
+                    raise
+                backoff_seconds = self._backoff_seconds(attempt)
+                with self._lock:
+                    self._throttled += 1
+                    if (
+                        attempt >= self.max_retries
+                        or self._clock() + backoff_seconds > deadline
+                    ):
+                        self._failures += 1
+                        raise
+                    self._retries += 1
+            self._wait(backoff_seconds)
+            attempt += 1
+
+    def _acquire(self) -> None:
+        """トークンバケットからトークンを1つ予約し、使用できる時刻まで待機する
+
+        トークンを前借りする方式のため、待機する呼び出しは到着順に送信される。
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - self._updated_at) * self.transactions_per_second,
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            wait_seconds = max(0.0, -self._tokens / self.transactions_per_second)
+            self._requests += 1
+            if wait_seconds > 0:
+                self._queue_depth += 1
+                self._max_queue_depth = max(self._max_queue_depth, self._queue_depth)
+        if wait_seconds <= 0:
+            return
+        try:
+            self._wait(wait_seconds)
+        finally:
+            with self._lock:
+                self._queue_depth -= 1
+
+    def _backoff_seconds(self, attempt: int) -> float:
+        """試行回数に応じたジッター付きの指数バックオフの待機時間(秒)を返す"""
+        ceiling = min(self.backoff_max_seconds, self.backoff_base_seconds * 2**attempt)
+        return self._jitter(0.0, ceiling)
+
+    def _wait(self, seconds: float) -> None:
+        """指定の時間待機し、待機時間を記録する"""
+        self._sleep(seconds)
+        with self._lock:
+            self._wait_seconds += seconds
@@ -0,0 +1,50 @@
+"""遅いAWS Comprehend APIへのリクエストをヘッジするクラスを定義する"""
+
+from src.core.hedging import RequestHedger
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+)
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
+
+
+class HedgedAwsComprehendApi(IAsyncAwsComprehendApi):
+    """一定時間内に結果が返らない場合に、同じリクエストを追加で送信するデコレーター
+
+    感情分析は同じテキストに対して同じ結果を返すため、どちらの結果を使ってもよい。
+    追加のリクエストも課金の対象となるため、ヘッジの割合は予算で制限する。
+    """
+
+    def __init__(
+        self,
+        aws_comprehend_api: IAsyncAwsComprehendApi,
+        hedger: RequestHedger,
+    ):
+        """HedgedAwsComprehendApi クラスのインスタンスを初期化する
+
+        Args:
+            aws_comprehend_api (IAsyncAwsComprehendApi): 呼び出し対象のAPI
+            hedger (RequestHedger): リクエスト間で共有するヘッジの仕組み
+        """
+        self.aws_comprehend_api = aws_comprehend_api
+        self.hedger = hedger
+
+    async def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出する
+
+        Args:
+            text_list (list[str]): 感情を検出するテキストのリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+
+        Raises:
+            ComprehendError: Comprehend APIに関連するエラーが発生した場合
+        """
+        return await self.hedger.run(
+            lambda: self.aws_comprehend_api.batch_detect_sentiment(text_list)
+        )
@@ -0,0 +1,25 @@
+"""AWS Comprehend APIの非同期インターフェースを定義する抽象基底クラスを提供する"""
+
+from abc import ABC, abstractmethod
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+)
+
+
+class IAsyncAwsComprehendApi(ABC):
+    """AWS Comprehend APIの非同期インターフェースを定義する抽象基底クラス"""
+
+    @abstractmethod
+    async def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出する
+
+        Args:
+            text_list (list[str]): 対象のテキストリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+        """
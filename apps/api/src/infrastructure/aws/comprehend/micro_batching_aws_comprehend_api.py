@@ -0,0 +1,201 @@
+"""同時に行われる感情分析のテキストを1つのバッチにまとめるクラスを定義する"""
+
+import asyncio
+from dataclasses import dataclass
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentError,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
+
+_ItemFuture = asyncio.Future[SentimentResult | SentimentError]
+
+
+def _set_exception(futures: list[_ItemFuture], error: Exception) -> None:
+    """結果が設定されていないFutureに例外を設定する"""
+    for future in futures:
+        if not future.done():
+            future.set_exception(error)
+            # 全ての呼び出し元がキャンセルされた場合でも、
+            # 未取得の例外として警告されないように例外を取得済みにする
+            future.exception()
+
+
+@dataclass(frozen=True)
+class MicroBatchStats:
+    """バッチの集約に関する統計情報
+
+    Attributes:
+        requests (int): 感情分析の呼び出し回数
+        texts (int): 呼び出し元から受け取ったテキスト数
+        deduplicated (int): 集約中の同じテキストと共有したテキスト数
+        batches (int): 呼び出し対象のAPIに送信したバッチ数
+        bypassed (int): 入力が不正なため集約せずに送信した呼び出し回数
+    """
+
+    requests: int
+    texts: int
+    deduplicated: int
+    batches: int
+    bypassed: int
+
+
+class MicroBatchingAwsComprehendApi(IAsyncAwsComprehendApi):
+    """複数の呼び出し元のテキストを集約して1回のバッチで感情分析を行うデコレーター
+
+    最初のテキストを受け取ってから一定時間が経過するか、テキスト数がバッチサイズの
+    上限に達した時点で、集約したテキストを1回の呼び出しで送信する。
+    同じテキストは1回だけ送信し、結果をそれぞれの呼び出し元に返す。
+
+    空のテキストや長すぎるテキストを含む呼び出しは、他の呼び出し元のバッチを
+    エラーにしないように集約せずにそのまま送信する。
+    キューはイベントループに紐づくため、インスタンスは1つのイベントループ上で使用する。
+    """
+
+    def __init__(
+        self,
+        aws_comprehend_api: IAsyncAwsComprehendApi,
+        window_seconds: float = 0.01,
+        max_batch_size: int = 25,
+        max_text_size: int = 5000,
+    ):
+        """MicroBatchingAwsComprehendApi クラスのインスタンスを初期化する
+
+        Args:
+            aws_comprehend_api (IAsyncAwsComprehendApi): 呼び出し対象のAPI
+            window_seconds (float, optional): テキストを集約する最大の待ち時間(秒)
+            max_batch_size (int, optional): 1回のバッチで送信するテキスト数の上限
+            max_text_size (int, optional): 集約の対象とするテキストの最大文字数
+        """
+        self.aws_comprehend_api = aws_comprehend_api
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self.max_text_size = max_text_size
+        self._pending: dict[str, _ItemFuture] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._sending: set[asyncio.Task[None]] = set()
+        self._requests = 0
+        self._texts = 0
+        self._deduplicated = 0
+        self._batches = 0
+        self._bypassed = 0
+
+    @property
+    def stats(self) -> MicroBatchStats:
+        """バッチの集約に関する統計情報を返す"""
+        return MicroBatchStats(
+            requests=self._requests,
+            texts=self._texts,
+            deduplicated=self._deduplicated,
+            batches=self._batches,
+            bypassed=self._bypassed,
+        )
+
+    def _is_batchable(self, text_list: list[str]) -> bool:
+        """他の呼び出し元のテキストと集約できる入力かどうかを判定する"""
+        return bool(text_list) and all(
+            text.strip() and len(text) <= self.max_text_size for text in text_list
+        )
+
+    def _enqueue(self, text: str) -> _ItemFuture:
+        """テキストを集約中のバッチに追加し、結果を受け取るFutureを返す"""
+        future = self._pending.get(text)
+        if future is not None:
+            self._deduplicated += 1
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[text] = future
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.window_seconds, self._flush
+            )
+        return future
+
+    def _flush(self) -> None:
+        """集約中のテキストを1つのバッチとして送信する"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        self._batches += 1
+        task = asyncio.ensure_future(self._send(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: dict[str, _ItemFuture]) -> None:
+        """バッチを送信し、各テキストの結果をFutureに設定する"""
+        futures = list(batch.values())
+        try:
+            response = await self.aws_comprehend_api.batch_detect_sentiment(list(batch))
+        except Exception as error:
+            _set_exception(futures, error)
+            return
+
+        for result in response.result_list:
+            if not futures[result.index].done():
+                futures[result.index].set_result(result)
+        for sentiment_error in response.error_list:
+            if not futures[sentiment_error.index].done():
+                futures[sentiment_error.index].set_result(sentiment_error)
+        _set_exception(
+            futures,
+            ComprehendError(
+                ComprehendErrorType.API_ERROR,
+                "感情分析の結果が返されませんでした",
+            ),
+        )
+
+    async def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出する
+
+        Args:
+            text_list (list[str]): 感情を検出するテキストのリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+        """
+        self._requests += 1
+        if not self._is_batchable(text_list):
+            self._bypassed += 1
+            return await self.aws_comprehend_api.batch_detect_sentiment(text_list)
+
+        self._texts += len(text_list)
+        futures = [self._enqueue(text) for text in text_list]
+        # 共有しているFutureをキャンセルしないように、gather ではなく wait で待つ
+        await asyncio.wait(futures)
+
+        result_list = []
+        error_list = []
+        for position, future in enumerate(futures):
+            item = future.result()
+            if isinstance(item, SentimentResult):
+                result_list.append(item.model_copy(update={"index": position}))
+            else:
+                error_list.append(item.model_copy(update={"index": position}))
+        return BatchDetectSentimentResponse(
+            result_list=result_list,
+            error_list=error_list,
+        )
+
+    async def aclose(self) -> None:
+        """集約中のテキストを送信し、送信中のバッチの完了を待つ"""
+        self._flush()
+        if self._sending:
+            await asyncio.wait(self._sending)
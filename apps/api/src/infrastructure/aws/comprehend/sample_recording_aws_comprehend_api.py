@@ -0,0 +1,87 @@
+"""感情分析の結果をローカルのモデルの学習用に記録するクラスを定義する"""
+
+import threading
+from dataclasses import dataclass
+
+from src.core.logger.logger import logger
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+from src.infrastructure.local_sentiment.training_samples import TrainingSample
+
+
+@dataclass(frozen=True)
+class SampleRecordingStats:
+    """学習用のサンプルの記録に関する統計情報
+
+    Attributes:
+        recorded (int): ファイルに記録したサンプルの件数
+        write_errors (int): ファイルへの書き込みに失敗した回数
+    """
+
+    recorded: int
+    write_errors: int
+
+
+class SampleRecordingAwsComprehendApi(IAwsComprehendApi):
+    """感情分析に成功したテキストとスコアを JSON Lines のファイルに追記するデコレーター
+
+    記録したサンプルは、ローカルで推定するモデルを蒸留で学習するために使用する。
+    ファイルにはメッセージの本文がそのまま含まれるため、明示的に有効にした場合のみ使用する。
+
+    記録は感情分析の処理に影響させないため、書き込みのエラーはログに出力して無視する。
+    チャンクを並列に送信するワーカースレッドから呼び出されるため、スレッドセーフに実装する。
+    """
+
+    def __init__(self, aws_comprehend_api: IAwsComprehendApi, path: str):
+        """SampleRecordingAwsComprehendApi クラスのインスタンスを初期化する
+
+        Args:
+            aws_comprehend_api (IAwsComprehendApi): 呼び出し対象のAPI
+            path (str): サンプルを追記するファイルのパス
+        """
+        self.aws_comprehend_api = aws_comprehend_api
+        self.path = path
+        self._lock = threading.Lock()
+        self._recorded = 0
+        self._write_errors = 0
+
+    @property
+    def stats(self) -> SampleRecordingStats:
+        """学習用のサンプルの記録に関する統計情報を返す"""
+        with self._lock:
+            return SampleRecordingStats(
+                recorded=self._recorded, write_errors=self._write_errors
+            )
+
+    def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出し、成功した結果を記録する
+
+        Args:
+            text_list (list[str]): 感情を検出するテキストのリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+        """
+        response = self.aws_comprehend_api.batch_detect_sentiment(text_list)
+        lines = [
+            TrainingSample.from_result(text_list[x.index], x).to_json() + "\n"
+            for x in response.result_list
+        ]
+        if not lines:
+            return response
+
+        with self._lock:
+            try:
+                with open(self.path, "a", encoding="utf-8") as file:
+                    file.writelines(lines)
+            except OSError as error:
+                self._write_errors += 1
+                logger.warning("Failed to record training samples: %s", error)
+            else:
+                self._recorded += len(lines)
+        return response
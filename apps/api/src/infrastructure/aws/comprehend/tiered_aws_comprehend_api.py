@@ -0,0 +1,118 @@
+"""確信度の低いテキストのみをAWS Comprehend APIで分析するクラスを定義する"""
+
+import threading
+from dataclasses import dataclass
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+
+
+@dataclass(frozen=True)
+class TieredSentimentStats:
+    """段階的な感情分析に関する統計情報
+
+    Attributes:
+        texts (int): 感情分析を行ったテキストの件数
+        escalated (int): 確信度が閾値を下回り、AWS Comprehend APIで分析した件数
+        escalation_rate (float): 感情分析を行った件数に対する escalated の割合
+        remote_calls (int): AWS Comprehend APIを呼び出した回数
+    """
+
+    texts: int
+    escalated: int
+    escalation_rate: float
+    remote_calls: int
+
+
+class TieredAwsComprehendApi(IAwsComprehendApi):
+    """ローカルの推定を先に行い、確信度の低いテキストのみを外部のAPIで分析するデコレーター
+
+    ローカルの推定結果の中で最も高いスコアを確信度とし、確信度が閾値を下回るテキストと
+    ローカルの推定がエラーとしたテキストのみを、まとめて外部のAPIで分析する。
+    外部のAPIの結果とエラーのインデックスは元のテキストの位置に戻して結合する。
+    閾値を上げるほど分析の精度を優先し、下げるほど料金とレイテンシを優先する。
+
+    チャンクを並列に送信するワーカースレッドから呼び出されるため、スレッドセーフに実装する。
+    """
+
+    def __init__(
+        self,
+        local_api: IAwsComprehendApi,
+        remote_api: IAwsComprehendApi,
+        confidence_threshold: float = 0.6,
+    ):
+        """TieredAwsComprehendApi クラスのインスタンスを初期化する
+
+        Args:
+            local_api (IAwsComprehendApi): 先に推定を行うローカルのAPI
+            remote_api (IAwsComprehendApi): 確信度の低いテキストを分析する外部のAPI
+            confidence_threshold (float, optional):
+                ローカルの推定結果を採用する確信度の下限
+        """
+        self.local_api = local_api
+        self.remote_api = remote_api
+        self.confidence_threshold = confidence_threshold
+        self._lock = threading.Lock()
+        self._texts = 0
+        self._escalated = 0
+        self._remote_calls = 0
+
+    @property
+    def stats(self) -> TieredSentimentStats:
+        """段階的な感情分析に関する統計情報を返す"""
+        with self._lock:
+            return TieredSentimentStats(
+                texts=self._texts,
+                escalated=self._escalated,
+                escalation_rate=self._escalated / self._texts if self._texts else 0.0,
+                remote_calls=self._remote_calls,
+            )
+
+    def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出する
+
+        Args:
+            text_list (list[str]): 感情を検出するテキストのリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+        """
+        local_response = self.local_api.batch_detect_sentiment(text_list)
+        result_list = [
+            x
+            for x in local_response.result_list
+            if max(x.sentiment_score.values(), default=0.0) >= self.confidence_threshold
+        ]
+        accepted_indexes = {x.index for x in result_list}
+        escalated_indexes = [
+            index for index in range(len(text_list)) if index not in accepted_indexes
+        ]
+        with self._lock:
+            self._texts += len(text_list)
+            self._escalated += len(escalated_indexes)
+            if escalated_indexes:
+                self._remote_calls += 1
+        if not escalated_indexes:
+            return BatchDetectSentimentResponse(result_list=result_list, error_list=[])
+
+        # 外部のAPIの結果とエラーのインデックスを元の位置に戻す
+        remote_response = self.remote_api.batch_detect_sentiment(
+            [text_list[index] for index in escalated_indexes]
+        )
+        result_list.extend(
+            x.model_copy(update={"index": escalated_indexes[x.index]})
+            for x in remote_response.result_list
+        )
+        result_list.sort(key=lambda x: x.index)
+        return BatchDetectSentimentResponse(
+            result_list=result_list,
+            error_list=[
+                x.model_copy(update={"index": escalated_indexes[x.index]})
+                for x in remote_response.error_list
+            ],
+        )
@@ -0,0 +1,72 @@
+"""AWS Comprehend の結果から蒸留したモデルで感情分析を行うクラスを定義する"""
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+from src.infrastructure.local_sentiment.lexicon_sentiment_api import (
+    LexiconSentimentApi,
+)
+from src.infrastructure.local_sentiment.linear_sentiment_model import (
+    LinearSentimentModel,
+)
+
+
+class DistilledSentimentApi(IAwsComprehendApi):
+    """蒸留した線形モデルで感情を推定する IAwsComprehendApi の実装クラス
+
+    バッチ全体のテキストを1つの疎行列に変換し、重み行列との積で一度に推定する。
+    AWS Comprehend と同じく、4つの感情のスコア(合計 1)と最もスコアの高い感情を返す。
+    """
+
+    def __init__(self, model: LinearSentimentModel):
+        """DistilledSentimentApi クラスのインスタンスを初期化する
+
+        Args:
+            model (LinearSentimentModel): 感情の推定に使用するモデル
+        """
+        self.model = model
+
+    @classmethod
+    def from_path(cls, path: str) -> "DistilledSentimentApi":
+        """保存したモデルを読み込んでインスタンスを作成する
+
+        Args:
+            path (str): npz 形式で保存したモデルのパス
+
+        Returns:
+            DistilledSentimentApi: 作成したインスタンス
+        """
+        return cls(LinearSentimentModel.load(path))
+
+    def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出する
+
+        Args:
+            text_list (list[str]): 感情を検出するテキストのリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+        """
+        if not text_list:
+            return BatchDetectSentimentResponse(result_list=[], error_list=[])
+
+        scores = self.model.predict_proba(text_list)
+        labels = scores.argmax(axis=1)
+        result_list = [
+            SentimentResult(
+                index=index,
+                sentiment=LexiconSentimentApi.SENTIMENTS[label],
+                sentiment_score=dict(
+                    zip(LexiconSentimentApi.SCORE_KEYS, row, strict=True)
+                ),
+            )
+            for index, (label, row) in enumerate(
+                zip(labels.tolist(), scores.tolist(), strict=True)
+            )
+        ]
+        return BatchDetectSentimentResponse(result_list=result_list, error_list=[])
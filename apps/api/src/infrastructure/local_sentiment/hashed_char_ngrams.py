@@ -0,0 +1,133 @@
+"""テキストを文字 n-gram のハッシュ値の特徴量に変換するクラスを定義する"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.infrastructure.local_sentiment.lexicon_sentiment_api import normalize_text
+
+# n-gram のハッシュ値の計算に使用する FNV-1a の定数
+_FNV_OFFSET_BASIS = 0xCBF29CE484222325
+_FNV_PRIME = np.uint64(0x100000001B3)
+
+
+@dataclass(frozen=True)
+class SparseFeatures:
+    """テキストごとの特徴量を座標形式で保持する疎行列
+
+    Attributes:
+        rows (np.ndarray): 要素ごとのテキストの位置
+        cols (np.ndarray): 要素ごとの特徴量の位置 (n-gram のハッシュ値)
+        values (np.ndarray): 要素ごとの値。テキストごとに L2 ノルムが 1 となる
+        n_rows (int): テキストの件数
+    """
+
+    rows: np.ndarray
+    cols: np.ndarray
+    values: np.ndarray
+    n_rows: int
+
+    def dot(self, weights: np.ndarray) -> np.ndarray:
+        """重み行列との積を計算する
+
+        Args:
+            weights (np.ndarray): 特徴量の数 x 出力の数 の重み行列
+
+        Returns:
+            np.ndarray: テキストの件数 x 出力の数 の行列
+        """
+        return np.column_stack(
+            [
+                np.bincount(
+                    self.rows,
+                    weights=self.values * weights[self.cols, k],
+                    minlength=self.n_rows,
+                )
+                for k in range(weights.shape[1])
+            ]
+        )
+
+    def transpose_dot(self, matrix: np.ndarray, n_features: int) -> np.ndarray:
+        """転置した疎行列とテキストごとの行列の積を計算する
+
+        Args:
+            matrix (np.ndarray): テキストの件数 x 出力の数 の行列
+            n_features (int): 特徴量の数
+
+        Returns:
+            np.ndarray: 特徴量の数 x 出力の数 の行列
+        """
+        return np.column_stack(
+            [
+                np.bincount(
+                    self.cols,
+                    weights=self.values * matrix[self.rows, k],
+                    minlength=n_features,
+                )
+                for k in range(matrix.shape[1])
+            ]
+        )
+
+
+class HashedCharNgramVectorizer:
+    """正規化したテキストの文字 n-gram を、ハッシュ値で固定長の特徴量に変換する
+
+    語彙を保持しないため、学習と推論で同じ設定を使えば同じ特徴量となる。
+    ハッシュ値はプロセスごとに変わらない FNV-1a で計算し、バッチ全体の文字を
+    連結した配列に対して NumPy でまとめて計算する。
+    日本語は単語の区切りが無いため、形態素解析の代わりに文字 n-gram を使用する。
+    """
+
+    def __init__(self, n_features: int = 2**17, ngram_range: tuple[int, int] = (1, 3)):
+        """HashedCharNgramVectorizer クラスのインスタンスを初期化する
+
+        Args:
+            n_features (int, optional): 特徴量の数 (ハッシュ値の範囲)
+            ngram_range (tuple[int, int], optional): 使用する n-gram の長さの範囲
+        """
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+
+    def transform(self, texts: Sequence[str]) -> SparseFeatures:
+        """テキストのリストを特徴量の疎行列に変換する
+
+        Args:
+            texts (Sequence[str]): 変換するテキストのリスト
+
+        Returns:
+            SparseFeatures: テキストごとの特徴量
+        """
+        normalized = [normalize_text(x) for x in texts]
+        lengths = np.array([len(x) for x in normalized], dtype=np.int64)
+        codes = np.frombuffer(
+            "".join(normalized).encode("utf-32-le"), dtype=np.uint32
+        ).astype(np.uint64)
+        text_ids = np.repeat(np.arange(len(texts)), lengths)
+
+        rows = []
+        cols = []
+        min_n, max_n = self.ngram_range
+        for n in range(min_n, max_n + 1):
+            count = len(codes) - n + 1
+            if count <= 0:
+                continue
+            hashes = np.full(count, _FNV_OFFSET_BASIS ^ n, dtype=np.uint64)
+            for offset in range(n):
+                hashes = (hashes ^ codes[offset : offset + count]) * _FNV_PRIME
+            hashes ^= hashes >> np.uint64(29)
+            # 連結したテキストをまたぐ n-gram は除外する
+            within_text = text_ids[:count] == text_ids[n - 1 : n - 1 + count]
+            rows.append(text_ids[:count][within_text])
+            cols.append(hashes[within_text] % np.uint64(self.n_features))
+
+        row_array = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        col_array = (
+            np.concatenate(cols).astype(np.int64) if cols else np.zeros(0, np.int64)
+        )
+        # テキストの長さによる影響を抑えるため、n-gram の数の平方根で割る
+        ngram_counts = np.bincount(row_array, minlength=len(texts))
+        values = 1.0 / np.sqrt(ngram_counts[row_array])
+        return SparseFeatures(
+            rows=row_array, cols=col_array, values=values, n_rows=len(texts)
+        )
@@ -0,0 +1,216 @@
+"""ローカルの感情分析で使用する日本語の極性辞書を定義する"""
+
+from dataclasses import dataclass
+from enum import Enum
+
+
+class TermKind(Enum):
+    """否定表現の判定方法を決める語の種類を定義する列挙型"""
+
+    # 形容詞の語幹 (例: 嬉し → 嬉しくない)
+    ADJECTIVE = "adjective"
+    # 名詞・形容動詞の語幹 (例: 問題 → 問題ない、好き → 好きじゃない)
+    NOUN = "noun"
+    # 否定表現を判定しない語 (動詞や感動詞、絵文字など)
+    FIXED = "fixed"
+
+
+# 語の種類ごとの、語の直後に続く否定表現
+NEGATION_SUFFIXES: dict[TermKind, tuple[str, ...]] = {
+    TermKind.ADJECTIVE: ("くない", "くなかった", "くありません", "くはない"),
+    TermKind.NOUN: (
+        "ではない",
+        "じゃない",
+        "ではありません",
+        "じゃありません",
+        "ではなかった",
+        "じゃなかった",
+        "がない",
+        "はない",
+        "ない",
+        "なし",
+        "無し",
+    ),
+    TermKind.FIXED: (),
+}
+
+
+@dataclass(frozen=True)
+class LexiconEntry:
+    """極性辞書の1語を表すクラス
+
+    Attributes:
+        term (str): NFKC で正規化した語 (活用する語は語幹)
+        polarity (float): 極性の強さ。肯定は正の値、否定は負の値
+        kind (TermKind): 否定表現の判定方法を決める語の種類
+    """
+
+    term: str
+    polarity: float
+    kind: TermKind
+
+
+def _entries(kind: TermKind, polarity: float, *terms: str) -> list[LexiconEntry]:
+    """同じ種類と極性の語から辞書のエントリを作成する"""
+    return [LexiconEntry(term, polarity, kind) for term in terms]
+
+
+# 日本語の極性辞書
+# チャットのメッセージで頻出する語を中心に、表記の揺れ(ひらがな/漢字)も含める
+JAPANESE_POLARITY_LEXICON: tuple[LexiconEntry, ...] = tuple(
+    _entries(
+        TermKind.ADJECTIVE,
+        1.0,
+        "良",
+        "嬉し",
+        "うれし",
+        "楽し",
+        "たのし",
+        "素晴らし",
+        "すばらし",
+        "面白",
+        "おもしろ",
+        "美味し",
+        "おいし",
+        "優し",
+        "やさし",
+        "心強",
+        "頼もし",
+        "素早",
+        "分かりやす",
+        "わかりやす",
+        "使いやす",
+        "見やす",
+    )
+    + _entries(
+        TermKind.ADJECTIVE,
+        -1.0,
+        "悪",
+        "悲し",
+        "かなし",
+        "辛",
+        "つら",
+        "寂し",
+        "さみし",
+        "難し",
+        "むずかし",
+        "痛",
+        "怖",
+        "遅",
+        "厳し",
+        "きびし",
+        "面倒くさ",
+        "めんどくさ",
+        "分かりにく",
+        "わかりにく",
+        "使いにく",
+        "見にく",
+        "つまらな",
+    )
+    + _entries(
+        TermKind.NOUN,
+        1.0,
+        "好き",
+        "最高",
+        "感謝",
+        "成功",
+        "完了",
+        "便利",
+        "安心",
+        "満足",
+        "素敵",
+        "すてき",
+        "順調",
+        "丁寧",
+        "快適",
+        "幸せ",
+        "大丈夫",
+        "解決",
+        "改善",
+        "達成",
+        "元気",
+        "上出来",
+    )
+    + _entries(
+        TermKind.NOUN,
+        -1.0,
+        "嫌い",
+        "失敗",
+        "問題",
+        "不具合",
+        "障害",
+        "エラー",
+        "バグ",
+        "不安",
+        "心配",
+        "残念",
+        "不便",
+        "不満",
+        "面倒",
+        "無理",
+        "迷惑",
+        "苦手",
+        "大変",
+        "ミス",
+        "クレーム",
+        "トラブル",
+        "炎上",
+        "疲れ",
+    )
+    + _entries(
+        TermKind.FIXED,
+        1.0,
+        "ありがと",
+        "有難う",
+        "助かり",
+        "助かる",
+        "助かっ",
+        "おめでとう",
+        "さすが",
+        "流石",
+        "頑張",
+        "がんば",
+        "喜",
+        "笑",
+        "いいね",
+        "いいです",
+        "いい感じ",
+        "グッド",
+        "ナイス",
+        "good",
+        "nice",
+        "great",
+        "thanks",
+        "thank you",
+        "👍",
+        "🎉",
+        "😊",
+        "😄",
+        "🙏",
+        "✨",
+    )
+    + _entries(
+        TermKind.FIXED,
+        -1.0,
+        "困っ",
+        "困り",
+        "困る",
+        "怒",
+        "ムカ",
+        "イライラ",
+        "がっかり",
+        "落ち込",
+        "泣",
+        "壊れ",
+        "止まっ",
+        "bad",
+        "error",
+        "fail",
+        "😢",
+        "😭",
+        "😡",
+        "💦",
+    )
+    # 謝罪の表現は定型の挨拶として使われることも多いため、弱い否定とする
+    + _entries(TermKind.FIXED, -0.5, "申し訳", "すみません", "ごめん")
+)
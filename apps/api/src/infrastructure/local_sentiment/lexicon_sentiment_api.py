@@ -0,0 +1,166 @@
+"""極性辞書を使用してプロセス内で感情分析を行うクラスを定義する"""
+
+import unicodedata
+from collections.abc import Sequence
+
+import numpy as np
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentEnum,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+from src.infrastructure.local_sentiment.japanese_lexicon import (
+    JAPANESE_POLARITY_LEXICON,
+    NEGATION_SUFFIXES,
+    LexiconEntry,
+    TermKind,
+)
+
+# 否定表現を置き換える、語の種類ごとの記号 (テキストに現れない私用領域の文字)
+NEGATION_MARKS = {
+    TermKind.ADJECTIVE: "\ue000",
+    TermKind.NOUN: "\ue001",
+}
+
+
+def normalize_text(text: str) -> str:
+    """辞書と照合するためにテキストを正規化する
+
+    全角の英数字や半角カナの表記の揺れを NFKC で統一し、英字を小文字にする。
+
+    Args:
+        text (str): 正規化するテキスト
+
+    Returns:
+        str: 正規化したテキスト
+    """
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+class LexiconSentimentApi(IAwsComprehendApi):
+    """日本語の極性辞書と否定表現の判定で感情を推定する IAwsComprehendApi の実装クラス
+
+    ネットワーク通信を行わずにプロセス内で推定するため、料金がかからず、
+    AWS Comprehend を使用しない環境やベンチマークで使用できる。
+
+    バッチ全体のテキストと辞書の語の出現回数を NumPy の行列として数え、
+    否定表現が続く出現は極性を反転して弱めたうえで、肯定と否定の強さを集計する。
+    AWS Comprehend と同じく、4つの感情のスコア(合計 1)と最もスコアの高い感情を返す。
+    """
+
+    # スコアの並び順に対応する感情
+    SENTIMENTS = (
+        SentimentEnum.POSITIVE,
+        SentimentEnum.NEGATIVE,
+        SentimentEnum.NEUTRAL,
+        SentimentEnum.MIXED,
+    )
+    # AWS Comprehend のレスポンスと同じスコアのキー
+    SCORE_KEYS = ("Positive", "Negative", "Neutral", "Mixed")
+    # 否定表現が続く語の極性に掛ける係数 (「良くない」は「悪い」より弱い否定とする)
+    NEGATION_FACTOR = -0.5
+    # 極性を持つ語の有無にかかわらず加える中立の強さ
+    NEUTRAL_PRIOR = 0.5
+    # 肯定と否定の両方を含む場合に、重なる分の強さに掛ける混在の係数
+    MIXED_WEIGHT = 2.0
+
+    def __init__(self, lexicon: Sequence[LexiconEntry] = JAPANESE_POLARITY_LEXICON):
+        """LexiconSentimentApi クラスのインスタンスを初期化する
+
+        Args:
+            lexicon (Sequence[LexiconEntry], optional): 使用する極性辞書
+        """
+        terms = [normalize_text(x.term) for x in lexicon]
+        # 否定表現を語の種類ごとの記号に置き換えたテキストで、語と記号の並びを数える
+        # 置き換えで別の否定表現の一部を消さないように、長い否定表現から置き換える
+        self._negation_replacements = [
+            (suffix, mark)
+            for kind, mark in NEGATION_MARKS.items()
+            for suffix in sorted(NEGATION_SUFFIXES[kind], key=len, reverse=True)
+        ]
+        negated_terms = [
+            term + NEGATION_MARKS.get(x.kind, "")
+            for term, x in zip(terms, lexicon, strict=True)
+        ]
+        negatable = np.array([x.kind in NEGATION_MARKS for x in lexicon])
+        # 否定表現を判定しない語は、否定された出現を常に 0 回とする
+        self._negatable = negatable.astype(np.int64)
+
+        polarities = np.array([x.polarity for x in lexicon], dtype=np.float64)
+        negated_polarities = np.where(negatable, polarities * self.NEGATION_FACTOR, 0)
+        self._terms = np.array(terms, dtype=np.str_)
+        self._negated_terms = np.array(negated_terms, dtype=np.str_)
+        # 否定されていない出現と否定された出現を並べた回数に掛ける重み
+        self._positive_weights = np.concatenate(
+            [np.clip(polarities, 0, None), np.clip(negated_polarities, 0, None)]
+        )
+        self._negative_weights = np.concatenate(
+            [np.clip(-polarities, 0, None), np.clip(-negated_polarities, 0, None)]
+        )
+
+    def batch_detect_sentiment(
+        self,
+        text_list: list[str],
+    ) -> BatchDetectSentimentResponse:
+        """与えられたテキストリストの感情を検出する
+
+        Args:
+            text_list (list[str]): 感情を検出するテキストのリスト
+
+        Returns:
+            BatchDetectSentimentResponse: 感情分析の結果を含むレスポンスオブジェクト
+        """
+        if not text_list:
+            return BatchDetectSentimentResponse(result_list=[], error_list=[])
+
+        scores = self.score(text_list)
+        labels = scores.argmax(axis=1)
+        result_list = [
+            SentimentResult(
+                index=index,
+                sentiment=self.SENTIMENTS[label],
+                sentiment_score=dict(zip(self.SCORE_KEYS, row, strict=True)),
+            )
+            for index, (label, row) in enumerate(
+                zip(labels.tolist(), scores.tolist(), strict=True)
+            )
+        ]
+        return BatchDetectSentimentResponse(result_list=result_list, error_list=[])
+
+    def score(self, text_list: list[str]) -> np.ndarray:
+        """テキストごとに4つの感情のスコアを計算する
+
+        Args:
+            text_list (list[str]): 感情を推定するテキストのリスト
+
+        Returns:
+            np.ndarray: 行がテキスト、列が SENTIMENTS の順の感情に対応するスコアの行列。
+                各行の合計は 1 となる
+        """
+        texts = np.array([normalize_text(x) for x in text_list], dtype=np.str_)
+        marked_texts = texts
+        for suffix, mark in self._negation_replacements:
+            marked_texts = np.strings.replace(marked_texts, suffix, mark)
+
+        term_counts = np.strings.count(texts[:, np.newaxis], self._terms)
+        negated_counts = (
+            np.strings.count(marked_texts[:, np.newaxis], self._negated_terms)
+            * self._negatable
+        )
+        affirmed_counts = np.maximum(term_counts - negated_counts, 0)
+        counts = np.hstack([affirmed_counts, negated_counts])
+
+        positive = counts @ self._positive_weights
+        negative = counts @ self._negative_weights
+        mixed = np.minimum(positive, negative)
+        strengths = np.column_stack(
+            [
+                positive - mixed,
+                negative - mixed,
+                np.full(len(text_list), self.NEUTRAL_PRIOR),
+                mixed * self.MIXED_WEIGHT,
+            ]
+        )
+        return strengths / strengths.sum(axis=1, keepdims=True)
@@ -0,0 +1,158 @@
+"""文字 n-gram の特徴量から感情のスコアを計算する線形モデルを定義する"""
+
+from collections.abc import Sequence
+from enum import StrEnum
+from pathlib import Path
+
+import numpy as np
+
+from src.infrastructure.local_sentiment.hashed_char_ngrams import (
+    HashedCharNgramVectorizer,
+)
+
+
+class TrainingAlgorithm(StrEnum):
+    """線形モデルの学習方法を定義する列挙型"""
+
+    # 多クラスのロジスティック回帰 (確信度が較正されやすい)
+    LOGISTIC_REGRESSION = "logistic_regression"
+    # 多項ナイーブベイズ (1回の集計で学習でき、少ないサンプルでも安定する)
+    NAIVE_BAYES = "naive_bayes"
+
+
+class LinearSentimentModel:
+    """ハッシュ化した文字 n-gram の特徴量から4つの感情のスコアを計算する線形モデル
+
+    推論はバッチ全体の特徴量と重み行列の積と softmax のみで行う。
+    学習方法にかかわらず重み行列とバイアスの形は同じため、同じ方法で保存と推論ができる。
+    """
+
+    def __init__(
+        self,
+        vectorizer: HashedCharNgramVectorizer,
+        weights: np.ndarray,
+        bias: np.ndarray,
+    ):
+        """LinearSentimentModel クラスのインスタンスを初期化する
+
+        Args:
+            vectorizer (HashedCharNgramVectorizer): テキストを特徴量に変換するクラス
+            weights (np.ndarray): 特徴量の数 x 感情の数 の重み行列
+            bias (np.ndarray): 感情ごとのバイアス
+        """
+        self.vectorizer = vectorizer
+        self.weights = weights
+        self.bias = bias
+
+    def predict_proba(self, texts: Sequence[str]) -> np.ndarray:
+        """テキストごとに4つの感情のスコアを計算する
+
+        Args:
+            texts (Sequence[str]): 感情を推定するテキストのリスト
+
+        Returns:
+            np.ndarray: 行がテキスト、列が感情に対応するスコアの行列。
+                各行の合計は 1 となる
+        """
+        features = self.vectorizer.transform(texts)
+        return self._softmax(features.dot(self.weights) + self.bias)
+
+    def save(self, path: str | Path) -> None:
+        """モデルを NumPy の npz 形式で保存する
+
+        Args:
+            path (str | Path): 保存先のパス
+        """
+        np.savez_compressed(
+            path,
+            weights=self.weights.astype(np.float32),
+            bias=self.bias.astype(np.float32),
+            n_features=self.vectorizer.n_features,
+            ngram_range=np.array(self.vectorizer.ngram_range),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "LinearSentimentModel":
+        """NumPy の npz 形式で保存したモデルを読み込む
+
+        Args:
+            path (str | Path): 読み込むモデルのパス
+
+        Returns:
+            LinearSentimentModel: 読み込んだモデル
+        """
+        with np.load(path, allow_pickle=False) as data:
+            min_n, max_n = (int(x) for x in data["ngram_range"])
+            vectorizer = HashedCharNgramVectorizer(
+                n_features=int(data["n_features"]), ngram_range=(min_n, max_n)
+            )
+            return cls(vectorizer, data["weights"], data["bias"])
+
+    @classmethod
+    def fit(
+        cls,
+        texts: Sequence[str],
+        targets: np.ndarray,
+        vectorizer: HashedCharNgramVectorizer,
+        algorithm: TrainingAlgorithm = TrainingAlgorithm.LOGISTIC_REGRESSION,
+        epochs: int = 200,
+        learning_rate: float = 0.05,
+        l2: float = 1e-6,
+        alpha: float = 0.1,
+    ) -> "LinearSentimentModel":
+        """テキストと感情のスコアの組からモデルを学習する
+
+        目標には AWS Comprehend が返した感情のスコアをそのまま使用し (蒸留)、
+        最もスコアの高い感情だけでなく、確信度の分布も学習する。
+
+        Args:
+            texts (Sequence[str]): 学習に使用するテキストのリスト
+            targets (np.ndarray): テキストの件数 x 感情の数 の目標のスコア
+            vectorizer (HashedCharNgramVectorizer): テキストを特徴量に変換するクラス
+            algorithm (TrainingAlgorithm, optional): 学習方法
+            epochs (int, optional): ロジスティック回帰の反復回数
+            learning_rate (float, optional): ロジスティック回帰の学習率
+            l2 (float, optional): ロジスティック回帰の L2 正則化の係数
+            alpha (float, optional): ナイーブベイズの平滑化の係数
+
+        Returns:
+            LinearSentimentModel: 学習したモデル
+        """
+        features = vectorizer.transform(texts)
+        targets = targets / targets.sum(axis=1, keepdims=True)
+        if algorithm == TrainingAlgorithm.NAIVE_BAYES:
+            # 目標のスコアで重み付けした n-gram の出現を感情ごとに集計する
+            counts = features.transpose_dot(targets, vectorizer.n_features) + alpha
+            weights = np.log(counts / counts.sum(axis=0, keepdims=True))
+            bias = np.log(np.clip(targets.mean(axis=0), 1e-9, None))
+            return cls(vectorizer, weights, bias)
+
+        weights = np.zeros((vectorizer.n_features, targets.shape[1]))
+        bias = np.zeros(targets.shape[1])
+        # Adam の1次と2次のモーメント
+        moments = [np.zeros_like(weights), np.zeros_like(weights)]
+        bias_moments = [np.zeros_like(bias), np.zeros_like(bias)]
+        beta1, beta2, eps = 0.9, 0.999, 1e-8
+        for step in range(1, epochs + 1):
+            probabilities = cls._softmax(features.dot(weights) + bias)
+            residuals = (probabilities - targets) / len(texts)
+            gradients = (
+                features.transpose_dot(residuals, vectorizer.n_features) + l2 * weights,
+                residuals.sum(axis=0),
+            )
+            correction = learning_rate * np.sqrt(1 - beta2**step) / (1 - beta1**step)
+            for parameter, gradient, (first, second) in zip(
+                (weights, bias), gradients, (moments, bias_moments), strict=True
+            ):
+                first *= beta1
+                first += (1 - beta1) * gradient
+                second *= beta2
+                second += (1 - beta2) * gradient**2
+                parameter -= correction * first / (np.sqrt(second) + eps)
+        return cls(vectorizer, weights, bias)
+
+    @staticmethod
+    def _softmax(logits: np.ndarray) -> np.ndarray:
+        """行ごとに softmax を計算する"""
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
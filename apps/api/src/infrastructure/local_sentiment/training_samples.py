@@ -0,0 +1,112 @@
+"""ローカルのモデルの学習に使用する感情分析のサンプルを定義する"""
+
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import SentimentResult
+from src.infrastructure.local_sentiment.lexicon_sentiment_api import (
+    LexiconSentimentApi,
+)
+
+
+@dataclass(frozen=True)
+class TrainingSample:
+    """テキストと AWS Comprehend による感情のスコアの組
+
+    Attributes:
+        text (str): 感情分析を行ったテキスト
+        scores (tuple[float, ...]): LexiconSentimentApi.SCORE_KEYS の順の感情のスコア
+    """
+
+    text: str
+    scores: tuple[float, ...]
+
+    @classmethod
+    def from_result(cls, text: str, result: SentimentResult) -> "TrainingSample":
+        """感情分析の結果からサンプルを作成する
+
+        Args:
+            text (str): 感情分析を行ったテキスト
+            result (SentimentResult): テキストの感情分析の結果
+
+        Returns:
+            TrainingSample: 作成したサンプル
+        """
+        return cls(
+            text=text,
+            scores=tuple(
+                result.sentiment_score.get(key, 0.0)
+                for key in LexiconSentimentApi.SCORE_KEYS
+            ),
+        )
+
+    def to_json(self) -> str:
+        """JSON Lines の1行として書き込む文字列を返す"""
+        return json.dumps(
+            {
+                "text": self.text,
+                "scores": dict(
+                    zip(LexiconSentimentApi.SCORE_KEYS, self.scores, strict=True)
+                ),
+            },
+            ensure_ascii=False,
+        )
+
+
+def read_training_samples(path: str | Path) -> list[TrainingSample]:
+    """JSON Lines のファイルからサンプルを読み込む
+
+    同じテキストが複数回記録されている場合は最後に記録したサンプルを使用する。
+    壊れた行やスコアの合計が 0 の行は読み飛ばす。
+
+    Args:
+        path (str | Path): 読み込むファイルのパス
+
+    Returns:
+        list[TrainingSample]: 読み込んだサンプルのリスト
+    """
+    samples: dict[str, TrainingSample] = {}
+    for sample in _iter_training_samples(path):
+        samples.pop(sample.text, None)
+        samples[sample.text] = sample
+    return list(samples.values())
+
+
+def _iter_training_samples(path: str | Path) -> Iterator[TrainingSample]:
+    """JSON Lines のファイルから読み込めたサンプルを順に返す"""
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                sample = TrainingSample(
+                    text=str(record["text"]),
+                    scores=tuple(
+                        float(record["scores"].get(key, 0.0))
+                        for key in LexiconSentimentApi.SCORE_KEYS
+                    ),
+                )
+            except (ValueError, KeyError, TypeError, AttributeError):
+                continue
+            if sum(sample.scores) > 0:
+                yield sample
+
+
+def to_target_matrix(samples: list[TrainingSample]) -> np.ndarray:
+    """サンプルの感情のスコアを、行の合計が 1 となる目標のスコアの行列に変換する
+
+    Args:
+        samples (list[TrainingSample]): 変換するサンプルのリスト
+
+    Returns:
+        np.ndarray: サンプルの件数 x 感情の数 の行列
+    """
+    targets = np.array([x.scores for x in samples], dtype=np.float64).reshape(
+        len(samples), len(LexiconSentimentApi.SCORE_KEYS)
+    )
+    return targets / targets.sum(axis=1, keepdims=True)
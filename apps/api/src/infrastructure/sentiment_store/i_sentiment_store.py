@@ -0,0 +1,49 @@
+"""感情分析結果の永続ストアのインターフェースを定義する抽象基底クラスを提供する"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SentimentStoreKey:
+    """感情分析結果を識別するキー
+
+    ポストIDと更新日時の組み合わせで検索し、
+    見つからない場合はテキストのハッシュ値で検索する。
+
+    Attributes:
+        post_id (int): ポストID
+        updated_at (str): ポストの更新日時
+        text_hash (str): メッセージ本文のハッシュ値
+    """
+
+    post_id: int
+    updated_at: str
+    text_hash: str
+
+
+class ISentimentStore(ABC):
+    """感情分析結果の永続ストアのインターフェースを定義する抽象基底クラス"""
+
+    @abstractmethod
+    def get_many(self, keys: list[SentimentStoreKey]) -> dict[SentimentStoreKey, str]:
+        """複数のキーに対応する感情分析結果をまとめて取得する
+
+        Args:
+            keys (list[SentimentStoreKey]): 取得対象のキーのリスト
+
+        Returns:
+            dict[SentimentStoreKey, str]: 結果が見つかったキーと感情の対応
+        """
+
+    @abstractmethod
+    def put_many(self, entries: dict[SentimentStoreKey, str]) -> None:
+        """複数の感情分析結果をまとめて保存する
+
+        Args:
+            entries (dict[SentimentStoreKey, str]): 保存するキーと感情の対応
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """ストアが保持しているリソースを解放する"""
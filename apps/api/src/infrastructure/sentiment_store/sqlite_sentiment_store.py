@@ -0,0 +1,218 @@
+"""SQLiteを使用して感情分析結果を永続化するストアを定義する"""
+
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from src.core.logger.logger import logger
+from src.infrastructure.sentiment_store.i_sentiment_store import (
+    ISentimentStore,
+    SentimentStoreKey,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sentiments (
+    post_id INTEGER NOT NULL,
+    updated_at TEXT NOT NULL,
+    text_hash BLOB NOT NULL,
+    sentiment TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (post_id, updated_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_sentiments_text_hash ON sentiments (text_hash);
+CREATE INDEX IF NOT EXISTS idx_sentiments_stored_at ON sentiments (stored_at);
+"""
+
+
+class SqliteSentimentStore(ISentimentStore):
+    """SQLiteのWALモードで感情分析結果を永続化するストア
+
+    ポストIDと更新日時を主キーとし、テキストのハッシュ値にもインデックスを張る。
+    1ページ分のキーを1回のクエリで検索できるように、複数件をまとめて読み書きする。
+
+    接続はスレッドごとに作成し、WALモードにより読み込みと書き込みを並行して行う。
+    保存件数が上限を超えた場合は、保存日時の古いものから削除する。
+
+    ストアはキャッシュとして扱うため、SQLiteのエラーはログに出力して無視し、
+    感情分析の処理は継続する。
+    """
+
+    # 1回のクエリで使用するキーの上限 (SQLiteのプレースホルダ数の上限を考慮する)
+    QUERY_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 1_000_000,
+        compact_interval: int = 10_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        """SqliteSentimentStore クラスのインスタンスを初期化する
+
+        Args:
+            path (str): データベースファイルのパス
+            max_entries (int, optional): 保存する件数の上限
+            compact_interval (int, optional): コンパクションを行う書き込み件数の間隔
+            clock (Callable[[], float], optional): 現在時刻(秒)を返す関数
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.compact_interval = compact_interval
+        self._clock = clock
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._writes_since_compaction = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        connection = self._connect()
+        # auto_vacuum はテーブル作成前に設定した場合のみ有効になる
+        connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        connection.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """現在のスレッドで使用する接続を取得する"""
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path,
+                timeout=5.0,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def _select(
+        self, connection: sqlite3.Connection, keys: list[SentimentStoreKey]
+    ) -> Iterator[tuple[int, str, bytes, str]]:
+        """ポストIDまたはテキストのハッシュ値が一致する行を取得する"""
+        post_ids = list({key.post_id for key in keys})
+        text_hashes = list({bytes.fromhex(key.text_hash) for key in keys})
+        query = (
+            "SELECT post_id, updated_at, text_hash, sentiment FROM sentiments"
+            f" WHERE post_id IN ({','.join('?' * len(post_ids))})"
+            f" OR text_hash IN ({','.join('?' * len(text_hashes))})"
+        )
+        return connection.execute(query, [*post_ids, *text_hashes])
+
+    def get_many(self, keys: list[SentimentStoreKey]) -> dict[SentimentStoreKey, str]:
+        """複数のキーに対応する感情分析結果をまとめて取得する
+
+        ポストIDと更新日時が一致する結果を優先し、
+        見つからない場合はテキストのハッシュ値が一致する結果を返す。
+
+        Args:
+            keys (list[SentimentStoreKey]): 取得対象のキーのリスト
+
+        Returns:
+            dict[SentimentStoreKey, str]: 結果が見つかったキーと感情の対応
+        """
+        by_post: dict[tuple[int, str], str] = {}
+        by_text_hash: dict[bytes, str] = {}
+        try:
+            connection = self._connect()
+            for offset in range(0, len(keys), self.QUERY_BATCH_SIZE):
+                batch = keys[offset : offset + self.QUERY_BATCH_SIZE]
+                for post_id, updated_at, text_hash, sentiment in self._select(
+                    connection, batch
+                ):
+                    by_post[(post_id, updated_at)] = sentiment
+                    by_text_hash[text_hash] = sentiment
+        except sqlite3.Error as error:
+            logger.warning("Failed to read sentiment store: %s", error)
+            return {}
+
+        result = {}
+        for key in keys:
+            found = by_post.get((key.post_id, key.updated_at)) or by_text_hash.get(
+                bytes.fromhex(key.text_hash)
+            )
+            if found is not None:
+                result[key] = found
+        return result
+
+    def put_many(self, entries: dict[SentimentStoreKey, str]) -> None:
+        """複数の感情分析結果をまとめて保存する
+
+        同じポストIDと更新日時の結果が既にある場合は上書きする。
+        書き込み件数が一定に達するごとにコンパクションを行う。
+
+        Args:
+            entries (dict[SentimentStoreKey, str]): 保存するキーと感情の対応
+        """
+        if not entries:
+            return
+
+        stored_at = self._clock()
+        rows = [
+            (
+                key.post_id,
+                key.updated_at,
+                bytes.fromhex(key.text_hash),
+                sentiment,
+                stored_at,
+            )
+            for key, sentiment in entries.items()
+        ]
+        try:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO sentiments VALUES (?, ?, ?, ?, ?)", rows
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except sqlite3.Error as error:
+            logger.warning("Failed to write sentiment store: %s", error)
+            return
+
+        with self._lock:
+            self._writes_since_compaction += len(rows)
+            should_compact = self._writes_since_compaction >= self.compact_interval
+            if should_compact:
+                self._writes_since_compaction = 0
+        if should_compact:
+            self.compact()
+
+    def compact(self) -> int:
+        """保存件数の上限を超えた古い結果を削除し、ファイルを縮小する
+
+        Returns:
+            int: 削除した件数
+        """
+        try:
+            connection = self._connect()
+            cursor = connection.execute(
+                "DELETE FROM sentiments WHERE stored_at < ("
+                "SELECT stored_at FROM sentiments"
+                " ORDER BY stored_at DESC LIMIT 1 OFFSET ?)",
+                (self.max_entries - 1,),
+            )
+            deleted = cursor.rowcount
+            # 削除により空いたページを解放し、WALファイルを切り詰める
+            connection.execute("PRAGMA incremental_vacuum").fetchall()
+            connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as error:
+            logger.warning("Failed to compact sentiment store: %s", error)
+            return 0
+
+        logger.info("Compacted sentiment store, deleted %d entries", deleted)
+        return deleted
+
+    def close(self) -> None:
+        """全てのスレッドの接続をクローズする"""
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
@@ -0,0 +1,231 @@
+"""Typetalk APIへの非同期リクエストを行うクラスを定義する"""
+
+import httpx
+
+from src.core.text_hash import hash_token
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.http_client import TypetalkTimeouts
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.infrastructure.typetalk.rate_limiter import (
+    TOO_MANY_REQUESTS,
+    TypetalkRateLimiter,
+)
+from src.schemas.message import TypetalkGetMessagesResponse
+from src.schemas.space import TypetalkGetSpacesResponse
+from src.schemas.topic import TypetalkGetTopicsResponse
+
+
+class AsyncTypetalkApi(IAsyncTypetalkApi):
+    """Typetalk APIへの非同期リクエストを行うクラス
+
+    レート制限の調整の仕組みが指定された場合は、アクセストークンごとの
+    レート制限を超えないように送信を待機させ、レート制限の超過を返された場合は
+    待機した後に再送する。
+    """
+
+    # レート制限の超過を返された場合に再送する回数
+    MAX_RATE_LIMIT_RETRIES = 1
+
+    def __init__(
+        self,
+        base_url: str,
+        client: httpx.AsyncClient,
+        timeouts: TypetalkTimeouts,
+        rate_limiter: TypetalkRateLimiter | None = None,
+    ):
+        """AsyncTypetalkApi クラスのインスタンスを初期化する
+
+        Args:
+            base_url (str): Typetalk API のベース URL
+            client (httpx.AsyncClient): リクエストに使用する共有非同期HTTPクライアント
+            timeouts (TypetalkTimeouts): エンドポイントごとのタイムアウト設定
+            rate_limiter (TypetalkRateLimiter | None, optional):
+                リクエスト間で共有するレート制限の調整の仕組み
+        """
+        self.base_url = base_url
+        self.client = client
+        self.timeouts = timeouts
+        self.rate_limiter = rate_limiter
+
+    async def __send(
+        self,
+        url: str,
+        headers: dict,
+        timeout: httpx.Timeout,
+        params: dict | None,
+    ) -> httpx.Response:
+        """レート制限に合わせてGETリクエストを送信する
+
+        Args:
+            url (str): リクエスト先のURL
+            headers (dict): リクエストヘッダー
+            timeout (httpx.Timeout): リクエストのタイムアウト
+            params (dict | None): リクエストパラメータ
+
+        Returns:
+            httpx.Response: レスポンス
+
+        Raises:
+            TypetalkAPIError: レート制限による待機時間が上限を超える場合に発生する。
+        """
+        rate_limiter = self.rate_limiter
+        if rate_limiter is None:
+            return await self.client.get(
+                url=url, headers=headers, params=params, timeout=timeout
+            )
+
+        token_hash = hash_token(headers["Authorization"].removeprefix("Bearer "))
+        attempts = self.MAX_RATE_LIMIT_RETRIES + 1
+        for attempt in range(attempts):
+            # 送信できるまで待機し、レスポンスの内容からレート制限の状態を更新する
+            await rate_limiter.acquire(token_hash)
+            try:
+                r = await self.client.get(
+                    url=url, headers=headers, params=params, timeout=timeout
+                )
+            except BaseException:
+                rate_limiter.release(token_hash)
+                raise
+            rate_limiter.release(token_hash, r.status_code, r.headers)
+            if r.status_code != TOO_MANY_REQUESTS or attempt == attempts - 1:
+                break
+        return r
+
+    async def __get(
+        self,
+        url: str,
+        headers: dict,
+        timeout: httpx.Timeout,
+        params: dict | None = None,
+    ) -> bytes:
+        """GETリクエストを行う
+
+        Args:
+            url (str): リクエスト先のURL
+            headers (dict): リクエストヘッダー
+            timeout (httpx.Timeout): リクエストのタイムアウト
+            params (dict | None, optional): リクエストパラメータ
+
+        Returns:
+            bytes: レスポンスのJSONデータのバイト列
+
+        Note:
+            正常なレスポンスは Python の辞書に変換せずにバイト列のまま返し、
+            呼び出し元でスキーマが使用するフィールドだけを検証して取り出す。
+
+        Raises:
+            TypetalkAPIError:
+                Typetalk APIからエラーレスポンスを受け取った場合に発生する。
+        """
+        try:
+            r = await self.__send(url, headers, timeout, params)
+            r.raise_for_status()
+
+            return r.content
+
+        except httpx.HTTPStatusError as exc:
+            raise TypetalkAPIError(
+                status_code=exc.response.status_code,
+                content=exc.response.json() if exc.response.content else None,
+                detail=exc.args,
+            ) from exc
+
+    async def get_spaces(self, typetalk_token: str) -> TypetalkGetSpacesResponse:
+        """Typetalkの組織一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+
+        Returns:
+            TypetalkGetSpacesResponse: Typetalk組織一覧のレスポンス
+
+        Reference:
+            https://developer.nulab.com/ja/docs/typetalk/api/1/get-spaces/#
+        """
+        url = f"{self.base_url}/api/v1/spaces"
+        headers = {"Authorization": f"Bearer {typetalk_token}"}
+        query_params = {"excludesGuest": "true"}
+        typetalk_response = await self.__get(
+            url,
+            headers=headers,
+            timeout=self.timeouts.spaces,
+            params=query_params,
+        )
+        return TypetalkGetSpacesResponse.model_validate_json(
+            typetalk_response,
+        )
+
+    async def get_topics(
+        self,
+        typetalk_token: str,
+        space_key: str,
+    ) -> TypetalkGetTopicsResponse:
+        """Typetalkの指定の組織からトピック一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            space_key (str): 対象の組織キー
+
+        Returns:
+            TypetalkGetTopicsResponse: Typetalkトピック一覧のレスポンス
+
+        Reference:
+            https://developer.nulab.com/ja/docs/typetalk/api/3/get-topics/#
+        """
+        url = f"{self.base_url}/api/v3/topics"
+        headers = {"Authorization": f"Bearer {typetalk_token}"}
+        query_params = {"isArchived": "false", "spaceKey": space_key}
+        typetalk_response = await self.__get(
+            url=url,
+            headers=headers,
+            timeout=self.timeouts.topics,
+            params=query_params,
+        )
+        return TypetalkGetTopicsResponse.model_validate_json(
+            typetalk_response,
+        )
+
+    async def get_messages(
+        self,
+        typetalk_token: str,
+        topic_id: int,
+        from_id: int | None = None,
+        count: int | None = None,
+        since_id: int | None = None,
+    ) -> TypetalkGetMessagesResponse:
+        """Typetalkの指定のトピックからメッセージ一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            topic_id (int): 対象のトピックID
+            from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+            count (int | None, optional):
+                取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+            since_id (int | None, optional):
+                指定した場合は、このIDより新しいメッセージ一覧を古い順に取得する
+
+        Returns:
+            TypetalkGetMessagesResponse: Typetalkメッセージ一覧のレスポンス
+
+        Reference:
+            https://developer.nulab.com/ja/docs/typetalk/api/1/get-messages/#
+        """
+        url = f"{self.base_url}/api/v1/topics/{topic_id}"
+        headers = {"Authorization": f"Bearer {typetalk_token}"}
+        query_params = {"direction": "backward"}
+        if since_id is not None:
+            # 指定のIDより新しいメッセージ一覧を古い順に取得する
+            query_params = {"direction": "forward", "from": str(since_id)}
+        elif from_id is not None:
+            query_params["from"] = str(from_id)
+        if count is not None:
+            query_params["count"] = str(count)
+        typetalk_response = await self.__get(
+            url,
+            headers=headers,
+            timeout=self.timeouts.messages,
+            params=query_params,
+        )
+        return TypetalkGetMessagesResponse.model_validate_json(
+            typetalk_response,
+        )
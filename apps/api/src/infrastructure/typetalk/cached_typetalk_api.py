@@ -0,0 +1,98 @@
+"""Typetalkの組織一覧とトピック一覧のレスポンスをキャッシュするクラスを定義する"""
+
+from src.core.text_hash import hash_token
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.infrastructure.typetalk.listing_cache import TypetalkListingCache
+from src.schemas.message import TypetalkGetMessagesResponse
+from src.schemas.space import TypetalkGetSpacesResponse
+from src.schemas.topic import TypetalkGetTopicsResponse
+
+
+class CachedTypetalkApi(IAsyncTypetalkApi):
+    """組織一覧とトピック一覧のレスポンスをアクセストークンごとにキャッシュするデコレーター
+
+    変更の少ない組織一覧とトピック一覧は、エンドポイントごとの有効期間の間キャッシュから返す。
+    メッセージ一覧はキャッシュせず、そのまま呼び出し対象のAPIに委譲する。
+    結果のオブジェクトは呼び出し元間で共有されるため、呼び出し元で変更してはならない。
+    """
+
+    def __init__(
+        self,
+        typetalk_api: IAsyncTypetalkApi,
+        cache: TypetalkListingCache,
+        spaces_ttl_seconds: float = 300.0,
+        topics_ttl_seconds: float = 60.0,
+    ):
+        """CachedTypetalkApi クラスのインスタンスを初期化する
+
+        Args:
+            typetalk_api (IAsyncTypetalkApi): 呼び出し対象のAPI
+            cache (TypetalkListingCache): リクエスト間で共有するキャッシュ
+            spaces_ttl_seconds (float, optional): 組織一覧の有効期間(秒)
+            topics_ttl_seconds (float, optional): トピック一覧の有効期間(秒)
+        """
+        self.typetalk_api = typetalk_api
+        self.cache = cache
+        self.spaces_ttl_seconds = spaces_ttl_seconds
+        self.topics_ttl_seconds = topics_ttl_seconds
+
+    async def get_spaces(self, typetalk_token: str) -> TypetalkGetSpacesResponse:
+        """Typetalkの組織一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+
+        Returns:
+            TypetalkGetSpacesResponse: Typetalk組織一覧のレスポンス
+        """
+        return await self.cache.get_or_fetch(
+            (hash_token(typetalk_token), "get_spaces"),
+            self.spaces_ttl_seconds,
+            lambda: self.typetalk_api.get_spaces(typetalk_token),
+        )
+
+    async def get_topics(
+        self,
+        typetalk_token: str,
+        space_key: str,
+    ) -> TypetalkGetTopicsResponse:
+        """Typetalkの指定の組織からトピック一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            space_key (str): 対象の組織キー
+
+        Returns:
+            TypetalkGetTopicsResponse: Typetalkトピック一覧のレスポンス
+        """
+        return await self.cache.get_or_fetch(
+            (hash_token(typetalk_token), "get_topics", space_key),
+            self.topics_ttl_seconds,
+            lambda: self.typetalk_api.get_topics(typetalk_token, space_key),
+        )
+
+    async def get_messages(
+        self,
+        typetalk_token: str,
+        topic_id: int,
+        from_id: int | None = None,
+        count: int | None = None,
+        since_id: int | None = None,
+    ) -> TypetalkGetMessagesResponse:
+        """Typetalkの指定のトピックからメッセージ一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            topic_id (int): 対象のトピックID
+            from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+            count (int | None, optional):
+                取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+            since_id (int | None, optional):
+                指定した場合は、このIDより新しいメッセージ一覧を古い順に取得する
+
+        Returns:
+            TypetalkGetMessagesResponse: Typetalkメッセージ一覧のレスポンス
+        """
+        return await self.typetalk_api.get_messages(
+            typetalk_token, topic_id, from_id, count, since_id
+        )
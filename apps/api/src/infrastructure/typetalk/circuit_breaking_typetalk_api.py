@@ -0,0 +1,146 @@
+"""障害が続くTypetalk APIへのリクエストを遮断するクラスを定義する"""
+
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import httpx
+
+from src.core.circuit_breaker import CircuitBreaker
+from src.infrastructure.typetalk.exceptions import (
+    TypetalkAPIError,
+    TypetalkCircuitOpenError,
+)
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.schemas.message import TypetalkGetMessagesResponse
+from src.schemas.space import TypetalkGetSpacesResponse
+from src.schemas.topic import TypetalkGetTopicsResponse
+
+T = TypeVar("T")
+
+# 障害として数えるHTTPステータスコードの下限
+INTERNAL_SERVER_ERROR = 500
+# 遮断中に返すHTTPステータスコード
+SERVICE_UNAVAILABLE = 503
+
+
+class CircuitBreakingTypetalkApi(IAsyncTypetalkApi):
+    """遮断している間、Typetalk APIへリクエストせずにエラーとするデコレーター
+
+    5xxのエラーレスポンスと、タイムアウトなどの通信エラーを失敗として数える。
+    認証エラーやレート制限などの4xxのエラーレスポンスは、Typetalk API自体は
+    応答しているため失敗として数えない。
+    """
+
+    def __init__(
+        self, typetalk_api: IAsyncTypetalkApi, circuit_breaker: CircuitBreaker
+    ):
+        """CircuitBreakingTypetalkApi クラスのインスタンスを初期化する
+
+        Args:
+            typetalk_api (IAsyncTypetalkApi): 呼び出し対象のAPI
+            circuit_breaker (CircuitBreaker): リクエスト間で共有するサーキットブレーカー
+        """
+        self.typetalk_api = typetalk_api
+        self.circuit_breaker = circuit_breaker
+
+    async def get_spaces(self, typetalk_token: str) -> TypetalkGetSpacesResponse:
+        """Typetalkの組織一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+
+        Returns:
+            TypetalkGetSpacesResponse: Typetalk組織一覧のレスポンス
+
+        Raises:
+            TypetalkCircuitOpenError: サーキットブレーカーが遮断している場合に発生する。
+        """
+        return await self._call(lambda: self.typetalk_api.get_spaces(typetalk_token))
+
+    async def get_topics(
+        self,
+        typetalk_token: str,
+        space_key: str,
+    ) -> TypetalkGetTopicsResponse:
+        """Typetalkの指定の組織からトピック一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            space_key (str): 対象の組織キー
+
+        Returns:
+            TypetalkGetTopicsResponse: Typetalkトピック一覧のレスポンス
+
+        Raises:
+            TypetalkCircuitOpenError: サーキットブレーカーが遮断している場合に発生する。
+        """
+        return await self._call(
+            lambda: self.typetalk_api.get_topics(typetalk_token, space_key)
+        )
+
+    async def get_messages(
+        self,
+        typetalk_token: str,
+        topic_id: int,
+        from_id: int | None = None,
+        count: int | None = None,
+        since_id: int | None = None,
+    ) -> TypetalkGetMessagesResponse:
+        """Typetalkの指定のトピックからメッセージ一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            topic_id (int): 対象のトピックID
+            from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+            count (int | None, optional):
+                取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+            since_id (int | None, optional):
+                指定した場合は、このIDより新しいメッセージ一覧を古い順に取得する
+
+        Returns:
+            TypetalkGetMessagesResponse: Typetalkメッセージ一覧のレスポンス
+
+        Raises:
+            TypetalkCircuitOpenError: サーキットブレーカーが遮断している場合に発生する。
+        """
+        return await self._call(
+            lambda: self.typetalk_api.get_messages(
+                typetalk_token, topic_id, from_id, count, since_id
+            )
+        )
+
+    async def _call(self, func: Callable[[], Awaitable[T]]) -> T:
+        """サーキットブレーカーが許可する場合のみ呼び出し、結果を記録する"""
+        if not self.circuit_breaker.allow():
+            raise TypetalkCircuitOpenError(
+                status_code=SERVICE_UNAVAILABLE,
+                content={"error": "circuit_open"},
+                detail=("Typetalk API circuit breaker is open.",),
+            )
+        try:
+            result = await func()
+        except (TypetalkAPIError, httpx.TransportError) as error:
+            if self.is_failure(error):
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            raise
+        except BaseException:
+            self.circuit_breaker.release()
+            raise
+        self.circuit_breaker.record_success()
+        return result
+
+    @staticmethod
+    def is_failure(error: Exception) -> bool:
+        """Typetalk APIの障害として数える例外かどうかを返す
+
+        Args:
+            error (Exception): 呼び出しで発生した例外
+
+        Returns:
+            bool: 5xxのエラーレスポンスや通信エラーの場合は True
+        """
+        if isinstance(error, TypetalkAPIError):
+            return error.status_code >= INTERNAL_SERVER_ERROR
+        return isinstance(error, httpx.TransportError)
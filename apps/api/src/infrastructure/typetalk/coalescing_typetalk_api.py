@@ -0,0 +1,101 @@
+"""同時に行われる同じTypetalk APIへのリクエストを1回にまとめるクラスを定義する"""
+
+from src.core.text_hash import hash_token
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.infrastructure.typetalk.single_flight import SingleFlight
+from src.schemas.message import TypetalkGetMessagesResponse
+from src.schemas.space import TypetalkGetSpacesResponse
+from src.schemas.topic import TypetalkGetTopicsResponse
+
+
+class CoalescingTypetalkApi(IAsyncTypetalkApi):
+    """同じリクエストが実行中の場合に、その結果を共有するデコレーター
+
+    アクセストークンのハッシュ値、エンドポイント、パラメータが同じリクエストが
+    実行中の場合は、Typetalk APIへのリクエストを行わずに実行中のリクエストの
+    結果を待って返す。結果のオブジェクトは呼び出し元間で共有されるため、
+    呼び出し元で変更してはならない。
+    """
+
+    def __init__(
+        self,
+        typetalk_api: IAsyncTypetalkApi,
+        single_flight: SingleFlight,
+    ):
+        """CoalescingTypetalkApi クラスのインスタンスを初期化する
+
+        Args:
+            typetalk_api (IAsyncTypetalkApi): 呼び出し対象のAPI
+            single_flight (SingleFlight): リクエスト間で共有する集約の仕組み
+        """
+        self.typetalk_api = typetalk_api
+        self.single_flight = single_flight
+
+    async def get_spaces(self, typetalk_token: str) -> TypetalkGetSpacesResponse:
+        """Typetalkの組織一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+
+        Returns:
+            TypetalkGetSpacesResponse: Typetalk組織一覧のレスポンス
+        """
+        return await self.single_flight.do(
+            (hash_token(typetalk_token), "get_spaces"),
+            lambda: self.typetalk_api.get_spaces(typetalk_token),
+        )
+
+    async def get_topics(
+        self,
+        typetalk_token: str,
+        space_key: str,
+    ) -> TypetalkGetTopicsResponse:
+        """Typetalkの指定の組織からトピック一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            space_key (str): 対象の組織キー
+
+        Returns:
+            TypetalkGetTopicsResponse: Typetalkトピック一覧のレスポンス
+        """
+        return await self.single_flight.do(
+            (hash_token(typetalk_token), "get_topics", space_key),
+            lambda: self.typetalk_api.get_topics(typetalk_token, space_key),
+        )
+
+    async def get_messages(
+        self,
+        typetalk_token: str,
+        topic_id: int,
+        from_id: int | None = None,
+        count: int | None = None,
+        since_id: int | None = None,
+    ) -> TypetalkGetMessagesResponse:
+        """Typetalkの指定のトピックからメッセージ一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            topic_id (int): 対象のトピックID
+            from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+            count (int | None, optional):
+                取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+            since_id (int | None, optional):
+                指定した場合は、このIDより新しいメッセージ一覧を古い順に取得する
+
+        Returns:
+            TypetalkGetMessagesResponse: Typetalkメッセージ一覧のレスポンス
+        """
+        return await self.single_flight.do(
+            (
+                hash_token(typetalk_token),
+                "get_messages",
+                topic_id,
+                from_id,
+                count,
+                since_id,
+            ),
+            lambda: self.typetalk_api.get_messages(
+                typetalk_token, topic_id, from_id, count, since_id
+            ),
+        )
@@ -19,3 +19,19 @@ class TypetalkAPIError(AppBaseError):
         self.status_code = status_code
         self.content = content
         super().__init__(detail)
+
+
+class CachedTypetalkAPIError(TypetalkAPIError):
+    """キャッシュしたTypetalk APIのエラーレスポンスを返す場合に発生する例外クラス
+
+    Typetalk APIへのリクエストを行わずに発生させるため、
+    例外ハンドラーではスタックトレースを出力しない。
+    """
+
+
+class TypetalkCircuitOpenError(TypetalkAPIError):
+    """サーキットブレーカーがリクエストを遮断した場合に発生する例外クラス
+
+    Typetalk APIへのリクエストを行わずに発生させるため、
+    例外ハンドラーではスタックトレースを出力しない。
+    """
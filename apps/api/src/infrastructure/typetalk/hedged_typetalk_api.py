@@ -0,0 +1,101 @@
+"""遅いTypetalk APIへのリクエストをヘッジするクラスを定義する"""
+
+from collections.abc import Mapping
+
+from src.core.hedging import RequestHedger
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.schemas.message import TypetalkGetMessagesResponse
+from src.schemas.space import TypetalkGetSpacesResponse
+from src.schemas.topic import TypetalkGetTopicsResponse
+
+
+class HedgedTypetalkApi(IAsyncTypetalkApi):
+    """一定時間内にレスポンスが返らない場合に、同じリクエストを追加で送信するデコレーター
+
+    エンドポイントごとにレイテンシの傾向が異なるため、ヘッジの仕組みは
+    エンドポイントごとに分ける。対応するヘッジの仕組みが無いエンドポイントは
+    ヘッジせずに呼び出す。
+    """
+
+    def __init__(
+        self,
+        typetalk_api: IAsyncTypetalkApi,
+        hedgers: Mapping[str, RequestHedger],
+    ):
+        """HedgedTypetalkApi クラスのインスタンスを初期化する
+
+        Args:
+            typetalk_api (IAsyncTypetalkApi): 呼び出し対象のAPI
+            hedgers (Mapping[str, RequestHedger]):
+                メソッド名をキーとした、リクエスト間で共有するヘッジの仕組み
+        """
+        self.typetalk_api = typetalk_api
+        self.hedgers = hedgers
+
+    async def get_spaces(self, typetalk_token: str) -> TypetalkGetSpacesResponse:
+        """Typetalkの組織一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+
+        Returns:
+            TypetalkGetSpacesResponse: Typetalk組織一覧のレスポンス
+        """
+        hedger = self.hedgers.get("get_spaces")
+        if hedger is None:
+            return await self.typetalk_api.get_spaces(typetalk_token)
+        return await hedger.run(lambda: self.typetalk_api.get_spaces(typetalk_token))
+
+    async def get_topics(
+        self,
+        typetalk_token: str,
+        space_key: str,
+    ) -> TypetalkGetTopicsResponse:
+        """Typetalkの指定の組織からトピック一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            space_key (str): 対象の組織キー
+
+        Returns:
+            TypetalkGetTopicsResponse: Typetalkトピック一覧のレスポンス
+        """
+        hedger = self.hedgers.get("get_topics")
+        if hedger is None:
+            return await self.typetalk_api.get_topics(typetalk_token, space_key)
+        return await hedger.run(
+            lambda: self.typetalk_api.get_topics(typetalk_token, space_key)
+        )
+
+    async def get_messages(
+        self,
+        typetalk_token: str,
+        topic_id: int,
+        from_id: int | None = None,
+        count: int | None = None,
+        since_id: int | None = None,
+    ) -> TypetalkGetMessagesResponse:
+        """Typetalkの指定のトピックからメッセージ一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            topic_id (int): 対象のトピックID
+            from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+            count (int | None, optional):
+                取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+            since_id (int | None, optional):
+                指定した場合は、このIDより新しいメッセージ一覧を古い順に取得する
+
+        Returns:
+            TypetalkGetMessagesResponse: Typetalkメッセージ一覧のレスポンス
+        """
+        hedger = self.hedgers.get("get_messages")
+        if hedger is None:
+            return await self.typetalk_api.get_messages(
+                typetalk_token, topic_id, from_id, count, since_id
+            )
+        return await hedger.run(
+            lambda: self.typetalk_api.get_messages(
+                typetalk_token, topic_id, from_id, count, since_id
+            )
+        )
@@ -0,0 +1,110 @@
+"""Typetalk APIへのリクエストで共有するHTTPクライアントを管理する"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import httpx
+
+from src.core.config import Settings, get_settings
+
+
+@dataclass(frozen=True)
+class TypetalkTimeouts:
+    """Typetalk APIのエンドポイントごとのタイムアウト設定"""
+
+    spaces: httpx.Timeout
+    topics: httpx.Timeout
+    messages: httpx.Timeout
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "TypetalkTimeouts":
+        """環境設定からタイムアウト設定を作成する
+
+        Args:
+            settings (Settings): 環境設定
+
+        Returns:
+            TypetalkTimeouts: エンドポイントごとのタイムアウト設定
+        """
+        connect = settings.typetalk_connect_timeout
+        return cls(
+            spaces=httpx.Timeout(settings.typetalk_spaces_timeout, connect=connect),
+            topics=httpx.Timeout(settings.typetalk_topics_timeout, connect=connect),
+            messages=httpx.Timeout(settings.typetalk_messages_timeout, connect=connect),
+        )
+
+
+def _create_limits(settings: Settings) -> httpx.Limits:
+    """環境設定からコネクションプールの制限を作成する"""
+    return httpx.Limits(
+        max_connections=settings.typetalk_http_max_connections,
+        max_keepalive_connections=settings.typetalk_http_max_keepalive_connections,
+        keepalive_expiry=settings.typetalk_http_keepalive_expiry,
+    )
+
+
+def _create_default_timeout(settings: Settings) -> httpx.Timeout:
+    """環境設定からクライアント全体のデフォルトタイムアウトを作成する"""
+    return httpx.Timeout(
+        settings.typetalk_messages_timeout,
+        connect=settings.typetalk_connect_timeout,
+    )
+
+
+def create_typetalk_http_client(settings: Settings) -> httpx.Client:
+    """環境設定に従ってコネクションプールを持つHTTPクライアントを作成する
+
+    Args:
+        settings (Settings): 環境設定
+
+    Returns:
+        httpx.Client: キープアライブ接続を再利用するHTTPクライアント
+    """
+    return httpx.Client(
+        limits=_create_limits(settings),
+        http2=settings.typetalk_http2,
+        timeout=_create_default_timeout(settings),
+    )
+
+
+def create_typetalk_async_http_client(settings: Settings) -> httpx.AsyncClient:
+    """環境設定に従ってコネクションプールを持つ非同期HTTPクライアントを作成する
+
+    非同期クライアントの接続はイベントループに紐づくため、
+    FastAPIのlifespanでアプリケーションのイベントループ上に作成すること。
+
+    Args:
+        settings (Settings): 環境設定
+
+    Returns:
+        httpx.AsyncClient: キープアライブ接続を再利用する非同期HTTPクライアント
+    """
+    return httpx.AsyncClient(
+        limits=_create_limits(settings),
+        http2=settings.typetalk_http2,
+        timeout=_create_default_timeout(settings),
+    )
+
+
+@lru_cache
+def get_typetalk_http_client() -> httpx.Client:
+    """アプリケーション全体で共有するHTTPクライアントを取得する
+
+    初回呼び出し時にクライアントを作成し、以降は同じインスタンスを返す。
+    通常はFastAPIのlifespanで起動時に作成し、終了時に close_typetalk_http_client で
+    クローズする。
+
+    Returns:
+        httpx.Client: 共有HTTPクライアント
+    """
+    return create_typetalk_http_client(get_settings())
+
+
+def close_typetalk_http_client() -> None:
+    """共有HTTPクライアントをクローズし、キャッシュを破棄する
+
+    クライアントが作成されていない場合は何もしない。
+    """
+    if get_typetalk_http_client.cache_info().currsize:
+        get_typetalk_http_client().close()
+    get_typetalk_http_client.cache_clear()
@@ -43,6 +43,8 @@ class ITypetalkApi(ABC):
         typetalk_token: str,
         topic_id: int,
         from_id: int | None = None,
+        count: int | None = None,
+        since_id: int | None = None,
     ) -> TypetalkGetMessagesResponse:
         """Typetalkの指定のトピックからメッセージ一覧を取得する
 
@@ -50,6 +52,10 @@ class ITypetalkApi(ABC):
             typetalk_token (str): Typetalkのアクセストークン
             topic_id (int): 対象のトピックID
             from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+            count (int | None, optional):
+                取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+            since_id (int | None, optional):
+                指定した場合は、このIDより新しいメッセージ一覧を古い順に取得する
 
         Returns:
             TypetalkGetMessagesResponse: Typetalkメッセージ一覧のレスポンス
@@ -0,0 +1,212 @@
+"""Typetalkの組織一覧やトピック一覧をアクセストークンごとに保持するキャッシュを定義する"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypeVar
+
+from src.core.logger.logger import logger
+
+T = TypeVar("T")
+
+# 先頭の要素をアクセストークンのハッシュ値とするキー
+ListingCacheKey = tuple[Hashable, ...]
+
+
+@dataclass(frozen=True)
+class ListingCacheStats:
+    """一覧キャッシュの統計情報
+
+    Attributes:
+        hits (int): 有効期間内のエントリを返した回数
+        stale_hits (int): 有効期間を過ぎたエントリを返し、再取得を開始した回数
+        misses (int): エントリが無いか再利用できる期間を過ぎたため取得した回数
+        refreshes (int): バックグラウンドで再取得した回数
+        refresh_failures (int): バックグラウンドの再取得に失敗した回数
+        invalidations (int): 無効化したエントリ数
+        evictions (int): 容量超過で破棄したエントリ数
+        size (int): 現在のエントリ数
+        in_flight (int): 現在実行中の再取得の数
+    """
+
+    hits: int
+    stale_hits: int
+    misses: int
+    refreshes: int
+    refresh_failures: int
+    invalidations: int
+    evictions: int
+    size: int
+    in_flight: int
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """キャッシュのエントリ"""
+
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+
+class TypetalkListingCache:
+    """Typetalkの一覧のレスポンスを、アクセストークンのハッシュ値ごとに保持する
+
+    有効期間内のエントリはそのまま返す。有効期間を過ぎても再利用できる期間内であれば、
+    古いエントリを即座に返しつつバックグラウンドで再取得する (stale-while-revalidate)。
+    エントリ数の上限を超えた場合は最も長く使われていないエントリから破棄する。
+
+    キーにはアクセストークンのハッシュ値を使用し、アクセストークン自体は保持しない。
+    エラーとなったレスポンスはキャッシュしない。
+    タスクはイベントループに紐づくため、インスタンスは1つのイベントループ上で使用する。
+    """
+
+    def __init__(
+        self,
+        stale_seconds: float = 600.0,
+        max_size: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """TypetalkListingCache クラスのインスタンスを初期化する
+
+        Args:
+            stale_seconds (float, optional):
+                有効期間を過ぎたエントリを、再取得の間に返してよい期間(秒)
+            max_size (int, optional): キャッシュするエントリ数の上限
+            clock (Callable[[], float], optional): 現在時刻(秒)を返す関数
+        """
+        self.stale_seconds = stale_seconds
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[ListingCacheKey, _Entry] = OrderedDict()
+        self._refreshing: dict[ListingCacheKey, asyncio.Task[Any]] = {}
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._refresh_failures = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> ListingCacheStats:
+        """一覧キャッシュの統計情報を返す"""
+        return ListingCacheStats(
+            hits=self._hits,
+            stale_hits=self._stale_hits,
+            misses=self._misses,
+            refreshes=self._refreshes,
+            refresh_failures=self._refresh_failures,
+            invalidations=self._invalidations,
+            evictions=self._evictions,
+            size=len(self._entries),
+            in_flight=len(self._refreshing),
+        )
+
+    async def get_or_fetch(
+        self,
+        key: ListingCacheKey,
+        ttl_seconds: float,
+        fetch: Callable[[], Awaitable[T]],
+    ) -> T:
+        """キャッシュのエントリを返し、無い場合は取得してキャッシュする
+
+        Args:
+            key (ListingCacheKey): アクセストークンのハッシュ値から始まるキー
+            ttl_seconds (float): 取得したエントリの有効期間(秒)
+            fetch (Callable[[], Awaitable[T]]): 一覧を取得する処理
+
+        Returns:
+            T: 一覧のレスポンス
+        """
+        now = self._clock()
+        entry = self._entries.get(key)
+        if entry is not None and now < entry.stale_until:
+            self._entries.move_to_end(key)
+            if now < entry.fresh_until:
+                self._hits += 1
+            else:
+                self._stale_hits += 1
+                self._start_refresh(key, ttl_seconds, fetch)
+            return entry.value
+
+        self._misses += 1
+        value = await fetch()
+        self._put(key, ttl_seconds, value)
+        return value
+
+    def invalidate(self, token_hash: str) -> int:
+        """アクセストークンのハッシュ値に対応するエントリを全て破棄する
+
+        実行中の再取得も中止し、破棄したエントリが再び保存されないようにする。
+
+        Args:
+            token_hash (str): アクセストークンのハッシュ値
+
+        Returns:
+            int: 破棄したエントリ数
+        """
+        for key, task in list(self._refreshing.items()):
+            if key[0] == token_hash:
+                task.cancel()
+        keys = [key for key in self._entries if key[0] == token_hash]
+        for key in keys:
+            del self._entries[key]
+        self._invalidations += len(keys)
+        return len(keys)
+
+    def _put(self, key: ListingCacheKey, ttl_seconds: float, value: object) -> None:
+        """エントリを保存し、上限を超えた場合は古いエントリを破棄する"""
+        now = self._clock()
+        self._entries[key] = _Entry(
+            value=value,
+            fresh_until=now + ttl_seconds,
+            stale_until=now + ttl_seconds + self.stale_seconds,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _start_refresh(
+        self,
+        key: ListingCacheKey,
+        ttl_seconds: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """エントリの再取得をバックグラウンドで開始する"""
+        if key in self._refreshing:
+            return
+        task = asyncio.ensure_future(fetch())
+        self._refreshing[key] = task
+        self._refreshes += 1
+        task.add_done_callback(partial(self._on_refreshed, key, ttl_seconds))
+
+    def _on_refreshed(
+        self,
+        key: ListingCacheKey,
+        ttl_seconds: float,
+        task: asyncio.Task[Any],
+    ) -> None:
+        """再取得の完了時にエントリを更新する"""
+        if self._refreshing.get(key) is task:
+            del self._refreshing[key]
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            # 再取得に失敗した場合は、再利用できる期間内は古いエントリを返し続ける
+            self._refresh_failures += 1
+            logger.warning("Failed to refresh Typetalk listing: %r", task.exception())
+            return
+        self._put(key, ttl_seconds, task.result())
+
+    async def aclose(self) -> None:
+        """実行中の再取得を中止し、完了を待つ"""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
@@ -0,0 +1,120 @@
+"""Typetalk APIのエラーレスポンスを短い期間保持するキャッシュを定義する"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class NegativeCacheStats:
+    """エラーレスポンスのキャッシュの統計情報
+
+    Attributes:
+        hits (int): キャッシュしたエラーレスポンスを返した回数
+        stores (int): エラーレスポンスを保存した回数
+        evictions (int): 容量超過で破棄したエントリ数
+        size (int): 現在のエントリ数
+    """
+
+    hits: int
+    stores: int
+    evictions: int
+    size: int
+
+
+@dataclass(frozen=True)
+class NegativeCacheEntry:
+    """キャッシュしたエラーレスポンス
+
+    Attributes:
+        status_code (int): HTTP ステータスコード
+        content (dict | None): エラーレスポンスの内容
+        expires_at (float): 有効期限(秒)
+    """
+
+    status_code: int
+    content: dict | None
+    expires_at: float
+
+
+class TypetalkNegativeCache:
+    """Typetalk APIのエラーレスポンスをアクセストークンのハッシュ値ごとに保持する
+
+    有効期限が切れたアクセストークンなどで同じリクエストが繰り返される場合に、
+    Typetalk APIへのリクエストを行わずに同じエラーレスポンスを返すために使用する。
+    キーにはアクセストークンのハッシュ値を使用し、アクセストークン自体は保持しない。
+    """
+
+    # キャッシュの対象とするHTTPステータスコード
+    CACHEABLE_STATUS_CODES = frozenset({401, 403, 404})
+
+    def __init__(
+        self,
+        ttl_seconds: float = 10.0,
+        max_size: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """TypetalkNegativeCache クラスのインスタンスを初期化する
+
+        Args:
+            ttl_seconds (float, optional): エラーレスポンスの有効期間(秒)
+            max_size (int, optional): キャッシュするエントリ数の上限
+            clock (Callable[[], float], optional): 現在時刻(秒)を返す関数
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, NegativeCacheEntry] = OrderedDict()
+        self._hits = 0
+        self._stores = 0
+        self._evictions = 0
+
+    @property
+    def stats(self) -> NegativeCacheStats:
+        """エラーレスポンスのキャッシュの統計情報を返す"""
+        return NegativeCacheStats(
+            hits=self._hits,
+            stores=self._stores,
+            evictions=self._evictions,
+            size=len(self._entries),
+        )
+
+    def get(self, key: Hashable) -> NegativeCacheEntry | None:
+        """有効期限内のエラーレスポンスを返す
+
+        Args:
+            key (Hashable): トークンのハッシュ値、エンドポイント、パラメータのキー
+
+        Returns:
+            NegativeCacheEntry | None: キャッシュしたエラーレスポンス。無い場合は None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._hits += 1
+        return entry
+
+    def put(self, key: Hashable, status_code: int, content: dict | None) -> None:
+        """キャッシュの対象となるステータスコードの場合にエラーレスポンスを保存する
+
+        Args:
+            key (Hashable): トークンのハッシュ値、エンドポイント、パラメータのキー
+            status_code (int): HTTP ステータスコード
+            content (dict | None): エラーレスポンスの内容
+        """
+        if status_code not in self.CACHEABLE_STATUS_CODES:
+            return
+        self._entries[key] = NegativeCacheEntry(
+            status_code=status_code,
+            content=content,
+            expires_at=self._clock() + self.ttl_seconds,
+        )
+        self._entries.move_to_end(key)
+        self._stores += 1
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
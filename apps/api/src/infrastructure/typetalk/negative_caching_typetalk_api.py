@@ -0,0 +1,133 @@
+"""Typetalk APIの認証エラーなどのエラーレスポンスをキャッシュするクラスを定義する"""
+
+from collections.abc import Awaitable, Callable, Hashable
+from typing import TypeVar
+
+from src.core.text_hash import hash_token
+from src.infrastructure.typetalk.exceptions import (
+    CachedTypetalkAPIError,
+    TypetalkAPIError,
+)
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.infrastructure.typetalk.negative_cache import TypetalkNegativeCache
+from src.schemas.message import TypetalkGetMessagesResponse
+from src.schemas.space import TypetalkGetSpacesResponse
+from src.schemas.topic import TypetalkGetTopicsResponse
+
+T = TypeVar("T")
+
+
+class NegativeCachingTypetalkApi(IAsyncTypetalkApi):
+    """401/403/404 のエラーレスポンスを短い期間キャッシュするデコレーター
+
+    エラーレスポンスをキャッシュしている間は、同じアクセストークン、エンドポイント、
+    パラメータのリクエストを Typetalk API へ送信せず、同じステータスコードと内容の
+    CachedTypetalkAPIError を発生させる。
+    """
+
+    def __init__(
+        self,
+        typetalk_api: IAsyncTypetalkApi,
+        negative_cache: TypetalkNegativeCache,
+    ):
+        """NegativeCachingTypetalkApi クラスのインスタンスを初期化する
+
+        Args:
+            typetalk_api (IAsyncTypetalkApi): 呼び出し対象のAPI
+            negative_cache (TypetalkNegativeCache): リクエスト間で共有するキャッシュ
+        """
+        self.typetalk_api = typetalk_api
+        self.negative_cache = negative_cache
+
+    async def _call(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """キャッシュしたエラーレスポンスが無い場合に処理を実行する
+
+        Args:
+            key (Hashable): トークンのハッシュ値、エンドポイント、パラメータのキー
+            func (Callable[[], Awaitable[T]]): Typetalk APIを呼び出す処理
+
+        Returns:
+            T: Typetalk APIのレスポンス
+
+        Raises:
+            CachedTypetalkAPIError: キャッシュしたエラーレスポンスがある場合に発生する。
+            TypetalkAPIError:
+                Typetalk APIからエラーレスポンスを受け取った場合に発生する。
+        """
+        entry = self.negative_cache.get(key)
+        if entry is not None:
+            raise CachedTypetalkAPIError(
+                status_code=entry.status_code,
+                content=entry.content,
+                detail=("Cached Typetalk API error response.", entry.status_code),
+            )
+        try:
+            return await func()
+        except TypetalkAPIError as exc:
+            self.negative_cache.put(key, exc.status_code, exc.content)
+            raise
+
+    async def get_spaces(self, typetalk_token: str) -> TypetalkGetSpacesResponse:
+        """Typetalkの組織一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+
+        Returns:
+            TypetalkGetSpacesResponse: Typetalk組織一覧のレスポンス
+        """
+        return await self._call(
+            (hash_token(typetalk_token), "get_spaces"),
+            lambda: self.typetalk_api.get_spaces(typetalk_token),
+        )
+
+    async def get_topics(
+        self,
+        typetalk_token: str,
+        space_key: str,
+    ) -> TypetalkGetTopicsResponse:
+        """Typetalkの指定の組織からトピック一覧を取得する
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            space_key (str): 対象の組織キー
+
+        Returns:
+            TypetalkGetTopicsResponse: Typetalkトピック一覧のレスポンス
+        """
+        return await self._call(
+            (hash_token(typetalk_token), "get_topics", space_key),
+            lambda: self.typetalk_api.get_topics(typetalk_token, space_key),
+        )
+
+    async def get_messages(
+        self,
+        typetalk_token: str,
+        topic_id: int,
+        from_id: int | None = None,
+        count: int | None = None,
+        since_id: int | None = None,
+    ) -> TypetalkGetMessagesResponse:
+        """Typetalkの指定のトピックからメッセージ一覧を取得する
+
+        認証エラーやトピックが存在しないエラーは開始IDや件数に依存しないため、
+        キーにはトピックIDのみを含める。
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            topic_id (int): 対象のトピックID
+            from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+            count (int | None, optional):
+                取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+            since_id (int | None, optional):
+                指定した場合は、このIDより新しいメッセージ一覧を古い順に取得する
+
+        Returns:
+            TypetalkGetMessagesResponse: Typetalkメッセージ一覧のレスポンス
+        """
+        return await self._call(
+            (hash_token(typetalk_token), "get_messages", topic_id),
+            lambda: self.typetalk_api.get_messages(
+                typetalk_token, topic_id, from_id, count, since_id
+            ),
+        )
@@ -0,0 +1,325 @@
+"""Typetalk APIのレート制限に合わせてリクエストを調整する仕組みを定義する"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+
+# レート制限の超過を示すHTTPステータスコード
+TOO_MANY_REQUESTS = 429
+
+
+@dataclass(frozen=True)
+class RateLimitStats:
+    """レート制限の調整に関する統計情報
+
+    Attributes:
+        requests (int): 送信を許可したリクエスト数
+        delayed (int): 送信を待機させたリクエスト数
+        rejected (int): 待機時間が上限を超えるため送信しなかったリクエスト数
+        throttled (int): Typetalk APIからレート制限の超過を返された回数
+        tracked_tokens (int): 状態を保持しているアクセストークンの数
+        lowest_remaining (int | None):
+            レート制限が判明しているアクセストークンのうち、最も少ない残りリクエスト数
+        lowest_concurrency_limit (int | None):
+            レート制限が不明なアクセストークンのうち、最も小さい同時実行数の上限
+    """
+
+    requests: int
+    delayed: int
+    rejected: int
+    throttled: int
+    tracked_tokens: int
+    lowest_remaining: int | None
+    lowest_concurrency_limit: int | None
+
+
+@dataclass
+class _TokenState:
+    """アクセストークンごとのレート制限の状態"""
+
+    concurrency_limit: float
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float | None = None
+    reset_epoch: int | None = None
+    next_at: float = 0.0
+    in_flight: int = 0
+    waiters: list[asyncio.Future[None]] = field(default_factory=list)
+
+    @property
+    def has_capacity(self) -> bool:
+        """同時実行数に空きがあるかどうかを返す
+
+        レート制限が判明している場合は残りリクエスト数で調整するため、常に空きがある。
+        """
+        return self.limit is not None or self.in_flight < int(self.concurrency_limit)
+
+    def wake_waiters(self) -> None:
+        """同時実行数の空きを待っている呼び出しを全て再開させる"""
+        for waiter in self.waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self.waiters.clear()
+
+
+class TypetalkRateLimiter:
+    """Typetalk APIのレート制限を超えないように、アクセストークンごとに送信を調整する
+
+    レスポンスの X-RateLimit-Limit、X-RateLimit-Remaining、X-RateLimit-Reset
+    ヘッダーから残りリクエスト数とリセット時刻を把握し、残りリクエスト数を使い切った場合は
+    リセット時刻まで送信を待機させる。残りリクエスト数が上限の一定割合を下回った場合は、
+    リセット時刻までの残り時間に均等に送信を分散させる。
+
+    レート制限が不明な場合は、同時実行数の上限を AIMD (加算増加・乗算減少) で調整する。
+    成功したレスポンスごとに上限を緩やかに増やし、レート制限の超過を返された場合は半減する。
+
+    キーにはアクセストークンのハッシュ値を使用し、アクセストークン自体は保持しない。
+    Futureはイベントループに紐づくため、インスタンスは1つのイベントループ上で使用する。
+    """
+
+    def __init__(
+        self,
+        smoothing_threshold: float = 0.2,
+        max_wait_seconds: float = 10.0,
+        initial_concurrency: int = 4,
+        max_concurrency: int = 32,
+        default_backoff_seconds: float = 1.0,
+        max_tokens: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        """TypetalkRateLimiter クラスのインスタンスを初期化する
+
+        Args:
+            smoothing_threshold (float, optional):
+                送信の分散を始める、上限に対する残りリクエスト数の割合
+            max_wait_seconds (float, optional):
+                送信を待機させる時間の上限(秒)。超える場合は送信せずにエラーとする
+            initial_concurrency (int, optional): 同時実行数の上限の初期値
+            max_concurrency (int, optional): 同時実行数の上限の最大値
+            default_backoff_seconds (float, optional):
+                レート制限の超過時にリセット時刻が不明な場合に待機する時間(秒)
+            max_tokens (int, optional): 状態を保持するアクセストークンの数の上限
+            clock (Callable[[], float], optional): 現在時刻(秒)を返す関数
+            wall_clock (Callable[[], float], optional):
+                UNIX時間(秒)を返す関数。リセット時刻の変換に使用する
+            sleep (Callable[[float], Awaitable[None]], optional): 待機する関数
+        """
+        self.smoothing_threshold = smoothing_threshold
+        self.max_wait_seconds = max_wait_seconds
+        self.initial_concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.default_backoff_seconds = default_backoff_seconds
+        self.max_tokens = max_tokens
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self._states: OrderedDict[str, _TokenState] = OrderedDict()
+        self._requests = 0
+        self._delayed = 0
+        self._rejected = 0
+        self._throttled = 0
+
+    @property
+    def stats(self) -> RateLimitStats:
+        """レート制限の調整に関する統計情報を返す"""
+        remaining = [
+            x.remaining for x in self._states.values() if x.remaining is not None
+        ]
+        concurrency_limits = [
+            int(x.concurrency_limit) for x in self._states.values() if x.limit is None
+        ]
+        return RateLimitStats(
+            requests=self._requests,
+            delayed=self._delayed,
+            rejected=self._rejected,
+            throttled=self._throttled,
+            tracked_tokens=len(self._states),
+            lowest_remaining=min(remaining, default=None),
+            lowest_concurrency_limit=min(concurrency_limits, default=None),
+        )
+
+    async def acquire(self, token_hash: str) -> None:
+        """リクエストを送信できるまで待機する
+
+        送信後は、成否にかかわらず必ず release を呼び出すこと。
+
+        Args:
+            token_hash (str): アクセストークンのハッシュ値
+
+        Raises:
+            TypetalkAPIError: 待機時間が上限を超える場合に発生する。
+        """
+        state = self._get_state(token_hash)
+        delayed = False
+        while True:
+            now = self._clock()
+            wait_seconds = self._budget_wait_seconds(state, now)
+            if wait_seconds > self.max_wait_seconds:
+                self._rejected += 1
+                raise TypetalkAPIError(
+                    status_code=TOO_MANY_REQUESTS,
+                    content={"error": "rate_limit_exceeded"},
+                    detail=("Typetalk API rate limit exceeded.", wait_seconds),
+                )
+            if wait_seconds > 0:
+                delayed = True
+                await self._sleep(wait_seconds)
+                continue
+            if not state.has_capacity:
+                delayed = True
+                waiter = asyncio.get_running_loop().create_future()
+                state.waiters.append(waiter)
+                try:
+                    await waiter
+                finally:
+                    if waiter in state.waiters:
+                        state.waiters.remove(waiter)
+                continue
+            break
+
+        self._take(state, now)
+        self._requests += 1
+        if delayed:
+            self._delayed += 1
+
+    def release(
+        self,
+        token_hash: str,
+        status_code: int | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> None:
+        """レスポンスの内容からレート制限の状態を更新する
+
+        Args:
+            token_hash (str): アクセストークンのハッシュ値
+            status_code (int | None, optional):
+                レスポンスのHTTPステータスコード。受け取れなかった場合は None
+            headers (Mapping[str, str] | None, optional): レスポンスヘッダー
+        """
+        state = self._get_state(token_hash)
+        state.in_flight -= 1
+        now = self._clock()
+        if headers is not None:
+            self._update_from_headers(state, headers, now)
+
+        if status_code == TOO_MANY_REQUESTS:
+            self._throttled += 1
+            state.concurrency_limit = max(1.0, state.concurrency_limit / 2)
+            state.remaining = 0
+            if state.reset_at is None or state.reset_at <= now:
+                state.reset_at = now + self._retry_after_seconds(headers)
+        elif status_code is not None:
+            state.concurrency_limit = min(
+                float(self.max_concurrency),
+                state.concurrency_limit + 1 / state.concurrency_limit,
+            )
+        state.wake_waiters()
+
+    def _get_state(self, token_hash: str) -> _TokenState:
+        """アクセストークンの状態を返し、無い場合は作成する"""
+        state = self._states.get(token_hash)
+        if state is None:
+            self._evict_idle_states()
+            state = _TokenState(concurrency_limit=float(self.initial_concurrency))
+            self._states[token_hash] = state
+        self._states.move_to_end(token_hash)
+        return state
+
+    def _evict_idle_states(self) -> None:
+        """上限に達している場合に、使われていない古い状態から破棄する"""
+        for token_hash in list(self._states):
+            if len(self._states) < self.max_tokens:
+                break
+            state = self._states[token_hash]
+            if state.in_flight == 0 and not state.waiters:
+                del self._states[token_hash]
+
+    def _budget_wait_seconds(self, state: _TokenState, now: float) -> float:
+        """残りリクエスト数から、送信まで待機する時間(秒)を返す"""
+        if state.reset_at is not None and state.reset_at <= now:
+            # リセット時刻を過ぎた場合は、次のレスポンスで判明するまで上限まで許可する
+            state.remaining = state.limit
+            state.reset_at = None
+            state.reset_epoch = None
+        if state.remaining is None:
+            return 0.0
+        if state.remaining <= 0:
+            return 0.0 if state.reset_at is None else state.reset_at - now
+        if self._smoothing_interval(state, now) > 0:
+            return max(0.0, state.next_at - now)
+        return 0.0
+
+    def _smoothing_interval(self, state: _TokenState, now: float) -> float:
+        """送信を分散させる間隔(秒)を返す。分散させない場合は 0 を返す"""
+        if (
+            state.limit is None
+            or state.remaining is None
+            or state.reset_at is None
+            or state.remaining <= 0
+            or state.remaining >= state.limit * self.smoothing_threshold
+        ):
+            return 0.0
+        return (state.reset_at - now) / state.remaining
+
+    def _take(self, state: _TokenState, now: float) -> None:
+        """リクエストの送信を記録する"""
+        state.in_flight += 1
+        interval = self._smoothing_interval(state, now)
+        if interval > 0:
+            state.next_at = max(now, state.next_at) + interval
+        if state.remaining is not None:
+            state.remaining -= 1
+
+    def _update_from_headers(
+        self, state: _TokenState, headers: Mapping[str, str], now: float
+    ) -> None:
+        """レート制限のレスポンスヘッダーから状態を更新する
+
+        ヘッダーの残りリクエスト数には、まだレスポンスを受け取っていない送信中の
+        リクエストが含まれないため、送信中の数を差し引く。同じリセット期間の
+        レスポンスは送信順に届くとは限らないため、把握している残りリクエスト数より
+        多い値では更新しない。
+        """
+        limit = _parse_int(headers.get("X-RateLimit-Limit"))
+        remaining = _parse_int(headers.get("X-RateLimit-Remaining"))
+        reset = _parse_int(headers.get("X-RateLimit-Reset"))
+        if limit is None or remaining is None:
+            return
+        state.limit = limit
+        available = max(0, remaining - state.in_flight)
+        if (
+            state.remaining is not None
+            and reset is not None
+            and reset == state.reset_epoch
+        ):
+            available = min(state.remaining, available)
+        state.remaining = available
+        if reset is not None:
+            state.reset_epoch = reset
+            # リセット時刻はUNIX時間で返されるため、現在時刻からの相対時間に変換する
+            state.reset_at = now + max(0.0, reset - self._wall_clock())
+
+    def _retry_after_seconds(self, headers: Mapping[str, str] | None) -> float:
+        """レート制限の超過時に、再送まで待機する時間(秒)を返す"""
+        retry_after = (
+            _parse_int(headers.get("Retry-After")) if headers is not None else None
+        )
+        if retry_after is None:
+            return self.default_backoff_seconds
+        return float(retry_after)
+
+
+def _parse_int(value: str | None) -> int | None:
+    """ヘッダーの値を整数に変換する。変換できない場合は None を返す"""
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
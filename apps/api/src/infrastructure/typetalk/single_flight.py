@@ -0,0 +1,87 @@
+"""同じキーの同時実行中の処理を1回にまとめる仕組みを定義する"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """処理の集約に関する統計情報
+
+    Attributes:
+        calls (int): 呼び出し回数
+        executions (int): 実際に処理を実行した回数
+        collapsed (int): 実行中の処理の結果を共有し、実行を省略した回数
+        in_flight (int): 現在実行中の処理の数
+    """
+
+    calls: int
+    executions: int
+    collapsed: int
+    in_flight: int
+
+
+class SingleFlight:
+    """同じキーの処理が実行中の場合に、その結果を共有する
+
+    最初の呼び出しで処理をタスクとして実行し、完了までに同じキーで呼び出された場合は
+    同じタスクの完了を待って結果を返す。処理で発生した例外は待機中の全ての呼び出しに
+    送出される。処理の完了後は結果を保持しないため、キャッシュとしては機能しない。
+
+    タスクはイベントループに紐づくため、インスタンスは1つのイベントループ上で使用する。
+    """
+
+    def __init__(self) -> None:
+        """SingleFlight クラスのインスタンスを初期化する"""
+        self._in_flight: dict[Hashable, asyncio.Task[Any]] = {}
+        self._calls = 0
+        self._executions = 0
+        self._collapsed = 0
+
+    @property
+    def stats(self) -> SingleFlightStats:
+        """処理の集約に関する統計情報を返す"""
+        return SingleFlightStats(
+            calls=self._calls,
+            executions=self._executions,
+            collapsed=self._collapsed,
+            in_flight=len(self._in_flight),
+        )
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """キーに対応する処理を実行し、その結果を返す
+
+        呼び出し元がキャンセルされても、他の呼び出し元が待機している処理は継続する。
+
+        Args:
+            key (Hashable): 処理を識別するキー
+            func (Callable[[], Awaitable[T]]): 実行する処理
+
+        Returns:
+            T: 処理の結果
+        """
+        self._calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            self._executions += 1
+            task.add_done_callback(partial(self._on_done, key))
+        else:
+            self._collapsed += 1
+
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        """処理の完了時に実行中の一覧から削除する"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # 全ての呼び出し元がキャンセルされた場合でも、
+            # 未取得の例外として警告されないように例外を取得済みにする
+            task.exception()
@@ -3,6 +3,7 @@
 import httpx
 
 from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.http_client import TypetalkTimeouts
 from src.infrastructure.typetalk.i_typetalk_api import ITypetalkApi
 from src.schemas.message import TypetalkGetMessagesResponse
 from src.schemas.space import TypetalkGetSpacesResponse
@@ -12,38 +13,59 @@ from src.schemas.topic import TypetalkGetTopicsResponse
 class TypetalkApi(ITypetalkApi):
     """Typetalk APIへのリクエストを行うクラス"""
 
-    def __init__(self, base_url: str):
+    def __init__(
+        self,
+        base_url: str,
+        client: httpx.Client,
+        timeouts: TypetalkTimeouts,
+    ):
         """TypetalkApi クラスのインスタンスを初期化する
 
         Args:
             base_url (str): Typetalk API のベース URL
+            client (httpx.Client): リクエストに使用する共有HTTPクライアント
+            timeouts (TypetalkTimeouts): エンドポイントごとのタイムアウト設定
         """
         self.base_url = base_url
+        self.client = client
+        self.timeouts = timeouts
 
-    def __get(self, url: str, headers: dict, params: dict | None = None) -> dict:
+    def __get(
+        self,
+        url: str,
+        headers: dict,
+        timeout: httpx.Timeout,
+        params: dict | None = None,
+    ) -> bytes:
         """GETリクエストを行う
 
         Args:
             url (str): リクエスト先のURL
             headers (dict): リクエストヘッダー
+            timeout (httpx.Timeout): リクエストのタイムアウト
             params (dict | None, optional): リクエストパラメータ
 
         Returns:
-            dict: レスポンスのJSONデータ
+            bytes: レスポンスのJSONデータのバイト列
+
+        Note:
+            正常なレスポンスは Python の辞書に変換せずにバイト列のまま返し、
+            呼び出し元でスキーマが使用するフィールドだけを検証して取り出す。
 
         Raises:
             TypetalkAPIError:
                 Typetalk APIからエラーレスポンスを受け取った場合に発生する。
         """
         try:
-            r = httpx.get(
+            r = self.client.get(
                 url=url,
                 headers=headers,
                 params=params,
+                timeout=timeout,
             )
             r.raise_for_status()
 
-            return r.json()
+            return r.content
 
         except httpx.HTTPStatusError as exc:
             raise TypetalkAPIError(
@@ -70,9 +92,10 @@ class TypetalkApi(ITypetalkApi):
         typetalk_response = self.__get(
             url,
             headers=headers,
+            timeout=self.timeouts.spaces,
             params=query_params,
         )
-        return TypetalkGetSpacesResponse.model_validate(
+        return TypetalkGetSpacesResponse.model_validate_json(
             typetalk_response,
         )
 
@@ -99,9 +122,10 @@ class TypetalkApi(ITypetalkApi):
         typetalk_response = self.__get(
             url=url,
             headers=headers,
+            timeout=self.timeouts.topics,
             params=query_params,
         )
-        return TypetalkGetTopicsResponse.model_validate(
+        return TypetalkGetTopicsResponse.model_validate_json(
             typetalk_response,
         )
 
@@ -110,6 +134,8 @@ class TypetalkApi(ITypetalkApi):
         typetalk_token: str,
         topic_id: int,
         from_id: int | None = None,
+        count: int | None = None,
+        since_id: int | None = None,
     ) -> TypetalkGetMessagesResponse:
         """Typetalkの指定のトピックからメッセージ一覧を取得する
 
@@ -117,6 +143,10 @@ class TypetalkApi(ITypetalkApi):
             typetalk_token (str): Typetalkのアクセストークン
             topic_id (int): 対象のトピックID
             from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+            count (int | None, optional):
+                取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+            since_id (int | None, optional):
+                指定した場合は、このIDより新しいメッセージ一覧を古い順に取得する
 
         Returns:
             TypetalkGetMessagesResponse: Typetalkメッセージ一覧のレスポンス
@@ -127,13 +157,19 @@ class TypetalkApi(ITypetalkApi):
         url = f"{self.base_url}/api/v1/topics/{topic_id}"
         headers = {"Authorization": f"Bearer {typetalk_token}"}
         query_params = {"direction": "backward"}
-        if from_id is not None:
+        if since_id is not None:
+            # 指定のIDより新しいメッセージ一覧を古い順に取得する
+            query_params = {"direction": "forward", "from": str(since_id)}
+        elif from_id is not None:
             query_params["from"] = str(from_id)
+        if count is not None:
+            query_params["count"] = str(count)
         typetalk_response = self.__get(
             url,
             headers=headers,
+            timeout=self.timeouts.messages,
             params=query_params,
         )
-        return TypetalkGetMessagesResponse.model_validate(
+        return TypetalkGetMessagesResponse.model_validate_json(
             typetalk_response,
         )
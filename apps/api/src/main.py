@@ -1,10 +1,19 @@
 """FastAPIアプリケーションを作成する機能を提供する"""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from src.api.dependencies import close_i_sentiment_store, get_i_aws_comprehend_api
 from src.api.routers import router
+from src.core.circuit_breaker import CircuitBreaker
+from src.core.config import Settings, get_settings
+from src.core.hedging import RequestHedger
+from src.core.metrics import metrics_registry
 from src.exceptions.exception_handlers import (
     comprehend_error_handler,
     custom_http_exception_handler,
@@ -12,8 +21,305 @@ from src.exceptions.exception_handlers import (
     unexpected_exception_handler,
     validation_exception_handler,
 )
+from src.infrastructure.aws.comprehend.async_aws_comprehend_api import (
+    AsyncAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.aws_comprehend_api import AwsComprehendApi
+from src.infrastructure.aws.comprehend.comprehend_client import (
+    warm_up_comprehend_client,
+)
 from src.infrastructure.aws.comprehend.exceptions import ComprehendError
+from src.infrastructure.aws.comprehend.hedged_aws_comprehend_api import (
+    HedgedAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.micro_batching_aws_comprehend_api import (
+    MicroBatchingAwsComprehendApi,
+)
 from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.http_client import (
+    close_typetalk_http_client,
+    create_typetalk_async_http_client,
+)
+from src.infrastructure.typetalk.listing_cache import TypetalkListingCache
+from src.infrastructure.typetalk.negative_cache import TypetalkNegativeCache
+from src.infrastructure.typetalk.rate_limiter import TypetalkRateLimiter
+from src.infrastructure.typetalk.single_flight import SingleFlight
+from src.use_cases.messages_prefetcher import MessagesPrefetcher
+from src.use_cases.topic_feed import TopicFeedHub
+
+
+@asynccontextmanager
+async def _typetalk_lifespan(app: FastAPI, settings: Settings) -> AsyncIterator[None]:
+    """Typetalk APIへのリクエストで共有するリソースを作成し、終了時に破棄する
+
+    非同期クライアントはリクエスト処理と同じイベントループ上で作成する必要があるため、
+    app.state に保持して依存関係から参照する。
+    同時に行われる同じリクエストを集約する場合は、集約の仕組みも app.state に保持する。
+    レート制限に合わせて送信を調整する場合は、調整の仕組みも app.state に保持する。
+    リクエストをヘッジする場合は、エンドポイントごとのヘッジの仕組みを保持する。
+
+    Args:
+        app (FastAPI): FastAPI アプリケーションインスタンス
+        settings (Settings): 環境設定
+    """
+    async_client = create_typetalk_async_http_client(settings)
+    app.state.typetalk_async_http_client = async_client
+    if settings.typetalk_coalesce_requests:
+        single_flight = SingleFlight()
+        app.state.typetalk_single_flight = single_flight
+        metrics_registry.register(
+            "typetalk_single_flight", lambda: asdict(single_flight.stats)
+        )
+    if settings.typetalk_rate_limit_enabled:
+        rate_limiter = TypetalkRateLimiter(
+            smoothing_threshold=settings.typetalk_rate_limit_smoothing_threshold,
+            max_wait_seconds=settings.typetalk_rate_limit_max_wait_seconds,
+            initial_concurrency=settings.typetalk_rate_limit_initial_concurrency,
+            max_concurrency=settings.typetalk_rate_limit_max_concurrency,
+        )
+        app.state.typetalk_rate_limiter = rate_limiter
+        metrics_registry.register(
+            "typetalk_rate_limit", lambda: asdict(rate_limiter.stats)
+        )
+    if settings.typetalk_hedging_enabled:
+        hedgers = {
+            name: RequestHedger.from_settings(settings)
+            for name in ("get_spaces", "get_topics", "get_messages")
+        }
+        app.state.typetalk_hedgers = hedgers
+        metrics_registry.register(
+            "typetalk_hedging",
+            lambda: {name: asdict(x.stats) for name, x in hedgers.items()},
+        )
+    try:
+        yield
+    finally:
+        if settings.typetalk_hedging_enabled:
+            metrics_registry.unregister("typetalk_hedging")
+            del app.state.typetalk_hedgers
+        if settings.typetalk_rate_limit_enabled:
+            metrics_registry.unregister("typetalk_rate_limit")
+            del app.state.typetalk_rate_limiter
+        if settings.typetalk_coalesce_requests:
+            metrics_registry.unregister("typetalk_single_flight")
+            del app.state.typetalk_single_flight
+        del app.state.typetalk_async_http_client
+        await async_client.aclose()
+        # スクリプト等から同期版クライアントが作成されている場合はクローズする
+        close_typetalk_http_client()
+
+
+@asynccontextmanager
+async def _typetalk_circuit_breaker_lifespan(
+    app: FastAPI, settings: Settings
+) -> AsyncIterator[None]:
+    """Typetalk APIへのリクエストで共有するサーキットブレーカーを作成し、破棄する
+
+    Args:
+        app (FastAPI): FastAPI アプリケーションインスタンス
+        settings (Settings): 環境設定
+    """
+    if not settings.typetalk_circuit_breaker_enabled:
+        yield
+        return
+
+    circuit_breaker = CircuitBreaker(
+        failure_threshold=settings.typetalk_circuit_breaker_failure_threshold,
+        probe_interval_seconds=settings.typetalk_circuit_breaker_probe_interval_seconds,
+    )
+    app.state.typetalk_circuit_breaker = circuit_breaker
+    metrics_registry.register(
+        "typetalk_circuit_breaker", lambda: asdict(circuit_breaker.stats)
+    )
+    try:
+        yield
+    finally:
+        metrics_registry.unregister("typetalk_circuit_breaker")
+        del app.state.typetalk_circuit_breaker
+
+
+@asynccontextmanager
+async def _typetalk_cache_lifespan(
+    app: FastAPI, settings: Settings
+) -> AsyncIterator[None]:
+    """Typetalk APIのレスポンスのキャッシュを作成し、終了時に破棄する
+
+    組織一覧とトピック一覧やエラーレスポンスをキャッシュする場合は、
+    それぞれのキャッシュを app.state に保持する。
+    一覧の再取得は共有のクライアントを使用するため、共有のクライアントを作成した後に
+    作成し、クローズする前に破棄する。
+
+    Args:
+        app (FastAPI): FastAPI アプリケーションインスタンス
+        settings (Settings): 環境設定
+    """
+    if settings.typetalk_listing_cache_enabled:
+        listing_cache = TypetalkListingCache(
+            stale_seconds=settings.typetalk_listing_cache_stale_seconds,
+            max_size=settings.typetalk_listing_cache_max_size,
+        )
+        app.state.typetalk_listing_cache = listing_cache
+        metrics_registry.register(
+            "typetalk_listing_cache", lambda: asdict(listing_cache.stats)
+        )
+    if settings.typetalk_negative_cache_enabled:
+        negative_cache = TypetalkNegativeCache(
+            ttl_seconds=settings.typetalk_negative_cache_ttl_seconds,
+            max_size=settings.typetalk_negative_cache_max_size,
+        )
+        app.state.typetalk_negative_cache = negative_cache
+        metrics_registry.register(
+            "typetalk_negative_cache", lambda: asdict(negative_cache.stats)
+        )
+    try:
+        yield
+    finally:
+        if settings.typetalk_negative_cache_enabled:
+            metrics_registry.unregister("typetalk_negative_cache")
+            del app.state.typetalk_negative_cache
+        if settings.typetalk_listing_cache_enabled:
+            await listing_cache.aclose()
+            metrics_registry.unregister("typetalk_listing_cache")
+            del app.state.typetalk_listing_cache
+
+
+@asynccontextmanager
+async def _comprehend_lifespan(app: FastAPI, settings: Settings) -> AsyncIterator[None]:
+    """感情分析で共有するリソースを作成し、終了時に破棄する
+
+    AWS Comprehend を使用する場合は、起動時にクライアントを事前に作成しておく。
+    リクエストをまたいでテキストを集約する場合は、集約の仕組みを app.state に保持する。
+    リクエストをヘッジする場合は、ヘッジの仕組みを app.state に保持する。
+
+    Args:
+        app (FastAPI): FastAPI アプリケーションインスタンス
+        settings (Settings): 環境設定
+    """
+    if settings.use_aws_comprehend_api:
+        warm_up_comprehend_client()
+
+    async_api: IAsyncAwsComprehendApi = AsyncAwsComprehendApi(
+        get_i_aws_comprehend_api()
+    )
+    if settings.comprehend_hedging_enabled:
+        hedger = RequestHedger.from_settings(settings)
+        app.state.comprehend_hedger = hedger
+        metrics_registry.register("comprehend_hedging", lambda: asdict(hedger.stats))
+        async_api = HedgedAwsComprehendApi(async_api, hedger)
+
+    if settings.comprehend_micro_batch_enabled:
+        micro_batcher = MicroBatchingAwsComprehendApi(
+            async_api,
+            window_seconds=settings.comprehend_micro_batch_window_ms / 1000,
+            max_batch_size=AwsComprehendApi.MAX_BATCH_SIZE,
+            max_text_size=AwsComprehendApi.MAX_TEXT_SIZE,
+        )
+        app.state.comprehend_micro_batcher = micro_batcher
+        metrics_registry.register(
+            "comprehend_micro_batcher", lambda: asdict(micro_batcher.stats)
+        )
+    try:
+        yield
+    finally:
+        if settings.comprehend_micro_batch_enabled:
+            await micro_batcher.aclose()
+            metrics_registry.unregister("comprehend_micro_batcher")
+            del app.state.comprehend_micro_batcher
+        if settings.comprehend_hedging_enabled:
+            metrics_registry.unregister("comprehend_hedging")
+            del app.state.comprehend_hedger
+        close_i_sentiment_store()
+
+
+@asynccontextmanager
+async def _messages_prefetch_lifespan(
+    app: FastAPI, settings: Settings
+) -> AsyncIterator[None]:
+    """次のページのメッセージ一覧を先読みする仕組みを作成し、終了時に破棄する
+
+    先読みは共有のクライアントを使用してバックグラウンドで実行するため、
+    共有のクライアントを作成した後に作成し、クローズする前に破棄する。
+
+    Args:
+        app (FastAPI): FastAPI アプリケーションインスタンス
+        settings (Settings): 環境設定
+    """
+    if not settings.messages_prefetch_enabled:
+        yield
+        return
+
+    prefetcher = MessagesPrefetcher(
+        ttl_seconds=settings.messages_prefetch_ttl_seconds,
+        max_entries=settings.messages_prefetch_max_entries,
+        max_concurrency=settings.messages_prefetch_max_concurrency,
+    )
+    app.state.messages_prefetcher = prefetcher
+    metrics_registry.register("messages_prefetch", lambda: asdict(prefetcher.stats))
+    try:
+        yield
+    finally:
+        await prefetcher.aclose()
+        metrics_registry.unregister("messages_prefetch")
+        del app.state.messages_prefetcher
+
+
+@asynccontextmanager
+async def _topic_stream_lifespan(
+    app: FastAPI, settings: Settings
+) -> AsyncIterator[None]:
+    """トピックの新しいポストを配信する仕組みを作成し、終了時に破棄する
+
+    ポーリングは共有のクライアントを使用してバックグラウンドで実行するため、
+    共有のクライアントを作成した後に作成し、クローズする前に破棄する。
+
+    Args:
+        app (FastAPI): FastAPI アプリケーションインスタンス
+        settings (Settings): 環境設定
+    """
+    if not settings.topic_stream_enabled:
+        yield
+        return
+
+    hub = TopicFeedHub(
+        poll_interval_seconds=settings.topic_stream_poll_interval_seconds,
+        poll_count=settings.topic_stream_poll_count,
+        idle_timeout_seconds=settings.topic_stream_idle_timeout_seconds,
+        queue_size=settings.topic_stream_queue_size,
+        keepalive_seconds=settings.topic_stream_keepalive_seconds,
+        max_topics=settings.topic_stream_max_topics,
+    )
+    app.state.topic_feed_hub = hub
+    metrics_registry.register("topic_stream", lambda: asdict(hub.stats))
+    try:
+        yield
+    finally:
+        await hub.aclose()
+        metrics_registry.unregister("topic_stream")
+        del app.state.topic_feed_hub
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """アプリケーションの起動時と終了時の処理を行う
+
+    起動時に外部サービスへの共有リソースを作成し、終了時に破棄する。
+
+    Args:
+        app (FastAPI): FastAPI アプリケーションインスタンス
+    """
+    settings = get_settings()
+    async with (
+        _typetalk_lifespan(app, settings),
+        _typetalk_circuit_breaker_lifespan(app, settings),
+        _typetalk_cache_lifespan(app, settings),
+        _comprehend_lifespan(app, settings),
+        _messages_prefetch_lifespan(app, settings),
+        _topic_stream_lifespan(app, settings),
+    ):
+        yield
 
 
 def add_exception_handlers(app: FastAPI) -> None:
@@ -35,7 +341,7 @@ def create_app() -> FastAPI:
     Returns:
         FastAPI: FastAPI アプリケーションインスタンス
     """
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
     app.include_router(router)
     add_exception_handlers(app)
     return app
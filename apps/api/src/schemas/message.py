@@ -1,5 +1,9 @@
 """Typetalkのメッセージに関するスキーマを定義する"""
 
+from typing import Literal
+
+from pydantic import Field
+
 from src.schemas.account import Account
 from src.schemas.core import BaseSchema
 from src.schemas.topic import Topic
@@ -29,3 +33,78 @@ class GetMessagesResponse(BaseSchema):
     topic: Topic
     has_next: bool
     posts: list[Post]
+
+
+class MessagesStreamHeader(BaseSchema):
+    """メッセージ一覧のストリーミングで最初に送信する行"""
+
+    type: Literal["header"] = "header"
+    topic: Topic
+    has_next: bool
+
+
+class MessagesStreamPost(BaseSchema):
+    """メッセージ一覧のストリーミングで感情分析の前に送信するポストの行"""
+
+    type: Literal["post"] = "post"
+    post: Post
+
+
+class SentimentPatch(BaseSchema):
+    """送信済みのポストに設定する感情"""
+
+    id: int
+    sentiment: str
+
+
+class MessagesStreamSentiments(BaseSchema):
+    """メッセージ一覧のストリーミングで感情分析のチャンクごとに送信する行"""
+
+    type: Literal["sentiments"] = "sentiments"
+    sentiments: list[SentimentPatch]
+
+
+# メッセージ一覧のストリーミングで送信する行
+MessagesStreamLine = (
+    MessagesStreamHeader | MessagesStreamPost | MessagesStreamSentiments
+)
+
+
+class TopicFeedPosts(BaseSchema):
+    """トピックの新しいポストの配信で送信するイベントのデータ"""
+
+    topic_id: int
+    posts: list[Post]
+
+
+# メッセージ一覧の一括取得で指定できるトピック数の上限
+MAX_BATCH_TOPICS = 50
+
+
+class GetMessagesBatchRequest(BaseSchema):
+    """メッセージ一覧一括取得APIリクエスト"""
+
+    topic_ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_TOPICS)
+    count: int | None = Field(default=None, ge=1, le=200)
+
+
+class MessagesBatchError(BaseSchema):
+    """メッセージ一覧の一括取得でトピックごとに返すエラー"""
+
+    status: int
+    title: str
+    detail: str | None = None
+
+
+class MessagesBatchResult(BaseSchema):
+    """メッセージ一覧の一括取得のトピックごとの結果"""
+
+    topic_id: int
+    messages: GetMessagesResponse | None = None
+    error: MessagesBatchError | None = None
+
+
+class GetMessagesBatchResponse(BaseSchema):
+    """メッセージ一覧一括取得APIレスポンス"""
+
+    results: list[MessagesBatchResult]
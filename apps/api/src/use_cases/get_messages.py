@@ -1,12 +1,47 @@
 """Typetalkからメッセージ一覧を取得し、感情分析を行う機能を提供する"""
 
-import copy
-from itertools import chain
+import asyncio
+from collections.abc import AsyncIterator
 
 from src.core.logger.logger import logger
-from src.infrastructure.aws.comprehend.aws_comprehend_api import IAwsComprehendApi
+from src.core.text_hash import hash_text
+from src.infrastructure.aws.comprehend.aws_comprehend_api import (
+    AwsComprehendApi,
+    IAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+)
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
+from src.infrastructure.sentiment_store.i_sentiment_store import (
+    ISentimentStore,
+    SentimentStoreKey,
+)
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
 from src.infrastructure.typetalk.i_typetalk_api import ITypetalkApi
-from src.schemas.message import GetMessagesResponse, Post, TypetalkGetMessagesResponse
+from src.schemas.message import (
+    GetMessagesResponse,
+    MessagesStreamHeader,
+    MessagesStreamLine,
+    MessagesStreamPost,
+    MessagesStreamSentiments,
+    Post,
+    SentimentPatch,
+    TypetalkGetMessagesResponse,
+)
+
+# 非同期版で並行して処理するチャンクあたりの分析対象ポスト数
+ANALYSIS_CHUNK_SIZE = AwsComprehendApi.MAX_BATCH_SIZE
+# 指定のIDより新しいメッセージ一覧を取得する場合の1ページの件数(Typetalk の上限)
+SINCE_PAGE_SIZE = 200
+# 指定のIDより新しいメッセージ一覧を取得する場合の、取得するページ数の上限
+SINCE_MAX_PAGES = 5
 
 
 def _get_typetalk_messages(
@@ -14,6 +49,7 @@ def _get_typetalk_messages(
     typetalk_token: str,
     topic_id: int,
     from_id: int | None = None,
+    count: int | None = None,
 ) -> TypetalkGetMessagesResponse:
     """Typetalkから特定のトピックのメッセージ一覧を取得する
 
@@ -22,66 +58,194 @@ def _get_typetalk_messages(
         typetalk_token (str): Typetalkのアクセストークン
         topic_id (int): 対象のトピックID
         from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+        count (int | None, optional): 取得するメッセージの件数
 
     Returns:
         TypetalkGetMessagesResponse: Typetalkメッセージ一覧のレスポンス
     """
-    return i_typetalk_api.get_messages(typetalk_token, topic_id, from_id)
+    return i_typetalk_api.get_messages(typetalk_token, topic_id, from_id, count)
 
 
-def _analyze_post_messages(
-    i_aws_comprehend_api: IAwsComprehendApi,
-    detect_target_post_messages: list[Post],
-) -> list[Post]:
-    """メッセージの感情分析を行い、分析結果を含む新しいポストのリストを返す
+def _to_sentiment_store_key(post: Post) -> SentimentStoreKey:
+    """ポストから感情分析結果の永続ストアのキーを作成する
 
     Args:
-        i_aws_comprehend_api (IAwsComprehendApi): AWS Comprehend APIのインターフェース
-        detect_target_post_messages (list[Post]): 感情分析を行うポストのリスト
+        post (Post): 対象のポスト
 
     Returns:
-        list[Post]: 感情分析結果を含むポストのリスト
+        SentimentStoreKey: 永続ストアのキー
     """
-    # 対象ポストの感情分析を実行する
-    batch_detect_sentiment_result = i_aws_comprehend_api.batch_detect_sentiment(
-        [x.message for x in detect_target_post_messages],
+    return SentimentStoreKey(
+        post_id=post.id,
+        updated_at=post.updated_at,
+        text_hash=hash_text(post.message),
     )
 
-    # 分析対象ポストに感情分析結果を設定する
-    return [
-        Post(
-            id=post.id,
-            message=post.message,
-            updated_at=post.updated_at,
-            account=post.account,
-            sentiment=sentiment_result.sentiment.value,
-        )
-        for post, sentiment_result in zip(
-            detect_target_post_messages,
-            batch_detect_sentiment_result.result_list,
-            strict=False,
+
+def _set_stored_sentiments(
+    sentiments: list[str | None],
+    target_indices: list[int],
+    keys: list[SentimentStoreKey],
+    stored_sentiments: dict[SentimentStoreKey, str],
+) -> tuple[list[int], list[SentimentStoreKey]]:
+    """永続ストアの結果を設定し、感情分析が必要なポストの位置とキーを返す
+
+    Args:
+        sentiments (list[str | None]): ポストの位置ごとの感情。結果を設定して更新する
+        target_indices (list[int]): 感情分析の対象のポストの位置
+        keys (list[SentimentStoreKey]): 対象のポストの永続ストアのキー
+        stored_sentiments (dict[SentimentStoreKey, str]): 永続ストアから取得した結果
+
+    Returns:
+        tuple[list[int], list[SentimentStoreKey]]:
+            感情分析が必要なポストの位置と、それらの永続ストアのキー
+    """
+    remaining_indices = []
+    remaining_keys = []
+    for index, key in zip(target_indices, keys, strict=True):
+        sentiment = stored_sentiments.get(key)
+        if sentiment is None:
+            remaining_indices.append(index)
+            remaining_keys.append(key)
+        else:
+            sentiments[index] = sentiment
+    return remaining_indices, remaining_keys
+
+
+def _set_detected_sentiments(
+    sentiments: list[str | None],
+    target_indices: list[int],
+    batch_detect_sentiment_result: BatchDetectSentimentResponse,
+) -> int:
+    """感情分析の結果を、結果のインデックスに対応するポストの位置に設定する
+
+    Args:
+        sentiments (list[str | None]): ポストの位置ごとの感情。結果を設定して更新する
+        target_indices (list[int]): 感情分析を行ったポストの位置
+        batch_detect_sentiment_result (BatchDetectSentimentResponse): 感情分析の結果
+
+    Returns:
+        int: 感情を設定したポストの数
+    """
+    for sentiment_result in batch_detect_sentiment_result.result_list:
+        sentiments[target_indices[sentiment_result.index]] = (
+            sentiment_result.sentiment.value
         )
-    ]
+    return len(batch_detect_sentiment_result.result_list)
 
 
-def _set_sentiment_to_posts(
-    posts: list[Post],
-    sentiment_posts: list[Post],
-) -> list[Post]:
-    """Typetalkのポストと感情分析結果をマージする
+def _to_sentiment_store_entries(
+    sentiments: list[str | None],
+    target_indices: list[int],
+    keys: list[SentimentStoreKey],
+) -> dict[SentimentStoreKey, str]:
+    """感情分析を行ったポストの結果から永続ストアに保存するエントリを作成する
+
+    Args:
+        sentiments (list[str | None]): ポストの位置ごとの感情
+        target_indices (list[int]): 感情分析を行ったポストの位置
+        keys (list[SentimentStoreKey]): 感情分析を行ったポストの永続ストアのキー
+
+    Returns:
+        dict[SentimentStoreKey, str]: 保存するキーと感情の対応
+    """
+    entries = {}
+    for index, key in zip(target_indices, keys, strict=True):
+        sentiment = sentiments[index]
+        if sentiment is not None:
+            entries[key] = sentiment
+    return entries
+
 
-    Typetalkのポストとそれらのメッセージに対する感情分析結果をマージする。
-    同じIDを持つポストは、感情分析結果を持つポストで上書きされる。
+async def _detect_chunk_sentiments_async(
+    i_async_aws_comprehend_api: IAsyncAwsComprehendApi,
+    i_sentiment_store: ISentimentStore | None,
+    posts: list[Post],
+    sentiments: list[str | None],
+    target_indices: list[int],
+) -> tuple[int, int]:
+    """1チャンク分のポストの感情を、永続ストアの結果と感情分析の結果から設定する
 
     Args:
+        i_async_aws_comprehend_api (IAsyncAwsComprehendApi):
+            AWS Comprehend APIの非同期インターフェース
+        i_sentiment_store (ISentimentStore | None): 感情分析結果の永続ストア
         posts (list[Post]): Typetalkから取得したポストのリスト
-        sentiment_posts (list[Post]): 感情分析結果を持つポストのリスト
+        sentiments (list[str | None]): ポストの位置ごとの感情。結果を設定して更新する
+        target_indices (list[int]): チャンクに含まれる感情分析の対象のポストの位置
 
     Returns:
-        list[Post]: マージされたポストのリスト
+        tuple[int, int]: 永続ストアの結果を設定したポストの数と、感情分析を行った数
     """
-    return list(
-        {post.id: post for post in chain(posts, sentiment_posts)}.values(),
+    keys: list[SentimentStoreKey] = []
+    stored_count = 0
+    if i_sentiment_store is not None:
+        # 永続ストアに保存済みの結果があるポストは分析対象から除外する
+        keys = [_to_sentiment_store_key(posts[i]) for i in target_indices]
+        remaining_indices, keys = _set_stored_sentiments(
+            sentiments,
+            target_indices,
+            keys,
+            await asyncio.to_thread(i_sentiment_store.get_many, keys),
+        )
+        stored_count = len(target_indices) - len(remaining_indices)
+        target_indices = remaining_indices
+
+    if not target_indices:
+        return stored_count, 0
+
+    try:
+        batch_detect_sentiment_result = (
+            await i_async_aws_comprehend_api.batch_detect_sentiment(
+                [posts[i].message for i in target_indices],
+            )
+        )
+    except ComprehendError as error:
+        if error.error_type != ComprehendErrorType.CIRCUIT_OPEN:
+            raise
+        # 遮断中は感情分析の結果なしとして返す
+        logger.warning("Skipped sentiment analysis: %s", error)
+        return stored_count, 0
+    analyzed_count = _set_detected_sentiments(
+        sentiments, target_indices, batch_detect_sentiment_result
+    )
+    if i_sentiment_store is not None:
+        await asyncio.to_thread(
+            i_sentiment_store.put_many,
+            _to_sentiment_store_entries(sentiments, target_indices, keys),
+        )
+    return stored_count, analyzed_count
+
+
+def _to_get_messages_response(
+    typetalk_response: TypetalkGetMessagesResponse,
+    sentiments: list[str | None],
+) -> GetMessagesResponse:
+    """Typetalkのポストに感情分析結果を付与してAPIレスポンスを作成する
+
+    Typetalkのレスポンスは同時に行われた同じリクエストと共有される場合があるため、
+    ポストは変更せず、感情がある場合のみ浅いコピーに設定する。
+
+    Args:
+        typetalk_response (TypetalkGetMessagesResponse):
+            Typetalkメッセージ一覧のレスポンス
+        sentiments (list[str | None]): ポストの位置ごとの感情
+
+    Returns:
+        GetMessagesResponse: メッセージ一覧取得APIレスポンス
+    """
+    # id の降順に並べ替えながら感情を付与する
+    result_posts = [
+        post if sentiment is None else post.model_copy(update={"sentiment": sentiment})
+        for post, sentiment in zip(
+            reversed(typetalk_response.posts), reversed(sentiments), strict=True
+        )
+    ]
+
+    return GetMessagesResponse(
+        topic=typetalk_response.topic,
+        has_next=typetalk_response.has_next,
+        posts=result_posts,
     )
 
 
@@ -91,10 +255,16 @@ def get_messages_use_case(
     typetalk_token: str,
     topic_id: int,
     from_id: int | None = None,
+    count: int | None = None,
+    i_sentiment_store: ISentimentStore | None = None,
 ) -> GetMessagesResponse:
     """Typetalkからメッセージを取得し、AWS Comprehendで感情分析を行う
 
     添付ファイルのみなど、メッセージ本文が空のポストは感情分析の対象から除外する。
+    永続ストアが指定された場合は、保存済みの結果があるポストの感情分析を省略し、
+    新たに分析した結果を保存する。
+    サーキットブレーカーが AWS Comprehend API の呼び出しを遮断している場合は、
+    エラーとせずに感情分析の結果なしのポストを返す。
 
     Args:
         i_typetalk_api (ITypetalkApi): Typetalk APIのインターフェース
@@ -102,6 +272,9 @@ def get_messages_use_case(
         typetalk_token (str): Typetalkのアクセストークン
         topic_id (int): 対象のトピックID
         from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+        count (int | None, optional):
+            取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+        i_sentiment_store (ISentimentStore | None, optional): 感情分析結果の永続ストア
 
     Returns:
         GetMessagesResponse: メッセージ一覧取得APIレスポンス
@@ -114,44 +287,414 @@ def get_messages_use_case(
         typetalk_token,
         topic_id,
         from_id,
+        count,
     )
     logger.info("Retrieved %d posts from Typetalk", len(typetalk_response.posts))
     logger.info("posts.has_next is : %s", typetalk_response.has_next)
 
-    typetalk_posts = copy.deepcopy(typetalk_response.posts)
+    posts = typetalk_response.posts
+    sentiments: list[str | None] = [None] * len(posts)
+
+    # 分析対象ポストの位置
+    target_indices = [i for i, post in enumerate(posts) if post.message]
 
-    # 分析対象ポスト
-    detect_target_post_messages = [x for x in typetalk_posts if x.message]
+    # 永続ストアに保存済みの結果があるポストは分析対象から除外する
+    keys: list[SentimentStoreKey] = []
+    if i_sentiment_store is not None and target_indices:
+        keys = [_to_sentiment_store_key(posts[i]) for i in target_indices]
+        stored_count = len(target_indices)
+        target_indices, keys = _set_stored_sentiments(
+            sentiments, target_indices, keys, i_sentiment_store.get_many(keys)
+        )
+        logger.info(
+            "Found %d posts in sentiment store", stored_count - len(target_indices)
+        )
 
-    if detect_target_post_messages:
+    if target_indices:
         # 分析対象ポストが有りの場合は感情分析を実行する
-        batch_detect_sentiment_result = _analyze_post_messages(
-            i_aws_comprehend_api,
-            detect_target_post_messages,
+        try:
+            batch_detect_sentiment_result = i_aws_comprehend_api.batch_detect_sentiment(
+                [posts[i].message for i in target_indices],
+            )
+        except ComprehendError as error:
+            if error.error_type != ComprehendErrorType.CIRCUIT_OPEN:
+                raise
+            # 遮断中は感情分析の結果なしとして返す
+            logger.warning("Skipped sentiment analysis: %s", error)
+        else:
+            analyzed_count = _set_detected_sentiments(
+                sentiments, target_indices, batch_detect_sentiment_result
+            )
+            logger.info("Performed sentiment analysis on %d posts", analyzed_count)
+            if i_sentiment_store is not None:
+                i_sentiment_store.put_many(
+                    _to_sentiment_store_entries(sentiments, target_indices, keys)
+                )
+    else:
+        # 分析対象ポストが無しの場合は感情分析を行わない
+        logger.info("No posts to perform sentiment analysis")
+
+    response = _to_get_messages_response(typetalk_response, sentiments)
+
+    logger.info("END - get_messages_use_case, topic_id: %s", topic_id)
+
+    return response
+
+
+async def get_messages_async_use_case(
+    i_async_typetalk_api: IAsyncTypetalkApi,
+    i_async_aws_comprehend_api: IAsyncAwsComprehendApi,
+    typetalk_token: str,
+    topic_id: int,
+    from_id: int | None = None,
+    count: int | None = None,
+    i_sentiment_store: ISentimentStore | None = None,
+) -> GetMessagesResponse:
+    """Typetalkからメッセージを取得し、AWS Comprehendで感情分析を非同期に行う
+
+    get_messages_use_case の非同期版であり、APIのリクエスト処理から呼び出す。
+    添付ファイルのみなど、メッセージ本文が空のポストは感情分析の対象から除外する。
+    件数の多いページでも待ち時間が積み重ならないように、分析対象のポストを
+    AWS Comprehend の1回のバッチの上限ごとのチャンクに分け、並行して処理する。
+    Typetalk のレスポンスは1つのJSONとして返されるため、チャンクの分析は
+    ページ全体の取得と解析が完了した後に開始する。取得と分析を重ねる処理は行わない。
+    永続ストアはブロッキングI/Oを行うため、ワーカースレッドで呼び出す。
+    サーキットブレーカーが遮断しているチャンクは、感情分析の結果なしとして返す。
+
+    Args:
+        i_async_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
+        i_async_aws_comprehend_api (IAsyncAwsComprehendApi):
+            AWS Comprehend APIの非同期インターフェース
+        typetalk_token (str): Typetalkのアクセストークン
+        topic_id (int): 対象のトピックID
+        from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+        count (int | None, optional):
+            取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+        i_sentiment_store (ISentimentStore | None, optional): 感情分析結果の永続ストア
+
+    Returns:
+        GetMessagesResponse: メッセージ一覧取得APIレスポンス
+    """
+    logger.info("START - get_messages_async_use_case, topic_id: %s", topic_id)
+
+    # Typetalkにて対象トピックのメッセージ一覧を取得する
+    typetalk_response = await i_async_typetalk_api.get_messages(
+        typetalk_token,
+        topic_id,
+        from_id,
+        count,
+    )
+    logger.info("Retrieved %d posts from Typetalk", len(typetalk_response.posts))
+    logger.info("posts.has_next is : %s", typetalk_response.has_next)
+
+    response = await analyze_messages_async(
+        i_async_aws_comprehend_api, typetalk_response, i_sentiment_store
+    )
+
+    logger.info("END - get_messages_async_use_case, topic_id: %s", topic_id)
+
+    return response
+
+
+async def get_messages_since_async_use_case(
+    i_async_typetalk_api: IAsyncTypetalkApi,
+    i_async_aws_comprehend_api: IAsyncAwsComprehendApi,
+    typetalk_token: str,
+    topic_id: int,
+    since_id: int,
+    count: int | None = None,
+    i_sentiment_store: ISentimentStore | None = None,
+) -> GetMessagesResponse:
+    """Typetalkから指定のIDより新しいメッセージのみを取得し、感情分析を非同期に行う
+
+    既に最新のページを持つクライアントの再取得で、取得済みのポストを取得し直して
+    分析しないように、新しいポストのみを取得して分析する。
+
+    Args:
+        i_async_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
+        i_async_aws_comprehend_api (IAsyncAwsComprehendApi):
+            AWS Comprehend APIの非同期インターフェース
+        typetalk_token (str): Typetalkのアクセストークン
+        topic_id (int): 対象のトピックID
+        since_id (int): 取得済みの最新のポストID
+        count (int | None, optional):
+            1ページで取得するメッセージの件数。指定しない場合は Typetalk の上限となる
+        i_sentiment_store (ISentimentStore | None, optional): 感情分析結果の永続ストア
+
+    Returns:
+        GetMessagesResponse: メッセージ一覧取得APIレスポンス。
+            ページ数の上限に達し、さらに新しいポストがある場合は has_next が True となる
+    """
+    logger.info(
+        "START - get_messages_since_async_use_case, topic_id: %s, since_id: %s",
+        topic_id,
+        since_id,
+    )
+
+    typetalk_response = await fetch_messages_since_async(
+        i_async_typetalk_api,
+        typetalk_token,
+        topic_id,
+        since_id,
+        page_size=count or SINCE_PAGE_SIZE,
+    )
+    logger.info("Retrieved %d new posts from Typetalk", len(typetalk_response.posts))
+
+    response = await analyze_messages_async(
+        i_async_aws_comprehend_api, typetalk_response, i_sentiment_store
+    )
+
+    logger.info("END - get_messages_since_async_use_case, topic_id: %s", topic_id)
+
+    return response
+
+
+async def fetch_messages_since_async(
+    i_async_typetalk_api: IAsyncTypetalkApi,
+    typetalk_token: str,
+    topic_id: int,
+    since_id: int,
+    page_size: int = SINCE_PAGE_SIZE,
+    max_pages: int = SINCE_MAX_PAGES,
+) -> TypetalkGetMessagesResponse:
+    """Typetalkから指定のIDより新しいメッセージ一覧を古い順に取得する
+
+    新しいポストが無くなるか、ページ数の上限に達するまで、取得した最新のポストIDから
+    続けて取得する。
+
+    Args:
+        i_async_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
+        typetalk_token (str): Typetalkのアクセストークン
+        topic_id (int): 対象のトピックID
+        since_id (int): 取得済みの最新のポストID
+        page_size (int, optional): 1ページで取得するメッセージの件数
+        max_pages (int, optional): 取得するページ数の上限
+
+    Returns:
+        TypetalkGetMessagesResponse: 新しいポストを id の昇順で持つメッセージ一覧。
+            ページ数の上限に達し、さらに新しいポストがある場合は has_next が True となる
+    """
+    posts: list[Post] = []
+    cursor = since_id
+    for _ in range(max_pages):
+        page = await i_async_typetalk_api.get_messages(
+            typetalk_token, topic_id, count=page_size, since_id=cursor
+        )
+        new_posts = [x for x in page.posts if x.id > cursor]
+        posts.extend(new_posts)
+        has_next = page.has_next and bool(new_posts)
+        if not has_next:
+            break
+        cursor = max(x.id for x in new_posts)
+
+    return TypetalkGetMessagesResponse(topic=page.topic, has_next=has_next, posts=posts)
+
+
+async def analyze_messages_async(
+    i_async_aws_comprehend_api: IAsyncAwsComprehendApi,
+    typetalk_response: TypetalkGetMessagesResponse,
+    i_sentiment_store: ISentimentStore | None = None,
+) -> GetMessagesResponse:
+    """取得済みのTypetalkのメッセージ一覧の感情分析を行い、APIレスポンスを作成する
+
+    分析対象のポストを AWS Comprehend の1回のバッチの上限ごとのチャンクに分け、
+    永続ストアの検索と感情分析を並行して処理する。
+
+    Args:
+        i_async_aws_comprehend_api (IAsyncAwsComprehendApi):
+            AWS Comprehend APIの非同期インターフェース
+        typetalk_response (TypetalkGetMessagesResponse):
+            Typetalkメッセージ一覧のレスポンス
+        i_sentiment_store (ISentimentStore | None, optional): 感情分析結果の永続ストア
+
+    Returns:
+        GetMessagesResponse: メッセージ一覧取得APIレスポンス
+
+    Raises:
+        ComprehendError: 感情分析でエラーが発生した場合
+    """
+    (response,) = await analyze_many_messages_async(
+        i_async_aws_comprehend_api, [typetalk_response], i_sentiment_store
+    )
+    if isinstance(response, ComprehendError):
+        raise response
+    return response
+
+
+async def analyze_many_messages_async(
+    i_async_aws_comprehend_api: IAsyncAwsComprehendApi,
+    typetalk_responses: list[TypetalkGetMessagesResponse],
+    i_sentiment_store: ISentimentStore | None = None,
+) -> list[GetMessagesResponse | ComprehendError]:
+    """複数のTypetalkのメッセージ一覧の感情分析をまとめて行い、APIレスポンスを作成する
+
+    全てのメッセージ一覧の分析対象のポストを1つにまとめてからチャンクに分けるため、
+    メッセージ一覧ごとに分析する場合より AWS Comprehend の呼び出し回数が少なくなる。
+    感情分析でエラーが発生したチャンクがある場合は、そのチャンクにポストを含む
+    メッセージ一覧のみをエラーとする。
+
+    Args:
+        i_async_aws_comprehend_api (IAsyncAwsComprehendApi):
+            AWS Comprehend APIの非同期インターフェース
+        typetalk_responses (list[TypetalkGetMessagesResponse]):
+            Typetalkメッセージ一覧のレスポンスのリスト
+        i_sentiment_store (ISentimentStore | None, optional): 感情分析結果の永続ストア
+
+    Returns:
+        list[GetMessagesResponse | ComprehendError]:
+            メッセージ一覧ごとのAPIレスポンス、または感情分析で発生したエラー
+    """
+    posts = [post for x in typetalk_responses for post in x.posts]
+    # ポストの位置ごとの、ポストを含むメッセージ一覧の位置
+    owners = [i for i, x in enumerate(typetalk_responses) for _ in x.posts]
+    sentiments: list[str | None] = [None] * len(posts)
+
+    # 分析対象ポストの位置
+    target_indices = [i for i, post in enumerate(posts) if post.message]
+    chunks = [
+        target_indices[offset : offset + ANALYSIS_CHUNK_SIZE]
+        for offset in range(0, len(target_indices), ANALYSIS_CHUNK_SIZE)
+    ]
+
+    errors: dict[int, ComprehendError] = {}
+    if chunks:
+        # 分析対象ポストが有りの場合は、チャンクごとに永続ストアの検索と感情分析を
+        # 並行して実行する
+        chunk_results = await asyncio.gather(
+            *(
+                _detect_chunk_sentiments_async(
+                    i_async_aws_comprehend_api,
+                    i_sentiment_store,
+                    posts,
+                    sentiments,
+                    chunk,
+                )
+                for chunk in chunks
+            ),
+            return_exceptions=True,
         )
+        chunk_counts: list[tuple[int, int]] = []
+        for chunk, result in zip(chunks, chunk_results, strict=True):
+            if isinstance(result, ComprehendError):
+                for i in chunk:
+                    errors.setdefault(owners[i], result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                chunk_counts.append(result)
+        if i_sentiment_store is not None:
+            logger.info(
+                "Found %d posts in sentiment store",
+                sum(stored for stored, _ in chunk_counts),
+            )
         logger.info(
             "Performed sentiment analysis on %d posts",
-            len(batch_detect_sentiment_result),
-        )
-        posts_with_sentiment = _set_sentiment_to_posts(
-            typetalk_posts,
-            batch_detect_sentiment_result,
+            sum(analyzed for _, analyzed in chunk_counts),
         )
     else:
-        # 分析対象ポストが無しの場合は分析結果無しで返す
-        posts_with_sentiment = typetalk_posts
+        # 分析対象ポストが無しの場合は感情分析を行わない
         logger.info("No posts to perform sentiment analysis")
 
-    # id の降順に並べ替えて返す
-    result_posts = list(reversed(posts_with_sentiment))
+    responses: list[GetMessagesResponse | ComprehendError] = []
+    offset = 0
+    for i, typetalk_response in enumerate(typetalk_responses):
+        end = offset + len(typetalk_response.posts)
+        error = errors.get(i)
+        responses.append(
+            error
+            if error is not None
+            else _to_get_messages_response(typetalk_response, sentiments[offset:end])
+        )
+        offset = end
+    return responses
 
-    # APIレスポンス
-    response = GetMessagesResponse(
-        topic=typetalk_response.topic,
-        has_next=typetalk_response.has_next,
-        posts=result_posts,
+
+async def stream_messages_async_use_case(
+    i_async_typetalk_api: IAsyncTypetalkApi,
+    i_async_aws_comprehend_api: IAsyncAwsComprehendApi,
+    typetalk_token: str,
+    topic_id: int,
+    from_id: int | None = None,
+    count: int | None = None,
+    i_sentiment_store: ISentimentStore | None = None,
+) -> AsyncIterator[MessagesStreamLine]:
+    """Typetalkからメッセージを取得し、感情分析の完了を待たずに順に返す
+
+    get_messages_async_use_case のストリーミング版であり、最初にトピックと続きの
+    ページの有無を、次に感情分析の前のポストを id の降順に返す。
+    その後、感情分析のチャンクが完了した順に、チャンク内のポストの感情を返す。
+    感情の無いポストや、感情分析でエラーとなったチャンクのポストの感情は返さない。
+
+    Typetalk の取得は最初の行を返す前に行うため、取得のエラーは最初の行の取得時に
+    送出される。途中で反復を終了した場合は、実行中の感情分析を取り消す。
+
+    Args:
+        i_async_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
+        i_async_aws_comprehend_api (IAsyncAwsComprehendApi):
+            AWS Comprehend APIの非同期インターフェース
+        typetalk_token (str): Typetalkのアクセストークン
+        topic_id (int): 対象のトピックID
+        from_id (int | None, optional): 取得するメッセージ一覧の開始ID
+        count (int | None, optional):
+            取得するメッセージの件数。指定しない場合はTypetalkの既定の件数となる
+        i_sentiment_store (ISentimentStore | None, optional): 感情分析結果の永続ストア
+
+    Yields:
+        MessagesStreamLine: ストリーミングで送信する行
+    """
+    logger.info("START - stream_messages_async_use_case, topic_id: %s", topic_id)
+
+    # Typetalkにて対象トピックのメッセージ一覧を取得する
+    typetalk_response = await i_async_typetalk_api.get_messages(
+        typetalk_token,
+        topic_id,
+        from_id,
+        count,
     )
+    logger.info("Retrieved %d posts from Typetalk", len(typetalk_response.posts))
 
-    logger.info("END - get_messages_use_case, topic_id: %s", topic_id)
+    yield MessagesStreamHeader(
+        topic=typetalk_response.topic, has_next=typetalk_response.has_next
+    )
+    posts = typetalk_response.posts
+    for post in reversed(posts):
+        yield MessagesStreamPost(post=post)
 
-    return response
+    sentiments: list[str | None] = [None] * len(posts)
+    target_indices = [i for i, post in enumerate(posts) if post.message]
+
+    async def detect(chunk_indices: list[int]) -> list[int]:
+        """1チャンク分のポストの感情を設定し、チャンク内のポストの位置を返す"""
+        try:
+            await _detect_chunk_sentiments_async(
+                i_async_aws_comprehend_api,
+                i_sentiment_store,
+                posts,
+                sentiments,
+                chunk_indices,
+            )
+        except ComprehendError:
+            # 送信済みの行は取り消せないため、エラーのチャンクは感情なしとする
+            logger.exception("Failed to analyze sentiments of streamed posts")
+        return chunk_indices
+
+    tasks = [
+        asyncio.ensure_future(
+            detect(target_indices[offset : offset + ANALYSIS_CHUNK_SIZE])
+        )
+        for offset in range(0, len(target_indices), ANALYSIS_CHUNK_SIZE)
+    ]
+    try:
+        for completed in asyncio.as_completed(tasks):
+            patches = [
+                SentimentPatch(id=posts[i].id, sentiment=sentiment)
+                for i in await completed
+                if (sentiment := sentiments[i]) is not None
+            ]
+            if patches:
+                yield MessagesStreamSentiments(sentiments=patches)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    logger.info("END - stream_messages_async_use_case, topic_id: %s", topic_id)
@@ -0,0 +1,132 @@
+"""複数のトピックのメッセージ一覧をまとめて取得し、感情分析を行う機能を提供する"""
+
+import asyncio
+
+from src.core.logger.logger import logger
+from src.infrastructure.aws.comprehend.exceptions import ComprehendError
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
+from src.infrastructure.sentiment_store.i_sentiment_store import ISentimentStore
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.schemas.message import (
+    GetMessagesBatchResponse,
+    MessagesBatchError,
+    MessagesBatchResult,
+    TypetalkGetMessagesResponse,
+)
+from src.use_cases.get_messages import analyze_many_messages_async
+
+
+async def get_messages_batch_async_use_case(
+    i_async_typetalk_api: IAsyncTypetalkApi,
+    i_async_aws_comprehend_api: IAsyncAwsComprehendApi,
+    typetalk_token: str,
+    topic_ids: list[int],
+    count: int | None = None,
+    max_concurrency: int = 8,
+    i_sentiment_store: ISentimentStore | None = None,
+) -> GetMessagesBatchResponse:
+    """複数のトピックのメッセージ一覧を取得し、感情分析をまとめて行う
+
+    トピックごとのメッセージ一覧の取得は同時実行数の上限内で並行して行い、
+    取得した全てのポストをまとめて AWS Comprehend の1回のバッチの上限ごとに分析する。
+    Typetalk や AWS Comprehend のエラーはリクエスト全体を失敗させず、
+    該当するトピックの結果としてエラーを返す。
+
+    Args:
+        i_async_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
+        i_async_aws_comprehend_api (IAsyncAwsComprehendApi):
+            AWS Comprehend APIの非同期インターフェース
+        typetalk_token (str): Typetalkのアクセストークン
+        topic_ids (list[int]): 対象のトピックIDのリスト。重複は除いて取得する
+        count (int | None, optional):
+            トピックごとに取得するメッセージの件数。指定しない場合はTypetalkの既定の件数
+        max_concurrency (int, optional): 同時に取得するトピック数の上限
+        i_sentiment_store (ISentimentStore | None, optional): 感情分析結果の永続ストア
+
+    Returns:
+        GetMessagesBatchResponse: 指定した順のトピックごとの結果
+    """
+    topic_ids = list(dict.fromkeys(topic_ids))
+    logger.info("START - get_messages_batch_async_use_case, topics: %d", len(topic_ids))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(topic_id: int) -> TypetalkGetMessagesResponse:
+        """同時実行数の上限内でトピックのメッセージ一覧を取得する"""
+        async with semaphore:
+            return await i_async_typetalk_api.get_messages(
+                typetalk_token, topic_id, None, count
+            )
+
+    fetched = await asyncio.gather(
+        *(fetch(x) for x in topic_ids), return_exceptions=True
+    )
+
+    results: dict[int, MessagesBatchResult] = {}
+    typetalk_responses: dict[int, TypetalkGetMessagesResponse] = {}
+    for topic_id, response in zip(topic_ids, fetched, strict=True):
+        if isinstance(response, TypetalkAPIError):
+            logger.warning("Failed to get messages of topic %s: %s", topic_id, response)
+            results[topic_id] = MessagesBatchResult(
+                topic_id=topic_id, error=_to_typetalk_error(response)
+            )
+        elif isinstance(response, BaseException):
+            raise response
+        else:
+            typetalk_responses[topic_id] = response
+
+    analyzed = await analyze_many_messages_async(
+        i_async_aws_comprehend_api,
+        list(typetalk_responses.values()),
+        i_sentiment_store,
+    )
+    for topic_id, messages in zip(typetalk_responses, analyzed, strict=True):
+        if isinstance(messages, ComprehendError):
+            logger.warning("Failed to analyze topic %s: %s", topic_id, messages)
+            results[topic_id] = MessagesBatchResult(
+                topic_id=topic_id, error=_to_comprehend_error(messages)
+            )
+        else:
+            results[topic_id] = MessagesBatchResult(
+                topic_id=topic_id, messages=messages
+            )
+
+    logger.info("END - get_messages_batch_async_use_case, topics: %d", len(topic_ids))
+
+    return GetMessagesBatchResponse(results=[results[x] for x in topic_ids])
+
+
+def _to_typetalk_error(error: TypetalkAPIError) -> MessagesBatchError:
+    """Typetalk APIのエラーをトピックごとのエラーに変換する
+
+    Args:
+        error (TypetalkAPIError): Typetalk APIのエラー
+
+    Returns:
+        MessagesBatchError: トピックごとのエラー
+    """
+    detail = error.content.get("error") if error.content else None
+    return MessagesBatchError(
+        status=error.status_code,
+        title="Typetalk API request failed.",
+        detail=str(detail) if detail else None,
+    )
+
+
+def _to_comprehend_error(error: ComprehendError) -> MessagesBatchError:
+    """AWS Comprehend APIのエラーをトピックごとのエラーに変換する
+
+    Args:
+        error (ComprehendError): AWS Comprehend APIのエラー
+
+    Returns:
+        MessagesBatchError: トピックごとのエラー
+    """
+    return MessagesBatchError(
+        status=error.status_code,
+        title="AWS Comprehend API error occurred.",
+        detail=str(error),
+    )
@@ -1,8 +1,24 @@
 """Typetalkから参加している組織の一覧を取得する機能を提供する"""
 
 from src.core.logger.logger import logger
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
 from src.infrastructure.typetalk.i_typetalk_api import ITypetalkApi
-from src.schemas.space import GetSpacesResponse
+from src.schemas.space import GetSpacesResponse, TypetalkGetSpacesResponse
+
+
+def _to_get_spaces_response(
+    typetalk_response: TypetalkGetSpacesResponse,
+) -> GetSpacesResponse:
+    """Typetalk組織一覧のレスポンスをAPIレスポンスに変換する
+
+    Args:
+        typetalk_response (TypetalkGetSpacesResponse): Typetalk組織一覧のレスポンス
+
+    Returns:
+        GetSpacesResponse: 組織一覧取得APIレスポンス
+    """
+    my_spaces = typetalk_response.my_spaces
+    return GetSpacesResponse(spaces=[my_space.space for my_space in my_spaces])
 
 
 def get_spaces_use_case(
@@ -25,9 +41,37 @@ def get_spaces_use_case(
     logger.info("Retrieved %d spaces from Typetalk", len(typetalk_response.my_spaces))
 
     # APIレスポンス
-    my_spaces = typetalk_response.my_spaces
-    response = GetSpacesResponse(spaces=[my_space.space for my_space in my_spaces])
+    response = _to_get_spaces_response(typetalk_response)
 
     logger.info("END - get_spaces_use_case")
 
     return response
+
+
+async def get_spaces_async_use_case(
+    i_async_typetalk_api: IAsyncTypetalkApi,
+    typetalk_token: str,
+) -> GetSpacesResponse:
+    """Typetalkから参加している組織の一覧を非同期に取得する
+
+    get_spaces_use_case の非同期版であり、APIのリクエスト処理から呼び出す。
+
+    Args:
+        i_async_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
+        typetalk_token (str): Typetalkのアクセストークン
+
+    Returns:
+        GetSpacesResponse: 組織一覧取得APIレスポンス
+    """
+    logger.info("START - get_spaces_async_use_case")
+
+    # Typetalkにて参加している組織一覧を取得する
+    typetalk_response = await i_async_typetalk_api.get_spaces(typetalk_token)
+    logger.info("Retrieved %d spaces from Typetalk", len(typetalk_response.my_spaces))
+
+    # APIレスポンス
+    response = _to_get_spaces_response(typetalk_response)
+
+    logger.info("END - get_spaces_async_use_case")
+
+    return response
@@ -1,8 +1,24 @@
 """Typetalkから参加しているトピックの一覧を取得する機能を提供する"""
 
 from src.core.logger.logger import logger
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
 from src.infrastructure.typetalk.i_typetalk_api import ITypetalkApi
-from src.schemas.topic import GetTopicsResponse
+from src.schemas.topic import GetTopicsResponse, TypetalkGetTopicsResponse
+
+
+def _to_get_topics_response(
+    typetalk_response: TypetalkGetTopicsResponse,
+) -> GetTopicsResponse:
+    """Typetalkトピック一覧のレスポンスをAPIレスポンスに変換する
+
+    Args:
+        typetalk_response (TypetalkGetTopicsResponse): Typetalkトピック一覧のレスポンス
+
+    Returns:
+        GetTopicsResponse: トピック一覧取得APIレスポンス
+    """
+    my_topics = typetalk_response.topics
+    return GetTopicsResponse(topics=[my_topic.topic for my_topic in my_topics])
 
 
 def get_topics_use_case(
@@ -28,9 +44,39 @@ def get_topics_use_case(
     logger.info("Retrieved %d topics from Typetalk", len(typetalk_response.topics))
 
     # APIレスポンス
-    my_topics = typetalk_response.topics
-    response = GetTopicsResponse(topics=[my_topic.topic for my_topic in my_topics])
+    response = _to_get_topics_response(typetalk_response)
 
     logger.info("END - get_topics_use_case, space_key: %s", space_key)
 
     return response
+
+
+async def get_topics_async_use_case(
+    i_async_typetalk_api: IAsyncTypetalkApi,
+    typetalk_token: str,
+    space_key: str,
+) -> GetTopicsResponse:
+    """Typetalkから参加しているトピック一覧を非同期に取得する
+
+    get_topics_use_case の非同期版であり、APIのリクエスト処理から呼び出す。
+
+    Args:
+        i_async_typetalk_api (IAsyncTypetalkApi): Typetalk APIの非同期インターフェース
+        typetalk_token (str): Typetalkのアクセストークン
+        space_key (str): 対象の組織キー
+
+    Returns:
+        GetTopicsResponse: トピック一覧取得APIレスポンス
+    """
+    logger.info("START - get_topics_async_use_case, space_key: %s", space_key)
+
+    # Typetalkにて参加しているトピック一覧を取得する
+    typetalk_response = await i_async_typetalk_api.get_topics(typetalk_token, space_key)
+    logger.info("Retrieved %d topics from Typetalk", len(typetalk_response.topics))
+
+    # APIレスポンス
+    response = _to_get_topics_response(typetalk_response)
+
+    logger.info("END - get_topics_async_use_case, space_key: %s", space_key)
+
+    return response
@@ -0,0 +1,230 @@
+"""次のページのメッセージ一覧を先読みしてキャッシュする仕組みを定義する"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+
+from src.core.logger.logger import logger
+from src.core.text_hash import hash_token
+from src.schemas.message import GetMessagesResponse
+
+# 開始IDを受け取り、感情分析済みのメッセージ一覧を返す関数
+MessagesFetcher = Callable[[int | None], Awaitable[GetMessagesResponse]]
+
+_PrefetchKey = tuple[str, int, int | None, int | None]
+
+
+@dataclass(frozen=True)
+class MessagesPrefetchStats:
+    """メッセージ一覧の先読みに関する統計情報
+
+    Attributes:
+        hits (int): 先読みした結果(先読み中を含む)から返した回数
+        misses (int): 先読みした結果が無く、取得した回数
+        scheduled (int): 先読みを開始した回数
+        completed (int): 先読みが完了し、キャッシュに保存した回数
+        skipped (int): 同時実行数の上限またはキャッシュが満杯のため先読みしなかった回数
+        cancelled (int): キャッシュが満杯のため先読みを中止した回数
+        failed (int): 先読みでエラーが発生した回数
+        size (int): 現在キャッシュしているページ数
+        in_flight (int): 現在先読み中のページ数
+    """
+
+    hits: int
+    misses: int
+    scheduled: int
+    completed: int
+    skipped: int
+    cancelled: int
+    failed: int
+    size: int
+    in_flight: int
+
+
+class MessagesPrefetcher:
+    """次のページのメッセージ一覧を先読みし、短い期間キャッシュする
+
+    続きのページがあるメッセージ一覧を返した直後に、最も古いポストのIDを開始IDとして
+    次のページの取得と感情分析をバックグラウンドで開始する。
+    結果はアクセストークンのハッシュ値、トピックID、開始ID、件数をキーとして
+    保持し、続けて行われるリクエストにはキャッシュ(先読み中の場合はその完了)から返す。
+
+    先読みの同時実行数とキャッシュのページ数には上限を設け、キャッシュが満杯になった
+    場合は実行中の先読みを中止する。
+    タスクはイベントループに紐づくため、インスタンスは1つのイベントループ上で使用する。
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 256,
+        max_concurrency: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """MessagesPrefetcher クラスのインスタンスを初期化する
+
+        Args:
+            ttl_seconds (float, optional): 先読みした結果の有効期間(秒)
+            max_entries (int, optional): キャッシュするページ数の上限
+            max_concurrency (int, optional): 同時に実行する先読みの上限
+            clock (Callable[[], float], optional): 現在時刻(秒)を返す関数
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_concurrency = max_concurrency
+        self._clock = clock
+        self._entries: dict[_PrefetchKey, tuple[float, GetMessagesResponse]] = {}
+        self._in_flight: dict[_PrefetchKey, asyncio.Task[GetMessagesResponse]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._scheduled = 0
+        self._completed = 0
+        self._skipped = 0
+        self._cancelled = 0
+        self._failed = 0
+
+    @property
+    def stats(self) -> MessagesPrefetchStats:
+        """メッセージ一覧の先読みに関する統計情報を返す"""
+        return MessagesPrefetchStats(
+            hits=self._hits,
+            misses=self._misses,
+            scheduled=self._scheduled,
+            completed=self._completed,
+            skipped=self._skipped,
+            cancelled=self._cancelled,
+            failed=self._failed,
+            size=len(self._entries),
+            in_flight=len(self._in_flight),
+        )
+
+    async def get_messages(
+        self,
+        typetalk_token: str,
+        topic_id: int,
+        from_id: int | None,
+        count: int | None,
+        fetch: MessagesFetcher,
+    ) -> GetMessagesResponse:
+        """先読みした結果があれば返し、無ければ取得する。その後、次のページを先読みする
+
+        Args:
+            typetalk_token (str): Typetalkのアクセストークン
+            topic_id (int): 対象のトピックID
+            from_id (int | None): 取得するメッセージ一覧の開始ID
+            count (int | None): 取得するメッセージの件数
+            fetch (MessagesFetcher): 開始IDを受け取りメッセージ一覧を取得する関数
+
+        Returns:
+            GetMessagesResponse: メッセージ一覧取得APIレスポンス
+        """
+        key = (hash_token(typetalk_token), topic_id, from_id, count)
+        response = await self._lookup(key)
+        if response is None:
+            self._misses += 1
+            response = await fetch(from_id)
+        else:
+            self._hits += 1
+
+        self._schedule_next_page(key, response, fetch)
+        return response
+
+    async def _lookup(self, key: _PrefetchKey) -> GetMessagesResponse | None:
+        """キャッシュまたは先読み中のタスクから結果を返す"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, response = entry
+            if expires_at > self._clock():
+                return response
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            return None
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # 呼び出し元がキャンセルされた場合はそのまま送出する
+            if not task.cancelled():
+                raise
+            return None
+        except Exception:
+            # 先読みに失敗した場合は改めて取得し、エラーは呼び出し元に返す
+            return None
+
+    def _schedule_next_page(
+        self,
+        key: _PrefetchKey,
+        response: GetMessagesResponse,
+        fetch: MessagesFetcher,
+    ) -> None:
+        """次のページがある場合は先読みを開始する"""
+        if not response.has_next or not response.posts:
+            return
+
+        token_hash, topic_id, _, count = key
+        next_key = (token_hash, topic_id, min(x.id for x in response.posts), count)
+        if next_key in self._in_flight or next_key in self._entries:
+            return
+
+        self._evict_expired()
+        if (
+            len(self._in_flight) >= self.max_concurrency
+            or len(self._entries) >= self.max_entries
+        ):
+            self._skipped += 1
+            return
+
+        task = asyncio.ensure_future(fetch(next_key[2]))
+        self._in_flight[next_key] = task
+        self._scheduled += 1
+        task.add_done_callback(partial(self._on_done, next_key))
+
+    def _on_done(
+        self, key: _PrefetchKey, task: asyncio.Task[GetMessagesResponse]
+    ) -> None:
+        """先読みの完了時に結果をキャッシュに保存する"""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.cancelled():
+            self._cancelled += 1
+            return
+        if task.exception() is not None:
+            self._failed += 1
+            logger.warning("Failed to prefetch messages: %r", task.exception())
+            return
+
+        self._evict_expired()
+        if len(self._entries) >= self.max_entries:
+            # キャッシュが満杯の場合は結果を破棄する
+            self._cancelled += 1
+            return
+        self._entries[key] = (self._clock() + self.ttl_seconds, task.result())
+        self._completed += 1
+        if len(self._entries) >= self.max_entries:
+            # 実行中の先読みの結果は保存できないため中止する
+            self._cancel_in_flight()
+
+    def _evict_expired(self) -> None:
+        """有効期限が切れたページをキャッシュから削除する"""
+        now = self._clock()
+        # 有効期間は一定のため、保存した順に有効期限が切れる
+        while self._entries:
+            key = next(iter(self._entries))
+            if self._entries[key][0] > now:
+                break
+            del self._entries[key]
+
+    def _cancel_in_flight(self) -> None:
+        """実行中の先読みを全て中止する"""
+        for task in list(self._in_flight.values()):
+            task.cancel()
+
+    async def aclose(self) -> None:
+        """実行中の先読みを中止し、完了を待つ"""
+        tasks = list(self._in_flight.values())
+        self._cancel_in_flight()
+        if tasks:
+            await asyncio.wait(tasks)
@@ -0,0 +1,482 @@
+"""トピックの新しいポストを共有のポーリングで取得し、購読者に配信する仕組みを定義する"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+
+from src.core.logger.logger import logger
+from src.exceptions.exceptions import AppBaseError
+from src.infrastructure.aws.comprehend.exceptions import ComprehendError
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
+from src.infrastructure.sentiment_store.i_sentiment_store import ISentimentStore
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.schemas.message import Post
+from src.use_cases.get_messages import (
+    analyze_messages_async,
+    fetch_messages_since_async,
+)
+
+
+class TopicFeedCapacityError(AppBaseError):
+    """ポーリングするトピック数が上限に達しているため購読できない場合に発生する例外クラス"""
+
+
+class TopicFeedEventType(StrEnum):
+    """購読者に配信するイベントの種類"""
+
+    # 新しいポスト
+    POSTS = "posts"
+    # 配信が追いつかなかったため、購読を終了した
+    RESET = "reset"
+    # トピックにアクセスできなくなった、またはアプリケーションの終了により購読を終了した
+    CLOSED = "closed"
+
+
+@dataclass(frozen=True)
+class TopicFeedEvent:
+    """購読者に配信するイベント
+
+    Attributes:
+        type (TopicFeedEventType): イベントの種類
+        posts (tuple[Post, ...]): 感情分析済みの新しいポスト(id の降順)
+        last_id (int | None): 配信済みの最新のポストID
+    """
+
+    type: TopicFeedEventType
+    posts: tuple[Post, ...] = ()
+    last_id: int | None = None
+
+
+@dataclass(frozen=True)
+class TopicFeedStats:
+    """トピックの新しいポストの配信に関する統計情報
+
+    Attributes:
+        topics (int): 現在ポーリングしているトピック数
+        subscribers (int): 現在の購読者数
+        polls (int): ポーリングを行った回数
+        poll_errors (int): メッセージ一覧の取得でエラーが発生した回数
+        new_posts (int): 取得した新しいポストの件数
+        delivered (int): 購読者にイベントを配信した回数
+        lagged (int): 配信が追いつかず購読を終了した回数
+        idle_shutdowns (int): 購読者がいないためポーリングを終了した回数
+    """
+
+    topics: int
+    subscribers: int
+    polls: int
+    poll_errors: int
+    new_posts: int
+    delivered: int
+    lagged: int
+    idle_shutdowns: int
+
+
+class TopicSubscription:
+    """トピックの新しいポストの購読
+
+    購読者ごとに上限のあるキューを持ち、ポーリングとは独立して読み出す。
+    キューが満杯になった購読者は終了させ、他の購読者とポーリングを待たせない。
+    """
+
+    def __init__(
+        self,
+        topic_id: int,
+        typetalk_token: str,
+        last_id: int,
+        queue_size: int,
+        keepalive_seconds: float,
+    ):
+        """TopicSubscription クラスのインスタンスを初期化する
+
+        Args:
+            topic_id (int): 対象のトピックID
+            typetalk_token (str): Typetalkのアクセストークン
+            last_id (int): 購読を開始した時点の最新のポストID
+            queue_size (int): 読み出されていないイベントの上限
+            keepalive_seconds (float): イベントを待つ時間の上限(秒)
+        """
+        self.topic_id = topic_id
+        self.typetalk_token = typetalk_token
+        self.last_id = last_id
+        self.keepalive_seconds = keepalive_seconds
+        self.closed = False
+        self._queue: asyncio.Queue[TopicFeedEvent] = asyncio.Queue(maxsize=queue_size)
+
+    def offer(self, event: TopicFeedEvent) -> bool:
+        """イベントをキューに追加する
+
+        Args:
+            event (TopicFeedEvent): 配信するイベント
+
+        Returns:
+            bool: キューが満杯のため追加できなかった場合は False
+        """
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def close(self, event_type: TopicFeedEventType) -> None:
+        """読み出されていないイベントを破棄し、購読を終了するイベントを追加する
+
+        Args:
+            event_type (TopicFeedEventType): 購読を終了する理由のイベントの種類
+        """
+        if self.closed:
+            return
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(TopicFeedEvent(type=event_type))
+
+    async def get(self) -> TopicFeedEvent | None:
+        """次のイベントを返す
+
+        Returns:
+            TopicFeedEvent | None: 待つ時間の上限までにイベントが無い場合は None
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), self.keepalive_seconds)
+        except TimeoutError:
+            return None
+
+
+class _TopicPoller:
+    """1つのトピックの新しいポストをポーリングし、購読者に配信する"""
+
+    def __init__(
+        self,
+        hub: "TopicFeedHub",
+        topic_id: int,
+        last_id: int,
+        i_async_typetalk_api: IAsyncTypetalkApi,
+        i_async_aws_comprehend_api: IAsyncAwsComprehendApi,
+        i_sentiment_store: ISentimentStore | None,
+    ):
+        """_TopicPoller クラスのインスタンスを初期化し、ポーリングを開始する
+
+        Args:
+            hub (TopicFeedHub): ポーリングの設定と統計情報を持つハブ
+            topic_id (int): 対象のトピックID
+            last_id (int): 配信済みとみなす最新のポストID
+            i_async_typetalk_api (IAsyncTypetalkApi):
+                Typetalk APIの非同期インターフェース
+            i_async_aws_comprehend_api (IAsyncAwsComprehendApi):
+                AWS Comprehend APIの非同期インターフェース
+            i_sentiment_store (ISentimentStore | None): 感情分析結果の永続ストア
+        """
+        self.topic_id = topic_id
+        self.last_id = last_id
+        self.subscriptions: list[TopicSubscription] = []
+        self.idle_since: float | None = None
+        self._hub = hub
+        self._typetalk_api = i_async_typetalk_api
+        self._comprehend_api = i_async_aws_comprehend_api
+        self._sentiment_store = i_sentiment_store
+        # 再接続した購読者に送り直すための、最近配信したイベント
+        self._recent_events: deque[TopicFeedEvent] = deque(maxlen=hub.queue_size)
+        self._task = asyncio.ensure_future(self._run())
+
+    def add(self, subscription: TopicSubscription, last_event_id: int | None) -> None:
+        """購読者を追加し、受信済みの ID より新しい配信済みのポストを送り直す"""
+        self.subscriptions.append(subscription)
+        self.idle_since = None
+        if last_event_id is None:
+            return
+        for event in self._recent_events:
+            posts = tuple(x for x in event.posts if x.id > last_event_id)
+            if posts:
+                subscription.offer(
+                    TopicFeedEvent(TopicFeedEventType.POSTS, posts, event.last_id)
+                )
+
+    def remove(self, subscription: TopicSubscription) -> None:
+        """購読者を削除し、購読者がいなくなった場合は待機を開始する"""
+        if subscription in self.subscriptions:
+            self.subscriptions.remove(subscription)
+        if not self.subscriptions and self.idle_since is None:
+            self.idle_since = self._hub.clock()
+
+    async def aclose(self) -> None:
+        """ポーリングを中止し、購読を終了する"""
+        self._task.cancel()
+        for subscription in self.subscriptions:
+            subscription.close(TopicFeedEventType.CLOSED)
+        await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self) -> None:
+        """一定の間隔でポーリングし、購読者がいない状態が続いた場合は終了する"""
+        while True:
+            await asyncio.sleep(self._hub.poll_interval_seconds)
+            if self.subscriptions:
+                try:
+                    await self._poll()
+                except Exception:
+                    # 予期しないエラーでもポーリングは継続する
+                    self._hub.record_poll(error=True)
+                    logger.exception("Failed to poll topic %s", self.topic_id)
+            elif (
+                self.idle_since is not None
+                and self._hub.clock() - self.idle_since
+                >= self._hub.idle_timeout_seconds
+            ):
+                self._hub.shutdown_idle(self)
+                return
+
+    async def _poll(self) -> None:
+        """配信済みのポストより新しいポストのみを取得し、分析して配信する
+
+        配信済みの最新のポストIDから新しい方向にページを続けて取得するため、
+        ポーリングの間隔の間に1ページの件数を超えるポストがあっても取りこぼさない。
+        購読者のアクセストークンでメッセージ一覧を取得する。アクセスできない
+        アクセストークンの購読は終了し、残りの購読者のアクセストークンで取得し直す。
+        """
+        while self.subscriptions:
+            typetalk_token = self.subscriptions[0].typetalk_token
+            try:
+                response = await fetch_messages_since_async(
+                    self._typetalk_api,
+                    typetalk_token,
+                    self.topic_id,
+                    self.last_id,
+                    page_size=self._hub.poll_count,
+                )
+                break
+            except TypetalkAPIError as e:
+                self._hub.record_poll(error=True)
+                logger.warning("Failed to poll topic %s: %s", self.topic_id, e)
+                if e.status_code not in TopicFeedHub.ACCESS_ERROR_STATUS_CODES:
+                    return
+                # アクセスできなくなったアクセストークンの購読を終了する
+                self._close_token(typetalk_token)
+        else:
+            return
+
+        new_posts = response.posts
+        self._hub.record_poll(new_posts=len(new_posts))
+        if not new_posts:
+            return
+        self.last_id = max(x.id for x in new_posts)
+
+        new_response = response.model_copy(update={"posts": new_posts})
+        try:
+            posts = (
+                await analyze_messages_async(
+                    self._comprehend_api, new_response, self._sentiment_store
+                )
+            ).posts
+        except ComprehendError as e:
+            # 感情分析に失敗した場合は感情の無いポストを配信する
+            logger.warning("Failed to analyze new posts: %s", e)
+            posts = list(reversed(new_posts))
+
+        self._broadcast(
+            TopicFeedEvent(TopicFeedEventType.POSTS, tuple(posts), self.last_id)
+        )
+
+    def _broadcast(self, event: TopicFeedEvent) -> None:
+        """イベントを購読者に配信し、キューが満杯の購読者は終了させる"""
+        self._recent_events.append(event)
+        for subscription in list(self.subscriptions):
+            if subscription.offer(event):
+                self._hub.record_delivery()
+                continue
+            self._hub.record_delivery(lagged=True)
+            subscription.close(TopicFeedEventType.RESET)
+            self.remove(subscription)
+
+    def _close_token(self, typetalk_token: str) -> None:
+        """指定のアクセストークンの購読を終了する"""
+        for subscription in list(self.subscriptions):
+            if subscription.typetalk_token == typetalk_token:
+                subscription.close(TopicFeedEventType.CLOSED)
+                self.remove(subscription)
+
+
+class TopicFeedHub:
+    """トピックごとに1つのポーリングを共有し、新しいポストを購読者に配信する
+
+    最初の購読者がトピックを購読した時点でポーリングを開始し、以降の購読者は
+    同じポーリングの結果を受け取るため、購読者数によらず Typetalk への取得と
+    感情分析はトピックごとに1回となる。
+    ポーリングでは前回までに配信したポストより新しいポストのみを分析して配信し、
+    購読者がいない状態が一定時間続いた場合は終了する。
+    タスクはイベントループに紐づくため、インスタンスは1つのイベントループ上で使用する。
+    """
+
+    # 購読を終了する、アクセスできないことを示すステータスコード
+    ACCESS_ERROR_STATUS_CODES = frozenset({401, 403, 404})
+
+    def __init__(
+        self,
+        poll_interval_seconds: float = 5.0,
+        poll_count: int = 50,
+        idle_timeout_seconds: float = 30.0,
+        queue_size: int = 100,
+        keepalive_seconds: float = 15.0,
+        max_topics: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """TopicFeedHub クラスのインスタンスを初期化する
+
+        Args:
+            poll_interval_seconds (float, optional): ポーリングの間隔(秒)
+            poll_count (int, optional): ポーリングで1ページに取得するメッセージの件数
+            idle_timeout_seconds (float, optional):
+                購読者がいない場合にポーリングを終了するまでの時間(秒)
+            queue_size (int, optional): 購読者ごとの読み出されていないイベントの上限
+            keepalive_seconds (float, optional):
+                イベントが無い場合に接続を維持するための送信を行う間隔(秒)
+            max_topics (int, optional): 同時にポーリングするトピック数の上限
+            clock (Callable[[], float], optional): 現在時刻(秒)を返す関数
+        """
+        self.poll_interval_seconds = poll_interval_seconds
+        self.poll_count = poll_count
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.queue_size = queue_size
+        self.keepalive_seconds = keepalive_seconds
+        self.max_topics = max_topics
+        self.clock = clock
+        self._pollers: dict[int, _TopicPoller] = {}
+        self._polls = 0
+        self._poll_errors = 0
+        self._new_posts = 0
+        self._delivered = 0
+        self._lagged = 0
+        self._idle_shutdowns = 0
+
+    @property
+    def stats(self) -> TopicFeedStats:
+        """トピックの新しいポストの配信に関する統計情報を返す"""
+        return TopicFeedStats(
+            topics=len(self._pollers),
+            subscribers=sum(len(x.subscriptions) for x in self._pollers.values()),
+            polls=self._polls,
+            poll_errors=self._poll_errors,
+            new_posts=self._new_posts,
+            delivered=self._delivered,
+            lagged=self._lagged,
+            idle_shutdowns=self._idle_shutdowns,
+        )
+
+    async def subscribe(
+        self,
+        i_async_typetalk_api: IAsyncTypetalkApi,
+        i_async_aws_comprehend_api: IAsyncAwsComprehendApi,
+        typetalk_token: str,
+        topic_id: int,
+        last_event_id: int | None = None,
+        i_sentiment_store: ISentimentStore | None = None,
+    ) -> TopicSubscription:
+        """トピックの新しいポストを購読する
+
+        アクセストークンでトピックにアクセスできることを確認してから購読する。
+        トピックのポーリングが無い場合は、最新のポストIDより新しいポストを配信する
+        ポーリングを開始する。受信済みの ID が指定された場合は、それより新しい
+        配信済みのポストをこの購読者にのみ送り直す。
+
+        Args:
+            i_async_typetalk_api (IAsyncTypetalkApi):
+                Typetalk APIの非同期インターフェース
+            i_async_aws_comprehend_api (IAsyncAwsComprehendApi):
+                AWS Comprehend APIの非同期インターフェース
+            typetalk_token (str): Typetalkのアクセストークン
+            topic_id (int): 対象のトピックID
+            last_event_id (int | None, optional): 再接続の場合の受信済みの最新のポストID
+            i_sentiment_store (ISentimentStore | None, optional):
+                感情分析結果の永続ストア
+
+        Returns:
+            TopicSubscription: トピックの新しいポストの購読
+
+        Raises:
+            TypetalkAPIError: トピックにアクセスできない場合
+            TopicFeedCapacityError: ポーリングするトピック数が上限に達している場合
+        """
+        latest = await i_async_typetalk_api.get_messages(
+            typetalk_token, topic_id, None, 1
+        )
+
+        poller = self._pollers.get(topic_id)
+        if poller is None:
+            if len(self._pollers) >= self.max_topics:
+                raise TopicFeedCapacityError(topic_id)
+            # 共有のポーリングはクライアントの指定によらず最新のポストから開始し、
+            # 受信済みの ID は送り直しにのみ使用する
+            poller = _TopicPoller(
+                self,
+                topic_id,
+                max((x.id for x in latest.posts), default=0),
+                i_async_typetalk_api,
+                i_async_aws_comprehend_api,
+                i_sentiment_store,
+            )
+            self._pollers[topic_id] = poller
+
+        subscription = TopicSubscription(
+            topic_id,
+            typetalk_token,
+            poller.last_id,
+            self.queue_size,
+            self.keepalive_seconds,
+        )
+        poller.add(subscription, last_event_id)
+        return subscription
+
+    def record_poll(self, new_posts: int = 0, error: bool = False) -> None:
+        """ポーリングの結果を統計情報に記録する
+
+        Args:
+            new_posts (int, optional): 取得した新しいポストの件数
+            error (bool, optional): メッセージ一覧の取得でエラーが発生したかどうか
+        """
+        self._polls += 1
+        self._new_posts += new_posts
+        if error:
+            self._poll_errors += 1
+
+    def record_delivery(self, lagged: bool = False) -> None:
+        """購読者への配信の結果を統計情報に記録する
+
+        Args:
+            lagged (bool, optional): 配信が追いつかず購読を終了したかどうか
+        """
+        if lagged:
+            self._lagged += 1
+        else:
+            self._delivered += 1
+
+    def unsubscribe(self, subscription: TopicSubscription) -> None:
+        """購読を終了する
+
+        Args:
+            subscription (TopicSubscription): 終了する購読
+        """
+        poller = self._pollers.get(subscription.topic_id)
+        if poller is not None:
+            poller.remove(subscription)
+
+    def shutdown_idle(self, poller: _TopicPoller) -> None:
+        """購読者がいない状態が続いたポーリングを削除する
+
+        Args:
+            poller (_TopicPoller): 終了するポーリング
+        """
+        if self._pollers.get(poller.topic_id) is poller:
+            del self._pollers[poller.topic_id]
+            self._idle_shutdowns += 1
+            logger.info("Stopped polling idle topic %s", poller.topic_id)
+
+    async def aclose(self) -> None:
+        """全てのポーリングを中止し、購読を終了する"""
+        pollers = list(self._pollers.values())
+        self._pollers.clear()
+        await asyncio.gather(*(x.aclose() for x in pollers))
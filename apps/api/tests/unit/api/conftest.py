@@ -4,12 +4,14 @@ from collections.abc import Generator
 
 import pytest
 
-from src.api.dependencies import get_i_aws_comprehend_api, get_i_typetalk_api
+from src.api.dependencies import get_i_async_typetalk_api, get_i_aws_comprehend_api
 from src.main import app
 from tests.unit.mocks.aws.comprehend.aws_comprehend_api_mock_error import (
     AwsComprehendApiMockError,
 )
-from tests.unit.mocks.typetalk.typetalk_api_mock_error import TypetalkApiMockError
+from tests.unit.mocks.typetalk.async_typetalk_api_mock_error import (
+    AsyncTypetalkApiMockError,
+)
 
 
 @pytest.fixture
@@ -19,9 +21,11 @@ def setup_dependency_typetalk_api_mock_error() -> Generator[None, None, None]:
     テスト中はTypetalk APIのエラー応答をシミュレートし、
     テスト終了後に依存関係を元の状態にリセットする。
     """
-    app.dependency_overrides[get_i_typetalk_api] = lambda: TypetalkApiMockError()
+    app.dependency_overrides[get_i_async_typetalk_api] = lambda: (
+        AsyncTypetalkApiMockError()
+    )
     yield
-    app.dependency_overrides.pop(get_i_typetalk_api)
+    app.dependency_overrides.pop(get_i_async_typetalk_api)
 
 
 @pytest.fixture
@@ -32,8 +36,8 @@ def setup_dependency_aws_comprehend_api_mock_error() -> Generator[None, None, No
     テスト終了後に依存関係を元の状態にリセットする。
     """
     # 依存関係を上書きする
-    app.dependency_overrides[get_i_aws_comprehend_api] = (
-        lambda: AwsComprehendApiMockError()
+    app.dependency_overrides[get_i_aws_comprehend_api] = lambda: (
+        AwsComprehendApiMockError()
     )
     yield
     app.dependency_overrides.pop(get_i_aws_comprehend_api)
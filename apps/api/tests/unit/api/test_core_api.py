@@ -1,8 +1,23 @@
 """APIの基本機能に関するテストケースを定義する"""
 
+from pathlib import Path
+
+import numpy as np
+import pytest
 from fastapi import status
 from fastapi.testclient import TestClient
 
+from src.api.dependencies import (
+    get_comprehend_circuit_breaker,
+    get_i_aws_comprehend_api,
+)
+from src.core.config import get_settings
+from src.infrastructure.local_sentiment.hashed_char_ngrams import (
+    HashedCharNgramVectorizer,
+)
+from src.infrastructure.local_sentiment.linear_sentiment_model import (
+    LinearSentimentModel,
+)
 from src.main import app
 
 client = TestClient(app, raise_server_exceptions=False)
@@ -24,9 +39,146 @@ class TestCoreApi:
             content = response.json()
             assert content == {"message": "success"}
 
+        def test_when_metrics_endpoint_called_then_returns_registered_metrics(
+            self, monkeypatch: pytest.MonkeyPatch
+        ) -> None:
+            """メトリクス取得APIが登録されたメトリクスを返す"""
+            # Arrange
+            monkeypatch.setenv("TYPETALK_LISTING_CACHE_ENABLED", "true")
+            get_settings.cache_clear()
+
+            # Act
+            with TestClient(app) as test_client:
+                test_client.get(
+                    "/spaces", headers={"x-typetalk-token": "valid_typetalk_token"}
+                )
+                response = test_client.get("/metrics")
+
+            # Assert
+            assert response.status_code == status.HTTP_200_OK
+            content = response.json()
+            assert content["typetalk_single_flight"]["calls"] == 1
+            assert content["typetalk_single_flight"]["collapsed"] == 0
+            assert content["comprehend_micro_batcher"]["requests"] == 0
+            assert content["typetalk_listing_cache"]["misses"] == 1
+
+        def test_when_cache_invalidated_then_only_own_entries_are_discarded(
+            self, monkeypatch: pytest.MonkeyPatch
+        ) -> None:
+            """キャッシュ無効化APIはリクエストのトークンのキャッシュのみを破棄する"""
+            # Arrange
+            monkeypatch.setenv("TYPETALK_LISTING_CACHE_ENABLED", "true")
+            get_settings.cache_clear()
+
+            with TestClient(app) as test_client:
+                for token in ("valid_typetalk_token", "other_typetalk_token"):
+                    test_client.get("/spaces", headers={"x-typetalk-token": token})
+
+                # Act
+                response = test_client.delete(
+                    "/cache", headers={"x-typetalk-token": "valid_typetalk_token"}
+                )
+                test_client.get(
+                    "/spaces", headers={"x-typetalk-token": "other_typetalk_token"}
+                )
+                metrics = test_client.get("/metrics").json()
+
+            # Assert
+            assert response.status_code == status.HTTP_200_OK
+            assert response.json() == {"invalidated": 1}
+            assert metrics["typetalk_listing_cache"]["hits"] == 1
+            assert metrics["typetalk_listing_cache"]["size"] == 1
+
+        def test_when_health_check_details_called_then_returns_circuit_states(
+            self,
+        ) -> None:
+            """詳細ヘルスチェックが外部サービスごとのサーキットブレーカーの状態を返す"""
+            # Act
+            with TestClient(app) as test_client:
+                response = test_client.get("/healthcheck/details")
+
+            # Assert
+            assert response.status_code == status.HTTP_200_OK
+            content = response.json()
+            assert content["message"] == "success"
+            assert content["upstreams"]["typetalk"]["state"] == "closed"
+            assert content["upstreams"]["comprehend"]["state"] == "closed"
+
+        def test_when_tiered_engine_selected_then_reports_escalation(
+            self, monkeypatch: pytest.MonkeyPatch
+        ) -> None:
+            """段階的な感情分析を選択した場合は、分析した件数と割合をメトリクスに返す"""
+            # Arrange
+            monkeypatch.setenv("SENTIMENT_ENGINE", "tiered")
+            get_settings.cache_clear()
+            get_i_aws_comprehend_api.cache_clear()
+
+            with TestClient(app) as test_client:
+                # Act
+                test_client.get(
+                    "/topics/6310/messages",
+                    headers={"x-typetalk-token": "valid_typetalk_token"},
+                )
+                metrics = test_client.get("/metrics").json()
+
+            # Assert
+            assert metrics["tiered_sentiment"]["texts"] == 2
+            assert metrics["tiered_sentiment"]["escalation_rate"] == 0.0
+
+        def test_when_distilled_model_given_then_tiered_uses_model(
+            self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+        ) -> None:
+            """学習したモデルのパスがある場合は、段階的な感情分析でモデルを使用する"""
+            # Arrange
+            # 全ての感情が同じスコアとなるモデルは、全てのテキストを外部のAPIで分析する
+            model_path = tmp_path / "model.npz"
+            LinearSentimentModel(
+                HashedCharNgramVectorizer(n_features=16), np.zeros((16, 4)), np.zeros(4)
+            ).save(model_path)
+            monkeypatch.setenv("SENTIMENT_ENGINE", "tiered")
+            monkeypatch.setenv("DISTILLED_MODEL_PATH", str(model_path))
+            get_settings.cache_clear()
+            get_i_aws_comprehend_api.cache_clear()
+
+            with TestClient(app) as test_client:
+                # Act
+                test_client.get(
+                    "/topics/6310/messages",
+                    headers={"x-typetalk-token": "valid_typetalk_token"},
+                )
+                metrics = test_client.get("/metrics").json()
+
+            # Assert
+            assert metrics["tiered_sentiment"]["escalation_rate"] == 1.0
+
     class TestUnhappyCases:
         """異常系のテストケース"""
 
+        def test_when_comprehend_circuit_open_then_returns_degraded_with_messages(
+            self,
+        ) -> None:
+            """AWS Comprehendの遮断中は、感情分析の結果なしのメッセージ一覧を返す"""
+            # Arrange
+            circuit_breaker = get_comprehend_circuit_breaker()
+            assert circuit_breaker is not None
+            for _ in range(circuit_breaker.failure_threshold):
+                circuit_breaker.record_failure()
+
+            with TestClient(app) as test_client:
+                # Act
+                messages = test_client.get(
+                    "/topics/6310/messages",
+                    headers={"x-typetalk-token": "valid_typetalk_token"},
+                )
+                health = test_client.get("/healthcheck/details")
+
+            # Assert
+            assert messages.status_code == status.HTTP_200_OK
+            assert all(x["sentiment"] is None for x in messages.json()["posts"])
+            assert health.json()["message"] == "degraded"
+            assert health.json()["upstreams"]["comprehend"]["state"] == "open"
+            assert health.json()["upstreams"]["comprehend"]["rejected"] >= 1
+
         def test_when_nonexistent_route_accessed_then_returns_404_not_found(
             self,
         ) -> None:
@@ -1,5 +1,6 @@
 """メッセージ一覧取得APIのテストケースを定義する"""
 
+import json
 from collections.abc import Generator
 
 import pytest
@@ -163,9 +164,135 @@ class TestGetMessagesApi:
             content = response.json()
             assert content == expected
 
+        def test_when_prefetch_enabled_then_next_page_served_from_prefetch(
+            self,
+            monkeypatch: pytest.MonkeyPatch,
+        ) -> None:
+            """先読みが有効な場合は次のページが先読みした結果から返される"""
+            # Arrange
+            monkeypatch.setenv("MESSAGES_PREFETCH_ENABLED", "true")
+            headers = {"x-typetalk-token": "valid_typetalk_token"}
+
+            with TestClient(app) as test_client:
+                first = test_client.get("/topics/6310/messages", headers=headers)
+                from_id = min(post["id"] for post in first.json()["posts"])
+
+                # Act
+                second = test_client.get(
+                    "/topics/6310/messages",
+                    headers=headers,
+                    params={"from_id": from_id},
+                )
+                metrics = test_client.get("/metrics").json()
+
+            # Assert
+            assert second.status_code == status.HTTP_200_OK
+            assert metrics["messages_prefetch"]["hits"] == 1
+            assert metrics["messages_prefetch"]["misses"] == 1
+
+        @pytest.mark.parametrize(
+            ("params", "headers"),
+            [
+                ({"stream": "true"}, {}),
+                ({}, {"accept": "application/x-ndjson"}),
+            ],
+            ids=[
+                # stream=true の場合、NDJSON のストリーミングで返される
+                "when_stream_query_given_then_streams_ndjson",
+                # Accept ヘッダーが NDJSON の場合、NDJSON のストリーミングで返される
+                "when_accept_ndjson_then_streams_ndjson",
+            ],
+        )
+        def test_when_stream_requested_then_returns_ndjson_lines(
+            self, params: dict, headers: dict
+        ) -> None:
+            """ストリーミングではヘッダー、ポスト、感情の順に NDJSON の行が返される"""
+            # Act
+            response = client.get(
+                "/topics/6310/messages",
+                params=params,
+                headers={"x-typetalk-token": "valid_typetalk_token", **headers},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["content-type"] == "application/x-ndjson"
+            lines = [json.loads(x) for x in response.text.splitlines()]
+            assert lines[0] == {
+                "type": "header",
+                "topic": {
+                    "id": 6310,
+                    "name": "テストトピック1",
+                    "description": "テストトピックの説明",
+                },
+                "hasNext": True,
+            }
+            assert [(x["type"], x["post"]["id"]) for x in lines[1:3]] == [
+                ("post", 154011),
+                ("post", 154010),
+            ]
+            assert all(x["post"]["sentiment"] is None for x in lines[1:3])
+            assert lines[3] == {
+                "type": "sentiments",
+                "sentiments": [
+                    {"id": 154010, "sentiment": "POSITIVE"},
+                    {"id": 154011, "sentiment": "POSITIVE"},
+                ],
+            }
+
+        def test_when_since_id_provided_then_returns_only_newer_posts(self) -> None:
+            """since_idを指定した場合はそれより新しいポストのみが感情付きで返される"""
+            # Act
+            response = client.get(
+                "/topics/6310/messages",
+                params={"since_id": 154010},
+                headers={"x-typetalk-token": "valid_typetalk_token"},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_200_OK
+            content = response.json()
+            assert [(x["id"], x["sentiment"]) for x in content["posts"]] == [
+                (154011, "POSITIVE")
+            ]
+            assert content["hasNext"] is False
+
     class TestUnhappyCases:
         """異常系のテストケース"""
 
+        def test_when_since_id_and_from_id_provided_then_returns_bad_request(
+            self,
+        ) -> None:
+            """since_idとfrom_idを同時に指定した場合は400エラーが返される"""
+            # Act
+            response = client.get(
+                "/topics/6310/messages",
+                params={"since_id": 154010, "from_id": 154011},
+                headers={"x-typetalk-token": "valid_typetalk_token"},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert response.json() == {
+                "title": "HTTP error occurred.",
+                "detail": "from_id and since_id cannot be used together.",
+            }
+
+        def test_when_stream_with_invalid_token_then_returns_error_response(
+            self,
+        ) -> None:
+            """ストリーミングでも Typetalk のエラーはエラーレスポンスで返される"""
+            # Act
+            response = client.get(
+                "/topics/6310/messages",
+                params={"stream": "true"},
+                headers={"x-typetalk-token": "invalid_typetalk_token"},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+            assert response.json()["title"] == "Typetalk API request failed."
+
         @pytest.mark.parametrize(
             ("typetalk_token", "topic_id", "expected_status", "expected_content"),
             [
@@ -230,6 +357,36 @@ class TestGetMessagesApi:
             content = response.json()
             assert content == expected_content
 
+        @pytest.mark.parametrize(
+            "count",
+            [0, 201],
+            ids=[
+                # 件数が1未満の場合、バリデーションエラーが返される
+                "when_count_is_less_than_1_then_returns_validation_error",
+                # 件数がTypetalkの上限を超える場合、バリデーションエラーが返される
+                "when_count_exceeds_typetalk_limit_then_returns_validation_error",
+            ],
+        )
+        def test_when_count_out_of_range_then_returns_validation_error(
+            self,
+            count: int,
+        ) -> None:
+            """取得件数が範囲外の場合にバリデーションエラーが返される"""
+            # Arrange
+            headers = {"x-typetalk-token": "valid_typetalk_token"}
+
+            # Act
+            response = client.get(
+                "/topics/6310/messages",
+                headers=headers,
+                params={"count": count},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+            content = response.json()
+            assert content["errors"][0]["name"] == "count"
+
         @pytest.mark.parametrize(
             ("headers", "expected"),
             [
@@ -0,0 +1,50 @@
+"""メッセージ一覧一括取得APIのテストケースを定義する"""
+
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from src.main import app
+
+client = TestClient(app, raise_server_exceptions=False)
+
+
+class TestGetMessagesBatchApi:
+    """メッセージ一覧一括取得APIのテストクラス"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_some_topics_fail_then_returns_results_per_topic(self) -> None:
+            """取得に失敗したトピックはエラーを、他のトピックはメッセージ一覧を返す"""
+            # Act
+            response = client.post(
+                "/topics/messages:batch",
+                headers={"X-Typetalk-Token": "valid_typetalk_token"},
+                json={"topicIds": [6310, 0]},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_200_OK
+            ok, failed = response.json()["results"]
+            assert ok["topicId"] == 6310
+            assert ok["error"] is None
+            assert [x["id"] for x in ok["messages"]["posts"]] == [154011, 154010]
+            assert all(x["sentiment"] for x in ok["messages"]["posts"])
+            assert failed["topicId"] == 0
+            assert failed["messages"] is None
+            assert failed["error"]["status"] == status.HTTP_404_NOT_FOUND
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        def test_when_topic_ids_empty_then_returns_422(self) -> None:
+            """トピックIDが指定されていない場合は422を返す"""
+            # Act
+            response = client.post(
+                "/topics/messages:batch",
+                headers={"X-Typetalk-Token": "valid_typetalk_token"},
+                json={"topicIds": []},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
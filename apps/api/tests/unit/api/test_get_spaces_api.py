@@ -115,6 +115,25 @@ class TestGetSpacesApi:
             content = response.json()
             assert content == expected_content
 
+        def test_when_invalid_token_repeated_then_returns_cached_error(
+            self,
+        ) -> None:
+            """無効なトークンで繰り返し呼び出すとキャッシュした同じエラーが返される"""
+            # Arrange
+            headers = {"x-typetalk-token": "invalid_typetalk_token"}
+
+            # Act
+            with TestClient(app, raise_server_exceptions=False) as test_client:
+                first = test_client.get("/spaces", headers=headers)
+                second = test_client.get("/spaces", headers=headers)
+                metrics = test_client.get("/metrics").json()
+
+            # Assert
+            assert first.status_code == second.status_code
+            assert first.status_code == status.HTTP_401_UNAUTHORIZED
+            assert first.json() == second.json()
+            assert metrics["typetalk_negative_cache"]["hits"] == 1
+
         def test_when_unexpected_error_occurs_then_returns_500_error(
             self,
             setup_dependency_typetalk_api_mock_error: Generator[None, None, None],
@@ -0,0 +1,101 @@
+"""トピックの新しいポスト配信APIのテストケースを定義する"""
+
+import json
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from pytest_mock import MockerFixture
+
+from src.api.routers import _to_server_sent_events
+from src.main import app
+from src.schemas.account import Account
+from src.schemas.message import Post
+from src.use_cases.topic_feed import (
+    TopicFeedEvent,
+    TopicFeedEventType,
+    TopicFeedHub,
+    TopicSubscription,
+)
+
+client = TestClient(app, raise_server_exceptions=False)
+
+
+class TestStreamTopicApi:
+    """トピックの新しいポスト配信APIのテストクラス"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        @pytest.mark.anyio
+        async def test_when_events_received_then_streams_server_sent_events(
+            self, mocker: MockerFixture
+        ) -> None:
+            """ready、posts の順にイベントを返し、購読の終了で解除して終わる"""
+            # Arrange
+            hub = mocker.Mock(spec=TopicFeedHub)
+            subscription = TopicSubscription(6310, "valid_typetalk_token", 100, 10, 1.0)
+            post = Post(
+                id=101,
+                message="テストメッセージ",
+                updated_at="2024-09-12T12:34:56Z",
+                account=Account(id=1, name="test", image_url=""),
+                sentiment="POSITIVE",
+            )
+            events = _to_server_sent_events(hub, subscription)
+
+            # Act
+            ready = await anext(events)
+            subscription.offer(
+                TopicFeedEvent(TopicFeedEventType.POSTS, (post,), last_id=101)
+            )
+            posts = await anext(events)
+            subscription.close(TopicFeedEventType.CLOSED)
+            rest = [x async for x in events]
+
+            # Assert
+            assert ready == b"id: 100\nevent: ready\ndata: {}\n\n"
+            id_line, event_line, data_line = posts.decode().splitlines()[:3]
+            assert (id_line, event_line) == ("id: 101", "event: posts")
+            data = json.loads(data_line.removeprefix("data: "))
+            assert data["topicId"] == 6310
+            assert [(x["id"], x["sentiment"]) for x in data["posts"]] == [
+                (101, "POSITIVE")
+            ]
+            assert rest == [b"event: closed\ndata: {}\n\n"]
+            hub.unsubscribe.assert_called_once_with(subscription)
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        def test_when_invalid_token_then_returns_error_before_streaming(
+            self,
+        ) -> None:
+            """トピックにアクセスできない場合はストリーミングせずにエラーが返される"""
+            # Act
+            with TestClient(app) as test_client:
+                response = test_client.get(
+                    "/topics/6310/stream",
+                    headers={"x-typetalk-token": "invalid_typetalk_token"},
+                )
+
+            # Assert
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+            assert response.json()["title"] == "Typetalk API request failed."
+
+        def test_when_stream_disabled_then_returns_service_unavailable(
+            self,
+        ) -> None:
+            """配信の仕組みが無い場合は503エラーが返される"""
+            # Act
+            response = client.get(
+                "/topics/6310/stream",
+                headers={"x-typetalk-token": "valid_typetalk_token"},
+            )
+
+            # Assert
+            assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+            assert response.json() == {
+                "title": "HTTP error occurred.",
+                "detail": "Topic stream is disabled.",
+            }
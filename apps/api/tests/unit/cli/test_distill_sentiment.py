@@ -0,0 +1,69 @@
+"""ローカルのモデルを学習・評価するコマンドのテストケースを定義する"""
+
+from pathlib import Path
+
+import pytest
+
+from src.cli.distill_sentiment import main
+from src.infrastructure.local_sentiment.training_samples import TrainingSample
+
+# 学習用のサンプル
+_SAMPLES = [
+    TrainingSample("ありがとうございます", (0.9, 0.02, 0.06, 0.02)),
+    TrainingSample("とても嬉しいです", (0.9, 0.02, 0.06, 0.02)),
+    TrainingSample("エラーで困っています", (0.02, 0.9, 0.06, 0.02)),
+    TrainingSample("障害が起きて大変です", (0.02, 0.9, 0.06, 0.02)),
+    TrainingSample("会議は10時です", (0.05, 0.05, 0.88, 0.02)),
+]
+
+
+class TestMain:
+    """main関数のテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_train_then_saves_model_for_evaluate(
+            self, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+        ) -> None:
+            """学習したモデルを保存し、保存したモデルを評価できる"""
+            # Arrange
+            samples_path = tmp_path / "samples.jsonl"
+            samples_path.write_text(
+                "".join(x.to_json() + "\n" for x in _SAMPLES), encoding="utf-8"
+            )
+            model_path = tmp_path / "model.npz"
+            common_args = ["--samples", str(samples_path), "--model", str(model_path)]
+
+            # Act
+            main(
+                ["train", *common_args, "--eval-fraction", "0", "--n-features", "4096"]
+            )
+            main(["evaluate", *common_args])
+
+            # Assert
+            output = capsys.readouterr().out
+            assert model_path.exists()
+            assert "trained on 5 samples" in output
+            assert "accuracy: 1.000" in output
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        def test_when_no_samples_then_exits(self, tmp_path: Path) -> None:
+            """サンプルが無い場合はエラーで終了する"""
+            # Arrange
+            samples_path = tmp_path / "samples.jsonl"
+            samples_path.write_text("", encoding="utf-8")
+
+            # Act & Assert
+            with pytest.raises(SystemExit):
+                main(
+                    [
+                        "train",
+                        "--samples",
+                        str(samples_path),
+                        "--model",
+                        str(tmp_path / "model.npz"),
+                    ]
+                )
@@ -1,17 +1,39 @@
 """tests/unit/ 以下のテストで使用する pytest の fixture 関数を定義する"""
 
 import os
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
 import pytest
 
-from src.api.dependencies import get_i_typetalk_api
+from src.api.dependencies import (
+    close_i_sentiment_store,
+    get_comprehend_circuit_breaker,
+    get_i_aws_comprehend_api,
+    get_i_typetalk_api,
+)
+from src.core.config import get_settings
 from src.infrastructure.aws.comprehend.aws_comprehend_api_mock import (
     AwsComprehendApiMock,
 )
+from src.infrastructure.typetalk.async_typetalk_api import AsyncTypetalkApi
+from src.infrastructure.typetalk.http_client import (
+    TypetalkTimeouts,
+    create_typetalk_async_http_client,
+)
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
 from src.infrastructure.typetalk.i_typetalk_api import ITypetalkApi
 
 
+@pytest.fixture
+def anyio_backend() -> str:
+    """非同期テストを実行するバックエンドを指定する fixture
+
+    Returns:
+        str: anyio のバックエンド名
+    """
+    return "asyncio"
+
+
 @pytest.fixture(autouse=True)
 def setup_unit_test_settings(
     monkeypatch: pytest.MonkeyPatch,
@@ -20,6 +42,9 @@ def setup_unit_test_settings(
     from src.core.config import get_settings
 
     get_settings.cache_clear()
+    get_i_aws_comprehend_api.cache_clear()
+    get_comprehend_circuit_breaker.cache_clear()
+    close_i_sentiment_store()
 
     # 環境変数 TYPETALK_API_BASE_URL をモックサーバーのURLに上書きする
     # これにより、ユニットテスト中はすべてのAPIリクエストがモックサーバーに向けられる
@@ -29,8 +54,11 @@ def setup_unit_test_settings(
 
     yield
 
-    # テスト完了後、設定のキャッシュをクリアする
+    # テスト完了後、設定と依存関係のキャッシュをクリアする
     get_settings.cache_clear()
+    get_i_aws_comprehend_api.cache_clear()
+    get_comprehend_circuit_breaker.cache_clear()
+    close_i_sentiment_store()
 
 
 @pytest.fixture
@@ -47,6 +75,25 @@ def typetalk_api() -> ITypetalkApi:
     return get_i_typetalk_api()
 
 
+@pytest.fixture
+async def async_typetalk_api() -> AsyncGenerator[IAsyncTypetalkApi, None]:
+    """AsyncTypetalkApiインスタンスを提供する fixture
+
+    Note:
+        非同期HTTPクライアントはテストのイベントループ上で作成し、テスト終了後にクローズする。
+
+    Yields:
+        IAsyncTypetalkApi: AsyncTypetalkApiインスタンス
+    """
+    settings = get_settings()
+    async with create_typetalk_async_http_client(settings) as client:
+        yield AsyncTypetalkApi(
+            settings.typetalk_api_base_url,
+            client=client,
+            timeouts=TypetalkTimeouts.from_settings(settings),
+        )
+
+
 @pytest.fixture(scope="session")
 def aws_comprehend_api_mock() -> AwsComprehendApiMock:
     """AWS Comprehend APIのモックインスタンスを提供する fixture
@@ -0,0 +1,118 @@
+"""サーキットブレーカーのテストケースを定義する"""
+
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class TestCircuitBreaker:
+    """CircuitBreakerクラスのテストケース"""
+
+    @pytest.fixture
+    def clock(self, mocker: MockerFixture) -> Mock:
+        """現在時刻を返す関数のモックを提供する"""
+        return mocker.Mock(return_value=0.0)
+
+    @pytest.fixture
+    def circuit_breaker(self, clock: Mock) -> CircuitBreaker:
+        """2回連続の失敗で遮断し、10秒後に復旧を確認するインスタンスを提供する"""
+        return CircuitBreaker(
+            failure_threshold=2, probe_interval_seconds=10.0, clock=clock
+        )
+
+    @staticmethod
+    def _trip(circuit_breaker: CircuitBreaker) -> None:
+        """失敗を繰り返して遮断させる"""
+        for _ in range(circuit_breaker.failure_threshold):
+            assert circuit_breaker.allow()
+            circuit_breaker.record_failure()
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_success_interleaves_failures_then_stays_closed(
+            self, circuit_breaker: CircuitBreaker
+        ) -> None:
+            """失敗が連続しない場合は遮断しない"""
+            # Act
+            circuit_breaker.record_failure()
+            circuit_breaker.record_success()
+            circuit_breaker.record_failure()
+
+            # Assert
+            assert circuit_breaker.state == CircuitState.CLOSED
+            assert circuit_breaker.allow()
+            assert circuit_breaker.stats.failures == 2
+            assert circuit_breaker.stats.consecutive_failures == 1
+
+        def test_when_probe_succeeds_then_closes(
+            self, circuit_breaker: CircuitBreaker, clock: Mock
+        ) -> None:
+            """確認までの時間が経過した後の呼び出しが成功した場合は閉じる"""
+            # Arrange
+            TestCircuitBreaker._trip(circuit_breaker)
+            clock.return_value = 10.0
+
+            # Act
+            allowed = circuit_breaker.allow()
+            circuit_breaker.record_success()
+
+            # Assert
+            assert allowed
+            assert circuit_breaker.state == CircuitState.CLOSED
+            assert circuit_breaker.stats.probes == 1
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        def test_when_failures_reach_threshold_then_rejects_calls(
+            self, circuit_breaker: CircuitBreaker
+        ) -> None:
+            """連続した失敗が閾値に達した場合は遮断し、呼び出しを許可しない"""
+            # Act
+            TestCircuitBreaker._trip(circuit_breaker)
+
+            # Assert
+            assert circuit_breaker.state == CircuitState.OPEN
+            assert not circuit_breaker.allow()
+            assert circuit_breaker.stats.rejected == 1
+            assert circuit_breaker.stats.opened == 1
+
+        def test_when_half_open_then_allows_only_one_probe(
+            self, circuit_breaker: CircuitBreaker, clock: Mock
+        ) -> None:
+            """復旧の確認中は、確認の呼び出しが終わるまで他の呼び出しを許可しない"""
+            # Arrange
+            TestCircuitBreaker._trip(circuit_breaker)
+            clock.return_value = 10.0
+
+            # Act
+            first = circuit_breaker.allow()
+            second = circuit_breaker.allow()
+            circuit_breaker.release()
+            third = circuit_breaker.allow()
+
+            # Assert
+            assert circuit_breaker.state == CircuitState.HALF_OPEN
+            assert (first, second, third) == (True, False, True)
+
+        def test_when_probe_fails_then_reopens(
+            self, circuit_breaker: CircuitBreaker, clock: Mock
+        ) -> None:
+            """確認の呼び出しが失敗した場合は再び遮断し、確認までの時間を待ち直す"""
+            # Arrange
+            TestCircuitBreaker._trip(circuit_breaker)
+            clock.return_value = 10.0
+            circuit_breaker.allow()
+
+            # Act
+            circuit_breaker.record_failure()
+            clock.return_value = 19.0
+
+            # Assert
+            assert circuit_breaker.state == CircuitState.OPEN
+            assert not circuit_breaker.allow()
+            assert circuit_breaker.stats.opened == 2
@@ -0,0 +1,136 @@
+"""リクエストのヘッジの仕組みのテストケースを定義する"""
+
+import asyncio
+
+import pytest
+
+from src.core.hedging import RequestHedger
+
+pytestmark = pytest.mark.anyio
+
+
+class _Calls:
+    """呼び出しごとに指定の処理を実行し、キャンセルされた回数を記録する関数"""
+
+    def __init__(self, *behaviors: str) -> None:
+        self.behaviors = list(behaviors)
+        self.count = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> str:
+        behavior = self.behaviors[self.count]
+        self.count += 1
+        try:
+            if behavior == "slow":
+                await asyncio.sleep(10)
+            elif behavior == "slow_error":
+                await asyncio.sleep(0.05)
+                raise RuntimeError("slow_error")
+            elif behavior == "error":
+                raise RuntimeError("error")
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"{behavior} {self.count}"
+
+
+async def _warmed_up_hedger(budget_ratio: float = 1.0) -> RequestHedger:
+    """レイテンシを1回計測し、ヘッジを始められる状態のインスタンスを作成する"""
+    hedger = RequestHedger(
+        budget_ratio=budget_ratio,
+        min_delay_seconds=0.01,
+        min_samples=1,
+    )
+    await hedger.run(_Calls("fast"))
+    return hedger
+
+
+class TestRequestHedger:
+    """RequestHedgerクラスのテストケース"""
+
+    class TestRun:
+        """runメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            async def test_when_samples_insufficient_then_does_not_hedge(
+                self,
+            ) -> None:
+                """レイテンシの計測数が足りない場合はヘッジしない"""
+                # Arrange
+                hedger = RequestHedger(min_samples=2)
+                func = _Calls("fast")
+
+                # Act
+                result = await hedger.run(func)
+
+                # Assert
+                assert result == "fast 1"
+                assert hedger.stats.delay_ms is None
+                assert hedger.stats.hedged == 0
+
+            async def test_when_primary_is_slow_then_hedge_wins(self) -> None:
+                """待ち時間を過ぎても結果が返らない場合はヘッジし、先に返った結果を使う"""
+                # Arrange
+                hedger = await _warmed_up_hedger()
+                func = _Calls("slow", "fast")
+
+                # Act
+                result = await hedger.run(func)
+                # キャンセルしたタスクの終了を待つ
+                await asyncio.sleep(0)
+
+                # Assert
+                assert result == "fast 2"
+                assert func.cancelled == 1
+                stats = hedger.stats
+                assert (stats.calls, stats.hedged, stats.wins) == (2, 1, 1)
+
+            async def test_when_primary_fails_after_hedge_then_returns_hedge_result(
+                self,
+            ) -> None:
+                """ヘッジ後に最初のリクエストが失敗した場合はヘッジの結果を返す"""
+                # Arrange
+                hedger = await _warmed_up_hedger()
+                func = _Calls("slow_error", "fast")
+
+                # Act
+                result = await hedger.run(func)
+
+                # Assert
+                assert result == "fast 2"
+                assert hedger.stats.wins == 1
+
+            async def test_when_budget_exhausted_then_waits_for_primary(
+                self,
+            ) -> None:
+                """予算が足りない場合はヘッジせずに最初のリクエストを待つ"""
+                # Arrange
+                hedger = await _warmed_up_hedger(budget_ratio=0.0)
+                func = _Calls("slow_error")
+
+                # Act
+                with pytest.raises(RuntimeError):
+                    await hedger.run(func)
+
+                # Assert
+                assert func.count == 1
+                assert hedger.stats.budget_exhausted == 1
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            async def test_when_both_fail_then_raises_primary_error(self) -> None:
+                """両方のリクエストが失敗した場合は最初のリクエストの例外を送出する"""
+                # Arrange
+                hedger = await _warmed_up_hedger()
+                func = _Calls("slow_error", "error")
+
+                # Act
+                with pytest.raises(RuntimeError) as exc_info:
+                    await hedger.run(func)
+
+                # Assert
+                assert str(exc_info.value) == "slow_error"
+                assert hedger.stats.hedged == 1
@@ -0,0 +1,94 @@
+"""同期版AWS Comprehend APIの非同期アダプターのテストケースを定義する"""
+
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.aws.comprehend.async_aws_comprehend_api import (
+    AsyncAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.aws_comprehend_api_mock import (
+    AwsComprehendApiMock,
+)
+from src.infrastructure.aws.comprehend.aws_comprehend_models import SentimentEnum
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from tests.unit.mocks.aws.comprehend.aws_comprehend_api_mock_error import (
+    AwsComprehendApiMockError,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class TestAsyncAwsComprehendApi:
+    """AsyncAwsComprehendApiクラスのテストケース"""
+
+    class TestBatchDetectSentiment:
+        """batch_detect_sentimentメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            async def test_when_texts_provided_then_returns_wrapped_api_result(
+                self,
+                aws_comprehend_api_mock: AwsComprehendApiMock,
+            ) -> None:
+                """同期版APIの感情分析結果がそのまま返される"""
+                # Arrange
+                async_api = AsyncAwsComprehendApi(aws_comprehend_api_mock)
+
+                # Act
+                response = await async_api.batch_detect_sentiment(["a", "b"])
+
+                # Assert
+                assert [x.index for x in response.result_list] == [0, 1]
+                assert all(
+                    x.sentiment == SentimentEnum.POSITIVE for x in response.result_list
+                )
+
+            async def test_when_called_then_runs_outside_event_loop_thread(
+                self,
+                mocker: MockerFixture,
+                aws_comprehend_api_mock: AwsComprehendApiMock,
+            ) -> None:
+                """同期版APIはイベントループとは別のスレッドで呼び出される"""
+                # Arrange
+                called_threads: list[threading.Thread] = []
+                original = aws_comprehend_api_mock.batch_detect_sentiment
+
+                def record_thread(text_list: list[str]) -> object:
+                    called_threads.append(threading.current_thread())
+                    return original(text_list)
+
+                mocker.patch.object(
+                    aws_comprehend_api_mock,
+                    "batch_detect_sentiment",
+                    side_effect=record_thread,
+                )
+                async_api = AsyncAwsComprehendApi(aws_comprehend_api_mock)
+
+                # Act
+                await async_api.batch_detect_sentiment(["a"])
+
+                # Assert
+                assert called_threads[0] is not threading.current_thread()
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            async def test_when_wrapped_api_raises_then_propagates_error(self) -> None:
+                """同期版APIで発生したComprehendErrorがそのまま送出される"""
+                # Arrange
+                async_api = AsyncAwsComprehendApi(AwsComprehendApiMockError())
+
+                # Act
+                with pytest.raises(ComprehendError) as exc:
+                    await async_api.batch_detect_sentiment(["a"])
+
+                # Assert
+                assert (
+                    exc.value.error_type == ComprehendErrorType.TEXT_SIZE_LIMIT_EXCEEDED
+                )
@@ -1,5 +1,6 @@
 """AWS Comprehend APIのテストケースを定義する"""
 
+from collections.abc import Generator
 from unittest.mock import Mock
 
 import pytest
@@ -11,6 +12,9 @@ from src.infrastructure.aws.comprehend.aws_comprehend_models import (
     BatchDetectSentimentResponse,
     SentimentEnum,
 )
+from src.infrastructure.aws.comprehend.comprehend_client import (
+    reset_comprehend_client,
+)
 from src.infrastructure.aws.comprehend.exceptions import (
     ComprehendError,
     ComprehendErrorType,
@@ -24,11 +28,18 @@ class TestAwsComprehendApi:
         """batch_detect_sentimentメソッドのテストケース"""
 
         @pytest.fixture
-        def mock_comprehend_client(self, mocker: MockerFixture) -> Mock:
-            """AWS Comprehendクライアントのモックを提供する"""
+        def mock_comprehend_client(
+            self, mocker: MockerFixture
+        ) -> Generator[Mock, None, None]:
+            """AWS Comprehendクライアントのモックを提供する
+
+            共有クライアントをテストの前後で破棄し、モックが使用されるようにする。
+            """
             mock_client = mocker.Mock()
             mocker.patch("boto3.client", return_value=mock_client)
-            return mock_client
+            reset_comprehend_client()
+            yield mock_client
+            reset_comprehend_client()
 
         class TestHappyCases:
             """正常系のテストケース"""
@@ -281,7 +292,7 @@ class TestAwsComprehendApi:
                 expected_error_type: ComprehendErrorType,
                 expected_status_code: int,
             ) -> None:
-                """AWS SDKのエラーエラーが発生した場合にComprehendErrorに変換して発生させる"""
+                """AWS SDKのエラーはComprehendErrorに変換して発生させる"""
                 # Arrange
                 text_list = ["テスト"]
                 mock_comprehend_client.batch_detect_sentiment.side_effect = ClientError(
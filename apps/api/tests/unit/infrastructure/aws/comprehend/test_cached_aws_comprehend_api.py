@@ -0,0 +1,224 @@
+"""感情分析の結果をキャッシュするクラスのテストケースを定義する"""
+
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentEnum,
+    SentimentError,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.cached_aws_comprehend_api import (
+    CachedAwsComprehendApi,
+    SentimentCacheStats,
+)
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+
+
+def _detect_sentiment(text_list: list[str]) -> BatchDetectSentimentResponse:
+    """テキストに応じた感情を返す感情分析のスタブ
+
+    "NG" を含むテキストはネガティブ、"error" で始まるテキストはエラーとして返す。
+    """
+    return BatchDetectSentimentResponse(
+        result_list=[
+            SentimentResult(
+                index=index,
+                sentiment=(
+                    SentimentEnum.NEGATIVE if "NG" in text else SentimentEnum.POSITIVE
+                ),
+                sentiment_score={"Positive": 1.0},
+            )
+            for index, text in enumerate(text_list)
+            if not text.startswith("error")
+        ],
+        error_list=[
+            SentimentError(
+                index=index,
+                error_code="INTERNAL_SERVER_ERROR",
+                error_message=text,
+            )
+            for index, text in enumerate(text_list)
+            if text.startswith("error")
+        ],
+    )
+
+
+class TestCachedAwsComprehendApi:
+    """CachedAwsComprehendApiクラスのテストケース"""
+
+    class TestBatchDetectSentiment:
+        """batch_detect_sentimentメソッドのテストケース"""
+
+        @pytest.fixture
+        def inner_api(self, mocker: MockerFixture) -> Mock:
+            """呼び出し対象のAPIのモックを提供する"""
+            return mocker.Mock(
+                spec=IAwsComprehendApi,
+                batch_detect_sentiment=Mock(side_effect=_detect_sentiment),
+            )
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            def test_when_texts_cached_then_sends_only_misses(
+                self, inner_api: Mock
+            ) -> None:
+                """キャッシュに無いテキストのみが送信され、結果は元の順序で返される"""
+                # Arrange
+                api = CachedAwsComprehendApi(inner_api)
+                api.batch_detect_sentiment(["OK1", "NG2"])
+
+                # Act
+                result = api.batch_detect_sentiment(["NG3", "OK1", "NG2", "OK4"])
+
+                # Assert
+                inner_api.batch_detect_sentiment.assert_called_with(["NG3", "OK4"])
+                assert [(x.index, x.sentiment) for x in result.result_list] == [
+                    (0, SentimentEnum.NEGATIVE),
+                    (1, SentimentEnum.POSITIVE),
+                    (2, SentimentEnum.NEGATIVE),
+                    (3, SentimentEnum.POSITIVE),
+                ]
+                assert api.stats == SentimentCacheStats(
+                    hits=2, misses=4, evictions=0, size=4
+                )
+
+            def test_when_all_texts_cached_then_does_not_call_api(
+                self, inner_api: Mock
+            ) -> None:
+                """全てのテキストがキャッシュにある場合はAPIを呼び出さない"""
+                # Arrange
+                api = CachedAwsComprehendApi(inner_api)
+                api.batch_detect_sentiment(["OK", "NG"])
+                inner_api.batch_detect_sentiment.reset_mock()
+
+                # Act
+                result = api.batch_detect_sentiment(["NG", "OK"])
+
+                # Assert
+                inner_api.batch_detect_sentiment.assert_not_called()
+                assert [x.sentiment for x in result.result_list] == [
+                    SentimentEnum.NEGATIVE,
+                    SentimentEnum.POSITIVE,
+                ]
+
+            @pytest.mark.parametrize(
+                "text_list",
+                [
+                    (["テスト", "テスト"]),
+                    (["ﾃｽﾄ", "テスト"]),
+                    (["テスト ", " テスト"]),
+                ],
+                ids=[
+                    # 同じテキストは1回だけ送信される
+                    "when_same_texts_provided_then_sends_once",
+                    # 半角と全角のカタカナは同じテキストとして扱われる
+                    "when_width_variants_provided_then_sends_once",
+                    # 前後の空白のみが異なるテキストは同じテキストとして扱われる
+                    "when_surrounding_spaces_differ_then_sends_once",
+                ],
+            )
+            def test_when_equivalent_texts_provided_then_sends_once(
+                self, inner_api: Mock, text_list: list[str]
+            ) -> None:
+                """正規化して同じになるテキストは1回だけ送信され、全ての位置に結果が返される"""
+                # Arrange
+                api = CachedAwsComprehendApi(inner_api)
+
+                # Act
+                result = api.batch_detect_sentiment(text_list)
+
+                # Assert
+                inner_api.batch_detect_sentiment.assert_called_once_with([text_list[0]])
+                assert [x.index for x in result.result_list] == [0, 1]
+
+            def test_when_max_size_exceeded_then_evicts_least_recently_used(
+                self, inner_api: Mock
+            ) -> None:
+                """上限を超えた場合は最も長く使われていないエントリが破棄される"""
+                # Arrange
+                api = CachedAwsComprehendApi(inner_api, max_size=2)
+                api.batch_detect_sentiment(["A", "B"])
+                # A を参照して B を最も長く使われていないエントリにする
+                api.batch_detect_sentiment(["A"])
+
+                # Act
+                api.batch_detect_sentiment(["C"])
+                api.batch_detect_sentiment(["A", "B"])
+
+                # Assert
+                inner_api.batch_detect_sentiment.assert_called_with(["B"])
+                assert api.stats.evictions == 2
+                assert api.stats.size == 2
+
+            def test_when_ttl_expired_then_analyzes_again(
+                self, mocker: MockerFixture, inner_api: Mock
+            ) -> None:
+                """有効期限を過ぎたエントリは破棄され、再度感情分析が行われる"""
+                # Arrange
+                clock = mocker.Mock(return_value=0.0)
+                api = CachedAwsComprehendApi(inner_api, ttl_seconds=60, clock=clock)
+                api.batch_detect_sentiment(["テスト"])
+
+                # Act
+                clock.return_value = 59.0
+                api.batch_detect_sentiment(["テスト"])
+                clock.return_value = 60.0
+                api.batch_detect_sentiment(["テスト"])
+
+                # Assert
+                assert inner_api.batch_detect_sentiment.call_count == 2
+                assert api.stats == SentimentCacheStats(
+                    hits=1, misses=2, evictions=1, size=1
+                )
+
+            def test_when_api_returns_errors_then_does_not_cache_errors(
+                self, inner_api: Mock
+            ) -> None:
+                """エラーは元の位置で返され、キャッシュされない"""
+                # Arrange
+                api = CachedAwsComprehendApi(inner_api)
+                api.batch_detect_sentiment(["OK"])
+
+                # Act
+                result = api.batch_detect_sentiment(["error", "OK", "error"])
+
+                # Assert
+                assert [x.index for x in result.result_list] == [1]
+                assert [x.index for x in result.error_list] == [0, 2]
+                api.batch_detect_sentiment(["error"])
+                inner_api.batch_detect_sentiment.assert_called_with(["error"])
+                assert api.stats.size == 1
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            def test_when_api_raises_error_then_propagates_error(
+                self, mocker: MockerFixture
+            ) -> None:
+                """APIでエラーが発生した場合にそのエラーが送出され、キャッシュされない"""
+                # Arrange
+                inner_api = mocker.Mock(
+                    spec=IAwsComprehendApi,
+                    batch_detect_sentiment=Mock(
+                        side_effect=ComprehendError(
+                            ComprehendErrorType.INVALID_REQUEST,
+                            "テキストリストが空です。",
+                        )
+                    ),
+                )
+                api = CachedAwsComprehendApi(inner_api)
+
+                # Act & Assert
+                with pytest.raises(ComprehendError):
+                    api.batch_detect_sentiment([])
+
+                assert api.stats.size == 0
@@ -0,0 +1,189 @@
+"""テキストリストを分割して感情分析を行うクラスのテストケースを定義する"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentEnum,
+    SentimentError,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.chunked_aws_comprehend_api import (
+    ChunkedAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+
+
+def _detect_sentiment(text_list: list[str]) -> BatchDetectSentimentResponse:
+    """チャンク内のインデックスで結果を返す感情分析のスタブ
+
+    "error" で始まるテキストはエラーとして返す。
+    """
+    return BatchDetectSentimentResponse(
+        result_list=[
+            SentimentResult(
+                index=index,
+                sentiment=SentimentEnum.POSITIVE,
+                sentiment_score={"Positive": 1.0},
+            )
+            for index, text in enumerate(text_list)
+            if not text.startswith("error")
+        ],
+        error_list=[
+            SentimentError(
+                index=index,
+                error_code="INTERNAL_SERVER_ERROR",
+                error_message=text,
+            )
+            for index, text in enumerate(text_list)
+            if text.startswith("error")
+        ],
+    )
+
+
+class TestChunkedAwsComprehendApi:
+    """ChunkedAwsComprehendApiクラスのテストケース"""
+
+    class TestBatchDetectSentiment:
+        """batch_detect_sentimentメソッドのテストケース"""
+
+        @pytest.fixture
+        def inner_api(self, mocker: MockerFixture) -> Mock:
+            """呼び出し対象のAPIのモックを提供する"""
+            return mocker.Mock(
+                spec=IAwsComprehendApi,
+                batch_detect_sentiment=Mock(side_effect=_detect_sentiment),
+            )
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            @pytest.mark.parametrize(
+                ("text_count", "expected_chunk_sizes"),
+                [
+                    (1, [1]),
+                    (25, [25]),
+                    (26, [25, 1]),
+                    (200, [25] * 8),
+                ],
+                ids=[
+                    # 1件のテキストは分割せずに送信される
+                    "when_single_text_provided_then_sends_without_chunking",
+                    # 上限ちょうどのテキストは分割せずに送信される
+                    "when_chunk_size_texts_provided_then_sends_without_chunking",
+                    # 上限を1件超えるテキストは2つのチャンクに分割される
+                    "when_chunk_size_exceeded_by_one_then_splits_into_two_chunks",
+                    # 200件のテキストは25件ずつのチャンクに分割される
+                    "when_200_texts_provided_then_splits_into_25_item_chunks",
+                ],
+            )
+            def test_when_texts_provided_then_splits_into_chunks(
+                self,
+                inner_api: Mock,
+                text_count: int,
+                expected_chunk_sizes: list[int],
+            ) -> None:
+                """テキストリストが上限ごとのチャンクに分割されて送信される"""
+                # Arrange
+                api = ChunkedAwsComprehendApi(inner_api, chunk_size=25)
+                text_list = [f"テスト{i}" for i in range(text_count)]
+
+                # Act
+                result = api.batch_detect_sentiment(text_list)
+
+                # Assert
+                chunk_sizes = sorted(
+                    (
+                        len(call.args[0])
+                        for call in inner_api.batch_detect_sentiment.call_args_list
+                    ),
+                    reverse=True,
+                )
+                assert chunk_sizes == expected_chunk_sizes
+                assert [x.index for x in result.result_list] == list(range(text_count))
+
+            def test_when_chunks_contain_errors_then_remaps_indices(
+                self, inner_api: Mock
+            ) -> None:
+                """各チャンクの結果とエラーのインデックスが元の位置に付け替えられる"""
+                # Arrange
+                api = ChunkedAwsComprehendApi(inner_api, chunk_size=3)
+                text_list = ["a", "error1", "b", "c", "d", "error5", "error6"]
+
+                # Act
+                result = api.batch_detect_sentiment(text_list)
+
+                # Assert
+                assert [x.index for x in result.result_list] == [0, 2, 3, 4]
+                assert [(x.index, x.error_message) for x in result.error_list] == [
+                    (1, "error1"),
+                    (5, "error5"),
+                    (6, "error6"),
+                ]
+
+            def test_when_multiple_chunks_provided_then_sends_concurrently(
+                self, mocker: MockerFixture
+            ) -> None:
+                """複数のチャンクが並列に送信される"""
+                # Arrange
+                barrier = threading.Barrier(4, timeout=5)
+
+                def detect_after_barrier(
+                    text_list: list[str],
+                ) -> BatchDetectSentimentResponse:
+                    # 4チャンクが同時に実行されていなければタイムアウトする
+                    barrier.wait()
+                    return _detect_sentiment(text_list)
+
+                inner_api = mocker.Mock(
+                    spec=IAwsComprehendApi,
+                    batch_detect_sentiment=Mock(side_effect=detect_after_barrier),
+                )
+                api = ChunkedAwsComprehendApi(inner_api, chunk_size=25, max_workers=4)
+
+                # Act
+                result = api.batch_detect_sentiment(["テスト"] * 100)
+
+                # Assert
+                assert len(result.result_list) == 100
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            def test_when_chunk_raises_error_then_propagates_error(
+                self, mocker: MockerFixture
+            ) -> None:
+                """いずれかのチャンクでエラーが発生した場合にそのエラーが送出される"""
+
+                # Arrange
+                def detect_or_raise(
+                    text_list: list[str],
+                ) -> BatchDetectSentimentResponse:
+                    if "NG" in text_list:
+                        raise ComprehendError(
+                            ComprehendErrorType.TEXT_SIZE_LIMIT_EXCEEDED,
+                            "テキストサイズが制限を超えています。最大: 5000文字",
+                        )
+                    return _detect_sentiment(text_list)
+
+                inner_api = mocker.Mock(
+                    spec=IAwsComprehendApi,
+                    batch_detect_sentiment=Mock(side_effect=detect_or_raise),
+                )
+                api = ChunkedAwsComprehendApi(inner_api, chunk_size=25)
+
+                # Act & Assert
+                with pytest.raises(ComprehendError) as exc:
+                    api.batch_detect_sentiment(["テスト"] * 30 + ["NG"])
+
+                assert (
+                    exc.value.error_type == ComprehendErrorType.TEXT_SIZE_LIMIT_EXCEEDED
+                )
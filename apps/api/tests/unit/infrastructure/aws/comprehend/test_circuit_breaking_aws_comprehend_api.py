@@ -0,0 +1,77 @@
+"""障害が続くAWS Comprehend APIへの呼び出しを遮断するクラスのテストケースを定義する"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.circuit_breaker import CircuitBreaker, CircuitState
+from src.infrastructure.aws.comprehend.circuit_breaking_aws_comprehend_api import (
+    CircuitBreakingAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+
+
+class TestCircuitBreakingAwsComprehendApi:
+    """CircuitBreakingAwsComprehendApiクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_invalid_request_then_does_not_count_failure(
+            self, mocker: MockerFixture
+        ) -> None:
+            """リクエストの誤りによるエラーは障害として数えない"""
+            # Arrange
+            inner_api = mocker.Mock(spec=IAwsComprehendApi)
+            inner_api.batch_detect_sentiment.side_effect = ComprehendError(
+                ComprehendErrorType.TEXT_SIZE_LIMIT_EXCEEDED, "Text too long"
+            )
+            circuit_breaker = CircuitBreaker(failure_threshold=1)
+            api = CircuitBreakingAwsComprehendApi(inner_api, circuit_breaker)
+
+            # Act
+            with pytest.raises(ComprehendError):
+                api.batch_detect_sentiment(["text"])
+
+            # Assert
+            assert circuit_breaker.state == CircuitState.CLOSED
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        @pytest.mark.parametrize(
+            "error_type",
+            [ComprehendErrorType.INTERNAL_SERVER, ComprehendErrorType.THROTTLING],
+            ids=[
+                # サーバー側のエラーは障害として数える
+                "when_internal_server_error_then_opens",
+                # 再試行しても解消しないスロットリングは障害として数える
+                "when_throttling_then_opens",
+            ],
+        )
+        def test_when_upstream_fails_then_raises_circuit_open_error(
+            self, mocker: MockerFixture, error_type: ComprehendErrorType
+        ) -> None:
+            """障害が続いた後は AWS Comprehend API を呼び出さずにエラーとする"""
+            # Arrange
+            inner_api = mocker.Mock(spec=IAwsComprehendApi)
+            inner_api.batch_detect_sentiment.side_effect = ComprehendError(
+                error_type, "error"
+            )
+            api = CircuitBreakingAwsComprehendApi(
+                inner_api, CircuitBreaker(failure_threshold=1)
+            )
+            with pytest.raises(ComprehendError):
+                api.batch_detect_sentiment(["text"])
+
+            # Act
+            with pytest.raises(ComprehendError) as exc:
+                api.batch_detect_sentiment(["text"])
+
+            # Assert
+            assert exc.value.error_type == ComprehendErrorType.CIRCUIT_OPEN
+            assert exc.value.status_code == 503
+            inner_api.batch_detect_sentiment.assert_called_once()
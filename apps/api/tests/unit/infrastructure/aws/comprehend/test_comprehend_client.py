@@ -0,0 +1,125 @@
+"""共有AWS Comprehendクライアントのテストケースを定義する"""
+
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.config import get_settings
+from src.infrastructure.aws.comprehend.comprehend_client import (
+    create_comprehend_client_config,
+    get_comprehend_client,
+    reset_comprehend_client,
+    warm_up_comprehend_client,
+)
+
+
+class TestComprehendClient:
+    """共有AWS Comprehendクライアントのテストケース"""
+
+    @pytest.fixture(autouse=True)
+    def mock_boto3_client(self, mocker: MockerFixture) -> Generator[Mock, None, None]:
+        """boto3.client をモックに置き換え、テストの前後で共有クライアントを破棄する"""
+        mock_boto3_client = mocker.patch(
+            "boto3.client", side_effect=lambda *args, **kwargs: mocker.Mock()
+        )
+        reset_comprehend_client()
+        yield mock_boto3_client
+        reset_comprehend_client()
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_called_multiple_times_then_returns_same_client(
+            self, mock_boto3_client: Mock
+        ) -> None:
+            """複数回呼び出してもクライアントは一度だけ作成され同じインスタンスが返される"""
+            # Act
+            first = get_comprehend_client()
+            second = get_comprehend_client()
+
+            # Assert
+            assert first is second
+            mock_boto3_client.assert_called_once()
+            assert mock_boto3_client.call_args.args == ("comprehend",)
+
+        def test_when_called_from_multiple_threads_then_creates_client_once(
+            self, mock_boto3_client: Mock
+        ) -> None:
+            """複数スレッドから同時に呼び出してもクライアントは一度だけ作成される"""
+            # Act
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                clients = list(
+                    executor.map(lambda _: get_comprehend_client(), range(32))
+                )
+
+            # Assert
+            assert all(client is clients[0] for client in clients)
+            mock_boto3_client.assert_called_once()
+
+        def test_when_reset_then_next_call_creates_new_client(
+            self, mock_boto3_client: Mock
+        ) -> None:
+            """破棄後の呼び出しでは新しいクライアントが作成される"""
+            # Arrange
+            first = get_comprehend_client()
+
+            # Act
+            reset_comprehend_client()
+            second = get_comprehend_client()
+
+            # Assert
+            assert first is not second
+            assert mock_boto3_client.call_count == 2
+
+        def test_when_warmed_up_then_client_is_created_in_advance(
+            self, mock_boto3_client: Mock
+        ) -> None:
+            """事前作成後の呼び出しでは新たにクライアントが作成されない"""
+            # Act
+            warm_up_comprehend_client()
+            get_comprehend_client()
+
+            # Assert
+            mock_boto3_client.assert_called_once()
+
+        def test_when_settings_provided_then_config_reflects_settings(
+            self, monkeypatch: pytest.MonkeyPatch
+        ) -> None:
+            """環境設定の値がクライアント設定に反映される"""
+            # Arrange
+            monkeypatch.setenv("COMPREHEND_MAX_POOL_CONNECTIONS", "32")
+            monkeypatch.setenv("COMPREHEND_CONNECT_TIMEOUT", "1.5")
+            monkeypatch.setenv("COMPREHEND_READ_TIMEOUT", "7.0")
+            monkeypatch.setenv("COMPREHEND_RETRY_MODE", "adaptive")
+            monkeypatch.setenv("COMPREHEND_MAX_ATTEMPTS", "5")
+            monkeypatch.setenv("COMPREHEND_TCP_KEEPALIVE", "false")
+            monkeypatch.setenv("COMPREHEND_GOVERNOR_ENABLED", "false")
+            get_settings.cache_clear()
+
+            # Act
+            config = create_comprehend_client_config(get_settings())
+
+            # Assert
+            assert config.max_pool_connections == 32
+            assert config.connect_timeout == 1.5
+            assert config.read_timeout == 7.0
+            assert config.retries == {"mode": "adaptive", "max_attempts": 5}
+            assert config.tcp_keepalive is False
+
+        def test_when_governor_enabled_then_botocore_does_not_retry(
+            self, monkeypatch: pytest.MonkeyPatch
+        ) -> None:
+            """送信の制御が有効な場合は botocore の最大試行回数が1回となる"""
+            # Arrange
+            monkeypatch.setenv("COMPREHEND_MAX_ATTEMPTS", "5")
+            monkeypatch.setenv("COMPREHEND_GOVERNOR_ENABLED", "true")
+            get_settings.cache_clear()
+
+            # Act
+            config = create_comprehend_client_config(get_settings())
+
+            # Assert
+            assert config.retries == {"mode": "standard", "max_attempts": 1}
@@ -0,0 +1,270 @@
+"""AWS Comprehend APIへの送信を制御するクラスのテストケースを定義する"""
+
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentEnum,
+    SentimentError,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.aws.comprehend.governed_aws_comprehend_api import (
+    GovernedAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+
+
+def _response(
+    text_list: list[str], error_codes: dict[str, str] | None = None
+) -> BatchDetectSentimentResponse:
+    """エラーコードを指定したテキストはエラーとし、それ以外は肯定とするレスポンスを作成する"""
+    error_codes = error_codes or {}
+    return BatchDetectSentimentResponse(
+        result_list=[
+            SentimentResult(
+                index=index,
+                sentiment=SentimentEnum.POSITIVE,
+                sentiment_score={"Positive": 1.0},
+            )
+            for index, text in enumerate(text_list)
+            if text not in error_codes
+        ],
+        error_list=[
+            SentimentError(
+                index=index, error_code=error_codes[text], error_message=text
+            )
+            for index, text in enumerate(text_list)
+            if text in error_codes
+        ],
+    )
+
+
+def _throttling_error() -> ComprehendError:
+    """スロットリングのエラーを作成する"""
+    return ComprehendError(ComprehendErrorType.THROTTLING, "Rate exceeded")
+
+
+class TestGovernedAwsComprehendApi:
+    """GovernedAwsComprehendApiクラスのテストケース"""
+
+    @pytest.fixture
+    def clock(self, mocker: MockerFixture) -> Mock:
+        """現在時刻を返す関数のモックを提供する"""
+        return mocker.Mock(return_value=0.0)
+
+    @pytest.fixture
+    def sleep(self, mocker: MockerFixture, clock: Mock) -> Mock:
+        """現在時刻を進める待機関数のモックを提供する"""
+
+        def advance(seconds: float) -> None:
+            clock.return_value += seconds
+
+        return mocker.Mock(side_effect=advance)
+
+    @pytest.fixture
+    def inner_api(self, mocker: MockerFixture) -> Mock:
+        """呼び出し対象のAPIのモックを提供する"""
+        return mocker.Mock(spec=IAwsComprehendApi)
+
+    @pytest.fixture
+    def api(
+        self, inner_api: Mock, clock: Mock, sleep: Mock
+    ) -> GovernedAwsComprehendApi:
+        """時刻と待機を差し替え、バックオフの上限まで待機するインスタンスを提供する"""
+        return GovernedAwsComprehendApi(
+            inner_api,
+            transactions_per_second=10.0,
+            burst=2,
+            max_retries=2,
+            backoff_base_seconds=0.1,
+            backoff_max_seconds=1.0,
+            clock=clock,
+            sleep=sleep,
+            jitter=lambda low, high: high,
+        )
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_burst_exhausted_then_waits_for_token(
+            self, api: GovernedAwsComprehendApi, inner_api: Mock, sleep: Mock
+        ) -> None:
+            """連続で送信できる回数を超えた場合は次のトークンまで待機する"""
+            # Arrange
+            inner_api.batch_detect_sentiment.side_effect = _response
+
+            # Act
+            for _ in range(3):
+                api.batch_detect_sentiment(["テスト"])
+
+            # Assert
+            sleep.assert_called_once_with(pytest.approx(0.1))
+            stats = api.stats
+            assert (stats.requests, stats.max_queue_depth) == (3, 1)
+            assert stats.queue_depth == 0
+
+        def test_when_throttled_then_retries_with_backoff(
+            self, api: GovernedAwsComprehendApi, inner_api: Mock, sleep: Mock
+        ) -> None:
+            """スロットリングの場合は指数バックオフで待機した後に再試行する"""
+            # Arrange
+            inner_api.batch_detect_sentiment.side_effect = [
+                _throttling_error(),
+                _throttling_error(),
+                _response(["テスト"]),
+            ]
+
+            # Act
+            response = api.batch_detect_sentiment(["テスト"])
+
+            # Assert
+            assert len(response.result_list) == 1
+            backoffs = [x.args[0] for x in sleep.call_args_list]
+            assert backoffs[0] == pytest.approx(0.1)
+            assert backoffs[1] == pytest.approx(0.2)
+            stats = api.stats
+            assert (stats.throttled, stats.retries) == (2, 2)
+            assert stats.throttle_rate == pytest.approx(2 / 3)
+
+        def test_when_item_errors_returned_then_retries_only_those_texts(
+            self, api: GovernedAwsComprehendApi, inner_api: Mock
+        ) -> None:
+            """一時的なエラーのテキストだけを再試行し、結果を元のインデックスに戻す"""
+            # Arrange
+            text_list = ["a", "retry", "invalid", "retry2"]
+            inner_api.batch_detect_sentiment.side_effect = [
+                _response(
+                    text_list,
+                    {
+                        "retry": "INTERNAL_SERVER_ERROR",
+                        "invalid": "TEXT_SIZE_LIMIT_EXCEEDED",
+                        "retry2": "INTERNAL_SERVER_ERROR",
+                    },
+                ),
+                _response(["retry", "retry2"]),
+            ]
+
+            # Act
+            response = api.batch_detect_sentiment(text_list)
+
+            # Assert
+            inner_api.batch_detect_sentiment.assert_called_with(["retry", "retry2"])
+            assert [x.index for x in response.result_list] == [0, 1, 3]
+            assert [(x.index, x.error_code) for x in response.error_list] == [
+                (2, "TEXT_SIZE_LIMIT_EXCEEDED")
+            ]
+            assert api.stats.item_retries == 2
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        def test_when_throttled_beyond_max_retries_then_raises_error(
+            self, api: GovernedAwsComprehendApi, inner_api: Mock
+        ) -> None:
+            """再試行の上限を超えてスロットリングされた場合はエラーを送出する"""
+            # Arrange
+            inner_api.batch_detect_sentiment.side_effect = _throttling_error()
+
+            # Act
+            with pytest.raises(ComprehendError) as exc_info:
+                api.batch_detect_sentiment(["テスト"])
+
+            # Assert
+            assert exc_info.value.error_type == ComprehendErrorType.THROTTLING
+            assert inner_api.batch_detect_sentiment.call_count == 3
+            assert api.stats.failures == 1
+
+        def test_when_retry_time_exhausted_then_raises_before_max_retries(
+            self, inner_api: Mock, clock: Mock, sleep: Mock
+        ) -> None:
+            """次のバックオフで再試行の時間の上限を超える場合は再試行せずに送出する"""
+            # Arrange
+            api = GovernedAwsComprehendApi(
+                inner_api,
+                max_retries=5,
+                backoff_base_seconds=1.0,
+                backoff_max_seconds=1.0,
+                max_total_retry_seconds=2.5,
+                clock=clock,
+                sleep=sleep,
+                jitter=lambda low, high: high,
+            )
+            inner_api.batch_detect_sentiment.side_effect = _throttling_error()
+
+            # Act
+            with pytest.raises(ComprehendError) as exc_info:
+                api.batch_detect_sentiment(["テスト"])
+
+            # Assert
+            assert exc_info.value.error_type == ComprehendErrorType.THROTTLING
+            assert inner_api.batch_detect_sentiment.call_count == 3
+            assert [x.args[0] for x in sleep.call_args_list] == [1.0, 1.0]
+            assert api.stats.failures == 1
+
+        def test_when_retry_time_exhausted_then_returns_item_errors(
+            self, inner_api: Mock, clock: Mock, sleep: Mock
+        ) -> None:
+            """再試行の時間の上限に達した場合は、失敗したテキストを error_list で返す"""
+            # Arrange
+            api = GovernedAwsComprehendApi(
+                inner_api,
+                max_retries=5,
+                backoff_base_seconds=1.0,
+                backoff_max_seconds=1.0,
+                max_total_retry_seconds=1.5,
+                clock=clock,
+                sleep=sleep,
+                jitter=lambda low, high: high,
+            )
+            inner_api.batch_detect_sentiment.side_effect = lambda text_list: _response(
+                text_list, {"retry": "INTERNAL_SERVER_ERROR"}
+            )
+
+            # Act
+            response = api.batch_detect_sentiment(["a", "retry"])
+
+            # Assert
+            assert inner_api.batch_detect_sentiment.call_count == 2
+            assert [x.index for x in response.error_list] == [1]
+            assert api.stats.item_retries == 1
+
+        def test_when_other_error_occurs_then_raises_without_retry(
+            self, api: GovernedAwsComprehendApi, inner_api: Mock
+        ) -> None:
+            """スロットリング以外のエラーは再試行せずに送出する"""
+            # Arrange
+            inner_api.batch_detect_sentiment.side_effect = ComprehendError(
+                ComprehendErrorType.INTERNAL_SERVER, "error"
+            )
+
+            # Act
+            with pytest.raises(ComprehendError):
+                api.batch_detect_sentiment(["テスト"])
+
+            # Assert
+            assert inner_api.batch_detect_sentiment.call_count == 1
+            assert api.stats.retries == 0
+
+        def test_when_item_errors_persist_then_returns_them_in_error_list(
+            self, api: GovernedAwsComprehendApi, inner_api: Mock
+        ) -> None:
+            """再試行の上限を超えても失敗するテキストは error_list で返す"""
+            # Arrange
+            inner_api.batch_detect_sentiment.side_effect = lambda text_list: _response(
+                text_list, {"retry": "INTERNAL_SERVER_ERROR"}
+            )
+
+            # Act
+            response = api.batch_detect_sentiment(["a", "retry"])
+
+            # Assert
+            assert inner_api.batch_detect_sentiment.call_count == 3
+            assert [x.index for x in response.result_list] == [0]
+            assert [x.index for x in response.error_list] == [1]
@@ -0,0 +1,299 @@
+"""同時に行われる感情分析のテキストを集約するデコレーターのテストケースを定義する"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentEnum,
+    SentimentError,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.aws.comprehend.micro_batching_aws_comprehend_api import (
+    MicroBatchingAwsComprehendApi,
+    MicroBatchStats,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def _response(text_list: list[str]) -> BatchDetectSentimentResponse:
+    """先頭が x のテキストはエラー、それ以外は肯定的とするレスポンスを返す"""
+    result_list = []
+    error_list = []
+    for index, text in enumerate(text_list):
+        if text.startswith("x"):
+            error_list.append(
+                SentimentError(
+                    index=index, error_code="INTERNAL_SERVER_ERROR", error_message=text
+                )
+            )
+        else:
+            result_list.append(
+                SentimentResult(
+                    index=index,
+                    sentiment=SentimentEnum.POSITIVE,
+                    sentiment_score={"Positive": len(text) / 100},
+                )
+            )
+    return BatchDetectSentimentResponse(result_list=result_list, error_list=error_list)
+
+
+@pytest.fixture
+def inner_api(mocker: MockerFixture) -> AsyncMock:
+    """呼び出されたテキストに応じたレスポンスを返す非同期APIのモック"""
+    api = mocker.AsyncMock()
+    api.batch_detect_sentiment.side_effect = _response
+    return api
+
+
+class TestMicroBatchingAwsComprehendApi:
+    """MicroBatchingAwsComprehendApiクラスのテストケース"""
+
+    class TestBatchDetectSentiment:
+        """batch_detect_sentimentメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            async def test_when_called_concurrently_then_sends_one_batch(
+                self, inner_api: AsyncMock
+            ) -> None:
+                """同時に呼び出された場合はテキストを集約して1回で送信する"""
+                # Arrange
+                api = MicroBatchingAwsComprehendApi(inner_api, window_seconds=0.01)
+
+                # Act
+                first, second = await asyncio.gather(
+                    api.batch_detect_sentiment(["a", "bb"]),
+                    api.batch_detect_sentiment(["ccc"]),
+                )
+
+                # Assert
+                inner_api.batch_detect_sentiment.assert_awaited_once_with(
+                    ["a", "bb", "ccc"]
+                )
+                assert [x.index for x in first.result_list] == [0, 1]
+                assert [x.sentiment_score for x in first.result_list] == [
+                    {"Positive": 0.01},
+                    {"Positive": 0.02},
+                ]
+                assert [x.index for x in second.result_list] == [0]
+                assert second.result_list[0].sentiment_score == {"Positive": 0.03}
+                assert api.stats == MicroBatchStats(
+                    requests=2, texts=3, deduplicated=0, batches=1, bypassed=0
+                )
+
+            async def test_when_same_text_requested_then_sends_it_once(
+                self, inner_api: AsyncMock
+            ) -> None:
+                """集約中の同じテキストは1回だけ送信し、結果を共有する"""
+                # Arrange
+                api = MicroBatchingAwsComprehendApi(inner_api, window_seconds=0.01)
+
+                # Act
+                first, second = await asyncio.gather(
+                    api.batch_detect_sentiment(["a", "a"]),
+                    api.batch_detect_sentiment(["b", "a"]),
+                )
+
+                # Assert
+                inner_api.batch_detect_sentiment.assert_awaited_once_with(["a", "b"])
+                assert [x.index for x in first.result_list] == [0, 1]
+                assert [x.index for x in second.result_list] == [0, 1]
+                assert api.stats.deduplicated == 2
+
+            async def test_when_batch_size_reached_then_sends_without_waiting(
+                self, inner_api: AsyncMock
+            ) -> None:
+                """テキスト数がバッチサイズの上限に達した場合は待ち時間を待たずに送信する"""
+                # Arrange
+                api = MicroBatchingAwsComprehendApi(
+                    inner_api, window_seconds=60, max_batch_size=25
+                )
+                text_list = [f"text{i}" for i in range(30)]
+
+                # Act
+                response = await asyncio.wait_for(
+                    asyncio.gather(
+                        api.batch_detect_sentiment(text_list[:25]),
+                        api.batch_detect_sentiment(text_list[25:]),
+                        api.aclose(),
+                    ),
+                    timeout=1,
+                )
+
+                # Assert
+                sent = [
+                    call.args[0]
+                    for call in inner_api.batch_detect_sentiment.call_args_list
+                ]
+                assert sent == [text_list[:25], text_list[25:]]
+                assert len(response[0].result_list) == 25
+                assert len(response[1].result_list) == 5
+
+            async def test_when_window_elapsed_then_sends_separate_batches(
+                self, inner_api: AsyncMock
+            ) -> None:
+                """待ち時間の経過後に呼び出された場合は別のバッチとして送信する"""
+                # Arrange
+                api = MicroBatchingAwsComprehendApi(inner_api, window_seconds=0.001)
+
+                # Act
+                await api.batch_detect_sentiment(["a"])
+                await api.batch_detect_sentiment(["b"])
+
+                # Assert
+                assert inner_api.batch_detect_sentiment.await_count == 2
+                assert api.stats.batches == 2
+
+            async def test_when_error_item_returned_then_maps_to_caller_index(
+                self, inner_api: AsyncMock
+            ) -> None:
+                """テキスト単位のエラーは呼び出し元での位置に対応付けて返す"""
+                # Arrange
+                api = MicroBatchingAwsComprehendApi(inner_api, window_seconds=0.01)
+
+                # Act
+                first, second = await asyncio.gather(
+                    api.batch_detect_sentiment(["a"]),
+                    api.batch_detect_sentiment(["b", "x-error"]),
+                )
+
+                # Assert
+                assert first.error_list == []
+                assert [x.index for x in second.result_list] == [0]
+                assert [x.index for x in second.error_list] == [1]
+                assert second.error_list[0].error_message == "x-error"
+
+            @pytest.mark.parametrize(
+                "text_list",
+                [
+                    [],
+                    ["a", " "],
+                    ["a", "a" * 5001],
+                ],
+                ids=[
+                    # 空のリスト
+                    "empty_list",
+                    # 空白のみのテキストを含む
+                    "blank_text",
+                    # 最大文字数を超えるテキストを含む
+                    "too_long_text",
+                ],
+            )
+            async def test_when_input_is_invalid_then_sends_without_batching(
+                self, inner_api: AsyncMock, text_list: list[str]
+            ) -> None:
+                """不正な入力は他の呼び出し元と集約せずにそのまま送信する"""
+                # Arrange
+                api = MicroBatchingAwsComprehendApi(inner_api, window_seconds=0.01)
+
+                # Act
+                await asyncio.gather(
+                    api.batch_detect_sentiment(text_list),
+                    api.batch_detect_sentiment(["b"]),
+                )
+
+                # Assert
+                sent = [
+                    call.args[0]
+                    for call in inner_api.batch_detect_sentiment.call_args_list
+                ]
+                assert sent == [text_list, ["b"]]
+                assert api.stats.bypassed == 1
+
+            async def test_when_one_caller_cancelled_then_others_receive_result(
+                self, inner_api: AsyncMock
+            ) -> None:
+                """呼び出し元の1つがキャンセルされても他の呼び出し元は結果を受け取る"""
+                # Arrange
+                api = MicroBatchingAwsComprehendApi(inner_api, window_seconds=0.01)
+                first = asyncio.create_task(api.batch_detect_sentiment(["a"]))
+                second = asyncio.create_task(api.batch_detect_sentiment(["a"]))
+                await asyncio.sleep(0)
+
+                # Act
+                first.cancel()
+                response = await second
+
+                # Assert
+                assert [x.index for x in response.result_list] == [0]
+                with pytest.raises(asyncio.CancelledError):
+                    await first
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            async def test_when_api_raises_error_then_all_callers_receive_error(
+                self, inner_api: AsyncMock
+            ) -> None:
+                """送信でエラーが発生した場合は集約した全ての呼び出し元にエラーが送出される"""
+                # Arrange
+                inner_api.batch_detect_sentiment.side_effect = ComprehendError(
+                    ComprehendErrorType.API_ERROR, "error"
+                )
+                api = MicroBatchingAwsComprehendApi(inner_api, window_seconds=0.01)
+
+                # Act
+                results = await asyncio.gather(
+                    api.batch_detect_sentiment(["a"]),
+                    api.batch_detect_sentiment(["b"]),
+                    return_exceptions=True,
+                )
+
+                # Assert
+                assert all(isinstance(x, ComprehendError) for x in results)
+                assert inner_api.batch_detect_sentiment.await_count == 1
+
+            async def test_when_result_missing_then_raises_api_error(
+                self, inner_api: AsyncMock
+            ) -> None:
+                """一部のテキストの結果が返されない場合はエラーが送出される"""
+                # Arrange
+                inner_api.batch_detect_sentiment.side_effect = lambda text_list: (
+                    _response(text_list[:1])
+                )
+                api = MicroBatchingAwsComprehendApi(inner_api, window_seconds=0.01)
+
+                # Act
+                first, second = await asyncio.gather(
+                    api.batch_detect_sentiment(["a"]),
+                    api.batch_detect_sentiment(["b"]),
+                    return_exceptions=True,
+                )
+
+                # Assert
+                assert isinstance(first, BatchDetectSentimentResponse)
+                assert isinstance(second, ComprehendError)
+                assert second.error_type == ComprehendErrorType.API_ERROR
+
+    class TestAclose:
+        """acloseメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            async def test_when_texts_pending_then_sends_them_immediately(
+                self, inner_api: AsyncMock
+            ) -> None:
+                """集約中のテキストは待ち時間を待たずに送信される"""
+                # Arrange
+                api = MicroBatchingAwsComprehendApi(inner_api, window_seconds=60)
+                task = asyncio.create_task(api.batch_detect_sentiment(["a"]))
+                await asyncio.sleep(0)
+
+                # Act
+                await asyncio.wait_for(api.aclose(), timeout=1)
+
+                # Assert
+                inner_api.batch_detect_sentiment.assert_awaited_once_with(["a"])
+                response = await task
+                assert len(response.result_list) == 1
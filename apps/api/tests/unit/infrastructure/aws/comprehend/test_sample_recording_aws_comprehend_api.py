@@ -0,0 +1,89 @@
+"""感情分析の結果を学習用に記録するクラスのテストケースを定義する"""
+
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentEnum,
+    SentimentError,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+from src.infrastructure.aws.comprehend.sample_recording_aws_comprehend_api import (
+    SampleRecordingAwsComprehendApi,
+)
+from src.infrastructure.local_sentiment.training_samples import (
+    TrainingSample,
+    read_training_samples,
+)
+
+_RESPONSE = BatchDetectSentimentResponse(
+    result_list=[
+        SentimentResult(
+            index=1,
+            sentiment=SentimentEnum.NEGATIVE,
+            sentiment_score={
+                "Positive": 0.1,
+                "Negative": 0.8,
+                "Neutral": 0.05,
+                "Mixed": 0.05,
+            },
+        )
+    ],
+    error_list=[
+        SentimentError(
+            index=0, error_code="INTERNAL_SERVER_ERROR", error_message="error"
+        )
+    ],
+)
+
+
+class TestSampleRecordingAwsComprehendApi:
+    """SampleRecordingAwsComprehendApiクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_results_returned_then_records_successful_results(
+            self, mocker: MockerFixture, tmp_path: Path
+        ) -> None:
+            """成功した結果のみをテキストとスコアの組として記録する"""
+            # Arrange
+            inner_api = mocker.Mock(spec=IAwsComprehendApi)
+            inner_api.batch_detect_sentiment.return_value = _RESPONSE
+            path = tmp_path / "samples.jsonl"
+            api = SampleRecordingAwsComprehendApi(inner_api, str(path))
+
+            # Act
+            response = api.batch_detect_sentiment(["失敗するテキスト", "困った"])
+
+            # Assert
+            assert response == _RESPONSE
+            assert read_training_samples(path) == [
+                TrainingSample("困った", (0.1, 0.8, 0.05, 0.05))
+            ]
+            assert api.stats.recorded == 1
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        def test_when_write_fails_then_returns_response(
+            self, mocker: MockerFixture, tmp_path: Path
+        ) -> None:
+            """書き込みに失敗しても感情分析の結果は返す"""
+            # Arrange
+            inner_api = mocker.Mock(spec=IAwsComprehendApi)
+            inner_api.batch_detect_sentiment.return_value = _RESPONSE
+            api = SampleRecordingAwsComprehendApi(
+                inner_api, str(tmp_path / "missing" / "samples.jsonl")
+            )
+
+            # Act
+            response = api.batch_detect_sentiment(["失敗するテキスト", "困った"])
+
+            # Assert
+            assert response == _RESPONSE
+            assert api.stats.recorded == 0
+            assert api.stats.write_errors == 1
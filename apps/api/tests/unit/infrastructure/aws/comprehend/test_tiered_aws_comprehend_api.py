@@ -0,0 +1,155 @@
+"""確信度の低いテキストのみを外部のAPIで分析するクラスのテストケースを定義する"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentEnum,
+    SentimentError,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.aws.comprehend.i_aws_comprehend_api import IAwsComprehendApi
+from src.infrastructure.aws.comprehend.tiered_aws_comprehend_api import (
+    TieredAwsComprehendApi,
+)
+from src.infrastructure.local_sentiment.lexicon_sentiment_api import (
+    LexiconSentimentApi,
+)
+
+
+def _negative_response(text_list: list[str]) -> BatchDetectSentimentResponse:
+    """全てのテキストを否定と判定するレスポンスを作成する"""
+    return BatchDetectSentimentResponse(
+        result_list=[
+            SentimentResult(
+                index=index,
+                sentiment=SentimentEnum.NEGATIVE,
+                sentiment_score={"Negative": 0.99},
+            )
+            for index in range(len(text_list))
+        ],
+        error_list=[],
+    )
+
+
+class TestTieredAwsComprehendApi:
+    """TieredAwsComprehendApiクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_confidence_low_then_escalates_and_merges_in_order(
+            self, mocker: MockerFixture
+        ) -> None:
+            """確信度の低いテキストのみを外部のAPIで分析し、元の順に結合する"""
+            # Arrange
+            remote_api = mocker.Mock(spec=IAwsComprehendApi)
+            remote_api.batch_detect_sentiment.side_effect = _negative_response
+            api = TieredAwsComprehendApi(
+                LexiconSentimentApi(), remote_api, confidence_threshold=0.6
+            )
+            text_list = ["ありがとう!", "あまり良くない", "了解です", "好きじゃない"]
+
+            # Act
+            response = api.batch_detect_sentiment(text_list)
+
+            # Assert
+            remote_api.batch_detect_sentiment.assert_called_once_with(
+                ["あまり良くない", "好きじゃない"]
+            )
+            assert [(x.index, x.sentiment) for x in response.result_list] == [
+                (0, SentimentEnum.POSITIVE),
+                (1, SentimentEnum.NEGATIVE),
+                (2, SentimentEnum.NEUTRAL),
+                (3, SentimentEnum.NEGATIVE),
+            ]
+            assert response.result_list[1].sentiment_score == {"Negative": 0.99}
+            assert api.stats.escalated == 2
+            assert api.stats.escalation_rate == 0.5
+            assert api.stats.remote_calls == 1
+
+        @pytest.mark.parametrize(
+            ("confidence_threshold", "expected_escalated"),
+            [(0.0, 0), (1.01, 3)],
+            ids=[
+                # 閾値が 0 の場合は全てのテキストをローカルの推定結果とする
+                "when_threshold_is_zero_then_never_escalates",
+                # 閾値が 1 を超える場合は全てのテキストを外部のAPIで分析する
+                "when_threshold_exceeds_one_then_always_escalates",
+            ],
+        )
+        def test_when_threshold_changed_then_escalation_follows(
+            self,
+            mocker: MockerFixture,
+            confidence_threshold: float,
+            expected_escalated: int,
+        ) -> None:
+            """閾値に応じて外部のAPIで分析する件数が変わる"""
+            # Arrange
+            remote_api = mocker.Mock(spec=IAwsComprehendApi)
+            remote_api.batch_detect_sentiment.side_effect = _negative_response
+            api = TieredAwsComprehendApi(
+                LexiconSentimentApi(), remote_api, confidence_threshold
+            )
+
+            # Act
+            response = api.batch_detect_sentiment(["嬉しい", "良くない", "了解"])
+
+            # Assert
+            assert len(response.result_list) == 3
+            assert api.stats.escalated == expected_escalated
+            assert remote_api.batch_detect_sentiment.call_count == min(
+                1, expected_escalated
+            )
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        def test_when_remote_returns_errors_then_maps_error_indexes(
+            self, mocker: MockerFixture
+        ) -> None:
+            """外部のAPIがエラーとしたテキストは元の位置のエラーとして返す"""
+            # Arrange
+            remote_api = mocker.Mock(spec=IAwsComprehendApi)
+            remote_api.batch_detect_sentiment.return_value = (
+                BatchDetectSentimentResponse(
+                    result_list=[],
+                    error_list=[
+                        SentimentError(
+                            index=0,
+                            error_code="INTERNAL_SERVER_ERROR",
+                            error_message="error",
+                        )
+                    ],
+                )
+            )
+            api = TieredAwsComprehendApi(LexiconSentimentApi(), remote_api)
+
+            # Act
+            response = api.batch_detect_sentiment(["嬉しい", "良くない"])
+
+            # Assert
+            assert [x.index for x in response.result_list] == [0]
+            assert [x.index for x in response.error_list] == [1]
+
+        def test_when_remote_raises_then_propagates_error(
+            self, mocker: MockerFixture
+        ) -> None:
+            """外部のAPIの例外はそのまま送出する"""
+            # Arrange
+            remote_api = mocker.Mock(spec=IAwsComprehendApi)
+            remote_api.batch_detect_sentiment.side_effect = ComprehendError(
+                ComprehendErrorType.CIRCUIT_OPEN, "circuit open"
+            )
+            api = TieredAwsComprehendApi(LexiconSentimentApi(), remote_api)
+
+            # Act & Assert
+            with pytest.raises(ComprehendError) as exc:
+                api.batch_detect_sentiment(["良くない"])
+
+            assert exc.value.error_type == ComprehendErrorType.CIRCUIT_OPEN
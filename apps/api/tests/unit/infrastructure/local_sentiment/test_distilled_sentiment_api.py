@@ -0,0 +1,64 @@
+"""蒸留したモデルによる感情分析のクラスのテストケースを定義する"""
+
+import numpy as np
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import SentimentEnum
+from src.infrastructure.local_sentiment.distilled_sentiment_api import (
+    DistilledSentimentApi,
+)
+from src.infrastructure.local_sentiment.hashed_char_ngrams import (
+    HashedCharNgramVectorizer,
+)
+from src.infrastructure.local_sentiment.linear_sentiment_model import (
+    LinearSentimentModel,
+)
+
+
+def _model() -> LinearSentimentModel:
+    """「嬉」を肯定、「困」を否定とする重みを持つモデルを作成する"""
+    vectorizer = HashedCharNgramVectorizer(n_features=256, ngram_range=(1, 1))
+    weights = np.zeros((256, 4))
+    weights[vectorizer.transform(["嬉"]).cols[0], 0] = 5.0
+    weights[vectorizer.transform(["困"]).cols[0], 1] = 5.0
+    return LinearSentimentModel(vectorizer, weights, np.array([0.0, 0.0, 1.0, 0.0]))
+
+
+class TestDistilledSentimentApi:
+    """DistilledSentimentApiクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_texts_given_then_returns_results_in_order(self) -> None:
+            """バッチのテキストごとに、最もスコアの高い感情とスコアを返す"""
+            # Arrange
+            api = DistilledSentimentApi(_model())
+
+            # Act
+            response = api.batch_detect_sentiment(["嬉", "困", "了解"])
+
+            # Assert
+            assert [(x.index, x.sentiment) for x in response.result_list] == [
+                (0, SentimentEnum.POSITIVE),
+                (1, SentimentEnum.NEGATIVE),
+                (2, SentimentEnum.NEUTRAL),
+            ]
+            assert set(response.result_list[0].sentiment_score) == {
+                "Positive",
+                "Negative",
+                "Neutral",
+                "Mixed",
+            }
+            assert response.error_list == []
+
+        def test_when_text_list_empty_then_returns_empty_response(self) -> None:
+            """テキストが無い場合は空のレスポンスを返す"""
+            # Arrange
+            api = DistilledSentimentApi(_model())
+
+            # Act
+            response = api.batch_detect_sentiment([])
+
+            # Assert
+            assert response.result_list == []
+            assert response.error_list == []
@@ -0,0 +1,118 @@
+"""極性辞書による感情分析のクラスのテストケースを定義する"""
+
+import pytest
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import SentimentEnum
+from src.infrastructure.local_sentiment.japanese_lexicon import (
+    LexiconEntry,
+    TermKind,
+)
+from src.infrastructure.local_sentiment.lexicon_sentiment_api import (
+    LexiconSentimentApi,
+)
+
+
+class TestLexiconSentimentApi:
+    """LexiconSentimentApiクラスのテストケース"""
+
+    class TestBatchDetectSentiment:
+        """batch_detect_sentimentメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            @pytest.mark.parametrize(
+                ("text", "expected"),
+                [
+                    ("今日はとても嬉しいです！", SentimentEnum.POSITIVE),
+                    ("エラーが出て困っています", SentimentEnum.NEGATIVE),
+                    ("明日の会議は10時からです", SentimentEnum.NEUTRAL),
+                    ("ありがとう、でもバグがあります", SentimentEnum.MIXED),
+                    ("あまり良くないですね", SentimentEnum.NEGATIVE),
+                    ("問題ないです", SentimentEnum.POSITIVE),
+                    ("ＧＯＯＤ", SentimentEnum.POSITIVE),
+                ],
+                ids=[
+                    # 肯定の語を含む場合は肯定と判定する
+                    "when_positive_term_then_positive",
+                    # 否定の語を含む場合は否定と判定する
+                    "when_negative_term_then_negative",
+                    # 極性を持つ語が無い場合は中立と判定する
+                    "when_no_polar_term_then_neutral",
+                    # 肯定と否定の語を同じ強さで含む場合は混在と判定する
+                    "when_both_polarities_then_mixed",
+                    # 否定表現が続く肯定の語は否定と判定する
+                    "when_positive_term_negated_then_negative",
+                    # 否定表現が続く否定の語は肯定と判定する
+                    "when_negative_term_negated_then_positive",
+                    # 全角の英字は正規化して辞書と照合する
+                    "when_full_width_text_then_normalized",
+                ],
+            )
+            def test_when_text_given_then_returns_expected_sentiment(
+                self, text: str, expected: SentimentEnum
+            ) -> None:
+                """テキストに含まれる語と否定表現から感情を判定する"""
+                # Arrange
+                api = LexiconSentimentApi()
+
+                # Act
+                response = api.batch_detect_sentiment([text])
+
+                # Assert
+                assert response.result_list[0].sentiment == expected
+
+            def test_when_batch_given_then_returns_scores_for_each_text(
+                self,
+            ) -> None:
+                """バッチのテキストごとに、合計が1となる4つの感情のスコアを返す"""
+                # Arrange
+                api = LexiconSentimentApi()
+                text_list = ["嬉しい", "悲しい", "", "普通"]
+
+                # Act
+                response = api.batch_detect_sentiment(text_list)
+
+                # Assert
+                assert [x.index for x in response.result_list] == [0, 1, 2, 3]
+                assert response.error_list == []
+                for result in response.result_list:
+                    assert set(result.sentiment_score) == {
+                        "Positive",
+                        "Negative",
+                        "Neutral",
+                        "Mixed",
+                    }
+                    assert sum(result.sentiment_score.values()) == pytest.approx(1.0)
+
+            def test_when_custom_lexicon_given_then_uses_it(self) -> None:
+                """指定した極性辞書と否定表現を判定する語の種類を使用する"""
+                # Arrange
+                api = LexiconSentimentApi(
+                    [
+                        LexiconEntry("晴れ", 1.0, TermKind.NOUN),
+                        LexiconEntry("雨", -1.0, TermKind.FIXED),
+                    ]
+                )
+
+                # Act
+                response = api.batch_detect_sentiment(["晴れ", "晴れじゃない", "雨"])
+
+                # Assert
+                assert [x.sentiment for x in response.result_list] == [
+                    SentimentEnum.POSITIVE,
+                    SentimentEnum.NEGATIVE,
+                    SentimentEnum.NEGATIVE,
+                ]
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            def test_when_empty_list_given_then_returns_empty_response(self) -> None:
+                """空のリストの場合は空のレスポンスを返す"""
+                # Act
+                response = LexiconSentimentApi().batch_detect_sentiment([])
+
+                # Assert
+                assert response.result_list == []
+                assert response.error_list == []
@@ -0,0 +1,123 @@
+"""文字 n-gram の線形モデルのテストケースを定義する"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.infrastructure.local_sentiment.hashed_char_ngrams import (
+    HashedCharNgramVectorizer,
+)
+from src.infrastructure.local_sentiment.linear_sentiment_model import (
+    LinearSentimentModel,
+    TrainingAlgorithm,
+)
+
+# 感情ごとに典型的な語を含む学習用のテキストと目標のスコア
+_TEXTS = [
+    "ありがとうございます、助かりました",
+    "とても嬉しいです",
+    "最高の結果でした",
+    "エラーで困っています",
+    "障害が起きて大変です",
+    "バグが直らなくて辛い",
+    "明日の会議は10時です",
+    "資料を共有します",
+]
+_TARGETS = np.array(
+    [[0.9, 0.02, 0.06, 0.02]] * 3
+    + [[0.02, 0.9, 0.06, 0.02]] * 3
+    + [[0.05, 0.05, 0.88, 0.02]] * 2
+)
+
+
+class TestHashedCharNgramVectorizer:
+    """HashedCharNgramVectorizerクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_same_text_then_same_features(self) -> None:
+            """バッチ内の位置によらず、同じテキストは同じ特徴量となる"""
+            # Arrange
+            vectorizer = HashedCharNgramVectorizer(n_features=1024)
+
+            # Act
+            single = vectorizer.transform(["嬉しい"])
+            batch = vectorizer.transform(["了解です", "嬉しい"])
+
+            # Assert
+            assert sorted(single.cols.tolist()) == sorted(
+                batch.cols[batch.rows == 1].tolist()
+            )
+
+        def test_when_texts_concatenated_then_ngrams_do_not_cross_texts(self) -> None:
+            """テキストの境界をまたぐ n-gram を含めない"""
+            # Arrange
+            vectorizer = HashedCharNgramVectorizer(n_features=1024, ngram_range=(1, 3))
+
+            # Act
+            features = vectorizer.transform(["あい", "", "う"])
+
+            # Assert
+            # 「あい」は1-gram 2件と2-gram 1件、「う」は1-gram 1件となる
+            assert np.bincount(features.rows, minlength=3).tolist() == [3, 0, 1]
+            assert np.allclose(
+                np.bincount(features.rows, weights=features.values**2), [1, 0, 1]
+            )
+
+
+class TestLinearSentimentModel:
+    """LinearSentimentModelクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        @pytest.mark.parametrize(
+            "algorithm",
+            list(TrainingAlgorithm),
+            ids=[
+                # ロジスティック回帰で学習したモデルは目標の感情を推定する
+                "when_logistic_regression_then_learns_targets",
+                # ナイーブベイズで学習したモデルは目標の感情を推定する
+                "when_naive_bayes_then_learns_targets",
+            ],
+        )
+        def test_when_fit_then_predicts_target_sentiments(
+            self, algorithm: TrainingAlgorithm
+        ) -> None:
+            """学習したテキストに対して目標のスコアが最も高い感情を推定する"""
+            # Arrange
+            vectorizer = HashedCharNgramVectorizer(n_features=4096)
+
+            # Act
+            model = LinearSentimentModel.fit(
+                _TEXTS, _TARGETS, vectorizer, algorithm=algorithm
+            )
+            scores = model.predict_proba(_TEXTS)
+
+            # Assert
+            assert scores.argmax(axis=1).tolist() == _TARGETS.argmax(axis=1).tolist()
+            assert np.allclose(scores.sum(axis=1), 1.0)
+
+        def test_when_saved_and_loaded_then_same_scores(self, tmp_path: Path) -> None:
+            """保存して読み込んだモデルは同じスコアを返す"""
+            # Arrange
+            model = LinearSentimentModel.fit(
+                _TEXTS,
+                _TARGETS,
+                HashedCharNgramVectorizer(n_features=4096, ngram_range=(1, 2)),
+                epochs=20,
+            )
+            path = tmp_path / "model.npz"
+
+            # Act
+            model.save(path)
+            loaded = LinearSentimentModel.load(path)
+
+            # Assert
+            assert loaded.vectorizer.n_features == 4096
+            assert loaded.vectorizer.ngram_range == (1, 2)
+            assert np.allclose(
+                loaded.predict_proba(_TEXTS), model.predict_proba(_TEXTS), atol=1e-5
+            )
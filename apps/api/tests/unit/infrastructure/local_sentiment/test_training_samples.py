@@ -0,0 +1,72 @@
+"""学習用のサンプルの読み込みのテストケースを定義する"""
+
+from pathlib import Path
+
+from src.infrastructure.local_sentiment.training_samples import (
+    TrainingSample,
+    read_training_samples,
+    to_target_matrix,
+)
+
+
+class TestReadTrainingSamples:
+    """read_training_samples関数のテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_text_recorded_twice_then_keeps_latest(
+            self, tmp_path: Path
+        ) -> None:
+            """同じテキストが複数回記録されている場合は最後のサンプルを使用する"""
+            # Arrange
+            path = tmp_path / "samples.jsonl"
+            path.write_text(
+                "\n".join(
+                    [
+                        TrainingSample("嬉しい", (0.9, 0.1, 0.0, 0.0)).to_json(),
+                        TrainingSample("困った", (0.0, 1.0, 0.0, 0.0)).to_json(),
+                        TrainingSample("嬉しい", (0.5, 0.0, 0.5, 0.0)).to_json(),
+                    ]
+                ),
+                encoding="utf-8",
+            )
+
+            # Act
+            samples = read_training_samples(path)
+
+            # Assert
+            assert samples == [
+                TrainingSample("困った", (0.0, 1.0, 0.0, 0.0)),
+                TrainingSample("嬉しい", (0.5, 0.0, 0.5, 0.0)),
+            ]
+            assert to_target_matrix(samples).tolist() == [
+                [0.0, 1.0, 0.0, 0.0],
+                [0.5, 0.0, 0.5, 0.0],
+            ]
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        def test_when_line_broken_then_skips_line(self, tmp_path: Path) -> None:
+            """壊れた行とスコアの合計が 0 の行は読み飛ばす"""
+            # Arrange
+            path = tmp_path / "samples.jsonl"
+            path.write_text(
+                "\n".join(
+                    [
+                        '{"text": "途中で切れた',
+                        '{"text": "スコア無し"}',
+                        TrainingSample("ゼロ", (0.0, 0.0, 0.0, 0.0)).to_json(),
+                        "",
+                        TrainingSample("了解", (0.0, 0.0, 1.0, 0.0)).to_json(),
+                    ]
+                ),
+                encoding="utf-8",
+            )
+
+            # Act
+            samples = read_training_samples(path)
+
+            # Assert
+            assert samples == [TrainingSample("了解", (0.0, 0.0, 1.0, 0.0))]
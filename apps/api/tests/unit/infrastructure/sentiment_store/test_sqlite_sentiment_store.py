@@ -0,0 +1,205 @@
+"""SQLiteを使用した感情分析結果の永続ストアのテストケースを定義する"""
+
+import sqlite3
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.text_hash import hash_text
+from src.infrastructure.sentiment_store.i_sentiment_store import SentimentStoreKey
+from src.infrastructure.sentiment_store.sqlite_sentiment_store import (
+    SqliteSentimentStore,
+)
+
+
+def _key(
+    post_id: int, message: str, updated_at: str = "2024-01-23T00:00:00Z"
+) -> SentimentStoreKey:
+    """テスト用の永続ストアのキーを作成する"""
+    return SentimentStoreKey(
+        post_id=post_id, updated_at=updated_at, text_hash=hash_text(message)
+    )
+
+
+class TestSqliteSentimentStore:
+    """SqliteSentimentStoreクラスのテストケース"""
+
+    @pytest.fixture
+    def store_path(self, tmp_path: Path) -> str:
+        """データベースファイルのパスを提供する"""
+        return str(tmp_path / "store" / "sentiments.db")
+
+    @pytest.fixture
+    def store(self, store_path: str) -> Generator[SqliteSentimentStore, None, None]:
+        """SqliteSentimentStoreのインスタンスを提供する"""
+        store = SqliteSentimentStore(store_path)
+        yield store
+        store.close()
+
+    class TestGetMany:
+        """get_manyメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            def test_when_entries_saved_then_returns_saved_sentiments(
+                self, store: SqliteSentimentStore
+            ) -> None:
+                """保存した結果がキーに対応して返され、未保存のキーは含まれない"""
+                # Arrange
+                store.put_many({_key(1, "OK"): "POSITIVE", _key(2, "NG"): "NEGATIVE"})
+
+                # Act
+                result = store.get_many([_key(2, "NG"), _key(3, "未保存")])
+
+                # Assert
+                assert result == {_key(2, "NG"): "NEGATIVE"}
+
+            def test_when_post_updated_with_same_text_then_falls_back_to_text_hash(
+                self, store: SqliteSentimentStore
+            ) -> None:
+                """更新日時が異なっても本文が同じ場合はテキストのハッシュ値で結果が返される"""
+                # Arrange
+                store.put_many({_key(1, "同じ本文"): "NEUTRAL"})
+                key = _key(99, "同じ本文", updated_at="2024-02-01T00:00:00Z")
+
+                # Act
+                result = store.get_many([key])
+
+                # Assert
+                assert result == {key: "NEUTRAL"}
+
+            def test_when_post_updated_with_new_text_then_returns_nothing(
+                self, store: SqliteSentimentStore
+            ) -> None:
+                """同じポストの本文が更新された場合は結果が返されない"""
+                # Arrange
+                store.put_many({_key(1, "更新前"): "POSITIVE"})
+
+                # Act
+                result = store.get_many(
+                    [_key(1, "更新後", updated_at="2024-02-01T00:00:00Z")]
+                )
+
+                # Assert
+                assert result == {}
+
+            def test_when_keys_exceed_query_batch_size_then_returns_all(
+                self, store: SqliteSentimentStore
+            ) -> None:
+                """1回のクエリの上限を超えるキーでも全ての結果が返される"""
+                # Arrange
+                entries = {
+                    _key(i, f"本文{i}"): "POSITIVE"
+                    for i in range(SqliteSentimentStore.QUERY_BATCH_SIZE + 10)
+                }
+                store.put_many(entries)
+
+                # Act
+                result = store.get_many(list(entries))
+
+                # Assert
+                assert result == entries
+
+            def test_when_store_reopened_then_returns_saved_sentiments(
+                self, store_path: str
+            ) -> None:
+                """ストアを開き直しても保存した結果が返される"""
+                # Arrange
+                store = SqliteSentimentStore(store_path)
+                store.put_many({_key(1, "OK"): "POSITIVE"})
+                store.close()
+
+                # Act
+                reopened = SqliteSentimentStore(store_path)
+                result = reopened.get_many([_key(1, "OK")])
+                reopened.close()
+
+                # Assert
+                assert result == {_key(1, "OK"): "POSITIVE"}
+
+            def test_when_used_from_multiple_threads_then_returns_saved_sentiments(
+                self, store: SqliteSentimentStore
+            ) -> None:
+                """複数のスレッドから読み書きできる"""
+
+                # Arrange
+                def put_and_get(post_id: int) -> dict[SentimentStoreKey, str]:
+                    store.put_many({_key(post_id, f"本文{post_id}"): "POSITIVE"})
+                    return store.get_many([_key(post_id, f"本文{post_id}")])
+
+                # Act
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    results = list(executor.map(put_and_get, range(20)))
+
+                # Assert
+                assert all(len(result) == 1 for result in results)
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            def test_when_database_error_occurs_then_returns_empty_result(
+                self, store: SqliteSentimentStore, mocker: MockerFixture
+            ) -> None:
+                """データベースのエラーが発生した場合は結果なしとして扱われる"""
+                # Arrange
+                mocker.patch.object(
+                    store, "_select", side_effect=sqlite3.OperationalError("locked")
+                )
+
+                # Act
+                result = store.get_many([_key(1, "OK")])
+
+                # Assert
+                assert result == {}
+
+    class TestCompact:
+        """compactメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            def test_when_max_entries_exceeded_then_deletes_oldest_entries(
+                self, store_path: str, mocker: MockerFixture
+            ) -> None:
+                """保存件数の上限を超えた場合は保存日時の古い結果から削除される"""
+                # Arrange
+                clock = mocker.Mock(return_value=0.0)
+                store = SqliteSentimentStore(
+                    store_path, max_entries=2, compact_interval=100, clock=clock
+                )
+                for post_id in range(4):
+                    clock.return_value = float(post_id)
+                    store.put_many({_key(post_id, f"本文{post_id}"): "POSITIVE"})
+
+                # Act
+                deleted = store.compact()
+
+                # Assert
+                assert deleted == 2
+                result = store.get_many(
+                    [_key(post_id, f"本文{post_id}") for post_id in range(4)]
+                )
+                assert sorted(key.post_id for key in result) == [2, 3]
+                store.close()
+
+            def test_when_writes_reach_interval_then_compacts_automatically(
+                self, store_path: str, mocker: MockerFixture
+            ) -> None:
+                """書き込み件数が間隔に達した場合は自動でコンパクションが行われる"""
+                # Arrange
+                store = SqliteSentimentStore(
+                    store_path, max_entries=10, compact_interval=3
+                )
+                compact = mocker.spy(store, "compact")
+
+                # Act
+                store.put_many({_key(1, "1"): "POSITIVE", _key(2, "2"): "POSITIVE"})
+                store.put_many({_key(3, "3"): "POSITIVE"})
+
+                # Assert
+                compact.assert_called_once()
+                store.close()
@@ -0,0 +1,267 @@
+"""Typetalk APIの非同期クライアントのテストケースを定義する"""
+
+from collections.abc import Callable
+
+import httpx
+import pytest
+from fastapi import status
+from pytest_mock import MockerFixture
+
+from src.core.config import get_settings
+from src.infrastructure.typetalk.async_typetalk_api import AsyncTypetalkApi
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.http_client import TypetalkTimeouts
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.infrastructure.typetalk.rate_limiter import TypetalkRateLimiter
+from src.schemas.space import MySpace, Space, TypetalkGetSpacesResponse
+
+pytestmark = pytest.mark.anyio
+
+SPACES_JSON = b'{"mySpaces": []}'
+
+
+def _create_rate_limited_api(
+    status_codes: list[int],
+) -> tuple[AsyncTypetalkApi, Callable[[], int]]:
+    """指定のステータスコードを順に返すクライアントとレート制限の調整でAPIを作成する"""
+    codes = iter(status_codes)
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        status_code = next(codes)
+        content = SPACES_JSON if status_code == status.HTTP_200_OK else b""
+        return httpx.Response(status_code, content=content)
+
+    async def sleep(seconds: float) -> None:
+        return None
+
+    api = AsyncTypetalkApi(
+        "https://typetalk.test",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        timeouts=TypetalkTimeouts.from_settings(get_settings()),
+        rate_limiter=TypetalkRateLimiter(sleep=sleep),
+    )
+    return api, lambda: len(requests)
+
+
+class TestAsyncTypetalkApi:
+    """AsyncTypetalkApiクラスのテストケース"""
+
+    class TestGetSpaces:
+        """get_spacesメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            async def test_when_valid_token_provided_then_returns_expected_spaces(
+                self,
+                async_typetalk_api: IAsyncTypetalkApi,
+            ) -> None:
+                """有効なトークンが提供された場合に期待される組織一覧が返される"""
+                # Arrange
+                typetalk_token = "valid_typetalk_token"
+                expected = TypetalkGetSpacesResponse(
+                    my_spaces=[
+                        MySpace(
+                            space=Space(
+                                key="abcdefghij",
+                                name="テスト組織1",
+                                image_url="https://placehold.jp/150x150.png",
+                            ),
+                        ),
+                        MySpace(
+                            space=Space(
+                                key="0123456789",
+                                name="テスト組織2",
+                                image_url="https://placehold.jp/150x150.png",
+                            ),
+                        ),
+                    ],
+                )
+
+                # Act
+                response = await async_typetalk_api.get_spaces(typetalk_token)
+
+                # Assert
+                assert response == expected
+
+            async def test_when_throttled_once_then_retries_request(self) -> None:
+                """レート制限の超過を返された場合は待機した後に再送する"""
+                # Arrange
+                api, request_count = _create_rate_limited_api(
+                    [status.HTTP_429_TOO_MANY_REQUESTS, status.HTTP_200_OK]
+                )
+
+                # Act
+                response = await api.get_spaces("valid_typetalk_token")
+
+                # Assert
+                assert response.my_spaces == []
+                assert request_count() == 2
+                assert api.rate_limiter is not None
+                assert api.rate_limiter.stats.throttled == 1
+                await api.client.aclose()
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            async def test_when_throttled_repeatedly_then_raises_error(self) -> None:
+                """再送してもレート制限の超過を返された場合はエラーが発生する"""
+                # Arrange
+                api, request_count = _create_rate_limited_api(
+                    [status.HTTP_429_TOO_MANY_REQUESTS] * 2
+                )
+
+                # Act
+                with pytest.raises(TypetalkAPIError) as exc:
+                    await api.get_spaces("valid_typetalk_token")
+
+                # Assert
+                assert exc.value.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+                assert request_count() == 2
+                await api.client.aclose()
+
+            async def test_when_invalid_token_provided_then_raises_unauthorized_error(
+                self,
+                async_typetalk_api: IAsyncTypetalkApi,
+            ) -> None:
+                """無効なトークンが提供された場合にエラーが発生する"""
+                # Act
+                with pytest.raises(TypetalkAPIError) as exc:
+                    await async_typetalk_api.get_spaces("invalid_typetalk_token")
+
+                # Assert
+                assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+                assert exc.value.content is None
+
+    class TestGetTopics:
+        """get_topicsメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            async def test_when_valid_input_provided_then_returns_expected_topics(
+                self,
+                async_typetalk_api: IAsyncTypetalkApi,
+            ) -> None:
+                """有効な入力が提供された場合に期待されるトピック一覧が返される"""
+                # Act
+                response = await async_typetalk_api.get_topics(
+                    "valid_typetalk_token", "valid_space_key"
+                )
+
+                # Assert
+                assert [x.topic.id for x in response.topics] == [6310, 6233]
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            async def test_when_invalid_space_key_provided_then_raises_not_found_error(
+                self,
+                async_typetalk_api: IAsyncTypetalkApi,
+            ) -> None:
+                """無効な組織キーが提供された場合にエラーが発生する"""
+                # Act
+                with pytest.raises(TypetalkAPIError) as exc:
+                    await async_typetalk_api.get_topics(
+                        "valid_typetalk_token", "invalid"
+                    )
+
+                # Assert
+                assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+                assert exc.value.content == {"error": {"title": "The space not found."}}
+
+    class TestGetMessages:
+        """get_messagesメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            @pytest.mark.parametrize(
+                ("from_id", "expected_post_ids"),
+                [
+                    (None, [154010, 154011]),
+                    (154011, [154010]),
+                ],
+                ids=[
+                    # from_idを指定しない場合、トピックの最新のメッセージが返される
+                    "when_from_id_is_not_specified_then_returns_latest_messages",
+                    # from_idを指定した場合、指定されたIDより前のメッセージが返される
+                    "when_from_id_is_specified_then_returns_messages_before_that_id",
+                ],
+            )
+            async def test_when_valid_input_provided_then_returns_expected_messages(
+                self,
+                async_typetalk_api: IAsyncTypetalkApi,
+                from_id: int | None,
+                expected_post_ids: list[int],
+            ) -> None:
+                """有効な入力が提供された場合に期待されるメッセージ一覧が返される"""
+                # Act
+                response = await async_typetalk_api.get_messages(
+                    "valid_typetalk_token", 6310, from_id
+                )
+
+                # Assert
+                assert response.topic.id == 6310
+                assert response.has_next is True
+                assert [x.id for x in response.posts] == expected_post_ids
+
+            async def test_when_count_provided_then_sends_count_param(
+                self,
+                mocker: MockerFixture,
+                async_typetalk_api: AsyncTypetalkApi,
+            ) -> None:
+                """取得件数を指定した場合はクエリパラメータで送信される"""
+                # Arrange
+                spy = mocker.spy(async_typetalk_api.client, "get")
+
+                # Act
+                await async_typetalk_api.get_messages(
+                    "valid_typetalk_token", 6310, 154011, count=100
+                )
+
+                # Assert
+                assert spy.call_args.kwargs["params"] == {
+                    "direction": "backward",
+                    "from": "154011",
+                    "count": "100",
+                }
+
+            async def test_when_since_id_provided_then_requests_forward_direction(
+                self,
+                mocker: MockerFixture,
+                async_typetalk_api: AsyncTypetalkApi,
+            ) -> None:
+                """since_idを指定した場合はそのIDから新しい方向に取得する"""
+                # Arrange
+                spy = mocker.spy(async_typetalk_api.client, "get")
+
+                # Act
+                await async_typetalk_api.get_messages(
+                    "valid_typetalk_token", 6310, count=200, since_id=154010
+                )
+
+                # Assert
+                assert spy.call_args.kwargs["params"] == {
+                    "direction": "forward",
+                    "from": "154010",
+                    "count": "200",
+                }
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            async def test_when_invalid_topic_id_provided_then_raises_not_found_error(
+                self,
+                async_typetalk_api: IAsyncTypetalkApi,
+            ) -> None:
+                """無効なトピックIDが提供された場合にエラーが発生する"""
+                # Act
+                with pytest.raises(TypetalkAPIError) as exc:
+                    await async_typetalk_api.get_messages("valid_typetalk_token", 0)
+
+                # Assert
+                assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+                assert exc.value.content == {}
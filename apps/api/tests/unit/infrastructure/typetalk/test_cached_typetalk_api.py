@@ -0,0 +1,237 @@
+"""Typetalkの一覧のレスポンスをキャッシュするクラスのテストケースを定義する"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.text_hash import hash_token
+from src.infrastructure.typetalk.cached_typetalk_api import CachedTypetalkApi
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.infrastructure.typetalk.listing_cache import TypetalkListingCache
+
+pytestmark = pytest.mark.anyio
+
+TOKEN = "valid_typetalk_token"
+
+
+def _create_api(
+    mocker: MockerFixture, stale_seconds: float = 600.0, max_size: int = 10000
+) -> tuple[CachedTypetalkApi, AsyncMock, TypetalkListingCache, Mock]:
+    """呼び出しごとに異なる値を返すモックと時刻を固定したキャッシュからAPIを作成する
+
+    Returns:
+        tuple[CachedTypetalkApi, AsyncMock, TypetalkListingCache, Mock]:
+            作成したAPI、呼び出し対象のモック、キャッシュ、時刻を返すモック
+    """
+    inner_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+    inner_api.get_spaces.side_effect = [f"spaces {i}" for i in range(10)]
+    inner_api.get_topics.side_effect = [f"topics {i}" for i in range(10)]
+    clock = mocker.Mock(return_value=0.0)
+    cache = TypetalkListingCache(stale_seconds, max_size, clock)
+    api = CachedTypetalkApi(
+        inner_api, cache, spaces_ttl_seconds=300.0, topics_ttl_seconds=60.0
+    )
+    return api, inner_api, cache, clock
+
+
+async def _wait_refresh(cache: TypetalkListingCache) -> None:
+    """実行中の再取得が完了するまで待つ"""
+    while cache.stats.in_flight:
+        await asyncio.sleep(0)
+
+
+class TestCachedTypetalkApi:
+    """CachedTypetalkApiクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        async def test_when_called_within_ttl_then_returns_cached_response(
+            self, mocker: MockerFixture
+        ) -> None:
+            """有効期間内の呼び出しはTypetalk APIへリクエストせずにキャッシュから返す"""
+            # Arrange
+            api, inner_api, cache, _ = _create_api(mocker)
+
+            # Act
+            first = await api.get_topics(TOKEN, "abcdefghij")
+            second = await api.get_topics(TOKEN, "abcdefghij")
+
+            # Assert
+            assert first == second == "topics 0"
+            assert inner_api.get_topics.await_count == 1
+            assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+        async def test_when_ttl_expired_then_returns_stale_and_refreshes(
+            self, mocker: MockerFixture
+        ) -> None:
+            """有効期間を過ぎた場合は古いレスポンスを返し、バックグラウンドで再取得する"""
+            # Arrange
+            api, inner_api, cache, clock = _create_api(mocker)
+            await api.get_spaces(TOKEN)
+            clock.return_value = 301.0
+
+            # Act
+            stale = await api.get_spaces(TOKEN)
+            await _wait_refresh(cache)
+            refreshed = await api.get_spaces(TOKEN)
+
+            # Assert
+            assert (stale, refreshed) == ("spaces 0", "spaces 1")
+            assert inner_api.get_spaces.await_count == 2
+            stats = cache.stats
+            assert (stats.hits, stats.stale_hits, stats.refreshes) == (1, 1, 1)
+
+        async def test_when_stale_period_expired_then_fetches_again(
+            self, mocker: MockerFixture
+        ) -> None:
+            """再利用できる期間を過ぎた場合は古いレスポンスを返さずに取得する"""
+            # Arrange
+            api, inner_api, cache, clock = _create_api(mocker, stale_seconds=600.0)
+            await api.get_spaces(TOKEN)
+            clock.return_value = 901.0
+
+            # Act
+            response = await api.get_spaces(TOKEN)
+
+            # Assert
+            assert response == "spaces 1"
+            assert cache.stats.misses == 2
+
+        @pytest.mark.parametrize(
+            ("token", "space_key"),
+            [("other_token", "abcdefghij"), (TOKEN, "0123456789")],
+            ids=[
+                # トークンが異なる場合はキャッシュを共有しない
+                "when_token_differs_then_fetches",
+                # 組織キーが異なる場合はキャッシュを共有しない
+                "when_space_key_differs_then_fetches",
+            ],
+        )
+        async def test_when_key_differs_then_fetches(
+            self, mocker: MockerFixture, token: str, space_key: str
+        ) -> None:
+            """トークンやパラメータが異なる呼び出しにはキャッシュを返さない"""
+            # Arrange
+            api, inner_api, _, _ = _create_api(mocker)
+            await api.get_topics(TOKEN, "abcdefghij")
+
+            # Act
+            response = await api.get_topics(token, space_key)
+
+            # Assert
+            assert response == "topics 1"
+
+        async def test_when_cached_then_key_does_not_contain_raw_token(
+            self, mocker: MockerFixture
+        ) -> None:
+            """キャッシュのキーにはアクセストークン自体を含めない"""
+            # Arrange
+            api, _, cache, _ = _create_api(mocker)
+
+            # Act
+            await api.get_spaces(TOKEN)
+            await api.get_topics(TOKEN, "abcdefghij")
+
+            # Assert
+            keys = list(cache._entries)
+            assert all(key[0] == hash_token(TOKEN) for key in keys)
+            assert all(TOKEN not in key for key in keys)
+
+        async def test_when_invalidated_then_fetches_only_invalidated_token(
+            self, mocker: MockerFixture
+        ) -> None:
+            """無効化したトークンのエントリのみ破棄される"""
+            # Arrange
+            api, inner_api, cache, _ = _create_api(mocker)
+            await api.get_spaces(TOKEN)
+            await api.get_topics(TOKEN, "abcdefghij")
+            await api.get_spaces("other_token")
+
+            # Act
+            invalidated = cache.invalidate(hash_token(TOKEN))
+            await api.get_spaces(TOKEN)
+            await api.get_spaces("other_token")
+
+            # Assert
+            assert invalidated == 2
+            assert inner_api.get_spaces.await_count == 3
+            assert cache.stats.invalidations == 2
+
+        async def test_when_max_size_exceeded_then_evicts_least_recently_used(
+            self, mocker: MockerFixture
+        ) -> None:
+            """エントリ数の上限を超えた場合は最も長く使われていないエントリを破棄する"""
+            # Arrange
+            api, _, cache, _ = _create_api(mocker, max_size=2)
+            await api.get_topics(TOKEN, "space1")
+            await api.get_topics(TOKEN, "space2")
+            await api.get_topics(TOKEN, "space1")
+
+            # Act
+            await api.get_topics(TOKEN, "space3")
+
+            # Assert
+            assert [key[2] for key in cache._entries] == ["space1", "space3"]
+            assert cache.stats.evictions == 1
+
+        async def test_when_get_messages_called_then_delegates_without_cache(
+            self, mocker: MockerFixture
+        ) -> None:
+            """メッセージ一覧はキャッシュせずに委譲する"""
+            # Arrange
+            api, inner_api, cache, _ = _create_api(mocker)
+
+            # Act
+            await api.get_messages(TOKEN, 6310, None, 50)
+            await api.get_messages(TOKEN, 6310, None, 50)
+
+            # Assert
+            assert inner_api.get_messages.await_count == 2
+            assert cache.stats.size == 0
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        async def test_when_request_fails_then_does_not_cache_error(
+            self, mocker: MockerFixture
+        ) -> None:
+            """Typetalk APIのエラーはキャッシュしない"""
+            # Arrange
+            api, inner_api, cache, _ = _create_api(mocker)
+            inner_api.get_spaces.side_effect = [
+                TypetalkAPIError(401, {"error": "Unauthorized"}, ("Unauthorized",)),
+                "spaces",
+            ]
+
+            # Act
+            with pytest.raises(TypetalkAPIError):
+                await api.get_spaces(TOKEN)
+            response = await api.get_spaces(TOKEN)
+
+            # Assert
+            assert response == "spaces"
+            assert cache.stats.misses == 2
+
+        async def test_when_refresh_fails_then_keeps_stale_response(
+            self, mocker: MockerFixture
+        ) -> None:
+            """再取得に失敗した場合は再利用できる期間内は古いレスポンスを返し続ける"""
+            # Arrange
+            api, inner_api, cache, clock = _create_api(mocker)
+            inner_api.get_spaces.side_effect = ["spaces", RuntimeError("error")]
+            await api.get_spaces(TOKEN)
+            clock.return_value = 301.0
+
+            # Act
+            await api.get_spaces(TOKEN)
+            await _wait_refresh(cache)
+            response = await api.get_spaces(TOKEN)
+
+            # Assert
+            assert response == "spaces"
+            assert cache.stats.refresh_failures == 1
+            await cache.aclose()
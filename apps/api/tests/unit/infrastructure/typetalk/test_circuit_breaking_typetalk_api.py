@@ -0,0 +1,82 @@
+"""障害が続くTypetalk APIへのリクエストを遮断するクラスのテストケースを定義する"""
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.circuit_breaker import CircuitBreaker, CircuitState
+from src.infrastructure.typetalk.circuit_breaking_typetalk_api import (
+    CircuitBreakingTypetalkApi,
+)
+from src.infrastructure.typetalk.exceptions import (
+    TypetalkAPIError,
+    TypetalkCircuitOpenError,
+)
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+
+pytestmark = pytest.mark.anyio
+
+
+class TestCircuitBreakingTypetalkApi:
+    """CircuitBreakingTypetalkApiクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        async def test_when_client_error_returned_then_does_not_count_failure(
+            self, mocker: MockerFixture
+        ) -> None:
+            """4xxのエラーレスポンスは障害として数えない"""
+            # Arrange
+            inner_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            inner_api.get_spaces.side_effect = TypetalkAPIError(
+                status_code=401, content={"error": "invalid_token"}, detail=()
+            )
+            circuit_breaker = CircuitBreaker(failure_threshold=1)
+            api = CircuitBreakingTypetalkApi(inner_api, circuit_breaker)
+
+            # Act
+            with pytest.raises(TypetalkAPIError):
+                await api.get_spaces("invalid_typetalk_token")
+
+            # Assert
+            assert circuit_breaker.state == CircuitState.CLOSED
+            assert circuit_breaker.stats.failures == 0
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        @pytest.mark.parametrize(
+            "error",
+            [
+                TypetalkAPIError(status_code=502, content=None, detail=()),
+                httpx.ReadTimeout("timed out"),
+            ],
+            ids=[
+                # 5xxのエラーレスポンスは障害として数える
+                "when_server_error_returned_then_opens",
+                # タイムアウトは障害として数える
+                "when_timeout_occurs_then_opens",
+            ],
+        )
+        async def test_when_upstream_fails_then_rejects_without_request(
+            self, mocker: MockerFixture, error: Exception
+        ) -> None:
+            """障害が続いた後は Typetalk API へリクエストせずに503エラーとする"""
+            # Arrange
+            inner_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            inner_api.get_messages.side_effect = error
+            api = CircuitBreakingTypetalkApi(
+                inner_api, CircuitBreaker(failure_threshold=1)
+            )
+            with pytest.raises(type(error)):
+                await api.get_messages("valid_typetalk_token", 6310)
+
+            # Act
+            with pytest.raises(TypetalkCircuitOpenError) as exc:
+                await api.get_messages("valid_typetalk_token", 6310)
+
+            # Assert
+            assert exc.value.status_code == 503
+            assert exc.value.content == {"error": "circuit_open"}
+            inner_api.get_messages.assert_awaited_once()
@@ -0,0 +1,117 @@
+"""同じTypetalk APIへのリクエストを1回にまとめるクラスのテストケースを定義する"""
+
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.typetalk.coalescing_typetalk_api import (
+    CoalescingTypetalkApi,
+)
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.infrastructure.typetalk.single_flight import SingleFlight
+
+
+@pytest.mark.anyio
+class TestCoalescingTypetalkApi:
+    """CoalescingTypetalkApiクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        @pytest.mark.parametrize(
+            ("method_name", "args"),
+            [
+                ("get_spaces", ("valid_typetalk_token",)),
+                ("get_topics", ("valid_typetalk_token", "abcdefghij")),
+                ("get_messages", ("valid_typetalk_token", 6310, None)),
+            ],
+            ids=[
+                # 同時に行われる組織一覧取得は1回にまとめられる
+                "when_get_spaces_called_concurrently_then_requests_once",
+                # 同時に行われるトピック一覧取得は1回にまとめられる
+                "when_get_topics_called_concurrently_then_requests_once",
+                # 同時に行われるメッセージ一覧取得は1回にまとめられる
+                "when_get_messages_called_concurrently_then_requests_once",
+            ],
+        )
+        async def test_when_same_request_called_concurrently_then_requests_once(
+            self,
+            mocker: MockerFixture,
+            async_typetalk_api: IAsyncTypetalkApi,
+            method_name: str,
+            args: tuple,
+        ) -> None:
+            """同じリクエストを同時に行うとTypetalk APIへのリクエストは1回になる"""
+            # Arrange
+            spy = mocker.spy(async_typetalk_api, method_name)
+            single_flight = SingleFlight()
+            api = CoalescingTypetalkApi(async_typetalk_api, single_flight)
+
+            # Act
+            results = await asyncio.gather(
+                *(getattr(api, method_name)(*args) for _ in range(3))
+            )
+
+            # Assert
+            assert spy.call_count == 1
+            assert results[0] == results[1] == results[2]
+            assert single_flight.stats.collapsed == 2
+
+        @pytest.mark.parametrize(
+            ("first_args", "second_args"),
+            [
+                (("valid_typetalk_token", 6310, None), ("other_token", 6310, None)),
+                (
+                    ("valid_typetalk_token", 6310, None),
+                    ("valid_typetalk_token", 6310, 154011),
+                ),
+            ],
+            ids=[
+                # トークンが異なるリクエストはまとめられない
+                "when_tokens_differ_then_requests_each",
+                # パラメータが異なるリクエストはまとめられない
+                "when_params_differ_then_requests_each",
+            ],
+        )
+        async def test_when_different_requests_called_then_requests_each(
+            self,
+            mocker: MockerFixture,
+            first_args: tuple,
+            second_args: tuple,
+        ) -> None:
+            """トークンやパラメータが異なるリクエストはまとめられない"""
+            # Arrange
+            inner_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            api = CoalescingTypetalkApi(inner_api, SingleFlight())
+
+            # Act
+            await asyncio.gather(
+                api.get_messages(*first_args), api.get_messages(*second_args)
+            )
+
+            # Assert
+            assert inner_api.get_messages.await_count == 2
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        async def test_when_request_fails_then_all_callers_receive_error(
+            self,
+            async_typetalk_api: IAsyncTypetalkApi,
+        ) -> None:
+            """Typetalk APIのエラーは待機中の全ての呼び出し元に送出される"""
+            # Arrange
+            api = CoalescingTypetalkApi(async_typetalk_api, SingleFlight())
+
+            # Act
+            results = await asyncio.gather(
+                *(api.get_spaces("invalid_typetalk_token") for _ in range(3)),
+                return_exceptions=True,
+            )
+
+            # Assert
+            assert [
+                x.status_code if isinstance(x, TypetalkAPIError) else x for x in results
+            ] == [401] * 3
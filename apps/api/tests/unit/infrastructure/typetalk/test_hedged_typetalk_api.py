@@ -0,0 +1,68 @@
+"""Typetalk APIへのリクエストをヘッジするクラスのテストケースを定義する"""
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.core.hedging import RequestHedger
+from src.infrastructure.typetalk.hedged_typetalk_api import HedgedTypetalkApi
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+
+pytestmark = pytest.mark.anyio
+
+
+class TestHedgedTypetalkApi:
+    """HedgedTypetalkApiクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        @pytest.mark.parametrize(
+            ("method_name", "args"),
+            [
+                ("get_spaces", ("valid_typetalk_token",)),
+                ("get_topics", ("valid_typetalk_token", "abcdefghij")),
+                ("get_messages", ("valid_typetalk_token", 6310, None, 50, None)),
+            ],
+            ids=[
+                # 組織一覧取得はエンドポイントのヘッジの仕組みを通して呼び出される
+                "when_get_spaces_called_then_runs_with_hedger",
+                # トピック一覧取得はエンドポイントのヘッジの仕組みを通して呼び出される
+                "when_get_topics_called_then_runs_with_hedger",
+                # メッセージ一覧取得はエンドポイントのヘッジの仕組みを通して呼び出される
+                "when_get_messages_called_then_runs_with_hedger",
+            ],
+        )
+        async def test_when_called_then_runs_with_endpoint_hedger(
+            self, mocker: MockerFixture, method_name: str, args: tuple
+        ) -> None:
+            """エンドポイントごとのヘッジの仕組みを通して呼び出される"""
+            # Arrange
+            inner_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            hedger = RequestHedger()
+            other_hedger = RequestHedger()
+            hedgers = {
+                name: hedger if name == method_name else other_hedger
+                for name in ("get_spaces", "get_topics", "get_messages")
+            }
+            api = HedgedTypetalkApi(inner_api, hedgers)
+
+            # Act
+            await getattr(api, method_name)(*args)
+
+            # Assert
+            getattr(inner_api, method_name).assert_awaited_once_with(*args)
+            assert (hedger.stats.calls, other_hedger.stats.calls) == (1, 0)
+
+        async def test_when_hedger_missing_then_calls_directly(
+            self, mocker: MockerFixture
+        ) -> None:
+            """ヘッジの仕組みが無いエンドポイントはそのまま呼び出される"""
+            # Arrange
+            inner_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            api = HedgedTypetalkApi(inner_api, {})
+
+            # Act
+            await api.get_spaces("valid_typetalk_token")
+
+            # Assert
+            inner_api.get_spaces.assert_awaited_once_with("valid_typetalk_token")
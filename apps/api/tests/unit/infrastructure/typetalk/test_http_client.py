@@ -0,0 +1,122 @@
+"""Typetalk APIの共有HTTPクライアントのテストケースを定義する"""
+
+from collections.abc import Generator
+
+import httpx
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from src.core.config import get_settings
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.http_client import (
+    TypetalkTimeouts,
+    close_typetalk_http_client,
+    get_typetalk_http_client,
+)
+from src.infrastructure.typetalk.typetalk_api import TypetalkApi
+from src.main import app
+
+
+class TestTypetalkHttpClient:
+    """共有HTTPクライアントのテストケース"""
+
+    @pytest.fixture(autouse=True)
+    def reset_http_client(self) -> Generator[None, None, None]:
+        """テストの前後で共有HTTPクライアントを破棄する"""
+        close_typetalk_http_client()
+        yield
+        close_typetalk_http_client()
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        def test_when_called_multiple_times_then_returns_same_client(self) -> None:
+            """複数回呼び出しても同じクライアントが返される"""
+            # Act
+            first = get_typetalk_http_client()
+            second = get_typetalk_http_client()
+
+            # Assert
+            assert first is second
+            assert not first.is_closed
+
+        def test_when_closed_then_next_call_creates_new_client(self) -> None:
+            """クローズ後の呼び出しでは新しいクライアントが作成される"""
+            # Arrange
+            first = get_typetalk_http_client()
+
+            # Act
+            close_typetalk_http_client()
+            second = get_typetalk_http_client()
+
+            # Assert
+            assert first.is_closed
+            assert first is not second
+
+        def test_when_app_lifespan_ends_then_clients_are_closed(self) -> None:
+            """アプリケーションの終了時に共有クライアントがクローズされる"""
+            # Act
+            with TestClient(app) as test_client:
+                client = get_typetalk_http_client()
+                async_client = app.state.typetalk_async_http_client
+                response = test_client.get(
+                    "/spaces", headers={"x-typetalk-token": "valid_typetalk_token"}
+                )
+                assert response.status_code == status.HTTP_200_OK
+                assert not client.is_closed
+                assert not async_client.is_closed
+
+            # Assert
+            assert client.is_closed
+            assert async_client.is_closed
+            assert not hasattr(app.state, "typetalk_async_http_client")
+
+        @pytest.mark.parametrize(
+            ("method_name", "args", "expected_read_timeout"),
+            [
+                ("get_spaces", ("token",), 1.0),
+                ("get_topics", ("token", "space_key"), 2.0),
+                ("get_messages", ("token", 6310), 3.0),
+            ],
+            ids=[
+                # 組織一覧取得では組織一覧用のタイムアウトが使用される
+                "when_get_spaces_called_then_uses_spaces_timeout",
+                # トピック一覧取得ではトピック一覧用のタイムアウトが使用される
+                "when_get_topics_called_then_uses_topics_timeout",
+                # メッセージ一覧取得ではメッセージ一覧用のタイムアウトが使用される
+                "when_get_messages_called_then_uses_messages_timeout",
+            ],
+        )
+        def test_when_request_sent_then_uses_endpoint_timeout(
+            self,
+            monkeypatch: pytest.MonkeyPatch,
+            method_name: str,
+            args: tuple,
+            expected_read_timeout: float,
+        ) -> None:
+            """エンドポイントごとのタイムアウトでリクエストが送信される"""
+            # Arrange
+            monkeypatch.setenv("TYPETALK_SPACES_TIMEOUT", "1.0")
+            monkeypatch.setenv("TYPETALK_TOPICS_TIMEOUT", "2.0")
+            monkeypatch.setenv("TYPETALK_MESSAGES_TIMEOUT", "3.0")
+            get_settings.cache_clear()
+            timeouts: list[dict] = []
+
+            def handler(request: httpx.Request) -> httpx.Response:
+                timeouts.append(request.extensions["timeout"])
+                return httpx.Response(500)
+
+            client = httpx.Client(transport=httpx.MockTransport(handler))
+            typetalk_api = TypetalkApi(
+                "http://typetalk.test",
+                client=client,
+                timeouts=TypetalkTimeouts.from_settings(get_settings()),
+            )
+
+            # Act
+            with pytest.raises(TypetalkAPIError):
+                getattr(typetalk_api, method_name)(*args)
+
+            # Assert
+            assert timeouts[0]["read"] == expected_read_timeout
@@ -0,0 +1,159 @@
+"""Typetalk APIのエラーレスポンスをキャッシュするクラスのテストケースを定義する"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.typetalk.exceptions import (
+    CachedTypetalkAPIError,
+    TypetalkAPIError,
+)
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.infrastructure.typetalk.negative_cache import TypetalkNegativeCache
+from src.infrastructure.typetalk.negative_caching_typetalk_api import (
+    NegativeCachingTypetalkApi,
+)
+
+pytestmark = pytest.mark.anyio
+
+TOKEN = "invalid_typetalk_token"
+ERROR_CONTENT = {"error": "invalid_token"}
+
+
+def _create_api(
+    mocker: MockerFixture, status_code: int = 401
+) -> tuple[NegativeCachingTypetalkApi, AsyncMock, TypetalkNegativeCache, Mock]:
+    """常にエラーを発生させるモックと時刻を固定したキャッシュからAPIを作成する
+
+    Returns:
+        tuple[NegativeCachingTypetalkApi, AsyncMock, TypetalkNegativeCache, Mock]:
+            作成したAPI、呼び出し対象のモック、キャッシュ、時刻を返すモック
+    """
+    inner_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+    error = TypetalkAPIError(status_code, ERROR_CONTENT, ("error",))
+    inner_api.get_spaces.side_effect = error
+    inner_api.get_messages.side_effect = error
+    clock = mocker.Mock(return_value=0.0)
+    cache = TypetalkNegativeCache(ttl_seconds=10.0, clock=clock)
+    return NegativeCachingTypetalkApi(inner_api, cache), inner_api, cache, clock
+
+
+class TestNegativeCachingTypetalkApi:
+    """NegativeCachingTypetalkApiクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        async def test_when_succeeded_then_returns_response(
+            self, mocker: MockerFixture
+        ) -> None:
+            """正常なレスポンスはキャッシュせずにそのまま返す"""
+            # Arrange
+            inner_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            inner_api.get_spaces.return_value = "spaces"
+            cache = TypetalkNegativeCache()
+            api = NegativeCachingTypetalkApi(inner_api, cache)
+
+            # Act
+            response = await api.get_spaces("valid_typetalk_token")
+
+            # Assert
+            assert response == "spaces"
+            assert cache.stats.size == 0
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        @pytest.mark.parametrize(
+            "status_code",
+            [401, 403, 404],
+            ids=[
+                # 認証エラーはキャッシュされる
+                "when_unauthorized_then_caches_error",
+                # 権限エラーはキャッシュされる
+                "when_forbidden_then_caches_error",
+                # 存在しないリソースへのエラーはキャッシュされる
+                "when_not_found_then_caches_error",
+            ],
+        )
+        async def test_when_cacheable_error_repeated_then_raises_cached_error(
+            self, mocker: MockerFixture, status_code: int
+        ) -> None:
+            """キャッシュ対象のエラーはリクエストせずに同じ内容で発生する"""
+            # Arrange
+            api, inner_api, cache, _ = _create_api(mocker, status_code)
+            with pytest.raises(TypetalkAPIError):
+                await api.get_spaces(TOKEN)
+
+            # Act
+            with pytest.raises(CachedTypetalkAPIError) as exc_info:
+                await api.get_spaces(TOKEN)
+
+            # Assert
+            assert exc_info.value.status_code == status_code
+            assert exc_info.value.content == ERROR_CONTENT
+            assert inner_api.get_spaces.await_count == 1
+            assert cache.stats.hits == 1
+
+        async def test_when_server_error_then_does_not_cache(
+            self, mocker: MockerFixture
+        ) -> None:
+            """サーバーエラーはキャッシュせずに毎回Typetalk APIへリクエストする"""
+            # Arrange
+            api, inner_api, cache, _ = _create_api(mocker, 500)
+
+            # Act
+            for _ in range(2):
+                with pytest.raises(TypetalkAPIError) as exc_info:
+                    await api.get_spaces(TOKEN)
+
+            # Assert
+            assert not isinstance(exc_info.value, CachedTypetalkAPIError)
+            assert inner_api.get_spaces.await_count == 2
+            assert cache.stats.size == 0
+
+        async def test_when_ttl_expired_then_requests_again(
+            self, mocker: MockerFixture
+        ) -> None:
+            """有効期間を過ぎたエラーレスポンスは返さずに改めてリクエストする"""
+            # Arrange
+            api, inner_api, _, clock = _create_api(mocker)
+            with pytest.raises(TypetalkAPIError):
+                await api.get_messages(TOKEN, 6310)
+            clock.return_value = 10.0
+
+            # Act
+            with pytest.raises(TypetalkAPIError) as exc_info:
+                await api.get_messages(TOKEN, 6310, 154011)
+
+            # Assert
+            assert not isinstance(exc_info.value, CachedTypetalkAPIError)
+            assert inner_api.get_messages.await_count == 2
+
+        @pytest.mark.parametrize(
+            ("token", "topic_id"),
+            [("other_token", 6310), (TOKEN, 6311)],
+            ids=[
+                # トークンが異なる場合はキャッシュしたエラーを返さない
+                "when_token_differs_then_requests",
+                # トピックIDが異なる場合はキャッシュしたエラーを返さない
+                "when_topic_id_differs_then_requests",
+            ],
+        )
+        async def test_when_key_differs_then_requests(
+            self, mocker: MockerFixture, token: str, topic_id: int
+        ) -> None:
+            """トークンやエンドポイントのパラメータが異なる場合はリクエストする"""
+            # Arrange
+            api, inner_api, _, _ = _create_api(mocker)
+            with pytest.raises(TypetalkAPIError):
+                await api.get_messages(TOKEN, 6310)
+
+            # Act
+            with pytest.raises(TypetalkAPIError) as exc_info:
+                await api.get_messages(token, topic_id)
+
+            # Assert
+            assert not isinstance(exc_info.value, CachedTypetalkAPIError)
+            assert inner_api.get_messages.await_count == 2
@@ -0,0 +1,231 @@
+"""Typetalk APIのレート制限に合わせて送信を調整する仕組みのテストケースを定義する"""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.rate_limiter import TypetalkRateLimiter
+
+pytestmark = pytest.mark.anyio
+
+TOKEN_HASH = "token_hash"
+# UNIX時間の現在時刻
+WALL_NOW = 1_700_000_000
+
+
+class _FakeSleep:
+    """待機した時間を記録し、現在時刻を進める待機関数"""
+
+    def __init__(self, clock: Mock) -> None:
+        self.clock = clock
+        self.calls: list[float] = []
+
+    async def __call__(self, seconds: float) -> None:
+        self.calls.append(seconds)
+        self.clock.return_value += seconds
+
+
+def _create_limiter(
+    mocker: MockerFixture,
+    smoothing_threshold: float = 0.2,
+    max_wait_seconds: float = 10.0,
+    initial_concurrency: int = 4,
+    max_concurrency: int = 32,
+) -> tuple[TypetalkRateLimiter, _FakeSleep]:
+    """時刻と待機を差し替えたインスタンスを作成する"""
+    clock = mocker.Mock(return_value=0.0)
+    sleep = _FakeSleep(clock)
+    limiter = TypetalkRateLimiter(
+        smoothing_threshold=smoothing_threshold,
+        max_wait_seconds=max_wait_seconds,
+        initial_concurrency=initial_concurrency,
+        max_concurrency=max_concurrency,
+        clock=clock,
+        wall_clock=mocker.Mock(return_value=float(WALL_NOW)),
+        sleep=sleep,
+    )
+    return limiter, sleep
+
+
+def _headers(limit: int, remaining: int, reset_in: int) -> dict[str, str]:
+    """レート制限のレスポンスヘッダーを作成する"""
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(WALL_NOW + reset_in),
+    }
+
+
+class TestTypetalkRateLimiter:
+    """TypetalkRateLimiterクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        async def test_when_budget_remains_then_does_not_wait(
+            self, mocker: MockerFixture
+        ) -> None:
+            """残りリクエスト数が十分にある場合は待機せずに送信できる"""
+            # Arrange
+            limiter, sleep = _create_limiter(mocker)
+            await limiter.acquire(TOKEN_HASH)
+            limiter.release(TOKEN_HASH, 200, _headers(100, 90, 60))
+
+            # Act
+            for _ in range(5):
+                await limiter.acquire(TOKEN_HASH)
+
+            # Assert
+            assert sleep.calls == []
+            assert limiter.stats.lowest_remaining == 85
+
+        async def test_when_budget_exhausted_then_waits_until_reset(
+            self, mocker: MockerFixture
+        ) -> None:
+            """残りリクエスト数を使い切った場合はリセット時刻まで待機する"""
+            # Arrange
+            limiter, sleep = _create_limiter(mocker)
+            await limiter.acquire(TOKEN_HASH)
+            limiter.release(TOKEN_HASH, 200, _headers(100, 0, 5))
+
+            # Act
+            await limiter.acquire(TOKEN_HASH)
+
+            # Assert
+            assert sleep.calls == [5.0]
+            assert limiter.stats.delayed == 1
+            # リセット後は上限から1件消費した状態になる
+            assert limiter.stats.lowest_remaining == 99
+
+        async def test_when_budget_low_then_spreads_requests_until_reset(
+            self, mocker: MockerFixture
+        ) -> None:
+            """残りリクエスト数が少ない場合はリセット時刻までの間に送信を分散させる"""
+            # Arrange
+            limiter, sleep = _create_limiter(mocker, smoothing_threshold=0.2)
+            await limiter.acquire(TOKEN_HASH)
+            limiter.release(TOKEN_HASH, 200, _headers(100, 10, 10))
+
+            # Act
+            for _ in range(3):
+                await limiter.acquire(TOKEN_HASH)
+
+            # Assert
+            # 10秒で10件のため、1秒間隔で送信される
+            assert sleep.calls == [pytest.approx(1.0), pytest.approx(1.0)]
+
+        async def test_when_limit_unknown_then_limits_concurrency(
+            self, mocker: MockerFixture
+        ) -> None:
+            """レート制限が不明な場合は同時実行数の上限を超えて送信しない"""
+            # Arrange
+            limiter, _ = _create_limiter(mocker, initial_concurrency=2)
+            await limiter.acquire(TOKEN_HASH)
+            await limiter.acquire(TOKEN_HASH)
+
+            # Act
+            task = asyncio.create_task(limiter.acquire(TOKEN_HASH))
+            await asyncio.sleep(0)
+            blocked = not task.done()
+            limiter.release(TOKEN_HASH, 200)
+            await task
+
+            # Assert
+            assert blocked
+            assert limiter.stats.delayed == 1
+
+        async def test_when_requests_succeed_then_increases_concurrency_limit(
+            self, mocker: MockerFixture
+        ) -> None:
+            """成功したレスポンスごとに同時実行数の上限が増える"""
+            # Arrange
+            limiter, _ = _create_limiter(
+                mocker, initial_concurrency=2, max_concurrency=3
+            )
+
+            # Act
+            for _ in range(10):
+                await limiter.acquire(TOKEN_HASH)
+                limiter.release(TOKEN_HASH, 200)
+
+            # Assert
+            assert limiter.stats.lowest_concurrency_limit == 3
+
+        async def test_when_responses_overlap_then_never_exceeds_limit(
+            self, mocker: MockerFixture
+        ) -> None:
+            """送信中のリクエストがあり、レスポンスが順不同に届いても上限を超えない"""
+            # Arrange
+            limit = 5
+            limiter, _ = _create_limiter(mocker)
+            # Typetalk 側で消費されたリクエスト数と、送信中のリクエストの残り数
+            server_used = 0
+            pending: list[int] = []
+
+            async def send_available() -> None:
+                nonlocal server_used
+                while True:
+                    try:
+                        await limiter.acquire(TOKEN_HASH)
+                    except TypetalkAPIError:
+                        return
+                    server_used += 1
+                    assert server_used <= limit
+                    pending.append(limit - server_used)
+
+            await send_available()
+            limiter.release(TOKEN_HASH, 200, _headers(limit, pending.pop(), 60))
+
+            # Act
+            await send_available()
+            # 最初に送信したリクエストのレスポンスが先に届き、残りは逆順に届く
+            limiter.release(TOKEN_HASH, 200, _headers(limit, pending.pop(0), 60))
+            await send_available()
+            while pending:
+                limiter.release(TOKEN_HASH, 200, _headers(limit, pending.pop(), 60))
+                await send_available()
+
+            # Assert
+            assert server_used == limit
+            assert limiter.stats.lowest_remaining == 0
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        async def test_when_throttled_then_halves_concurrency_and_backs_off(
+            self, mocker: MockerFixture
+        ) -> None:
+            """レート制限の超過を返された場合は同時実行数を半減し、指定の時間待機する"""
+            # Arrange
+            limiter, sleep = _create_limiter(mocker, initial_concurrency=8)
+            await limiter.acquire(TOKEN_HASH)
+
+            # Act
+            limiter.release(TOKEN_HASH, 429, {"Retry-After": "3"})
+            await limiter.acquire(TOKEN_HASH)
+
+            # Assert
+            assert sleep.calls == [3.0]
+            stats = limiter.stats
+            assert (stats.throttled, stats.lowest_concurrency_limit) == (1, 4)
+
+        async def test_when_wait_exceeds_max_then_raises_error(
+            self, mocker: MockerFixture
+        ) -> None:
+            """待機時間が上限を超える場合は送信せずに429エラーを発生させる"""
+            # Arrange
+            limiter, sleep = _create_limiter(mocker, max_wait_seconds=10.0)
+            await limiter.acquire(TOKEN_HASH)
+            limiter.release(TOKEN_HASH, 200, _headers(100, 0, 60))
+
+            # Act
+            with pytest.raises(TypetalkAPIError) as exc_info:
+                await limiter.acquire(TOKEN_HASH)
+
+            # Assert
+            assert exc_info.value.status_code == 429
+            assert sleep.calls == []
+            assert limiter.stats.rejected == 1
@@ -0,0 +1,145 @@
+"""同時実行中の処理を1回にまとめる仕組みのテストケースを定義する"""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.single_flight import SingleFlight, SingleFlightStats
+
+
+@pytest.mark.anyio
+class TestSingleFlight:
+    """SingleFlightクラスのテストケース"""
+
+    class TestDo:
+        """doメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            async def test_when_same_key_called_concurrently_then_executes_once(
+                self,
+            ) -> None:
+                """同じキーで同時に呼び出した場合は処理が1回だけ実行され結果が共有される"""
+                # Arrange
+                single_flight = SingleFlight()
+                release = asyncio.Event()
+                executions = 0
+
+                async def func() -> dict:
+                    nonlocal executions
+                    executions += 1
+                    await release.wait()
+                    return {"result": executions}
+
+                # Act
+                tasks = [
+                    asyncio.create_task(single_flight.do("key", func)) for _ in range(5)
+                ]
+                await asyncio.sleep(0)
+                release.set()
+                results = await asyncio.gather(*tasks)
+
+                # Assert
+                assert executions == 1
+                assert all(result is results[0] for result in results)
+                assert single_flight.stats == SingleFlightStats(
+                    calls=5, executions=1, collapsed=4, in_flight=0
+                )
+
+            async def test_when_different_keys_called_then_executes_each(
+                self,
+            ) -> None:
+                """異なるキーで呼び出した場合はそれぞれ処理が実行される"""
+                # Arrange
+                single_flight = SingleFlight()
+
+                async def func(value: str) -> str:
+                    await asyncio.sleep(0)
+                    return value
+
+                # Act
+                results = await asyncio.gather(
+                    single_flight.do("a", lambda: func("a")),
+                    single_flight.do("b", lambda: func("b")),
+                )
+
+                # Assert
+                assert results == ["a", "b"]
+                assert single_flight.stats.executions == 2
+
+            async def test_when_previous_call_completed_then_executes_again(
+                self,
+            ) -> None:
+                """完了した処理の結果は保持されず、次の呼び出しで再度実行される"""
+                # Arrange
+                single_flight = SingleFlight()
+                executions = 0
+
+                async def func() -> int:
+                    nonlocal executions
+                    executions += 1
+                    return executions
+
+                # Act
+                first = await single_flight.do("key", func)
+                second = await single_flight.do("key", func)
+
+                # Assert
+                assert (first, second) == (1, 2)
+
+            async def test_when_one_caller_cancelled_then_others_receive_result(
+                self,
+            ) -> None:
+                """呼び出し元の1つがキャンセルされても他の呼び出し元は結果を受け取る"""
+                # Arrange
+                single_flight = SingleFlight()
+                release = asyncio.Event()
+
+                async def func() -> str:
+                    await release.wait()
+                    return "result"
+
+                first = asyncio.create_task(single_flight.do("key", func))
+                second = asyncio.create_task(single_flight.do("key", func))
+                await asyncio.sleep(0)
+
+                # Act
+                first.cancel()
+                release.set()
+
+                # Assert
+                assert await second == "result"
+                with pytest.raises(asyncio.CancelledError):
+                    await first
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            async def test_when_func_raises_error_then_all_callers_receive_error(
+                self,
+            ) -> None:
+                """処理でエラーが発生した場合は待機中の全ての呼び出し元にエラーが送出される"""
+                # Arrange
+                single_flight = SingleFlight()
+                release = asyncio.Event()
+
+                async def func() -> None:
+                    await release.wait()
+                    raise TypetalkAPIError(
+                        status_code=401, content=None, detail=("Unauthorized",)
+                    )
+
+                tasks = [
+                    asyncio.create_task(single_flight.do("key", func)) for _ in range(3)
+                ]
+                await asyncio.sleep(0)
+
+                # Act
+                release.set()
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+
+                # Assert
+                assert all(isinstance(x, TypetalkAPIError) for x in results)
+                assert single_flight.stats.executions == 1
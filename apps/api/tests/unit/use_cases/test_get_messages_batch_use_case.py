@@ -0,0 +1,212 @@
+"""get_messages_batch_async_use_caseのテストモジュールを定義する"""
+
+import asyncio
+
+import pytest
+from fastapi import status
+from pytest_mock import MockerFixture
+
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentEnum,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.exceptions import (
+    ComprehendError,
+    ComprehendErrorType,
+)
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.schemas.account import Account
+from src.schemas.message import Post, TypetalkGetMessagesResponse
+from src.schemas.topic import Topic
+from src.use_cases.get_messages import ANALYSIS_CHUNK_SIZE
+from src.use_cases.get_messages_batch import get_messages_batch_async_use_case
+
+pytestmark = pytest.mark.anyio
+
+
+def _topic_page(topic_id: int, post_count: int) -> TypetalkGetMessagesResponse:
+    """指定の件数のポストを持つトピックのメッセージ一覧を作成する"""
+    return TypetalkGetMessagesResponse(
+        topic=Topic(id=topic_id, name=f"トピック{topic_id}"),
+        has_next=False,
+        posts=[
+            Post(
+                id=topic_id * 1000 + i,
+                message=f"message {topic_id}-{i}",
+                updated_at="2024-01-23T00:00:00Z",
+                account=Account(id=1, name="test", image_url=""),
+            )
+            for i in range(post_count)
+        ],
+    )
+
+
+async def _batch_detect_sentiment(text_list: list[str]) -> BatchDetectSentimentResponse:
+    """全てのテキストを肯定的と判定する感情分析の結果を返す"""
+    return BatchDetectSentimentResponse(
+        result_list=[
+            SentimentResult(
+                index=index, sentiment=SentimentEnum.POSITIVE, sentiment_score={}
+            )
+            for index in range(len(text_list))
+        ],
+        error_list=[],
+    )
+
+
+class TestGetMessagesBatchAsyncUseCase:
+    """get_messages_batch_async_use_caseのテストクラス"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        async def test_when_topics_have_posts_then_pools_texts_into_full_batches(
+            self, mocker: MockerFixture
+        ) -> None:
+            """全てのトピックのポストをまとめて、上限の件数ごとに感情分析する"""
+            # Arrange
+            post_count = ANALYSIS_CHUNK_SIZE * 3 // 5
+            typetalk_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            typetalk_api.get_messages.side_effect = (
+                lambda token, topic_id, from_id, count: _topic_page(
+                    topic_id, post_count
+                )
+            )
+            comprehend_api = mocker.AsyncMock(spec=IAsyncAwsComprehendApi)
+            comprehend_api.batch_detect_sentiment.side_effect = _batch_detect_sentiment
+
+            # Act
+            response = await get_messages_batch_async_use_case(
+                typetalk_api,
+                comprehend_api,
+                "valid_typetalk_token",
+                [1, 2, 1],
+            )
+
+            # Assert
+            assert [x.topic_id for x in response.results] == [1, 2]
+            assert all(x.error is None for x in response.results)
+            for result in response.results:
+                assert result.messages is not None
+                assert len(result.messages.posts) == post_count
+                assert all(x.sentiment == "POSITIVE" for x in result.messages.posts)
+            assert [
+                len(x.args[0])
+                for x in comprehend_api.batch_detect_sentiment.await_args_list
+            ] == [ANALYSIS_CHUNK_SIZE, post_count * 2 - ANALYSIS_CHUNK_SIZE]
+
+        async def test_when_many_topics_then_fetches_within_max_concurrency(
+            self, mocker: MockerFixture
+        ) -> None:
+            """同時に取得するトピック数は上限を超えない"""
+            # Arrange
+            in_flight = 0
+            max_in_flight = 0
+
+            async def get_messages(
+                token: str, topic_id: int, from_id: int | None, count: int | None
+            ) -> TypetalkGetMessagesResponse:
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return _topic_page(topic_id, 1)
+
+            typetalk_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            typetalk_api.get_messages.side_effect = get_messages
+            comprehend_api = mocker.AsyncMock(spec=IAsyncAwsComprehendApi)
+            comprehend_api.batch_detect_sentiment.side_effect = _batch_detect_sentiment
+
+            # Act
+            response = await get_messages_batch_async_use_case(
+                typetalk_api,
+                comprehend_api,
+                "valid_typetalk_token",
+                list(range(1, 11)),
+                count=1,
+                max_concurrency=3,
+            )
+
+            # Assert
+            assert len(response.results) == 10
+            assert max_in_flight == 3
+            comprehend_api.batch_detect_sentiment.assert_awaited_once()
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        async def test_when_topic_fetch_fails_then_returns_error_for_that_topic(
+            self, mocker: MockerFixture
+        ) -> None:
+            """取得に失敗したトピックのみエラーを返し、他のトピックは結果を返す"""
+
+            # Arrange
+            async def get_messages(
+                token: str, topic_id: int, from_id: int | None, count: int | None
+            ) -> TypetalkGetMessagesResponse:
+                if topic_id == 0:
+                    raise TypetalkAPIError(
+                        status.HTTP_404_NOT_FOUND, {"error": "not_found"}, ()
+                    )
+                return _topic_page(topic_id, 2)
+
+            typetalk_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            typetalk_api.get_messages.side_effect = get_messages
+            comprehend_api = mocker.AsyncMock(spec=IAsyncAwsComprehendApi)
+            comprehend_api.batch_detect_sentiment.side_effect = _batch_detect_sentiment
+
+            # Act
+            response = await get_messages_batch_async_use_case(
+                typetalk_api, comprehend_api, "valid_typetalk_token", [1, 0]
+            )
+
+            # Assert
+            ok, failed = response.results
+            assert ok.messages is not None
+            assert [x.sentiment for x in ok.messages.posts] == ["POSITIVE"] * 2
+            assert failed.messages is None
+            assert failed.error is not None
+            assert (failed.error.status, failed.error.detail) == (
+                status.HTTP_404_NOT_FOUND,
+                "not_found",
+            )
+
+        async def test_when_comprehend_fails_then_returns_errors_for_owning_topics(
+            self, mocker: MockerFixture
+        ) -> None:
+            """感情分析に失敗したチャンクのポストを含むトピックのみエラーを返す"""
+            # Arrange
+            typetalk_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            typetalk_api.get_messages.side_effect = (
+                lambda token, topic_id, from_id, count: _topic_page(
+                    topic_id, ANALYSIS_CHUNK_SIZE if topic_id == 1 else 1
+                )
+            )
+
+            async def batch_detect_sentiment(
+                text_list: list[str],
+            ) -> BatchDetectSentimentResponse:
+                if len(text_list) < ANALYSIS_CHUNK_SIZE:
+                    raise ComprehendError(ComprehendErrorType.THROTTLING, "throttled")
+                return await _batch_detect_sentiment(text_list)
+
+            comprehend_api = mocker.AsyncMock(spec=IAsyncAwsComprehendApi)
+            comprehend_api.batch_detect_sentiment.side_effect = batch_detect_sentiment
+
+            # Act
+            response = await get_messages_batch_async_use_case(
+                typetalk_api, comprehend_api, "valid_typetalk_token", [1, 2]
+            )
+
+            # Assert
+            ok, failed = response.results
+            assert ok.messages is not None
+            assert ok.error is None
+            assert failed.error is not None
+            assert failed.error.status == status.HTTP_429_TOO_MANY_REQUESTS
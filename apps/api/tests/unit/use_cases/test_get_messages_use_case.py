@@ -1,23 +1,63 @@
 """get_messages_use_caseのテストモジュールを定義する"""
 
+import asyncio
+from pathlib import Path
+
 import pytest
 from fastapi import status
 from pytest_mock import MockerFixture
 
+from src.infrastructure.aws.comprehend.async_aws_comprehend_api import (
+    AsyncAwsComprehendApi,
+)
 from src.infrastructure.aws.comprehend.aws_comprehend_api import AwsComprehendApi
 from src.infrastructure.aws.comprehend.aws_comprehend_api_mock import (
     AwsComprehendApiMock,
 )
+from src.infrastructure.aws.comprehend.aws_comprehend_models import (
+    BatchDetectSentimentResponse,
+    SentimentEnum,
+    SentimentResult,
+)
+from src.infrastructure.aws.comprehend.chunked_aws_comprehend_api import (
+    ChunkedAwsComprehendApi,
+)
 from src.infrastructure.aws.comprehend.exceptions import (
     ComprehendError,
     ComprehendErrorType,
 )
+from src.infrastructure.aws.comprehend.i_async_aws_comprehend_api import (
+    IAsyncAwsComprehendApi,
+)
+from src.infrastructure.sentiment_store.sqlite_sentiment_store import (
+    SqliteSentimentStore,
+)
 from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
 from src.infrastructure.typetalk.i_typetalk_api import ITypetalkApi
 from src.schemas.account import Account
-from src.schemas.message import GetMessagesResponse, Post
+from src.schemas.message import (
+    GetMessagesResponse,
+    MessagesStreamHeader,
+    MessagesStreamPost,
+    MessagesStreamSentiments,
+    Post,
+    SentimentPatch,
+    TypetalkGetMessagesResponse,
+)
 from src.schemas.topic import Topic
-from src.use_cases.get_messages import get_messages_use_case
+from src.use_cases.get_messages import (
+    ANALYSIS_CHUNK_SIZE,
+    SINCE_MAX_PAGES,
+    SINCE_PAGE_SIZE,
+    get_messages_async_use_case,
+    get_messages_since_async_use_case,
+    get_messages_use_case,
+    stream_messages_async_use_case,
+)
+from tests.unit.mocks.aws.comprehend.aws_comprehend_api_mock_error import (
+    AwsComprehendApiMockError,
+)
 
 
 class TestGetMessagesUseCase:
@@ -175,6 +215,153 @@ class TestGetMessagesUseCase:
             # Assert
             assert response == expected
 
+        def test_when_posts_exceed_batch_size_then_analyzes_all_posts(
+            self,
+            mocker: MockerFixture,
+            typetalk_api: ITypetalkApi,
+        ) -> None:
+            """バッチサイズの上限を超えるポストでも全てのポストが感情分析される"""
+            # Arrange
+            topic_id = 6310
+            post_count = AwsComprehendApi.MAX_BATCH_SIZE * 2 + 10
+            mock_response = GetMessagesResponse(
+                topic=Topic(id=topic_id, name="テストトピック", description=""),
+                has_next=False,
+                posts=[
+                    Post(
+                        id=i,
+                        # 奇数IDのポストはネガティブなメッセージとする
+                        message="NG" if i % 2 else "OK",
+                        updated_at="2024-01-23T00:00:00Z",
+                        account=Account(id=1, name="test", image_url=""),
+                        sentiment=None,
+                    )
+                    for i in range(post_count)
+                ],
+            )
+            mocker.patch.object(
+                typetalk_api, "get_messages", return_value=mock_response
+            )
+            comprehend_client = mocker.Mock()
+            comprehend_client.batch_detect_sentiment.side_effect = (
+                lambda TextList, LanguageCode: {  # noqa: N803
+                    "ResultList": [
+                        {
+                            "Index": index,
+                            "Sentiment": "NEGATIVE" if text == "NG" else "POSITIVE",
+                            "SentimentScore": {},
+                        }
+                        for index, text in enumerate(TextList)
+                    ],
+                    "ErrorList": [],
+                }
+            )
+            aws_comprehend_api = ChunkedAwsComprehendApi(
+                AwsComprehendApi(comprehend_client=comprehend_client),
+                chunk_size=AwsComprehendApi.MAX_BATCH_SIZE,
+            )
+
+            # Act
+            response = get_messages_use_case(
+                typetalk_api,
+                aws_comprehend_api,
+                "valid_typetalk_token",
+                topic_id,
+            )
+
+            # Assert
+            assert comprehend_client.batch_detect_sentiment.call_count == 3
+            assert [(post.id, post.sentiment) for post in response.posts] == [
+                (i, "NEGATIVE" if i % 2 else "POSITIVE")
+                for i in reversed(range(post_count))
+            ]
+
+        def test_when_some_texts_fail_then_sets_sentiments_by_result_index(
+            self,
+            mocker: MockerFixture,
+            typetalk_api: ITypetalkApi,
+        ) -> None:
+            """一部の分析に失敗しても結果のインデックスに対応するポストに感情が設定される"""
+            # Arrange
+            topic_id = 6310
+            typetalk_response = GetMessagesResponse(
+                topic=Topic(id=topic_id, name="テストトピック", description=""),
+                has_next=False,
+                posts=[
+                    Post(
+                        id=i,
+                        message=message,
+                        updated_at="2024-01-23T00:00:00Z",
+                        account=Account(id=1, name="test", image_url=""),
+                    )
+                    for i, message in enumerate(["OK", "", "ERROR", "NG"])
+                ],
+            )
+            mocker.patch.object(
+                typetalk_api, "get_messages", return_value=typetalk_response
+            )
+            comprehend_client = mocker.Mock()
+            comprehend_client.batch_detect_sentiment.return_value = {
+                "ResultList": [
+                    {"Index": 0, "Sentiment": "POSITIVE", "SentimentScore": {}},
+                    {"Index": 2, "Sentiment": "NEGATIVE", "SentimentScore": {}},
+                ],
+                "ErrorList": [
+                    {"Index": 1, "ErrorCode": "INTERNAL_SERVER", "ErrorMessage": ""},
+                ],
+            }
+
+            # Act
+            response = get_messages_use_case(
+                typetalk_api,
+                AwsComprehendApi(comprehend_client=comprehend_client),
+                "valid_typetalk_token",
+                topic_id,
+            )
+
+            # Assert
+            assert [(post.id, post.sentiment) for post in response.posts] == [
+                (3, "NEGATIVE"),
+                (2, None),
+                (1, None),
+                (0, "POSITIVE"),
+            ]
+            assert all(post.sentiment is None for post in typetalk_response.posts)
+
+        def test_when_sentiments_stored_then_skips_sentiment_analysis(
+            self,
+            mocker: MockerFixture,
+            tmp_path: Path,
+            typetalk_api: ITypetalkApi,
+            aws_comprehend_api_mock: AwsComprehendApiMock,
+        ) -> None:
+            """永続ストアに保存済みのポストは感情分析されずに保存済みの結果が返される"""
+            # Arrange
+            store = SqliteSentimentStore(str(tmp_path / "sentiments.db"))
+            spy = mocker.spy(aws_comprehend_api_mock, "batch_detect_sentiment")
+            first = get_messages_use_case(
+                typetalk_api,
+                aws_comprehend_api_mock,
+                "valid_typetalk_token",
+                6310,
+                i_sentiment_store=store,
+            )
+
+            # Act
+            second = get_messages_use_case(
+                typetalk_api,
+                aws_comprehend_api_mock,
+                "valid_typetalk_token",
+                6310,
+                i_sentiment_store=store,
+            )
+
+            # Assert
+            spy.assert_called_once()
+            assert second == first
+            assert all(post.sentiment == "POSITIVE" for post in second.posts)
+            store.close()
+
     class TestUnhappyCases:
         """異常系のテストケース"""
 
@@ -308,3 +495,486 @@ class TestGetMessagesUseCase:
 
             assert exc.value.error_type == error_type
             assert str(exc.value) == expected_message
+
+
+@pytest.mark.anyio
+class TestGetMessagesAsyncUseCase:
+    """get_messages_async_use_caseのテストクラス"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        @pytest.mark.parametrize(
+            ("topic_id", "expected_sentiments"),
+            [
+                (6310, {154011: "POSITIVE", 154010: "POSITIVE"}),
+                (390668, {126996578: None, 126996574: None}),
+            ],
+            ids=[
+                # 本文のあるポストには感情分析結果が設定され、id の降順で返される
+                "when_posts_have_message_then_returns_sentiments_in_descending_order",
+                # メッセージ本文が空の場合、感情分析結果なしのメッセージが返される
+                "when_message_body_empty_then_returns_messages_without_sentiment",
+            ],
+        )
+        async def test_when_valid_input_provided_then_returns_expected_messages(
+            self,
+            async_typetalk_api: IAsyncTypetalkApi,
+            aws_comprehend_api_mock: AwsComprehendApiMock,
+            topic_id: int,
+            expected_sentiments: dict[int, str | None],
+        ) -> None:
+            """有効な入力値が提供された場合に期待されるメッセージ一覧が返される"""
+            # Act
+            response = await get_messages_async_use_case(
+                async_typetalk_api,
+                AsyncAwsComprehendApi(aws_comprehend_api_mock),
+                "valid_typetalk_token",
+                topic_id,
+            )
+
+            # Assert
+            assert response.topic.id == topic_id
+            assert {x.id: x.sentiment for x in response.posts} == expected_sentiments
+            assert [x.id for x in response.posts] == list(expected_sentiments)
+
+        async def test_when_page_exceeds_chunk_size_then_analyzes_chunks_concurrently(
+            self,
+            mocker: MockerFixture,
+            async_typetalk_api: IAsyncTypetalkApi,
+        ) -> None:
+            """分析対象がチャンクサイズを超える場合はチャンクごとに並行して感情分析される"""
+            # Arrange
+            post_count = ANALYSIS_CHUNK_SIZE * 2 + 10
+            typetalk_response = GetMessagesResponse(
+                topic=Topic(id=6310, name="テストトピック", description=""),
+                has_next=True,
+                posts=[
+                    Post(
+                        id=i,
+                        message="NG" if i % 2 else "OK",
+                        updated_at="2024-01-23T00:00:00Z",
+                        account=Account(id=1, name="test", image_url=""),
+                    )
+                    for i in range(post_count)
+                ],
+            )
+            get_messages = mocker.patch.object(
+                async_typetalk_api, "get_messages", return_value=typetalk_response
+            )
+            in_flight = 0
+            max_in_flight = 0
+
+            async def batch_detect_sentiment(
+                text_list: list[str],
+            ) -> BatchDetectSentimentResponse:
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return BatchDetectSentimentResponse(
+                    result_list=[
+                        SentimentResult(
+                            index=index,
+                            sentiment=(
+                                SentimentEnum.NEGATIVE
+                                if text == "NG"
+                                else SentimentEnum.POSITIVE
+                            ),
+                            sentiment_score={},
+                        )
+                        for index, text in enumerate(text_list)
+                    ],
+                    error_list=[],
+                )
+
+            i_async_aws_comprehend_api = mocker.AsyncMock(spec=IAsyncAwsComprehendApi)
+            i_async_aws_comprehend_api.batch_detect_sentiment.side_effect = (
+                batch_detect_sentiment
+            )
+
+            # Act
+            response = await get_messages_async_use_case(
+                async_typetalk_api,
+                i_async_aws_comprehend_api,
+                "valid_typetalk_token",
+                6310,
+                count=post_count,
+            )
+
+            # Assert
+            get_messages.assert_awaited_once_with(
+                "valid_typetalk_token", 6310, None, post_count
+            )
+            assert i_async_aws_comprehend_api.batch_detect_sentiment.await_count == 3
+            assert max_in_flight == 3
+            assert [(post.id, post.sentiment) for post in response.posts] == [
+                (i, "NEGATIVE" if i % 2 else "POSITIVE")
+                for i in reversed(range(post_count))
+            ]
+
+        async def test_when_sentiments_stored_then_skips_sentiment_analysis(
+            self,
+            mocker: MockerFixture,
+            tmp_path: Path,
+            async_typetalk_api: IAsyncTypetalkApi,
+            aws_comprehend_api_mock: AwsComprehendApiMock,
+        ) -> None:
+            """永続ストアに保存済みのポストは感情分析されずに保存済みの結果が返される"""
+            # Arrange
+            store = SqliteSentimentStore(str(tmp_path / "sentiments.db"))
+            spy = mocker.spy(aws_comprehend_api_mock, "batch_detect_sentiment")
+            i_async_aws_comprehend_api = AsyncAwsComprehendApi(aws_comprehend_api_mock)
+            first = await get_messages_async_use_case(
+                async_typetalk_api,
+                i_async_aws_comprehend_api,
+                "valid_typetalk_token",
+                6310,
+                i_sentiment_store=store,
+            )
+
+            # Act
+            second = await get_messages_async_use_case(
+                async_typetalk_api,
+                i_async_aws_comprehend_api,
+                "valid_typetalk_token",
+                6310,
+                i_sentiment_store=store,
+            )
+
+            # Assert
+            spy.assert_called_once()
+            assert second == first
+            store.close()
+
+        async def test_when_comprehend_circuit_open_then_returns_no_sentiment(
+            self,
+            mocker: MockerFixture,
+            async_typetalk_api: IAsyncTypetalkApi,
+        ) -> None:
+            """AWS Comprehendの呼び出しが遮断されている場合は感情分析の結果なしで返す"""
+            # Arrange
+            i_async_aws_comprehend_api = mocker.AsyncMock(spec=IAsyncAwsComprehendApi)
+            i_async_aws_comprehend_api.batch_detect_sentiment.side_effect = (
+                ComprehendError(ComprehendErrorType.CIRCUIT_OPEN, "circuit open")
+            )
+
+            # Act
+            response = await get_messages_async_use_case(
+                async_typetalk_api,
+                i_async_aws_comprehend_api,
+                "valid_typetalk_token",
+                6310,
+            )
+
+            # Assert
+            assert [x.id for x in response.posts] == [154011, 154010]
+            assert all(x.sentiment is None for x in response.posts)
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        async def test_when_invalid_token_provided_then_raises_typetalk_api_error(
+            self,
+            async_typetalk_api: IAsyncTypetalkApi,
+            aws_comprehend_api_mock: AwsComprehendApiMock,
+        ) -> None:
+            """無効なトークンが提供された場合にTypetalkAPIErrorが発生する"""
+            # Act & Assert
+            with pytest.raises(TypetalkAPIError) as exc:
+                await get_messages_async_use_case(
+                    async_typetalk_api,
+                    AsyncAwsComprehendApi(aws_comprehend_api_mock),
+                    "invalid_typetalk_token",
+                    6310,
+                )
+
+            assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+        async def test_when_comprehend_error_occurs_then_raises_comprehend_error(
+            self,
+            async_typetalk_api: IAsyncTypetalkApi,
+        ) -> None:
+            """AWS ComprehendのエラーでComprehendErrorが発生する"""
+            # Act & Assert
+            with pytest.raises(ComprehendError) as exc:
+                await get_messages_async_use_case(
+                    async_typetalk_api,
+                    AsyncAwsComprehendApi(AwsComprehendApiMockError()),
+                    "valid_typetalk_token",
+                    6310,
+                )
+
+            assert exc.value.error_type == ComprehendErrorType.TEXT_SIZE_LIMIT_EXCEEDED
+
+
+@pytest.mark.anyio
+class TestStreamMessagesAsyncUseCase:
+    """stream_messages_async_use_caseのテストクラス"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        async def test_when_streamed_then_posts_precede_sentiments(
+            self,
+            async_typetalk_api: IAsyncTypetalkApi,
+            aws_comprehend_api_mock: AwsComprehendApiMock,
+        ) -> None:
+            """トピック、感情の無いポスト、ポストの感情の順に返される"""
+            # Act
+            lines = [
+                x
+                async for x in stream_messages_async_use_case(
+                    async_typetalk_api,
+                    AsyncAwsComprehendApi(aws_comprehend_api_mock),
+                    "valid_typetalk_token",
+                    6310,
+                )
+            ]
+
+            # Assert
+            assert [x.type for x in lines] == ["header", "post", "post", "sentiments"]
+            assert lines[0] == MessagesStreamHeader(
+                topic=Topic(
+                    id=6310, name="テストトピック1", description="テストトピックの説明"
+                ),
+                has_next=True,
+            )
+            assert [
+                (x.post.id, x.post.sentiment)
+                for x in lines[1:3]
+                if isinstance(x, MessagesStreamPost)
+            ] == [
+                (154011, None),
+                (154010, None),
+            ]
+            assert lines[3] == MessagesStreamSentiments(
+                sentiments=[
+                    SentimentPatch(id=154010, sentiment="POSITIVE"),
+                    SentimentPatch(id=154011, sentiment="POSITIVE"),
+                ]
+            )
+
+        async def test_when_chunks_complete_then_streams_sentiments_in_completion_order(
+            self,
+            mocker: MockerFixture,
+            async_typetalk_api: IAsyncTypetalkApi,
+        ) -> None:
+            """感情分析のチャンクが完了した順に、チャンクごとの感情が返される"""
+            # Arrange
+            post_count = ANALYSIS_CHUNK_SIZE + 5
+            mocker.patch.object(
+                async_typetalk_api,
+                "get_messages",
+                return_value=GetMessagesResponse(
+                    topic=Topic(id=6310, name="テストトピック", description=""),
+                    has_next=False,
+                    posts=[
+                        Post(
+                            id=i,
+                            message=f"message {i}",
+                            updated_at="2024-01-23T00:00:00Z",
+                            account=Account(id=1, name="test", image_url=""),
+                        )
+                        for i in range(post_count)
+                    ],
+                ),
+            )
+
+            async def batch_detect_sentiment(
+                text_list: list[str],
+            ) -> BatchDetectSentimentResponse:
+                # 件数の多い最初のチャンクほど遅く完了する
+                await asyncio.sleep(len(text_list) * 0.002)
+                return BatchDetectSentimentResponse(
+                    result_list=[
+                        SentimentResult(
+                            index=index,
+                            sentiment=SentimentEnum.NEUTRAL,
+                            sentiment_score={},
+                        )
+                        for index in range(len(text_list))
+                    ],
+                    error_list=[],
+                )
+
+            i_async_aws_comprehend_api = mocker.AsyncMock(spec=IAsyncAwsComprehendApi)
+            i_async_aws_comprehend_api.batch_detect_sentiment.side_effect = (
+                batch_detect_sentiment
+            )
+
+            # Act
+            lines = [
+                x
+                async for x in stream_messages_async_use_case(
+                    async_typetalk_api,
+                    i_async_aws_comprehend_api,
+                    "valid_typetalk_token",
+                    6310,
+                    count=post_count,
+                )
+            ]
+
+            # Assert
+            patches = [x for x in lines if isinstance(x, MessagesStreamSentiments)]
+            assert [len(x.sentiments) for x in patches] == [5, ANALYSIS_CHUNK_SIZE]
+            assert lines.index(patches[0]) == post_count + 1
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        async def test_when_comprehend_error_occurs_then_streams_posts_only(
+            self,
+            async_typetalk_api: IAsyncTypetalkApi,
+        ) -> None:
+            """AWS Comprehendのエラーでは、感情を返さずにポストのみを返す"""
+            # Act
+            lines = [
+                x
+                async for x in stream_messages_async_use_case(
+                    async_typetalk_api,
+                    AsyncAwsComprehendApi(AwsComprehendApiMockError()),
+                    "valid_typetalk_token",
+                    6310,
+                )
+            ]
+
+            # Assert
+            assert [x.type for x in lines] == ["header", "post", "post"]
+
+        async def test_when_invalid_token_provided_then_raises_on_first_line(
+            self,
+            async_typetalk_api: IAsyncTypetalkApi,
+            aws_comprehend_api_mock: AwsComprehendApiMock,
+        ) -> None:
+            """無効なトークンの場合は最初の行の取得時にTypetalkAPIErrorが発生する"""
+            # Arrange
+            lines = stream_messages_async_use_case(
+                async_typetalk_api,
+                AsyncAwsComprehendApi(aws_comprehend_api_mock),
+                "invalid_typetalk_token",
+                6310,
+            )
+
+            # Act & Assert
+            with pytest.raises(TypetalkAPIError) as exc:
+                await anext(lines)
+
+            assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def _forward_page(post_ids: list[int], has_next: bool) -> TypetalkGetMessagesResponse:
+    """指定のIDのポストを id の昇順で持つメッセージ一覧を作成する"""
+    return TypetalkGetMessagesResponse(
+        topic=Topic(id=6310, name="テストトピック"),
+        has_next=has_next,
+        posts=[
+            Post(
+                id=post_id,
+                message=f"message {post_id}",
+                updated_at="2024-01-23T00:00:00Z",
+                account=Account(id=1, name="test", image_url=""),
+            )
+            for post_id in post_ids
+        ],
+    )
+
+
+@pytest.mark.anyio
+class TestGetMessagesSinceAsyncUseCase:
+    """get_messages_since_async_use_caseのテストクラス"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        async def test_when_new_posts_span_pages_then_catches_up_page_by_page(
+            self,
+            mocker: MockerFixture,
+            aws_comprehend_api_mock: AwsComprehendApiMock,
+        ) -> None:
+            """新しいポストが無くなるまで、取得した最新のIDから続けて取得する"""
+            # Arrange
+            typetalk_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            typetalk_api.get_messages.side_effect = [
+                _forward_page([101, 102], has_next=True),
+                _forward_page([103, 104], has_next=True),
+                _forward_page([105], has_next=False),
+            ]
+
+            # Act
+            response = await get_messages_since_async_use_case(
+                typetalk_api,
+                AsyncAwsComprehendApi(aws_comprehend_api_mock),
+                "valid_typetalk_token",
+                6310,
+                since_id=100,
+                count=2,
+            )
+
+            # Assert
+            assert [x.id for x in response.posts] == [105, 104, 103, 102, 101]
+            assert all(x.sentiment == "POSITIVE" for x in response.posts)
+            assert response.has_next is False
+            assert [
+                x.kwargs["since_id"] for x in typetalk_api.get_messages.mock_calls
+            ] == [
+                100,
+                102,
+                104,
+            ]
+
+        async def test_when_page_cap_reached_then_returns_has_next(
+            self,
+            mocker: MockerFixture,
+            aws_comprehend_api_mock: AwsComprehendApiMock,
+        ) -> None:
+            """ページ数の上限に達した場合は、続きがあることを返す"""
+            # Arrange
+            typetalk_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            typetalk_api.get_messages.side_effect = [
+                _forward_page([post_id], has_next=True)
+                for post_id in range(101, 101 + SINCE_MAX_PAGES + 1)
+            ]
+
+            # Act
+            response = await get_messages_since_async_use_case(
+                typetalk_api,
+                AsyncAwsComprehendApi(aws_comprehend_api_mock),
+                "valid_typetalk_token",
+                6310,
+                since_id=100,
+                count=1,
+            )
+
+            # Assert
+            assert len(response.posts) == SINCE_MAX_PAGES
+            assert response.posts[0].id == 100 + SINCE_MAX_PAGES
+            assert response.has_next is True
+            assert typetalk_api.get_messages.await_count == SINCE_MAX_PAGES
+
+        async def test_when_no_new_posts_then_returns_empty_posts(
+            self,
+            mocker: MockerFixture,
+            aws_comprehend_api_mock: AwsComprehendApiMock,
+        ) -> None:
+            """新しいポストが無い場合は、1回の取得で空のポスト一覧を返す"""
+            # Arrange
+            typetalk_api = mocker.AsyncMock(spec=IAsyncTypetalkApi)
+            typetalk_api.get_messages.return_value = _forward_page([], has_next=False)
+
+            # Act
+            response = await get_messages_since_async_use_case(
+                typetalk_api,
+                AsyncAwsComprehendApi(aws_comprehend_api_mock),
+                "valid_typetalk_token",
+                6310,
+                since_id=100,
+            )
+
+            # Assert
+            assert response.posts == []
+            assert response.has_next is False
+            typetalk_api.get_messages.assert_awaited_once_with(
+                "valid_typetalk_token", 6310, count=SINCE_PAGE_SIZE, since_id=100
+            )
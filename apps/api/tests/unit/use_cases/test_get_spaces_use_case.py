@@ -4,9 +4,10 @@ import pytest
 from fastapi import status
 
 from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
 from src.infrastructure.typetalk.i_typetalk_api import ITypetalkApi
 from src.schemas.space import GetSpacesResponse, Space
-from src.use_cases.get_spaces import get_spaces_use_case
+from src.use_cases.get_spaces import get_spaces_async_use_case, get_spaces_use_case
 
 
 class TestGetSpacesUseCase:
@@ -63,3 +64,43 @@ class TestGetSpacesUseCase:
 
             assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
             assert exc.value.content is None
+
+
+@pytest.mark.anyio
+class TestGetSpacesAsyncUseCase:
+    """get_spaces_async_use_caseのテストクラス"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        async def test_when_valid_token_provided_then_returns_expected_spaces(
+            self,
+            async_typetalk_api: IAsyncTypetalkApi,
+        ) -> None:
+            """有効なトークンが提供された場合に期待される組織一覧が返される"""
+            # Act
+            response = await get_spaces_async_use_case(
+                async_typetalk_api, "valid_typetalk_token"
+            )
+
+            # Assert
+            assert [space.key for space in response.spaces] == [
+                "abcdefghij",
+                "0123456789",
+            ]
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        async def test_when_invalid_token_provided_then_raises_unauthorized_error(
+            self,
+            async_typetalk_api: IAsyncTypetalkApi,
+        ) -> None:
+            """無効なトークンが提供された場合にTypetalkAPIErrorが発生する"""
+            # Act & Assert
+            with pytest.raises(TypetalkAPIError) as exc:
+                await get_spaces_async_use_case(
+                    async_typetalk_api, "invalid_typetalk_token"
+                )
+
+            assert exc.value.status_code == status.HTTP_401_UNAUTHORIZED
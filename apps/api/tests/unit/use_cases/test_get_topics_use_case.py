@@ -4,9 +4,10 @@ import pytest
 from fastapi import status
 
 from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
 from src.infrastructure.typetalk.i_typetalk_api import ITypetalkApi
 from src.schemas.topic import GetTopicsResponse, Topic
-from src.use_cases.get_topics import get_topics_use_case
+from src.use_cases.get_topics import get_topics_async_use_case, get_topics_use_case
 
 
 class TestGetTopicsUseCase:
@@ -96,3 +97,40 @@ class TestGetTopicsUseCase:
 
             assert exc.value.status_code == expected_status
             assert exc.value.content == expected_content
+
+
+@pytest.mark.anyio
+class TestGetTopicsAsyncUseCase:
+    """get_topics_async_use_caseのテストクラス"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        async def test_when_valid_input_provided_then_returns_expected_topics(
+            self,
+            async_typetalk_api: IAsyncTypetalkApi,
+        ) -> None:
+            """有効な入力値が提供された場合に期待されるトピック一覧が返される"""
+            # Act
+            response = await get_topics_async_use_case(
+                async_typetalk_api, "valid_typetalk_token", "valid_space_key"
+            )
+
+            # Assert
+            assert [topic.id for topic in response.topics] == [6310, 6233]
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        async def test_when_invalid_space_key_provided_then_raises_not_found_error(
+            self,
+            async_typetalk_api: IAsyncTypetalkApi,
+        ) -> None:
+            """無効な組織キーが提供された場合にTypetalkAPIErrorが発生する"""
+            # Act & Assert
+            with pytest.raises(TypetalkAPIError) as exc:
+                await get_topics_async_use_case(
+                    async_typetalk_api, "valid_typetalk_token", "invalid"
+                )
+
+            assert exc.value.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,261 @@
+"""メッセージ一覧の先読みのテストケースを定義する"""
+
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.schemas.account import Account
+from src.schemas.message import GetMessagesResponse, Post
+from src.schemas.topic import Topic
+from src.use_cases.messages_prefetcher import MessagesPrefetcher
+
+pytestmark = pytest.mark.anyio
+
+TOKEN = "valid_typetalk_token"
+TOPIC_ID = 6310
+
+
+def _page(from_id: int | None, has_next: bool = True) -> GetMessagesResponse:
+    """開始IDより前の3件のポストを id の降順で持つメッセージ一覧を作成する"""
+    last_id = 100 if from_id is None else from_id
+    return GetMessagesResponse(
+        topic=Topic(id=TOPIC_ID, name="テストトピック"),
+        has_next=has_next,
+        posts=[
+            Post(
+                id=post_id,
+                message=f"message {post_id}",
+                updated_at="2024-01-23T00:00:00Z",
+                account=Account(id=1, name="test", image_url=""),
+            )
+            for post_id in range(last_id - 1, last_id - 4, -1)
+        ],
+    )
+
+
+class _Fetcher:
+    """呼び出された開始IDを記録し、解放されるまで結果を返さない取得関数"""
+
+    def __init__(self) -> None:
+        self.calls: list[int | None] = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.error: Exception | None = None
+
+    async def __call__(self, from_id: int | None) -> GetMessagesResponse:
+        self.calls.append(from_id)
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return _page(from_id)
+
+
+async def _wait_prefetch(prefetcher: MessagesPrefetcher) -> None:
+    """実行中の先読みが完了するまで待つ"""
+    while prefetcher.stats.in_flight:
+        await asyncio.sleep(0)
+
+
+class TestMessagesPrefetcher:
+    """MessagesPrefetcherクラスのテストケース"""
+
+    class TestGetMessages:
+        """get_messagesメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            async def test_when_next_page_requested_then_returns_prefetched_page(
+                self,
+            ) -> None:
+                """次のページのリクエストには先読みした結果が返される"""
+                # Arrange
+                prefetcher = MessagesPrefetcher()
+                fetch = _Fetcher()
+                first = await prefetcher.get_messages(TOKEN, TOPIC_ID, None, 3, fetch)
+                await _wait_prefetch(prefetcher)
+
+                # Act
+                second = await prefetcher.get_messages(TOKEN, TOPIC_ID, 97, 3, fetch)
+                await _wait_prefetch(prefetcher)
+
+                # Assert
+                assert min(x.id for x in first.posts) == 97
+                assert second == _page(97)
+                # 最初のページ、先読みした2ページ目、2ページ目から先読みした3ページ目
+                assert fetch.calls == [None, 97, 94]
+                stats = prefetcher.stats
+                assert (stats.hits, stats.misses, stats.completed) == (1, 1, 2)
+                await prefetcher.aclose()
+
+            async def test_when_prefetch_in_flight_then_waits_for_it(self) -> None:
+                """先読み中のページのリクエストは先読みの完了を待って結果を共有する"""
+                # Arrange
+                prefetcher = MessagesPrefetcher()
+                fetch = _Fetcher()
+                await prefetcher.get_messages(TOKEN, TOPIC_ID, None, None, fetch)
+                fetch.release.clear()
+
+                # Act
+                task = asyncio.create_task(
+                    prefetcher.get_messages(TOKEN, TOPIC_ID, 97, None, fetch)
+                )
+                await asyncio.sleep(0)
+                fetch.release.set()
+                response = await task
+
+                # Assert
+                assert response == _page(97)
+                assert fetch.calls.count(97) == 1
+                assert prefetcher.stats.hits == 1
+                await prefetcher.aclose()
+
+            @pytest.mark.parametrize(
+                ("token", "count"),
+                [("other_token", None), (TOKEN, 50)],
+                ids=[
+                    # トークンが異なる場合、先読みした結果は返されない
+                    "when_token_differs_then_fetches",
+                    # 件数が異なる場合、先読みした結果は返されない
+                    "when_count_differs_then_fetches",
+                ],
+            )
+            async def test_when_key_differs_then_fetches_page(
+                self, token: str, count: int | None
+            ) -> None:
+                """トークンや件数が異なるリクエストには先読みした結果を返さない"""
+                # Arrange
+                prefetcher = MessagesPrefetcher()
+                fetch = _Fetcher()
+                await prefetcher.get_messages(TOKEN, TOPIC_ID, None, None, fetch)
+                await _wait_prefetch(prefetcher)
+
+                # Act
+                await prefetcher.get_messages(token, TOPIC_ID, 97, count, fetch)
+
+                # Assert
+                assert fetch.calls[:3] == [None, 97, 97]
+                assert prefetcher.stats.hits == 0
+                await prefetcher.aclose()
+
+            async def test_when_has_next_is_false_then_does_not_prefetch(
+                self, mocker: MockerFixture
+            ) -> None:
+                """続きのページが無い場合は先読みしない"""
+                # Arrange
+                prefetcher = MessagesPrefetcher()
+                fetch = mocker.AsyncMock(return_value=_page(None, has_next=False))
+
+                # Act
+                await prefetcher.get_messages(TOKEN, TOPIC_ID, None, None, fetch)
+
+                # Assert
+                fetch.assert_awaited_once_with(None)
+                assert prefetcher.stats.scheduled == 0
+
+            async def test_when_ttl_expired_then_fetches_again(
+                self, mocker: MockerFixture
+            ) -> None:
+                """有効期間が過ぎた先読みの結果は返さずに改めて取得する"""
+                # Arrange
+                clock = mocker.Mock(return_value=0.0)
+                prefetcher = MessagesPrefetcher(ttl_seconds=30.0, clock=clock)
+                fetch = _Fetcher()
+                await prefetcher.get_messages(TOKEN, TOPIC_ID, None, None, fetch)
+                await _wait_prefetch(prefetcher)
+                clock.return_value = 31.0
+
+                # Act
+                await prefetcher.get_messages(TOKEN, TOPIC_ID, 97, None, fetch)
+
+                # Assert
+                assert fetch.calls[:3] == [None, 97, 97]
+                assert prefetcher.stats.misses == 2
+                await prefetcher.aclose()
+
+            async def test_when_concurrency_limit_reached_then_skips_prefetch(
+                self,
+            ) -> None:
+                """同時実行数の上限に達している場合は先読みしない"""
+                # Arrange
+                prefetcher = MessagesPrefetcher(max_concurrency=1)
+                fetch = _Fetcher()
+                await prefetcher.get_messages(TOKEN, TOPIC_ID, None, None, fetch)
+                fetch.release.clear()
+
+                # Act
+                await prefetcher.get_messages(TOKEN, 1, None, None, _Fetcher())
+
+                # Assert
+                stats = prefetcher.stats
+                assert (stats.scheduled, stats.skipped, stats.in_flight) == (1, 1, 1)
+                await prefetcher.aclose()
+
+            async def test_when_cache_full_then_cancels_in_flight_prefetch(
+                self,
+            ) -> None:
+                """キャッシュが満杯になった場合は実行中の先読みを中止する"""
+                # Arrange
+                prefetcher = MessagesPrefetcher(max_entries=1)
+                slow = _Fetcher()
+                await prefetcher.get_messages(TOKEN, 1, None, None, slow)
+                slow.release.clear()
+
+                # Act
+                await prefetcher.get_messages(TOKEN, 2, None, None, _Fetcher())
+                await _wait_prefetch(prefetcher)
+
+                # Assert
+                stats = prefetcher.stats
+                assert (stats.completed, stats.cancelled, stats.size) == (1, 1, 1)
+                await prefetcher.aclose()
+
+        class TestUnhappyCases:
+            """異常系のテストケース"""
+
+            async def test_when_prefetch_failed_then_fetches_again(self) -> None:
+                """先読みに失敗した場合は改めて取得する"""
+                # Arrange
+                prefetcher = MessagesPrefetcher()
+                fetch = _Fetcher()
+                await prefetcher.get_messages(TOKEN, TOPIC_ID, None, None, fetch)
+                fetch.release.clear()
+                fetch.error = RuntimeError("error")
+                task = asyncio.create_task(
+                    prefetcher.get_messages(TOKEN, TOPIC_ID, 97, None, fetch)
+                )
+                await asyncio.sleep(0)
+
+                # Act
+                fetch.release.set()
+                await asyncio.sleep(0)
+                fetch.error = None
+                response = await task
+
+                # Assert
+                assert response == _page(97)
+                assert fetch.calls[:3] == [None, 97, 97]
+                assert prefetcher.stats.failed == 1
+                await prefetcher.aclose()
+
+    class TestAclose:
+        """acloseメソッドのテストケース"""
+
+        class TestHappyCases:
+            """正常系のテストケース"""
+
+            async def test_when_prefetch_in_flight_then_cancels_it(self) -> None:
+                """実行中の先読みは中止される"""
+                # Arrange
+                prefetcher = MessagesPrefetcher()
+                fetch = _Fetcher()
+                await prefetcher.get_messages(TOKEN, TOPIC_ID, None, None, fetch)
+                fetch.release.clear()
+
+                # Act
+                await prefetcher.aclose()
+
+                # Assert
+                stats = prefetcher.stats
+                assert (stats.cancelled, stats.in_flight) == (1, 0)
@@ -0,0 +1,363 @@
+"""トピックの新しいポストの配信のテストケースを定義する"""
+
+import asyncio
+from collections.abc import Callable
+
+import pytest
+
+from src.infrastructure.aws.comprehend.async_aws_comprehend_api import (
+    AsyncAwsComprehendApi,
+)
+from src.infrastructure.aws.comprehend.aws_comprehend_api_mock import (
+    AwsComprehendApiMock,
+)
+from src.infrastructure.typetalk.exceptions import TypetalkAPIError
+from src.infrastructure.typetalk.i_async_typetalk_api import IAsyncTypetalkApi
+from src.schemas.account import Account
+from src.schemas.message import Post, TypetalkGetMessagesResponse
+from src.schemas.space import TypetalkGetSpacesResponse
+from src.schemas.topic import Topic, TypetalkGetTopicsResponse
+from src.use_cases.topic_feed import (
+    TopicFeedCapacityError,
+    TopicFeedEvent,
+    TopicFeedEventType,
+    TopicFeedHub,
+    TopicSubscription,
+)
+
+pytestmark = pytest.mark.anyio
+
+TOKEN = "valid_typetalk_token"
+TOPIC_ID = 6310
+# ポーリングで取得するメッセージの件数
+POLL_COUNT = 50
+
+
+def _post(post_id: int) -> Post:
+    """指定のIDのポストを作成する"""
+    return Post(
+        id=post_id,
+        message=f"message {post_id}",
+        updated_at="2024-01-23T00:00:00Z",
+        account=Account(id=1, name="test", image_url=""),
+    )
+
+
+class _TypetalkApi(IAsyncTypetalkApi):
+    """トピックのポストを id の昇順で返し、呼び出しを記録する Typetalk API
+
+    since_id を指定した場合は、そのIDより新しいポストを古い順に返す。
+    """
+
+    def __init__(self, post_ids: list[int]) -> None:
+        self.posts = [_post(x) for x in post_ids]
+        self.calls: list[tuple[str, int, int | None]] = []
+        self.error: TypetalkAPIError | None = None
+        # アクセスできないアクセストークン
+        self.revoked_tokens: set[str] = set()
+
+    async def get_spaces(self, typetalk_token: str) -> TypetalkGetSpacesResponse:
+        raise NotImplementedError
+
+    async def get_topics(
+        self, typetalk_token: str, space_key: str
+    ) -> TypetalkGetTopicsResponse:
+        raise NotImplementedError
+
+    async def get_messages(
+        self,
+        typetalk_token: str,
+        topic_id: int,
+        from_id: int | None = None,
+        count: int | None = None,
+        since_id: int | None = None,
+    ) -> TypetalkGetMessagesResponse:
+        self.calls.append((typetalk_token, topic_id, count))
+        if self.error is not None:
+            raise self.error
+        if typetalk_token in self.revoked_tokens:
+            raise TypetalkAPIError(401, {"error": "invalid_token"}, ())
+        count = count or 20
+        if since_id is None:
+            posts, has_next = self.posts[-count:], len(self.posts) > count
+        else:
+            newer = [x for x in self.posts if x.id > since_id]
+            posts, has_next = newer[:count], len(newer) > count
+        return TypetalkGetMessagesResponse(
+            topic=Topic(id=topic_id, name="テストトピック"),
+            has_next=has_next,
+            posts=posts,
+        )
+
+    def poll_calls(self) -> int:
+        """ポーリングによる呼び出しの回数を返す"""
+        return sum(1 for _, _, count in self.calls if count == POLL_COUNT)
+
+
+def _hub(
+    idle_timeout_seconds: float = 10.0, queue_size: int = 100, max_topics: int = 100
+) -> TopicFeedHub:
+    """テスト用に短い間隔でポーリングするハブを作成する"""
+    return TopicFeedHub(
+        poll_interval_seconds=0.01,
+        poll_count=POLL_COUNT,
+        idle_timeout_seconds=idle_timeout_seconds,
+        queue_size=queue_size,
+        keepalive_seconds=1.0,
+        max_topics=max_topics,
+    )
+
+
+async def _subscribe(
+    hub: TopicFeedHub,
+    typetalk_api: _TypetalkApi,
+    token: str = TOKEN,
+    topic_id: int = TOPIC_ID,
+    last_event_id: int | None = None,
+) -> TopicSubscription:
+    """モックの AWS Comprehend API を使用して購読する"""
+    return await hub.subscribe(
+        typetalk_api,
+        AsyncAwsComprehendApi(AwsComprehendApiMock()),
+        typetalk_token=token,
+        topic_id=topic_id,
+        last_event_id=last_event_id,
+    )
+
+
+async def _next_event(subscription: TopicSubscription) -> TopicFeedEvent:
+    """次のイベントを返す"""
+    event = await subscription.get()
+    assert event is not None
+    return event
+
+
+async def _wait_until(predicate: Callable[[], bool]) -> None:
+    """条件を満たすまで待つ"""
+    async with asyncio.timeout(1):
+        while not predicate():
+            await asyncio.sleep(0.005)
+
+
+class TestTopicFeedHub:
+    """TopicFeedHubクラスのテストケース"""
+
+    class TestHappyCases:
+        """正常系のテストケース"""
+
+        async def test_when_new_posts_then_broadcasts_only_new_posts_with_sentiment(
+            self,
+        ) -> None:
+            """購読の開始後の新しいポストのみを感情分析して配信する"""
+            # Arrange
+            hub = _hub()
+            typetalk_api = _TypetalkApi([99, 100])
+            subscription = await _subscribe(hub, typetalk_api)
+
+            # Act
+            typetalk_api.posts += [_post(101), _post(102)]
+            event = await _next_event(subscription)
+
+            # Assert
+            assert subscription.last_id == 100
+            assert event.type == TopicFeedEventType.POSTS
+            assert [x.id for x in event.posts] == [102, 101]
+            assert all(x.sentiment for x in event.posts)
+            assert event.last_id == 102
+            await hub.aclose()
+
+        async def test_when_posts_exceed_page_size_then_delivers_all_new_posts(
+            self,
+        ) -> None:
+            """ポーリングの間に1ページの件数を超えるポストがあっても全て配信する"""
+            # Arrange
+            hub = _hub()
+            typetalk_api = _TypetalkApi([100])
+            subscription = await _subscribe(hub, typetalk_api)
+            new_post_ids = list(range(101, 101 + POLL_COUNT * 2 + 10))
+
+            # Act
+            typetalk_api.posts += [_post(x) for x in new_post_ids]
+            event = await _next_event(subscription)
+
+            # Assert
+            assert sorted(x.id for x in event.posts) == new_post_ids
+            assert event.last_id == new_post_ids[-1]
+            await hub.aclose()
+
+        async def test_when_many_subscribers_then_shares_one_poller(self) -> None:
+            """同じトピックの購読者は1つのポーリングを共有し、同じポストを受け取る"""
+            # Arrange
+            hub = _hub()
+            typetalk_api = _TypetalkApi([100])
+            subscriptions = [
+                await _subscribe(hub, typetalk_api, token=f"token_{i}")
+                for i in range(10)
+            ]
+
+            # Act
+            typetalk_api.posts.append(_post(101))
+            events = [await _next_event(x) for x in subscriptions]
+
+            # Assert
+            assert all(x == events[0] for x in events)
+            stats = hub.stats
+            assert (stats.topics, stats.subscribers) == (1, 10)
+            # ポーリングごとの Typetalk への呼び出しは購読者数によらず1回となる
+            assert typetalk_api.poll_calls() == stats.polls
+            assert stats.new_posts == 1
+            await hub.aclose()
+
+        async def test_when_reconnected_then_replays_missed_posts(self) -> None:
+            """受信済みのIDを指定して再接続すると、それより新しい配信済みのポストを受け取る"""
+            # Arrange
+            hub = _hub()
+            typetalk_api = _TypetalkApi([100])
+            first = await _subscribe(hub, typetalk_api)
+            typetalk_api.posts += [_post(101), _post(102)]
+            await _next_event(first)
+
+            # Act
+            second = await _subscribe(hub, typetalk_api, last_event_id=101)
+            event = await _next_event(second)
+
+            # Assert
+            assert [x.id for x in event.posts] == [102]
+            await hub.aclose()
+
+        @pytest.mark.parametrize(
+            "last_event_id",
+            [0, 10**9],
+            ids=[
+                # 古い ID を指定しても、他の購読者に古いポストは配信されない
+                "when_old_id_given_then_does_not_rebroadcast",
+                # 大きな ID を指定しても、他の購読者への配信は止まらない
+                "when_huge_id_given_then_does_not_stall_delivery",
+            ],
+        )
+        async def test_when_last_event_id_given_then_polls_from_latest(
+            self, last_event_id: int
+        ) -> None:
+            """共有のポーリングは受信済みの ID によらず最新のポストから始まる"""
+            # Arrange
+            hub = _hub()
+            typetalk_api = _TypetalkApi([99, 100])
+            first = await _subscribe(hub, typetalk_api, last_event_id=last_event_id)
+            second = await _subscribe(hub, typetalk_api, token="other_token")
+
+            # Act
+            typetalk_api.posts.append(_post(101))
+            events = [await _next_event(first), await _next_event(second)]
+
+            # Assert
+            assert first.last_id == 100
+            assert all([x.id for x in event.posts] == [101] for event in events)
+            await hub.aclose()
+
+        async def test_when_no_subscribers_then_stops_polling(self) -> None:
+            """購読者がいない状態が続くとポーリングを終了する"""
+            # Arrange
+            hub = _hub(idle_timeout_seconds=0.02)
+            typetalk_api = _TypetalkApi([100])
+            subscription = await _subscribe(hub, typetalk_api)
+
+            # Act
+            hub.unsubscribe(subscription)
+            await _wait_until(lambda: hub.stats.topics == 0)
+            polls = typetalk_api.poll_calls()
+            await asyncio.sleep(0.05)
+
+            # Assert
+            assert hub.stats.idle_shutdowns == 1
+            assert typetalk_api.poll_calls() == polls
+            await hub.aclose()
+
+    class TestUnhappyCases:
+        """異常系のテストケース"""
+
+        async def test_when_subscriber_lags_then_resets_only_that_subscriber(
+            self,
+        ) -> None:
+            """キューが満杯の購読者のみを終了し、他の購読者には配信を続ける"""
+            # Arrange
+            hub = _hub(queue_size=1)
+            typetalk_api = _TypetalkApi([100])
+            slow = await _subscribe(hub, typetalk_api)
+            fast = await _subscribe(hub, typetalk_api)
+
+            # Act
+            typetalk_api.posts.append(_post(101))
+            await _next_event(fast)
+            typetalk_api.posts.append(_post(102))
+            second = await _next_event(fast)
+
+            # Assert
+            assert [x.id for x in second.posts] == [102]
+            assert (await _next_event(slow)).type == TopicFeedEventType.RESET
+            assert hub.stats.lagged == 1
+            assert hub.stats.subscribers == 1
+            await hub.aclose()
+
+        async def test_when_access_lost_then_closes_subscription(self) -> None:
+            """ポーリングでアクセスできなくなった場合は購読を終了する"""
+            # Arrange
+            hub = _hub()
+            typetalk_api = _TypetalkApi([100])
+            subscription = await _subscribe(hub, typetalk_api)
+
+            # Act
+            typetalk_api.error = TypetalkAPIError(401, None, ())
+            event = await _next_event(subscription)
+
+            # Assert
+            assert event.type == TopicFeedEventType.CLOSED
+            assert hub.stats.poll_errors >= 1
+            await hub.aclose()
+
+        async def test_when_first_token_revoked_then_polls_with_other_token(
+            self,
+        ) -> None:
+            """アクセスできないアクセストークンの購読のみを終了し、他の購読者で取得する"""
+            # Arrange
+            hub = _hub()
+            typetalk_api = _TypetalkApi([100])
+            revoked = await _subscribe(hub, typetalk_api, token="revoked_token")
+            other = await _subscribe(hub, typetalk_api)
+
+            # Act
+            typetalk_api.revoked_tokens.add("revoked_token")
+            typetalk_api.posts.append(_post(101))
+            closed = await _next_event(revoked)
+            event = await _next_event(other)
+
+            # Assert
+            assert closed.type == TopicFeedEventType.CLOSED
+            assert [x.id for x in event.posts] == [101]
+            assert hub.stats.subscribers == 1
+            await hub.aclose()
+
+        async def test_when_topic_not_accessible_then_raises_before_polling(
+            self,
+        ) -> None:
+            """トピックにアクセスできない場合は例外を送出し、ポーリングを開始しない"""
+            # Arrange
+            hub = _hub()
+            typetalk_api = _TypetalkApi([])
+            typetalk_api.error = TypetalkAPIError(404, None, ())
+
+            # Act & Assert
+            with pytest.raises(TypetalkAPIError):
+                await _subscribe(hub, typetalk_api)
+            assert hub.stats.topics == 0
+
+        async def test_when_too_many_topics_then_raises(self) -> None:
+            """ポーリングするトピック数が上限に達している場合は例外を送出する"""
+            # Arrange
+            hub = _hub(max_topics=1)
+            typetalk_api = _TypetalkApi([100])
+            await _subscribe(hub, typetalk_api)
+
+            # Act & Assert
+            with pytest.raises(TopicFeedCapacityError):
+                await _subscribe(hub, typetalk_api, topic_id=TOPIC_ID + 1)
+            await hub.aclose()